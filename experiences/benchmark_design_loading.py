@@ -0,0 +1,62 @@
+#! /usr/bin/python
+
+from __future__ import print_function
+
+import core.core as core
+import core.design_file as design_file
+import argparse
+import glob
+import os
+import time
+
+""" Compare loading the topologies of a campaign from its TopoDesignFile with the Python literal the scripts embedded
+
+    For each design of the designs directory, the literal is rebuilt as the scripts had it (a single line assigning the
+    list of topologies), then compiled and evaluated, as Python does each time a script is started. The design file is
+    opened (only its schema is read), its first topology read, then all of them.
+"""
+
+DESIGNS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "designs")
+
+
+def bestTime(function, repeat):
+    """ Return the best wall time of repeat calls of function, and its last result """
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        result = function()
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def loadLiteral(source):
+    namespace = {}
+    exec(compile(source, "<literal>", "exec"), namespace)
+    return namespace["mptcpTopos"]
+
+
+def benchmarkDesign(path, repeat):
+    topos = list(core.TopoDesignFile(path))
+    source = "mptcpTopos = " + repr(topos) + "\n"
+    literalTime, literalTopos = bestTime(lambda: loadLiteral(source), repeat)
+    openTime, _ = bestTime(lambda: core.TopoDesignFile(path), repeat)
+    firstTime, _ = bestTime(lambda: next(iter(core.TopoDesignFile(path))), repeat)
+    fullTime, fileTopos = bestTime(lambda: list(core.TopoDesignFile(path)), repeat)
+    if literalTopos != fileTopos:
+        raise Exception("The literal and the design file of " + path + " differ")
+
+    fileSize = os.path.getsize(path + design_file.COLUMNS_EXTENSION) + os.path.getsize(path + design_file.SCHEMA_EXTENSION)
+    print("%-12s %4d topos: literal %7d bytes %8.2f ms | design file %6d bytes, open %6.2f ms, first topo %6.2f ms, all %6.2f ms" % (
+        os.path.basename(path), len(topos), len(source), literalTime * 1000, fileSize, openTime * 1000, firstTime * 1000,
+        fullTime * 1000))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the loading of topology design files against Python literals")
+    parser.add_argument("--repeat", type=int, default=20, help="number of loads of each kind, the best one is reported")
+    parser.add_argument("designs", nargs="*", help="paths of the designs (without extension), default: all of " + DESIGNS_DIR)
+    args = parser.parse_args()
+    designs = args.designs or sorted(os.path.splitext(path)[0] for path in glob.glob(os.path.join(DESIGNS_DIR, "*.json")))
+    for design in designs:
+        benchmarkDesign(design, args.repeat)
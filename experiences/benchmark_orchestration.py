@@ -0,0 +1,218 @@
+#! /usr/bin/python
+
+from __future__ import print_function
+
+# Doing * imports is bad :'(
+from core.generate_topo import *
+from core.generate_xp import *
+from core.kernel_state import MPTCP_ENABLED_PATH
+
+import core.core as core
+import core.agent_launcher as agent_launcher
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+""" Measure the orchestration overhead of ExperienceLauncher, i.e., everything but the emulation itself
+
+    Each stand-in host is a directory of this machine, reached through LocalTransport, with stand-ins of sudo, mn and
+    mpPerf.py that do nothing but create the files Minitopo would. The wall time of a job is then only made of
+    orchestration: uploads, kernel parameter writes, cleanMininet and its readiness probes, and the retrieval of the results.
+    The readiness probe is the real one, only pointed at the stand-in host (see standInCmd()).
+    Each run appends one JSON line per configuration to the output file; give a previous output as baseline to spot
+    regressions. With --agent, the jobs go through AgentExperienceLauncher and a job agent per stand-in host instead.
+"""
+
+PHASES = ["upload", "lease", "kernel", "clean", "run", "collect"]
+""" Relative, so that each stand-in host has its own tmpfs in its directory """
+STANDIN_TMPFS = "tmpfs"
+POST_PROCESSING = [("command.log", "command.log"), ("ping.log", "ping.log"), ("https_client.log", "https_client.log"),
+                   ("https_server.log", "https_server.log")]
+
+STANDIN_SUDO = """#!/bin/sh
+# Kernel parameters are written with "sudo tee"; don't touch the real ones
+if [ "$1" = "tee" ]; then exec cat > /dev/null; fi
+exec "$@"
+"""
+STANDIN_MN = """#!/bin/sh
+exit 0
+"""
+STANDIN_MPPERF = """#!/bin/sh
+# Named after its directory, so that the readiness probe of a stand-in host only sees its own experience
+exec sh -c 'sleep ${STANDIN_RUNTIME:-0}
+for f in """ + " ".join([remoteFilename for remoteFilename, _ in POST_PROCESSING]) + """; do echo $f > $f; done' "mpPerf.py $PWD"
+"""
+""" The pattern of the readiness probe matching Minitopo experiences """
+MPPERF_PATTERN = "'[m]pPerf.py'"
+
+
+def standInCmd(remoteCmd, home):
+    """ The stand-in hosts share the processes of this machine and have no MPTCP kernel: the readiness probe looks for
+        the experiences started in the directory of the host only, and for its stand-in of the MPTCP sysctl
+    """
+    return remoteCmd.replace(MPPERF_PATTERN, "'[m]pPerf.py " + home + "/'").replace(MPTCP_ENABLED_PATH,
+                                                                                   os.path.join(home, "mptcp_enabled"))
+
+
+def writeStandIn(binDir, name, content):
+    path = os.path.join(binDir, name)
+    standIn = open(path, "w")
+    standIn.write(content)
+    standIn.close()
+    os.chmod(path, 0o755)
+
+
+class StandInTransport(core.LocalTransport):
+    """ Each host is a directory of this machine: its commands start there with it as HOME, as SSH commands start in the
+        home directory, and find the stand-ins first in their PATH
+    """
+    def __init__(self, remoteHostnames, remotePorts, rootDir, binDir):
+        core.LocalTransport.__init__(self, remoteHostnames, remotePorts)
+        self.homes = []
+        for num in range(len(remoteHostnames)):
+            home = os.path.join(rootDir, "host_" + str(num))
+            # Like the tmpfs mounted on the real hosts, it exists before the first job
+            os.makedirs(os.path.join(home, STANDIN_TMPFS))
+            open(os.path.join(home, "mptcp_enabled"), "w").close()
+            self.homes.append(home)
+        self.binDir = binDir
+
+    def shellCmd(self, num, remoteCmd):
+        return core.LocalTransport.shellCmd(self, num, "cd " + self.homes[num] + " && HOME=" + self.homes[num] + " PATH=" +
+                                            self.binDir + ":$PATH && " + standInCmd(remoteCmd, self.homes[num]))
+
+    def putCmd(self, num, filename, path):
+        return core.LocalTransport.putCmd(self, num, filename, os.path.join(self.homes[num], path))
+
+    def getCmd(self, num, remoteFilename, newFilename):
+        return core.LocalTransport.getCmd(self, num, os.path.join(self.homes[num], remoteFilename), newFilename)
+
+
+class StandInAgentLauncher(agent_launcher.AgentExperienceLauncher):
+    """ The agent runs the commands of the job itself, without going through StandInTransport """
+    def agentJob(self, num, kernelCmd, wanted, **kwargs):
+        job = agent_launcher.AgentExperienceLauncher.agentJob(self, num, kernelCmd, wanted, **kwargs)
+        for key in ["kernelCmd", "readyCmd"]:
+            if job[key] is not None:
+                job[key] = standInCmd(job[key], self.transport.homes[num])
+        return job
+
+
+def mean(values):
+    return sum(values) / len(values) if values else 0.0
+
+
+def runConfiguration(hosts, jobs, pipeline, bulkPull, runtime, verbose, agent=False):
+    """ Run jobs no-op experiences on hosts stand-in hosts and return the JSON-able result """
+    rootDir = tempfile.mkdtemp(prefix="mtbench")
+    binDir = os.path.join(rootDir, "bin")
+    os.mkdir(binDir)
+    writeStandIn(binDir, "sudo", STANDIN_SUDO)
+    writeStandIn(binDir, "mn", STANDIN_MN)
+    writeStandIn(binDir, "mpPerf.py", STANDIN_MPPERF)
+    os.environ["STANDIN_RUNTIME"] = str(runtime)
+
+    stdout = sys.stdout
+    if not verbose:
+        sys.stdout = open(os.devnull, "w")
+    try:
+        def transport(remoteHostnames, remotePorts):
+            return StandInTransport(remoteHostnames, remotePorts, rootDir, binDir)
+
+        launcherClass = StandInAgentLauncher if agent else core.ExperienceLauncher
+        launcher = launcherClass(["standin"] * hosts, [str(num) for num in range(hosts)], pipeline=pipeline, bulkPull=bulkPull,
+                                 transport=transport, minitopoPath=os.path.join(binDir, "mpPerf.py"))
+        durations = dict((phase, []) for phase in PHASES)
+        launcher.events.subscribe(lambda event: durations[event["phase"]].append(event["duration"]))
+        # As many different topologies as jobs, so that they are all distinct experiences
+        topos = [{PATHS: [{BANDWIDTH: 10 + job, DELAY: 10}, {BANDWIDTH: 10, DELAY: 20}]} for job in range(jobs)]
+
+        def test(**kwargs):
+            xpDict = {XP_TYPE: HTTPS, HTTPS_RANDOM_SIZE: "256", CLIENT_PCAP: "no"}
+            kwargs["postProcessing"] = POST_PROCESSING
+            core.experiment(launcher, xpDict, **kwargs)
+
+        start = time.time()
+        core.experimentTopos(topos, "bench", "mptcp", STANDIN_TMPFS, test, baseDir=rootDir)
+        launcher.finish()
+        wall = time.time() - start
+    finally:
+        if not verbose:
+            sys.stdout.close()
+            sys.stdout = stdout
+        shutil.rmtree(rootDir, ignore_errors=True)
+
+    phases = dict((phase, mean(durations[phase])) for phase in PHASES)
+    return {
+        "hosts": hosts, "jobs": jobs, "pipeline": pipeline, "bulkPull": bulkPull, "runtime": runtime, "agent": agent,
+        "wall": wall,
+        "jobsPerSecond": jobs / wall,
+        "phases": phases,
+        # Host time per job not spent in the (stand-in) emulation
+        "overheadPerJob": max(wall * hosts / jobs - runtime, 0.0),
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+def configurationKey(result):
+    # Results of older runs have no agent key
+    return tuple(result[key] for key in ["hosts", "jobs", "pipeline", "bulkPull", "runtime"]) + (result.get("agent", False),)
+
+
+def loadResults(path):
+    """ Return the last result of each configuration in the JSON lines file """
+    results = {}
+    resultsFile = open(path)
+    for line in resultsFile:
+        if line.strip():
+            result = json.loads(line)
+            results[configurationKey(result)] = result
+    resultsFile.close()
+    return results
+
+
+def printResult(result, baseline, tolerance):
+    line = ("agent " if result.get("agent", False) else "") + "hosts %2d jobs %4d pipeline %-5s bulkPull %-5s: %6.2f jobs/s, overhead %6.3f s/job (" % (
+        result["hosts"], result["jobs"], result["pipeline"], result["bulkPull"], result["jobsPerSecond"], result["overheadPerJob"])
+    line += ", ".join([phase + " %.3f" % result["phases"][phase] for phase in PHASES]) + ")"
+    reference = baseline.get(configurationKey(result))
+    if reference is not None and reference["overheadPerJob"] > 0.0:
+        ratio = result["overheadPerJob"] / reference["overheadPerJob"]
+        line += " %.2fx baseline" % ratio
+        if ratio > 1.0 + tolerance:
+            line += " REGRESSION"
+    print(line)
+
+
+def launchBenchmarks(hostCounts, jobs, runtime, output, baselinePath, tolerance, verbose, agent=False):
+    baseline = loadResults(baselinePath) if baselinePath is not None else {}
+    outputFile = open(output, "a")
+    # The agent neither pipelines nor pulls: a single configuration per number of hosts
+    modes = [False] if agent else [True, False]
+    for pipeline in modes:
+        for bulkPull in modes:
+            for hosts in hostCounts:
+                result = runConfiguration(hosts, jobs, pipeline, bulkPull, runtime, verbose, agent=agent)
+                print(json.dumps(result, sort_keys=True), file=outputFile)
+                outputFile.flush()
+                printResult(result, baseline, tolerance)
+    outputFile.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the orchestration overhead of ExperienceLauncher")
+    parser.add_argument("--hosts", type=int, nargs="+", default=[1, 2, 4], help="numbers of stand-in hosts to try")
+    parser.add_argument("--jobs", type=int, default=20, help="number of jobs of each configuration")
+    parser.add_argument("--runtime", type=float, default=0.0, help="seconds spent by the stand-in mpPerf.py")
+    parser.add_argument("--output", default="benchmark_orchestration.jsonl", help="JSON lines file the results are appended to")
+    parser.add_argument("--baseline", help="previous output to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="relative increase of the overhead reported as a regression")
+    parser.add_argument("--verbose", action="store_true", help="keep the output of the launcher")
+    parser.add_argument("--agent", action="store_true", help="run the jobs through a job agent per stand-in host")
+    args = parser.parse_args()
+    launchBenchmarks(args.hosts, args.jobs, args.runtime, args.output, args.baseline, args.tolerance, args.verbose,
+                     agent=args.agent)
@@ -0,0 +1,178 @@
+#! /usr/bin/env python
+
+from __future__ import print_function
+
+import base64
+import contextlib
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tarfile
+import threading
+import time
+
+""" Job agent, started once per remote host (or slot) by AgentExperienceLauncher
+
+    It reads one job per line on its stdin, as JSON, and runs all its steps on the host: write the topo and xp files in
+    the tmpfs directory of the job, push the kernel parameters, clean Mininet and wait until the host is ready, run
+    Minitopo under a timeout (killing and cleaning what it left if it expires), then archive the artifacts and remove
+    the directory. For each job, it writes on its stdout the (possibly gzipped) tar archive of the artifacts as it is
+    built, in chunks (see ChunkedWriter), then a JSON line with the outcome and the timing of each phase.
+
+    This file is copied as is on the hosts: it only depends on the standard library of their Python, 2 or 3.
+"""
+
+""" Same backoff as the readiness probes of core.py """
+READY_FIRST_DELAY = 0.1
+READY_BACKOFF = 2
+READY_MAX_DELAY = 5
+
+
+def shellCall(cmd, **kwargs):
+    devnull = open(os.devnull, "w")
+    returnCode = subprocess.call(["sh", "-c", cmd], stdout=kwargs.get("stdout", devnull), stderr=kwargs.get("stderr", devnull))
+    devnull.close()
+    return returnCode
+
+
+def waitReady(readyCmd, timeout):
+    """ Run readyCmd with backoff until it succeeds (then return True) or timeout seconds are elapsed """
+    deadline = time.time() + timeout
+    delay = READY_FIRST_DELAY
+    while shellCall(readyCmd) != 0:
+        if time.time() + delay > deadline:
+            return False
+        time.sleep(delay)
+        delay = min(delay * READY_BACKOFF, READY_MAX_DELAY)
+    return True
+
+
+@contextlib.contextmanager
+def timed(phases, phase):
+    """ Append the timing of the enclosed block to phases; the block can set the "ok" of the phase """
+    record = {"phase": phase, "start": time.time(), "ok": True}
+    try:
+        yield record
+    except Exception:
+        record["ok"] = False
+        raise
+    finally:
+        record["duration"] = time.time() - record["start"]
+        phases.append(record)
+
+
+def runMinitopo(job):
+    """ Return (returnCode, timedOut) of the Minitopo command of job, its outputs going in the tmpfs directory """
+    minitopoOut = open(os.path.join(job["tmpfs"], "minitopo.out"), "wb")
+    minitopoErr = open(os.path.join(job["tmpfs"], "minitopo.err"), "wb")
+    # In its own process group, so that the whole command can be killed on timeout
+    process = subprocess.Popen(["sh", "-c", job["cmd"]], stdout=minitopoOut, stderr=minitopoErr, preexec_fn=os.setsid)
+    expired = []
+
+    def kill():
+        expired.append(True)
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+    timer = threading.Timer(job["timeout"], kill)
+    timer.start()
+    process.wait()
+    timer.cancel()
+    minitopoOut.close()
+    minitopoErr.close()
+    return process.returncode, len(expired) > 0
+
+
+class ChunkedWriter(object):
+    """ Binary file object writing each write() on stream as its size in hexadecimal on a line, followed by its bytes
+        close() writes the empty chunk, so that the reader finds the end of the data without knowing its size beforehand
+    """
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, data):
+        if data:
+            self.stream.write(("%x\n" % len(data)).encode())
+            self.stream.write(data)
+
+    def close(self):
+        self.stream.write(b"0\n")
+
+
+def archiveArtifacts(artifacts, compress, stream):
+    """ Write the tar archive of the existing artifacts on stream as it is built, each one named by its index in the list """
+    archive = tarfile.open(fileobj=stream, mode="w|gz" if compress else "w|")
+    for index, path in enumerate(artifacts):
+        if os.path.isfile(path):
+            archive.add(path, arcname=str(index))
+    archive.close()
+
+
+def runJob(job, archive):
+    """ Return the reply for the job, its artifacts being written on archive (a ChunkedWriter) """
+    phases = []
+    reply = {"id": job["id"], "phases": phases, "hostReady": True}
+    try:
+        with timed(phases, "upload"):
+            if not os.path.isdir(job["tmpfs"]):
+                os.makedirs(job["tmpfs"])
+            for filename, content in job["files"].items():
+                jobFile = open(os.path.join(job["tmpfs"], filename), "wb")
+                jobFile.write(base64.b64decode(content))
+                jobFile.close()
+
+        if job.get("kernelCmd") is not None:
+            with timed(phases, "kernel") as record:
+                process = subprocess.Popen(["sh", "-c", job["kernelCmd"]], stdout=subprocess.PIPE)
+                out = process.communicate()[0]
+                reply["kernel"] = {"returnCode": process.returncode, "out": out.decode()}
+                record["ok"] = process.returncode == 0
+            if process.returncode != 0:
+                return reply
+
+        with timed(phases, "clean") as record:
+            if shellCall(job["cleanCmd"]) != 0 and job.get("fallbackCleanCmd") is not None:
+                shellCall(job["fallbackCleanCmd"])
+            record["ok"] = waitReady(job["readyCmd"], job["readyTimeout"])
+
+        with timed(phases, "run") as record:
+            reply["returnCode"], reply["timedOut"] = runMinitopo(job)
+            record["ok"] = not reply["timedOut"]
+        if reply["timedOut"]:
+            shellCall(job["killCmd"])
+            reply["hostReady"] = waitReady(job["readyCmd"], job["readyTimeout"])
+        else:
+            with timed(phases, "collect"):
+                archiveArtifacts(job["artifacts"], job.get("compress", False), archive)
+    except Exception as e:
+        reply["error"] = str(e)
+    finally:
+        shutil.rmtree(job["tmpfs"], ignore_errors=True)
+
+    return reply
+
+
+def main():
+    stdin = sys.stdin
+    # The archives are binary, and nothing but the replies may be written on the channel
+    stdout = getattr(sys.stdout, "buffer", sys.stdout)
+    sys.stdout = sys.stderr
+    for line in iter(stdin.readline, ""):
+        if not line.strip():
+            continue
+
+        archive = ChunkedWriter(stdout)
+        reply = runJob(json.loads(line), archive)
+        # Even if the archive could not be completed, the reply tells it
+        archive.close()
+        stdout.write((json.dumps(reply, sort_keys=True) + "\n").encode())
+        stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,281 @@
+from __future__ import print_function
+
+from core import ExperienceLauncher, MinitopoCommand, READY_TIMEOUT, bulkPullWanted, extractBulkPull
+from journal import RUNNING
+from kernel_state import xpKernelParameters
+
+import base64
+import io
+import json
+import os
+import subprocess
+import threading
+
+""" The agent itself, copied on each host before it is started """
+AGENT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "agent.py")
+""" Where the agent is copied on the hosts, relative to the directory the transport runs the commands in """
+AGENT_REMOTE_PATH = "minitopo_agent.py"
+""" Python interpreter of the hosts running the agent """
+AGENT_PYTHON = "python"
+""" On top of the timeout of a job, the agent cleans the host twice: give up on it if it did not reply after this """
+AGENT_REPLY_MARGIN = 2 * READY_TIMEOUT + 60
+""" A failed kernel parameter write only fails its job; the host is recovered once this number of writes failed in a row """
+MAX_KERNEL_FAILURES = 2
+
+
+class AgentChannel(object):
+    """ The agent (see agent.py) of host num, started through the transport at the first request
+
+        Requests and replies go through the stdin and stdout of the command running the agent, i.e., a single SSH
+        session with SshConnectionPool.
+    """
+    def __init__(self, transport, num, python=AGENT_PYTHON):
+        self.transport = transport
+        self.num = num
+        self.python = python
+        self.process = None
+        # Number of times the agent was (re)started
+        self.starts = 0
+
+    def isRunning(self):
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        if subprocess.call(self.transport.putCmd(self.num, AGENT_PATH, AGENT_REMOTE_PATH)) != 0:
+            raise Exception("Job agent could not be put on remote server at path " + AGENT_REMOTE_PATH)
+
+        self.process = subprocess.Popen(self.transport.shellCmd(self.num, self.python + " " + AGENT_REMOTE_PATH),
+                                        stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        self.starts += 1
+
+    def read(self, stream, size):
+        data = b""
+        while len(data) < size:
+            chunk = stream.read(size - len(data))
+            if not chunk:
+                raise Exception("Job agent stopped in the middle of a reply")
+            data += chunk
+        return data
+
+    def readChunks(self, stream):
+        """ Return the data written by the ChunkedWriter of the agent on stream """
+        chunks = []
+        while True:
+            line = stream.readline()
+            if not line:
+                raise Exception("Job agent stopped in the middle of a reply" if chunks else "Job agent stopped without reply")
+
+            size = int(line, 16)
+            if size == 0:
+                return b"".join(chunks)
+            chunks.append(self.read(stream, size))
+
+    def request(self, job, timeout):
+        """ Send job to the agent and return (reply, archive); the agent is killed if it did not reply after timeout """
+        if not self.isRunning():
+            self.start()
+
+        process = self.process
+        watchdog = threading.Timer(timeout, self.kill)
+        watchdog.start()
+        try:
+            process.stdin.write((json.dumps(job, sort_keys=True) + "\n").encode())
+            process.stdin.flush()
+            # The archive comes first, as the agent builds it
+            archive = self.readChunks(process.stdout)
+            line = process.stdout.readline()
+            if not line:
+                raise Exception("Job agent stopped without reply")
+
+            reply = json.loads(line.decode())
+        finally:
+            watchdog.cancel()
+        return reply, archive
+
+    def kill(self):
+        try:
+            self.process.kill()
+        except (AttributeError, OSError):
+            pass
+
+    def close(self):
+        """ The agent exits at the end of its stdin """
+        if self.process is None:
+            return
+
+        try:
+            self.process.stdin.close()
+        except IOError:
+            self.kill()
+        self.process.wait()
+        self.process.stdout.close()
+        self.process = None
+
+
+class AgentExperienceLauncher(ExperienceLauncher):
+    """ Same API as ExperienceLauncher (addWork and finish), but each job is a single exchange with an agent started
+        once per host (see agent.py)
+
+        Instead of one remote command per step, the controller sends the whole job (kernel parameters to write, topo and
+        xp files, artifacts to retrieve) to the agent of the host, which runs every step locally and replies with the
+        artifacts in one archive (gzipped if compressPull) and the timing of each phase. The kernel parameters cache
+        and leases, the timeout model, the journal and the phase events work as with ExperienceLauncher; the phases
+        timed by the agent are timestamped by the clock of the host. A host the agent could not clean after a timeout
+        is recovered from the controller as usual, as well as a host failing to write the kernel parameters
+        MAX_KERNEL_FAILURES times in a row (a single failed write only fails its job). pipeline, bulkPull and
+        timestampOutput do not apply.
+    """
+    def __init__(self, remoteHostnames, remotePorts, agentPython=AGENT_PYTHON, **kwargs):
+        """ agentPython is the Python interpreter of the hosts running the agent """
+        self.agentPython = agentPython
+        ExperienceLauncher.__init__(self, remoteHostnames, remotePorts, **kwargs)
+
+    def startWorkers(self):
+        self.jobCounters = [0] * len(self.remoteHostnames)
+        self.kernelFailures = [0] * len(self.remoteHostnames)
+        self.agents = [AgentChannel(self.transport, num, python=self.agentPython) for num in range(len(self.remoteHostnames))]
+        for num in range(len(self.remoteHostnames)):
+            thread = threading.Thread(target=self.agentLoop, args=(num,))
+            thread.start()
+            self.threads.append(thread)
+
+    def agentJob(self, num, kernelCmd, wanted, **kwargs):
+        """ Return the job description sent to the agent; wanted maps the remote path of the artifacts to their local
+            names, as bulkPullWanted()
+        """
+        files = {}
+        for filename in self.jobFiles(**kwargs):
+            jobFile = open(filename, "rb")
+            files[os.path.basename(filename)] = base64.b64encode(jobFile.read()).decode()
+            jobFile.close()
+
+        slot = self.slots[num]
+        return {
+            "id": kwargs.get("jobId", kwargs["workingDir"]),
+            "tmpfs": kwargs["tmpfs"],
+            "files": files,
+            "kernelCmd": kernelCmd,
+            "cleanCmd": slot.cleanCmd(),
+            # As cleanMininet(), but never on a host shared with other slots
+            "fallbackCleanCmd": None if slot.isolated() else "sudo mn -c",
+            "readyCmd": slot.readyCmd(),
+            "readyTimeout": READY_TIMEOUT,
+            "cmd": self.minitopoRemoteCmd(num, **kwargs),
+            "timeout": self.timeoutModel.timeout(**kwargs),
+            "killCmd": slot.killCmd(),
+            "artifacts": sorted(wanted),
+            "compress": self.compressPull,
+        }
+
+    def emitAgentPhases(self, num, reply, **kwargs):
+        for phase in reply["phases"]:
+            event = self.events.newEvent(phase["phase"], self.slotName(num), **kwargs)
+            event.update(phase)
+            self.events.emit(event, **kwargs)
+
+    def launchAgentXp(self, num, **kwargs):
+        """ Run the job through the agent of num and return (testOk, hostReady, artifacts), artifacts being None if they
+            could not be retrieved
+        """
+        files = self.postProcessingFiles(**kwargs)
+        outputs = [(outputFilename, kwargs["tmpfs"], os.path.join(kwargs["workingDir"], outputFilename))
+                   for outputFilename in ["minitopo.out", "minitopo.err"]]
+        wanted = bulkPullWanted(files + outputs)
+        parameters = xpKernelParameters(**kwargs)
+        with self.events.timed("lease", self.slotName(num), **kwargs):
+            # The other slots of the host must not change the kernel parameters during the experience
+            self.kernelState.acquire(num, parameters)
+        kernelError = None
+        try:
+            prepared = self.kernelState.prepare(num, parameters)
+            job = self.agentJob(num, None if prepared is None else prepared[0], wanted, **kwargs)
+            reply, archive = self.agents[num].request(job, job["timeout"] + AGENT_REPLY_MARGIN)
+            self.emitAgentPhases(num, reply, **kwargs)
+            if prepared is not None and "kernel" in reply:
+                try:
+                    self.kernelState.commit(num, parameters, prepared[1], reply["kernel"]["returnCode"],
+                                            reply["kernel"]["out"].encode())
+                    self.kernelFailures[num] = 0
+                except Exception as e:
+                    kernelError = e
+        finally:
+            self.kernelState.release(num)
+
+        if kernelError is not None:
+            print(str(kernelError) + ": continue")
+            self.kernelFailures[num] += 1
+            if self.kernelFailures[num] < MAX_KERNEL_FAILURES:
+                return False, True, None
+
+            # The kernel keeps refusing the parameters: the host needs more than another job
+            self.kernelFailures[num] = 0
+            return False, self.recoverHost(num, **kwargs), None
+
+        if "error" in reply:
+            raise Exception("Job agent failed: " + reply["error"])
+
+        if reply["timedOut"]:
+            print("Experience timed out after " + str(job["timeout"]) + " seconds; recover the machine")
+            # The host went through a recovery, don't trust its kernel state anymore
+            self.kernelState.invalidate(num)
+            self.timeoutModel.timedOut()
+            return False, reply["hostReady"] or self.recoverHost(num, **kwargs), None
+
+        if reply["returnCode"] == 0:
+            runPhase = [phase for phase in reply["phases"] if phase["phase"] == "run"][0]
+            self.timeoutModel.observe(runPhase["duration"], **kwargs)
+
+        # The agent names the artifacts by their index in the job
+        artifacts = job["artifacts"]
+        indexedWanted = dict((str(index), wanted[path]) for index, path in enumerate(artifacts))
+        pulled = extractBulkPull(io.BytesIO(archive), indexedWanted, self.compressPull)
+        missing = [path for index, path in enumerate(artifacts) if str(index) not in pulled]
+        if len(missing) > 0:
+            print("Files " + ", ".join(missing) + " could not be pull from remote server: continue")
+            return True, True, None
+
+        return True, True, [newFilename for _, _, newFilename in files]
+
+    def recoverHost(self, num, **kwargs):
+        """ The agent could not clean the host: escalate from the controller (possibly rebooting it, and its agent) """
+        minitopoCommand = MinitopoCommand(num, self.transport, None, kwargs["workingDir"], self.testOkList, slot=self.slots[num])
+        hostReady = minitopoCommand.recover()
+        self.agents[num].close()
+        return hostReady
+
+    def agentLoop(self, num):
+        while not self.quarantined[num]:
+            workData = self.workQueue.get()
+            if workData is None:
+                break
+
+            self.jobCounters[num] += 1
+            jobData = dict(workData, tmpfs=self.slots[num].tmpfs(workData["tmpfs"]) + "/job_" + str(self.jobCounters[num]))
+            testOk = False
+            hostReady = True
+            self.printXp(num, **jobData)
+            self.journalUpdate(num, RUNNING, **jobData)
+            try:
+                testOk, hostReady, artifacts = self.launchAgentXp(num, **jobData)
+            except Exception as e:
+                print(str(e) + ": continue")
+                # Restart the agent for the next job, after making sure the host is usable
+                self.agents[num].close()
+                self.kernelState.invalidate(num)
+                hostReady = self.recoverHost(num, **jobData)
+
+            self.testOkList[num] = testOk
+            if testOk:
+                self.hostFailures[num] = 0
+                self.xpCollected(num, artifacts, **jobData)
+            else:
+                self.hostFailed(num, hostReady)
+                self.retryXp(num, **workData)
+
+    def finish(self):
+        if not self.finished:
+            ExperienceLauncher.finish(self)
+            for agent in self.agents:
+                agent.close()
+            print(str(sum([agent.starts for agent in self.agents])) + " job agent starts for " +
+                  str(len(self.agents)) + " hosts")
@@ -0,0 +1,247 @@
+from __future__ import print_function
+
+from core import ExperienceLauncher, READY_TIMEOUT, RECOVERY_TIMEOUT, backoffDelays, bulkPullWanted, bulkPullCmd, \
+    extractBulkPull, checkBulkPull
+from event_loop import Command, EventLoop, Poll, Return, Sleep, Worker
+from journal import RUNNING
+from kernel_state import BOOT_ID_PATH, xpKernelParameters
+from Queue import Empty
+
+import os
+import tempfile
+import threading
+import time
+
+
+class AsyncExperienceLauncher(ExperienceLauncher):
+    """ Same API as ExperienceLauncher (addWork and finish), but one thread drives all the hosts with an event loop
+
+        Each remote operation is a subprocess polled by the loop instead of a blocking call in a thread per host, so a
+        single controller can drive hundreds of emulation hosts. The local work that would block the loop (hashing the
+        uploads, extracting the pulled archives, the SQLite commits and the ingestion of the results) runs in a Worker
+        thread instead. As with pipeline, the results of a job are retrieved while the next one runs on the host, and each
+        job uses its own tmpfs subdirectory. timestampOutput is not supported, since it needs a thread per output stream.
+    """
+    def startWorkers(self):
+        if self.timestampOutput:
+            raise Exception("timestampOutput is not supported by AsyncExperienceLauncher")
+
+        self.jobCounters = [0] * len(self.remoteHostnames)
+        # The master connections are opened by masterTask(), so that building a command never blocks the loop
+        self.transport.manageMasters()
+        self.worker = Worker()
+        self.loop = EventLoop()
+        for num in range(len(self.remoteHostnames)):
+            self.loop.spawn(self.hostTask(num))
+
+        thread = threading.Thread(target=self.runLoop)
+        thread.start()
+        self.threads.append(thread)
+
+    def runLoop(self):
+        self.loop.run()
+        self.worker.close()
+
+    def getWork(self):
+        """ Poll function of the work queue; the job is wrapped in a tuple since the sentinel is None """
+        try:
+            return (self.workQueue.get_nowait(),)
+        except Empty:
+            return None
+
+    def remoteCommand(self, num, remoteCmd, **kwargs):
+        return Command(self.transport.shellCmd(num, remoteCmd), **kwargs)
+
+    def masterTask(self, num):
+        """ Open the master connection in the loop, so that the following shellCmd() do not block on a handshake; return
+            True if it is open
+        """
+        if not self.transport.masterCheckDue(num):
+            raise Return(True)
+
+        result = yield Command(self.transport.masterCheckCmd(num))
+        if result.returnCode == 0:
+            self.transport.masterChecked(num)
+            raise Return(True)
+
+        result = yield Command(self.transport.openMasterCmd(num))
+        self.transport.masterOpened(num)
+        if result.returnCode == 0:
+            self.transport.masterChecked(num)
+        raise Return(result.returnCode == 0)
+
+    def checkedTask(self, command, error):
+        result = yield command
+        if result.returnCode != 0:
+            raise Exception(error)
+        raise Return(result)
+
+    def uploadTask(self, num, **kwargs):
+        filenames = self.jobFiles(**kwargs)
+        if self.uploadStore is not None:
+            if not self.uploadStore.isListed(num):
+                result = yield self.remoteCommand(num, self.uploadStore.listCmd(), capture=True)
+                if result.returnCode == 0:
+                    self.uploadStore.setListing(num, result.out)
+
+            if self.uploadStore.isListed(num):
+                puts, remoteCmd, hashes = yield self.worker.call(self.uploadStore.prepare, num, filenames, kwargs["tmpfs"])
+                for filename, remotePath in puts:
+                    yield self.checkedTask(Command(self.transport.putCmd(num, filename, remotePath)),
+                                           "File " + filename + " could not be put on remote server at path " + remotePath)
+                result = yield self.remoteCommand(num, remoteCmd)
+                if self.uploadStore.commit(num, puts, hashes, result.returnCode):
+                    return
+
+        yield self.checkedTask(self.remoteCommand(num, "mkdir -p " + kwargs["tmpfs"]),
+                               "Cannot create directory " + kwargs["tmpfs"] + " on remote server")
+        for filename in filenames:
+            yield self.checkedTask(Command(self.transport.putCmd(num, filename, kwargs["tmpfs"])),
+                                   "File " + filename + " could not be put on remote server at path " + kwargs["tmpfs"])
+
+    def kernelTask(self, num, parameters):
+        prepared = self.kernelState.prepare(num, parameters)
+        if prepared is not None:
+            remoteCmd, changed = prepared
+            result = yield self.remoteCommand(num, remoteCmd, capture=True)
+            self.kernelState.commit(num, parameters, changed, result.returnCode, result.out)
+
+    def readyTask(self, num, timeout):
+        """ Probe the slot with backoff until it is ready (then return True) or timeout seconds are elapsed """
+        result = yield self.remoteCommand(num, self.slots[num].readyCmd())
+        if result.returnCode == 0:
+            raise Return(True)
+
+        for delay in backoffDelays(timeout):
+            yield Sleep(delay)
+            result = yield self.remoteCommand(num, self.slots[num].readyCmd())
+            if result.returnCode == 0:
+                raise Return(True)
+        raise Return(False)
+
+    def cleanMininetTask(self, num):
+        result = yield self.remoteCommand(num, self.slots[num].cleanCmd())
+        if result.returnCode != 0:
+            yield self.remoteCommand(num, "sudo mn -c", timeout=30)
+        ready = yield self.readyTask(num, READY_TIMEOUT)
+        if not ready:
+            print("Host " + self.slotName(num) + " still not ready after cleaning Mininet: continue")
+
+    def bootIdTask(self, num):
+        result = yield self.remoteCommand(num, "cat " + BOOT_ID_PATH, capture=True)
+        raise Return(result.out.decode().strip() if result.returnCode == 0 else None)
+
+    def recoverTask(self, num):
+        """ Same escalation as MinitopoCommand.recover(), without blocking the loop """
+        slot = self.slots[num]
+        yield self.remoteCommand(num, slot.killCmd())
+        ready = yield self.readyTask(num, READY_TIMEOUT)
+        if ready or slot.isolated():
+            raise Return(ready)
+
+        bootId = yield self.bootIdTask(num)
+        yield self.remoteCommand(num, "sudo reboot")
+        for delay in backoffDelays(RECOVERY_TIMEOUT):
+            yield Sleep(delay)
+            # The reboot kills the master connection at some point
+            self.transport.masterLost(num)
+            masterOpened = yield self.masterTask(num)
+            if not masterOpened:
+                continue
+
+            newBootId = yield self.bootIdTask(num)
+            if newBootId is not None and newBootId != bootId:
+                yield self.remoteCommand(num, slot.cleanCmd())
+                # E.g., the MPTCP modules might be loaded after SSH is reachable
+                ready = yield self.readyTask(num, READY_TIMEOUT)
+                raise Return(ready)
+
+        raise Return(False)
+
+    def runTask(self, num, **kwargs):
+        """ Return True if the experience completed, False if it timed out """
+        minitopoOut = open(os.path.join(kwargs["workingDir"], "minitopo.out"), "wb")
+        minitopoErr = open(os.path.join(kwargs["workingDir"], "minitopo.err"), "wb")
+        timeout = self.timeoutModel.timeout(**kwargs)
+        start = time.time()
+        result = yield self.remoteCommand(num, self.minitopoRemoteCmd(num, **kwargs), timeout=timeout, stdout=minitopoOut,
+                                          stderr=minitopoErr)
+        minitopoOut.close()
+        minitopoErr.close()
+        if result.timedOut:
+            print("Experience timed out after " + str(timeout) + " seconds; recover the machine")
+            self.timeoutModel.timedOut()
+        elif result.returnCode == 0:
+            yield self.worker.call(self.timeoutModel.observe, time.time() - start, **kwargs)
+        raise Return(not result.timedOut)
+
+    def collectTask(self, num, **kwargs):
+        files = self.postProcessingFiles(**kwargs)
+        try:
+            with self.events.timed("collect", self.slotName(num), **kwargs):
+                if self.bulkPull:
+                    wanted = bulkPullWanted(files)
+                    archive = tempfile.TemporaryFile()
+                    yield self.remoteCommand(num, bulkPullCmd(wanted, self.compressPull), stdout=archive)
+                    archive.seek(0)
+                    pulled = yield self.worker.call(extractBulkPull, archive, wanted, self.compressPull)
+                    archive.close()
+                    checkBulkPull(wanted, pulled)
+                else:
+                    for remoteFilename, remotePath, newFilename in files:
+                        yield self.checkedTask(Command(self.transport.getCmd(num, remotePath + "/" + remoteFilename, newFilename)),
+                                               "File " + remoteFilename + " could not be pull from remote server at path " +
+                                               remotePath)
+            artifacts = [newFilename for _, _, newFilename in files]
+        except Exception as e:
+            print(str(e) + ": continue")
+            artifacts = None
+
+        yield self.worker.call(self.xpCollected, num, artifacts, **kwargs)
+        yield self.remoteCommand(num, "rm -rf " + kwargs["tmpfs"])
+
+    def hostTask(self, num):
+        while not self.quarantined[num]:
+            workData, = yield Poll(self.getWork)
+            if workData is None:
+                break
+
+            self.jobCounters[num] += 1
+            jobData = dict(workData, tmpfs=self.slots[num].tmpfs(workData["tmpfs"]) + "/job_" + str(self.jobCounters[num]))
+            testOk = False
+            hostReady = True
+            try:
+                masterOpened = yield self.masterTask(num)
+                if not masterOpened:
+                    raise Exception("Cannot open master SSH connection to " + self.slotName(num))
+                with self.events.timed("upload", self.slotName(num), **jobData):
+                    yield self.uploadTask(num, **jobData)
+                self.printXp(num, **jobData)
+                yield self.worker.call(self.journalUpdate, num, RUNNING, **jobData)
+                parameters = xpKernelParameters(**jobData)
+                with self.events.timed("lease", self.slotName(num), **jobData):
+                    # The other slots of the host must not change the kernel parameters during the experience
+                    yield Poll(lambda: self.kernelState.tryAcquire(num, parameters))
+                try:
+                    with self.events.timed("kernel", self.slotName(num), **jobData):
+                        yield self.kernelTask(num, parameters)
+                    with self.events.timed("clean", self.slotName(num), **jobData):
+                        yield self.cleanMininetTask(num)
+                    with self.events.timed("run", self.slotName(num), **jobData) as event:
+                        testOk = yield self.runTask(num, **jobData)
+                        event["ok"] = testOk
+                finally:
+                    self.kernelState.release(num)
+                if not testOk:
+                    # The host goes through a recovery, don't trust its kernel state anymore
+                    self.kernelState.invalidate(num)
+                    hostReady = yield self.recoverTask(num)
+            except Exception as e:
+                print(str(e) + ": continue")
+
+            if testOk:
+                self.hostFailures[num] = 0
+                self.loop.spawn(self.collectTask(num, **jobData))
+            else:
+                self.hostFailed(num, hostReady)
+                yield self.worker.call(self.retryXp, num, **workData)
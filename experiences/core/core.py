@@ -1,18 +1,67 @@
 from __future__ import print_function
 
+from design_file import TopoDesignFile
 from generate_topo import generateTopoFile, PATHS, DELAY, QUEUE_SIZE, QUEUING_DELAY, BANDWIDTH, LOSS, NETEM
+from events import PhaseEvents
 from generate_xp import generateXpFile
+from journal import CampaignJournal, PENDING, RUNNING, DONE, FAILED
+from kernel_state import BOOT_ID_PATH, KernelStateCache, mptcpEnabledParameters, openBupParameters, xpKernelParameters
+from pcap_summary import SUMMARY_EXTENSION
+from replication import AdaptiveReplication
+from result_cache import ResultCache, linkArtifact
+from result_store import ResultStore
+from scheduler import JobScheduler
+from slots import HOST_READY_CMD, ISOLATION_CHECK_CMD, Slot, expandSlots
+from ssh_pool import SshConnectionPool
+from transport import LocalTransport
+from timeout_model import TimeoutModel
+from upload_store import UploadStore
 from Queue import Queue
 
 import os
+import posixpath
+import shutil
+import signal
 import subprocess
+import tarfile
 import time
 import threading
 
-""" Let 2 hours to complete the experiment """
+""" Never let more than 2 hours to complete the experiment, whatever the TimeoutModel predicts """
 # This should be sufficient for the worst case topology (~0.10 Mbps to download 20 MB on single-path)
 THREAD_TIMEOUT = 7200
 
+""" Path of Minitopo on the remote hosts """
+MINITOPO_PATH = "~/git/minitopo/src/mpPerf.py"
+
+""" Policies of ExperienceLauncher pcapSummary: once summarized on the host, the pcap files are moved to PCAP_KEEP_DIR
+    (relative to the home directory of the hosts), removed, or still pulled along with their summary
+"""
+PCAP_KEEP = "keep"
+PCAP_DISCARD = "discard"
+PCAP_PULL = "pull"
+PCAP_KEEP_DIR = "minitopo_pcaps"
+""" The summarizer, uploaded with the topo and xp files of each job, and the Python interpreter of the hosts running it """
+PCAP_SUMMARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pcap_summary.py")
+PCAP_SUMMARY_PYTHON = "python"
+
+""" A job whose host failed is requeued until it was tried this number of times """
+MAX_JOB_ATTEMPTS = 3
+""" A host failing this number of consecutive jobs is quarantined (except the last healthy one) """
+MAX_HOST_FAILURES = 3
+""" Maximum time to wait for a host to come back after a reboot """
+RECOVERY_TIMEOUT = 300
+""" Maximum time to wait for a host to be ready (see Slot.readyCmd()) once cleaned """
+READY_TIMEOUT = 30
+""" Readiness is probed after READY_FIRST_DELAY seconds, then after a delay growing by READY_BACKOFF up to READY_MAX_DELAY """
+READY_FIRST_DELAY = 0.1
+READY_BACKOFF = 2
+READY_MAX_DELAY = 5
+""" Once a timed out command is killed, the output it printed is copied during at most this number of seconds before
+    recovering the host: orphaned processes may keep its pipes open until the recovery kills them
+"""
+DRAIN_TIMEOUT = 5
+
 
 """ Some useful functions """
 
@@ -28,6 +77,12 @@ def check_directory_exists(directory):
         os.makedirs(directory)
 
 
+def elemToDirname(elem):
+    if isinstance(elem, tuple):
+        return "_".join(elem)
+    return str(elem)
+
+
 def topoToFilename(topo):
     i = 0
     toReturn = ""
@@ -52,15 +107,90 @@ def topoToFilename(topo):
     return toReturn
 
 
+def backoffDelays(timeout):
+    """ Yield the delays to wait between two probes, growing exponentially, as long as timeout seconds are not elapsed """
+    deadline = time.time() + timeout
+    delay = READY_FIRST_DELAY
+    while time.time() + delay <= deadline:
+        yield delay
+        delay = min(delay * READY_BACKOFF, READY_MAX_DELAY)
+
+
+def waitUntil(probe, timeout):
+    """ Call probe() with backoff until it returns True (then return True) or timeout seconds are elapsed """
+    if probe():
+        return True
+
+    for delay in backoffDelays(timeout):
+        time.sleep(delay)
+        if probe():
+            return True
+    return False
+
+
+def copyWithTimestamps(stream, outFile):
+    """ Copy stream line by line to outFile, each line prefixed by the time at which it was read """
+    for line in iter(stream.readline, b""):
+        outFile.write(("%.3f " % time.time()).encode() + line)
+    stream.close()
+    outFile.close()
+
+
+def bulkPullWanted(files):
+    """ Map the remote path of each file (list of (remoteFilename, remotePath, newFilename)) to its local names """
+    wanted = {}
+    for remoteFilename, remotePath, newFilename in files:
+        wanted.setdefault(os.path.normpath(os.path.join(remotePath, remoteFilename)), []).append(newFilename)
+    return wanted
+
+
+def bulkPullCmd(wanted, compress):
+    """ Remote command writing a tar archive of the wanted files on its stdout, skipping the missing ones """
+    return "tar -c" + ("z" if compress else "") + "Pf - --ignore-failed-read " + " ".join(sorted(wanted))
+
+
+def extractBulkPull(stream, wanted, compress):
+    """ Extract the wanted files from the tar stream under their local names, return the set of pulled remote paths """
+    pulled = set()
+    try:
+        archive = tarfile.open(fileobj=stream, mode="r|gz" if compress else "r|")
+        for member in archive:
+            if member.name not in wanted or not member.isfile():
+                continue
+            # A stream can only be read once, so copy the first local file for the other names
+            firstFilename = wanted[member.name][0]
+            newFile = open(firstFilename, "wb")
+            shutil.copyfileobj(archive.extractfile(member), newFile)
+            newFile.close()
+            for newFilename in wanted[member.name][1:]:
+                shutil.copyfile(firstFilename, newFilename)
+            pulled.add(member.name)
+        archive.close()
+    except tarfile.TarError as e:
+        print("Bulk pull interrupted (" + str(e) + ")")
+    return pulled
+
+
+def checkBulkPull(wanted, pulled):
+    missing = [remoteFile for remoteFile in sorted(wanted) if remoteFile not in pulled]
+    if len(missing) > 0:
+        raise Exception("Files " + ", ".join(missing) + " could not be pull from remote server")
+
+
 class MinitopoCommand(object):
     """ The actual Minitopo command """
-    def __init__(self, num, remoteHostname, remotePort, cmd, cwd, testOkList):
+    def __init__(self, num, transport, cmd, cwd, testOkList, timestamps=False, slot=None):
+        """ The outputs go straight to minitopo.out and minitopo.err, unless timestamps is set: then each line is prefixed
+            by the time at which it was received
+            slot is the Slot of host num running the command; if None, the command uses the whole host
+        """
         self.num = num
-        self.remoteHostname = remoteHostname
-        self.remotePort = remotePort
+        self.slot = Slot(num, 0, 1) if slot is None else slot
+        self.transport = transport
         self.cmd = cmd
         self.cwd = cwd
         self.testOkList = testOkList
+        self.timestamps = timestamps
         self.process = None
 
     def run(self, timeout):
@@ -68,189 +198,383 @@ class MinitopoCommand(object):
 
         def target():
             try:
-                self.process = subprocess.Popen(self.cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                minitopoOut = open(os.path.join(self.cwd, "minitopo.out"), "w")
-                minitopoErr = open(os.path.join(self.cwd, "minitopo.err"), "w")
-                minitopoOut.writelines(self.process.stdout.readlines())
-                minitopoErr.writelines(self.process.stderr.readlines())
-                minitopoOut.close()
-                minitopoErr.close()
-                self.process.communicate()
+                minitopoOut = open(os.path.join(self.cwd, "minitopo.out"), "wb")
+                minitopoErr = open(os.path.join(self.cwd, "minitopo.err"), "wb")
+                # In its own process group, so that a timeout kills its children too
+                if self.timestamps:
+                    self.process = subprocess.Popen(self.cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                                    preexec_fn=os.setsid)
+                    # One thread per stream, so that a full stderr pipe cannot block the run. They close the files once
+                    # their stream ends, which a process that escaped the kill can delay: they must not block the exit
+                    copyThreads = [threading.Thread(target=copyWithTimestamps, args=(self.process.stdout, minitopoOut)),
+                                   threading.Thread(target=copyWithTimestamps, args=(self.process.stderr, minitopoErr))]
+                    for copyThread in copyThreads:
+                        copyThread.daemon = True
+                        copyThread.start()
+                    self.process.wait()
+                    for copyThread in copyThreads:
+                        copyThread.join(None if self.testOkList[self.num] else DRAIN_TIMEOUT)
+                else:
+                    self.process = subprocess.Popen(self.cmd, stdout=minitopoOut, stderr=minitopoErr, preexec_fn=os.setsid)
+                    self.process.wait()
+                    minitopoOut.close()
+                    minitopoErr.close()
             except Exception as e:
                 print(str(e) + ": continue")
 
         self.testOkList[self.num] = True
+        hostReady = True
 
         thread = threading.Thread(target=target)
         thread.start()
 
         thread.join(timeout)
         if thread.is_alive():
-            # print("Experience terminated!")
-            print("Experience failed; take a look on the machine")
-            time.sleep(66666666666)
-            # time.sleep(600)
+            print("Experience timed out after " + str(timeout) + " seconds; recover the machine")
             self.testOkList[self.num] = False
-            self.process.kill()
-            devnull = open(os.devnull, "w")
-            self.process = subprocess.Popen('ssh -p ' + self.remotePort + ' ' + self.remoteHostname + ' "sudo pkill -f mpPerf.py"',
-                                            shell=True, stdout=devnull, stderr=devnull)
-            time.sleep(1)
-            self.process = subprocess.Popen('ssh -p ' + self.remotePort + ' ' + self.remoteHostname + ' "sudo reboot"',
-                                            shell=True, stdout=devnull, stderr=devnull)
-            time.sleep(15)
-            self.process = subprocess.Popen('ssh -p ' + self.remotePort + ' ' + self.remoteHostname + ' "sudo mn -c"',
-                                            shell=True, stdout=devnull, stderr=devnull)
-            time.sleep(5)
+            self.kill()
+            # The copy of the outputs may still wait for processes of the experience, which the recovery kills
+            thread.join(DRAIN_TIMEOUT)
+            hostReady = self.recover()
 
         # Be sure
+        self.kill()
+        return hostReady
+
+    def kill(self):
+        """ Kill the process group of the command, i.e., the command and the local processes it started """
         try:
-            self.process.kill()
-        except OSError:
-            # Avoid exception if we just want to be sure
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except (AttributeError, OSError):
+            # Not started yet, or already gone
             pass
 
+    def isHostReady(self):
+        devnull = open(os.devnull, "w")
+        returnCode = subprocess.call(self.transport.shellCmd(self.num, self.slot.readyCmd()), stdout=devnull, stderr=devnull)
+        devnull.close()
+        return returnCode == 0
+
+    def bootId(self):
+        """ Return the boot_id of the host, or None if it cannot be reached """
+        devnull = open(os.devnull, "w")
+        process = subprocess.Popen(self.transport.shellCmd(self.num, "cat " + BOOT_ID_PATH), stdout=subprocess.PIPE, stderr=devnull)
+        out = process.communicate()[0]
+        devnull.close()
+        return out.decode().strip() if process.returncode == 0 else None
+
+    def recover(self):
+        """ Escalating recovery of the host: kill the experience and clean Mininet, then reboot if this was not enough
+            A slot sharing its host with others is never rebooted. Return True if the host is ready for the next experience
+        """
+        devnull = open(os.devnull, "w")
+        subprocess.call(self.transport.shellCmd(self.num, self.slot.killCmd()), stdout=devnull, stderr=devnull)
+        hostReady = waitUntil(self.isHostReady, READY_TIMEOUT)
+        if hostReady or self.slot.isolated():
+            devnull.close()
+            return hostReady
+
+        bootId = self.bootId()
+        subprocess.call(self.transport.shellCmd(self.num, "sudo reboot"), stdout=devnull, stderr=devnull)
+        # The reboot killed the master connection, it is reopened by the next command
+        self.transport.masterLost(self.num)
+        if not waitUntil(lambda: self.bootId() not in (None, bootId), RECOVERY_TIMEOUT):
+            devnull.close()
+            return False
+
+        subprocess.call(self.transport.shellCmd(self.num, self.slot.cleanCmd()), stdout=devnull, stderr=devnull)
+        devnull.close()
+        # E.g., the MPTCP modules might be loaded after SSH is reachable
+        return waitUntil(self.isHostReady, READY_TIMEOUT)
+
 
 class ExperienceLauncher(object):
     """ Keep track of all needed to launch experiences """
-    def __init__(self, remoteHostnames, remotePorts):
-        self.remoteHostnames = remoteHostnames
-        self.remotePorts = remotePorts
-
-        if not len(self.remoteHostnames) == len(self.remotePorts):
+    def __init__(self, remoteHostnames, remotePorts, bulkPull=True, compressPull=False, pipeline=True, journal=None,
+                 resultCache=None, timestampOutput=False, timeoutModel=None, lpt=True, slots=1,
+                 transport=SshConnectionPool, minitopoPath=MINITOPO_PATH, uploadDedup=True, resultStore=None,
+                 pcapSummary=None, replication=None):
+        """ If bulkPull, all files of postProcessing are retrieved in a single tar stream (gzipped if compressPull)
+            If pipeline, each host runs its jobs in three stages (upload, run, collect) so that the collect of a job
+            overlaps the upload and kernel configuration of the next one; each job then uses its own tmpfs subdirectory
+            If journal (a CampaignJournal) is given, jobs already done are skipped and the state of the others is recorded
+            If resultCache (a ResultCache) is given, jobs whose results are cached are linked instead of being run
+            If timestampOutput, each line of minitopo.out and minitopo.err is prefixed by the time it was received
+            timeoutModel (a TimeoutModel) gives the timeout of each job and learns from its runtime; if None, a model
+            starting from scratch is used
+            Jobs are dispatched as soon as they are added; if lpt, the longest expected runtime first among the oldest
+            pending ones (see JobScheduler), so that a long job does not end up alone at the tail of the campaign
+            slots is the number of experiences each host runs concurrently (or a list with this number for each host);
+            with more than one, each experience is isolated in its own network namespace (see Slot), which requires
+            Mininet switches without Open vSwitch
+            transport is the Transport class used to reach the hosts, e.g., LocalTransport to run everything on this
+            machine without SSH; minitopoPath is the mpPerf.py it runs
+            If uploadDedup, each host keeps the topo and xp files it received in an UploadStore, so that a file used by
+            several jobs is only sent once
+            If resultStore (a ResultStore) is given, the artifacts of each job are parsed into it as soon as they are
+            collected (or linked from the resultCache)
+            If pcapSummary is a policy (PCAP_KEEP, PCAP_DISCARD or PCAP_PULL), the .pcap files of postProcessing are
+            summarized on the host after the run (see pcap_summary.py), and X.pcap is pulled as X.pcap.summary.json
+            If replication (an AdaptiveReplication) is given, it records the completion time of each job as soon as it is
+            collected (or linked from the journal or the resultCache)
+        """
+        if pcapSummary not in (None, PCAP_KEEP, PCAP_DISCARD, PCAP_PULL):
+            raise Exception("Unknown pcap summary policy " + str(pcapSummary))
+
+        self.bulkPull = bulkPull
+        self.compressPull = compressPull
+        self.pipeline = pipeline
+        self.journal = journal
+        self.resultCache = resultCache
+        self.resultStore = resultStore
+        self.replication = replication
+        self.hostSoftwareVersions = None
+        self.pcapSummary = pcapSummary
+        self.timestampOutput = timestampOutput
+        self.minitopoPath = minitopoPath
+        # Subscribe to it to get the timing of each phase of each job
+        self.events = PhaseEvents()
+        self.timeoutModel = TimeoutModel(maxTimeout=THREAD_TIMEOUT) if timeoutModel is None else timeoutModel
+
+        if not len(remoteHostnames) == len(remotePorts):
             raise Exception("remoteHostnames and remotePorts with different lengths")
 
-        if len(self.remoteHostnames) <= 0:
+        if len(remoteHostnames) <= 0:
             raise Exception("No remote server specified")
 
-        self.workQueue = Queue(len(self.remoteHostnames))
+        # From now on, num identifies a slot: the lists below have one entry per slot
+        self.slots = expandSlots(remoteHostnames, slots)
+        self.remoteHostnames = [remoteHostnames[slot.host] for slot in self.slots]
+        self.remotePorts = [remotePorts[slot.host] for slot in self.slots]
+        self.transport = transport(self.remoteHostnames, self.remotePorts)
+        self.kernelState = KernelStateCache(self.transport, hosts=[slot.host for slot in self.slots])
+        self.uploadStore = UploadStore(self.transport, hosts=[slot.host for slot in self.slots]) if uploadDedup else None
+        self.workQueue = JobScheduler(len(self.remoteHostnames), lpt=lpt)
         self.finished = False
         self.testOkList = [True] * len(self.remoteHostnames)
+        self.hostFailures = [0] * len(self.remoteHostnames)
+        self.quarantined = [False] * len(self.remoteHostnames)
+        self.hostLock = threading.Lock()
+        # Jobs added and not completed yet, including requeued ones
+        self.outstanding = 0
+        self.outstandingCondition = threading.Condition()
         self.threads = []
+        self.checkIsolation()
+        self.startWorkers()
+
+    def checkIsolation(self):
+        """ Refuse to run several slots on a host whose Mininet switches would be shared by them (see Slot) """
+        for num in range(len(self.slots)):
+            if not self.slots[num].isolated() or self.slots[num].index > 0:
+                continue
+
+            devnull = open(os.devnull, "w")
+            returnCode = subprocess.call(self.transport.shellCmd(num, ISOLATION_CHECK_CMD), stdout=devnull, stderr=devnull)
+            devnull.close()
+            if returnCode != 0:
+                raise Exception("Host " + self.remoteHostnames[num] + " runs Open vSwitch, whose bridges are shared by all its "
+                                "network namespaces: it cannot run several slots")
+
+    def startWorkers(self):
+        if self.pipeline:
+            self.jobCounters = [0] * len(self.remoteHostnames)
+            self.readyQueues = [Queue(1) for _ in self.remoteHostnames]
+            self.collectQueues = [Queue(1) for _ in self.remoteHostnames]
+            loops = [self.uploadLoop, self.runLoop, self.collectLoop]
+        else:
+            loops = [self.workerLoop]
 
         for threadId in range(len(self.remoteHostnames)):
-            thread = threading.Thread(target=self.workerLoop, args=(threadId,))
-            thread.start()
-            self.threads.append(thread)
+            for loop in loops:
+                thread = threading.Thread(target=loop, args=(threadId,))
+                thread.start()
+                self.threads.append(thread)
+
+    def slotName(self, num):
+        name = self.remoteHostnames[num] + ":" + self.remotePorts[num]
+        return name + "/" + self.slots[num].name() if self.slots[num].isolated() else name
+
+    def remoteCall(self, num, remoteCmd, **kwargs):
+        """ Run remoteCmd on host num through the transport and return the exit code """
+        return subprocess.call(self.transport.shellCmd(num, remoteCmd), **kwargs)
 
     def putOnRemote(self, num, filename, path):
-        cmd = "scp -P " + self.remotePorts[num] + " " + filename + " " + self.remoteHostnames[num] + ":" + path
-        if subprocess.call(cmd.split()) != 0:
+        cmd = self.transport.putCmd(num, filename, path)
+        if subprocess.call(cmd) != 0:
             raise Exception("File " + filename + " could not be put on remote server at path " + path)
 
     def pullHereFromRemote(self, num, filename, path, newFilename):
-        cmd = "scp -P " + self.remotePorts[num] + " " + self.remoteHostnames[num] + ":" + path + "/" + filename + " " + newFilename
-        if subprocess.call(cmd.split()) != 0:
+        cmd = self.transport.getCmd(num, path + "/" + filename, newFilename)
+        if subprocess.call(cmd) != 0:
             raise Exception("File " + filename + " could not be pull from remote server at path " + path)
 
     def changeMptcpEnabled(self, num, value):
-        cmd = ["ssh", "-p", self.remotePorts[num], self.remoteHostnames[num], "sudo sysctl net.mptcp.mptcp_enabled=" + str(value)]
-        if subprocess.call(cmd) != 0:
-            raise Exception("Cannot change value of mptcp_enabled at " + str(value))
+        self.kernelState.apply(num, mptcpEnabledParameters(value))
 
     def changeOpenBup(self, num, value):
         """ Also disable the oracle if openBup is enabled """
-        cmd = ["ssh", "-p", self.remotePorts[num], self.remoteHostnames[num],
-               "echo " + str(value).split('-')[0] + " | sudo tee /sys/module/mptcp_fullmesh/parameters/open_bup"]
-        if subprocess.call(cmd) != 0:
-            raise Exception("Cannot change value of open_bup at " + str(value))
-
-        if value == "0" or value == "0-250":
-            sloss_threshold, sretrans_threshold, rto_ms_threshold, idle_periods_threshold, timer_period_ms = "250", "500", "1500", "0", "500"
-        elif value == "0-400":
-            sloss_threshold, sretrans_threshold, rto_ms_threshold, idle_periods_threshold, timer_period_ms = "400", "500", "1500", "0", "500"
-        elif value == "0-100":
-            sloss_threshold, sretrans_threshold, rto_ms_threshold, idle_periods_threshold, timer_period_ms = "100", "500", "1500", "0", "500"
-        elif value == "0-t1":
-            sloss_threshold, sretrans_threshold, rto_ms_threshold, idle_periods_threshold, timer_period_ms = "250", "500", "1500", "0", "1"
-        elif value == "0-t10":
-            sloss_threshold, sretrans_threshold, rto_ms_threshold, idle_periods_threshold, timer_period_ms = "250", "500", "1500", "0", "10"
-        elif value == "0-t100":
-            sloss_threshold, sretrans_threshold, rto_ms_threshold, idle_periods_threshold, timer_period_ms = "250", "500", "1500", "0", "100"
-        elif value == "0-t500":
-            sloss_threshold, sretrans_threshold, rto_ms_threshold, idle_periods_threshold, timer_period_ms = "250", "500", "1500", "0", "500"
-        elif value == "0-t1000":
-            sloss_threshold, sretrans_threshold, rto_ms_threshold, idle_periods_threshold, timer_period_ms = "250", "500", "1500", "0", "1000"
-        elif value == "0-T750":
-            sloss_threshold, sretrans_threshold, rto_ms_threshold, idle_periods_threshold, timer_period_ms = "250", "500", "750", "0", "100"
-        elif value == "0-t100-T500":
-            sloss_threshold, sretrans_threshold, rto_ms_threshold, idle_periods_threshold, timer_period_ms = "250", "500", "500", "0", "100"
-        else:
-            sloss_threshold, sretrans_threshold, rto_ms_threshold, idle_periods_threshold, timer_period_ms = "0", "0", "0", "0", "500"
-
-        cmd = ["ssh", "-p", self.remotePorts[num], self.remoteHostnames[num],
-               "echo " + sloss_threshold + " | sudo tee /sys/module/mptcp_oracle/parameters/sloss_threshold"]
-        if subprocess.call(cmd) != 0:
-            raise Exception("Cannot change value of sloss_threshold at " + sloss_threshold)
-
-        cmd = ["ssh", "-p", self.remotePorts[num], self.remoteHostnames[num],
-               "echo " + sretrans_threshold + " | sudo tee /sys/module/mptcp_oracle/parameters/sretrans_threshold"]
-        if subprocess.call(cmd) != 0:
-            raise Exception("Cannot change value of sretrans_threshold at " + sretrans_threshold)
-
-        cmd = ["ssh", "-p", self.remotePorts[num], self.remoteHostnames[num],
-               "echo " + rto_ms_threshold + " | sudo tee /sys/module/mptcp_oracle/parameters/rto_ms_threshold"]
-        if subprocess.call(cmd) != 0:
-            raise Exception("Cannot change value of rto_ms_threshold at " + rto_ms_threshold)
-
-        cmd = ["ssh", "-p", self.remotePorts[num], self.remoteHostnames[num],
-               "echo " + idle_periods_threshold + " | sudo tee /sys/module/mptcp_oracle/parameters/idle_periods_threshold"]
-        if subprocess.call(cmd) != 0:
-            raise Exception("Cannot change value of idle_periods_threshold at " + idle_periods_threshold)
-
-        cmd = ["ssh", "-p", self.remotePorts[num], self.remoteHostnames[num],
-               "echo " + timer_period_ms + " | sudo tee /sys/module/mptcp_oracle/parameters/timer_period_ms"]
-        if subprocess.call(cmd) != 0:
-            raise Exception("Cannot change value of timer_period_ms at " + timer_period_ms)
-
-    def postProcessing(self, num, **kwargs):
-        """ Can have two or three elements in tuple, remotePath can be ignored (replaced by kwargs["tmpfs"]) """
+        self.kernelState.apply(num, openBupParameters(value))
+
+    def pullAllHereFromRemote(self, num, files, compress=False):
+        """ Pull all files (list of (remoteFilename, remotePath, newFilename)) in a single tar stream
+            Raise an Exception listing the files that could not be pulled
+        """
+        wanted = bulkPullWanted(files)
+        devnull = open(os.devnull, "w")
+        process = subprocess.Popen(self.transport.shellCmd(num, bulkPullCmd(wanted, compress)), stdout=subprocess.PIPE, stderr=devnull)
+        try:
+            pulled = extractBulkPull(process.stdout, wanted, compress)
+        finally:
+            process.stdout.close()
+            process.wait()
+            devnull.close()
+
+        checkBulkPull(wanted, pulled)
+
+    def postProcessingEntries(self, **kwargs):
+        """ Can have two or three elements in tuple, remotePath can be ignored (None, i.e., kwargs["tmpfs"])
+            Return the list of (remoteFilename, remotePath, localFilename), the pcap files being replaced by their summary
+            with pcapSummary
+        """
+        entries = []
         for postProcess in kwargs["postProcessing"]:
             if len(postProcess) == 2:
                 remoteFilename, localFilename = postProcess
-                remotePath = kwargs["tmpfs"]
+                remotePath = None
             elif len(postProcess) == 3:
                 remoteFilename, remotePath, localFilename = postProcess
             else:
                 raise Exception("Invalid number of elements in postProcessing: " + str(postProcess))
 
-            self.pullHereFromRemote(num, remoteFilename, remotePath, os.path.join(kwargs["workingDir"], localFilename))
-
-    def cleanMininet(self, num):
-        cmd = ["ssh", "-p", self.remotePorts[num], self.remoteHostnames[num], "timeout 20 sudo mn -c"]
-        devnull = open(os.devnull, 'w')
-        if subprocess.call(cmd, stdout=devnull, stderr=devnull) != 0:
-            # raise Exception("Cannot clean mininet for thread " + str(num))
-            subprocess.Popen('ssh -p ' + self.remotePorts[self.num] + ' ' + self.remoteHostnames[self.num] + ' "sudo mn -c"',
-                             shell=True, stdout=devnull, stderr=devnull)
-            time.sleep(30)
+            if self.pcapSummary is not None and remoteFilename.endswith(".pcap"):
+                entries.append((remoteFilename + SUMMARY_EXTENSION, remotePath, localFilename + SUMMARY_EXTENSION))
+                if self.pcapSummary != PCAP_PULL:
+                    continue
+            entries.append((remoteFilename, remotePath, localFilename))
+        return entries
 
-        devnull.close()
-        time.sleep(1)
+    def postProcessingFiles(self, **kwargs):
+        """ Return the list of (remoteFilename, remotePath, newFilename) """
+        return [(remoteFilename, kwargs["tmpfs"] if remotePath is None else remotePath,
+                 os.path.join(kwargs["workingDir"], localFilename))
+                for remoteFilename, remotePath, localFilename in self.postProcessingEntries(**kwargs)]
 
-    def launchXp(self, num, **kwargs):
-        if kwargs["protocol"] == "tcp":
-            self.changeMptcpEnabled(num, 0)
-        elif kwargs["protocol"] == "mptcp":
-            self.changeMptcpEnabled(num, 1)
+    def postProcessing(self, num, **kwargs):
+        files = self.postProcessingFiles(**kwargs)
+        if self.bulkPull:
+            self.pullAllHereFromRemote(num, files, compress=self.compressPull)
         else:
-            raise Exception("Unknown protocol " + protocol)
+            for remoteFilename, remotePath, newFilename in files:
+                self.pullHereFromRemote(num, remoteFilename, remotePath, newFilename)
 
-        if "openBup" in kwargs:
-            self.changeOpenBup(num, kwargs["openBup"])
+        return [newFilename for _, _, newFilename in files]
 
-        self.cleanMininet(num)
-        cmd = 'ssh -p ' + self.remotePorts[num] + ' ' + self.remoteHostnames[num] + \
-              ' "cd ' + kwargs["tmpfs"] + '; sudo ~/git/minitopo/src/mpPerf.py -x ' + os.path.basename(kwargs["xpAbsPath"]) + ' -t ' + \
-              os.path.basename(kwargs["topoAbsPath"]) + '"'
-        MinitopoCommand(num, self.remoteHostnames[num], self.remotePorts[num], cmd, kwargs["workingDir"], self.testOkList).run(timeout=THREAD_TIMEOUT)
+    def resultCacheFiles(self, **kwargs):
+        """ Identify the files of postProcessing by their remote name, relative to tmpfs for tuples with two elements """
+        files = []
+        for remoteFilename, remotePath, localFilename in self.postProcessingEntries(**kwargs):
+            remoteKey = remoteFilename if remotePath is None else posixpath.join(remotePath, remoteFilename)
+            files.append((remoteKey, os.path.join(kwargs["workingDir"], localFilename)))
+        return files
 
-    def threadLaunchXp(self, num, **kwargs):
-        global testOkList
+    def cleanMininet(self, num):
+        """ Clean what the previous experience left, then wait until the host is actually ready for the next one """
+        devnull = open(os.devnull, 'w')
+        if self.remoteCall(num, self.slots[num].cleanCmd(), stdout=devnull, stderr=devnull) != 0:
+            # raise Exception("Cannot clean mininet for thread " + str(num))
+            subprocess.Popen(self.transport.shellCmd(num, "sudo mn -c"), stdout=devnull, stderr=devnull)
 
-        self.putOnRemote(num, kwargs["topoAbsPath"], kwargs["tmpfs"])
-        self.putOnRemote(num, kwargs["xpAbsPath"], kwargs["tmpfs"])
+        if not waitUntil(lambda: self.remoteCall(num, self.slots[num].readyCmd(), stdout=devnull, stderr=devnull) == 0,
+                         READY_TIMEOUT):
+            print("Host " + self.slotName(num) + " still not ready after cleaning Mininet: continue")
+        devnull.close()
+
+    def minitopoRemoteCmd(self, num, **kwargs):
+        cmd = "cd " + kwargs["tmpfs"] + "; " + self.slots[num].wrapCmd(self.minitopoPath + " -x " +
+                                                                       os.path.basename(kwargs["xpAbsPath"]) + " -t " +
+                                                                       os.path.basename(kwargs["topoAbsPath"]))
+        pcaps = self.summarizedPcaps(**kwargs)
+        if len(pcaps) == 0:
+            return cmd
+
+        # Outside of the namespace of the slot, and keeping the return code of Minitopo
+        return cmd + "; returnCode=$?; " + self.pcapSummaryCmd(pcaps, **kwargs) + "; exit $returnCode"
+
+    def summarizedPcaps(self, **kwargs):
+        """ Remote paths of the pcap files of postProcessing to summarize, relative to kwargs["tmpfs"] for tuples with two
+            elements
+        """
+        if self.pcapSummary is None:
+            return []
+
+        pcaps = []
+        for postProcess in kwargs["postProcessing"]:
+            remoteKey = postProcess[0] if len(postProcess) == 2 else posixpath.join(postProcess[1], postProcess[0])
+            if remoteKey.endswith(".pcap"):
+                pcaps.append(remoteKey)
+        return pcaps
+
+    def pcapSummaryCmd(self, pcaps, **kwargs):
+        """ Remote command summarizing the pcaps (relative to kwargs["tmpfs"]) then applying the pcapSummary policy """
+        cmd = PCAP_SUMMARY_PYTHON + " " + os.path.basename(PCAP_SUMMARY_PATH)
+        if self.pcapSummary == PCAP_KEEP:
+            keepDir = posixpath.join(PCAP_KEEP_DIR, kwargs["testDirectory"],
+                                     os.path.relpath(kwargs["workingDir"], kwargs["campaignDir"]).replace(os.sep, "/"))
+            cmd += " --keep $HOME/" + keepDir
+        elif self.pcapSummary == PCAP_DISCARD:
+            cmd += " --discard"
+        return cmd + " " + " ".join(pcaps)
+
+    def jobFiles(self, **kwargs):
+        """ Local files to put in kwargs["tmpfs"] before the run """
+        filenames = [kwargs["topoAbsPath"], kwargs["xpAbsPath"]]
+        if self.pcapSummary is not None:
+            filenames.append(PCAP_SUMMARY_PATH)
+        return filenames
 
+    def launchXp(self, num, **kwargs):
+        parameters = xpKernelParameters(**kwargs)
+        with self.events.timed("lease", self.slotName(num), **kwargs):
+            # The other slots of the host must not change the kernel parameters during the experience
+            self.kernelState.acquire(num, parameters)
+        try:
+            with self.events.timed("kernel", self.slotName(num), **kwargs):
+                # Push sysctl and module parameters in a single remote invocation, and only those that changed
+                self.kernelState.apply(num, parameters)
+
+            with self.events.timed("clean", self.slotName(num), **kwargs):
+                self.cleanMininet(num)
+            cmd = self.transport.shellCmd(num, self.minitopoRemoteCmd(num, **kwargs))
+            minitopoCommand = MinitopoCommand(num, self.transport, cmd, kwargs["workingDir"], self.testOkList,
+                                              timestamps=self.timestampOutput, slot=self.slots[num])
+            start = time.time()
+            with self.events.timed("run", self.slotName(num), **kwargs) as event:
+                hostReady = minitopoCommand.run(timeout=self.timeoutModel.timeout(**kwargs))
+                event["ok"] = self.testOkList[num]
+        finally:
+            self.kernelState.release(num)
+
+        if not self.testOkList[num]:
+            # The host went through a recovery, don't trust its kernel state anymore
+            self.kernelState.invalidate(num)
+            self.timeoutModel.timedOut()
+        elif minitopoCommand.process is not None and minitopoCommand.process.returncode == 0:
+            self.timeoutModel.observe(time.time() - start, **kwargs)
+        return hostReady
+
+    def uploadXp(self, num, **kwargs):
+        """ Put the topo and xp files (see jobFiles()) in kwargs["tmpfs"], created if needed """
+        with self.events.timed("upload", self.slotName(num), **kwargs):
+            filenames = self.jobFiles(**kwargs)
+            if self.uploadStore is not None and self.uploadStore.upload(num, filenames, kwargs["tmpfs"]):
+                return
+
+            if self.remoteCall(num, "mkdir -p " + kwargs["tmpfs"]) != 0:
+                raise Exception("Cannot create directory " + kwargs["tmpfs"] + " on remote server")
+            for filename in filenames:
+                self.putOnRemote(num, filename, kwargs["tmpfs"])
+
+    def printXp(self, num, **kwargs):
         printStr = "Thread " + str(num)
         for key in kwargs:
             if key != "postProcessing" and key != "topo":
@@ -258,78 +582,387 @@ class ExperienceLauncher(object):
 
         print(printStr)
 
-        self.launchXp(num, **kwargs)
+    def journalUpdate(self, num, state, artifacts=None, **kwargs):
+        """ num is None if the job did not need any host """
+        if self.journal is not None:
+            host = None if num is None else self.slotName(num)
+            self.journal.update(kwargs["jobId"], state, host=host, artifacts=artifacts)
+
+    def jobDone(self):
+        self.workQueue.done()
+        with self.outstandingCondition:
+            self.outstanding -= 1
+            self.outstandingCondition.notify_all()
+
+    def hostFailed(self, num, hostReady):
+        """ Quarantine the host if it could not be recovered or failed too many times in a row """
+        # Its connection may be the culprit
+        self.transport.masterLost(num)
+        with self.hostLock:
+            self.hostFailures[num] += 1
+            if hostReady and self.hostFailures[num] < MAX_HOST_FAILURES:
+                return
+
+            if self.quarantined.count(False) <= 1:
+                print("Thread " + str(num) + " keeps failing but is the last healthy host: continue")
+                return
+
+            self.quarantined[num] = True
+            print("Quarantine host " + self.slotName(num) + " after " +
+                  str(self.hostFailures[num]) + " failures; take a look on the machine")
+
+    def retryXp(self, num, **kwargs):
+        """ Requeue a job whose host failed, so that any healthy host can run it """
+        attempts = kwargs.get("attempts", 1)
+        if attempts >= MAX_JOB_ATTEMPTS:
+            print("Give up " + kwargs["workingDir"] + " after " + str(attempts) + " attempts")
+            self.journalUpdate(num, FAILED, **kwargs)
+            self.jobDone()
+            return
+
+        print("Requeue " + kwargs["workingDir"] + " (attempt " + str(attempts + 1) + ")")
+        kwargs["attempts"] = attempts + 1
+        self.requeueXp(num, **kwargs)
+
+    def requeueXp(self, num, **kwargs):
+        """ Put a job back in the work queue as it is, e.g., because it never ran on its host """
+        self.journalUpdate(num, PENDING, **kwargs)
+        self.workQueue.put(kwargs, self.timeoutModel.expectedRuntime(**kwargs))
+
+    def collectXp(self, num, **kwargs):
+        try:
+            with self.events.timed("collect", self.slotName(num), **kwargs):
+                artifacts = self.postProcessing(num, **kwargs)
+        except Exception as e:
+            print(str(e) + ": continue")
+            artifacts = None
+        self.xpCollected(num, artifacts, **kwargs)
+
+    def xpCollected(self, num, artifacts, **kwargs):
+        """ Record the end of a job; artifacts is None if they could not be retrieved """
+        if artifacts is None:
+            self.journalUpdate(num, FAILED, **kwargs)
+        else:
+            self.journalUpdate(num, DONE, artifacts=artifacts, **kwargs)
+            if "resultCacheKey" in kwargs:
+                self.resultCache.store(kwargs["resultCacheKey"], self.resultCacheFiles(**kwargs))
+            self.ingestXp(artifacts, **kwargs)
+        self.jobDone()
+
+    def ingestXp(self, artifacts, **kwargs):
+        """ Parse the artifacts of a completed job into the resultStore and the replication, if any """
+        for sink in [self.resultStore, self.replication]:
+            if sink is None:
+                continue
 
-        if self.testOkList[num]:
             try:
-                self.postProcessing(num, **kwargs)
+                sink.ingest(artifacts, **kwargs)
             except Exception as e:
                 print(str(e) + ": continue")
 
+    def threadLaunchXp(self, num, **kwargs):
+        global testOkList
+
+        self.testOkList[num] = True
+        hostReady = True
+        jobData = dict(kwargs, tmpfs=self.slots[num].tmpfs(kwargs["tmpfs"]))
+        try:
+            self.uploadXp(num, **jobData)
+            self.printXp(num, **jobData)
+            self.journalUpdate(num, RUNNING, **jobData)
+            hostReady = self.launchXp(num, **jobData)
+        except Exception as e:
+            print(str(e) + ": continue")
+            self.testOkList[num] = False
+
+        if self.testOkList[num]:
+            self.hostFailures[num] = 0
+            self.collectXp(num, **jobData)
+        else:
+            self.hostFailed(num, hostReady)
+            self.retryXp(num, **kwargs)
+
     def workerLoop(self, num):
-        while not self.finished or not self.workQueue.empty():
+        while not self.quarantined[num]:
             workData = self.workQueue.get()
+            if workData is None:
+                break
             self.threadLaunchXp(num, **workData)
-            self.workQueue.task_done()
+
+    def uploadLoop(self, num):
+        """ First pipeline stage: put the files of the next job in its own tmpfs subdirectory """
+        while not self.quarantined[num]:
+            workData = self.workQueue.get()
+            if workData is None:
+                break
+
+            self.jobCounters[num] += 1
+            jobData = dict(workData, tmpfs=self.slots[num].tmpfs(workData["tmpfs"]) + "/job_" + str(self.jobCounters[num]))
+            try:
+                self.uploadXp(num, **jobData)
+                self.readyQueues[num].put((workData, jobData))
+            except Exception as e:
+                print(str(e) + ": continue")
+                self.hostFailed(num, True)
+                self.retryXp(num, **workData)
+
+        self.readyQueues[num].put(None)
+
+    def runLoop(self, num):
+        """ Second pipeline stage: the emulation itself, only one at a time on each host """
+        while True:
+            readyData = self.readyQueues[num].get()
+            if readyData is None:
+                self.collectQueues[num].put(None)
+                break
+
+            workData, jobData = readyData
+            if self.quarantined[num]:
+                # Not an attempt, since the job did not run; the collect stage still removes its tmpfs subdirectory
+                self.requeueXp(num, **workData)
+                self.collectQueues[num].put((False, jobData))
+                continue
+
+            self.testOkList[num] = True
+            hostReady = True
+            self.printXp(num, **jobData)
+            self.journalUpdate(num, RUNNING, **jobData)
+            try:
+                hostReady = self.launchXp(num, **jobData)
+            except Exception as e:
+                print(str(e) + ": continue")
+                self.testOkList[num] = False
+
+            if self.testOkList[num]:
+                self.hostFailures[num] = 0
+            else:
+                self.hostFailed(num, hostReady)
+                self.retryXp(num, **workData)
+            self.collectQueues[num].put((self.testOkList[num], jobData))
+
+    def collectLoop(self, num):
+        """ Third pipeline stage: retrieve the results while the next job runs, then free its tmpfs subdirectory """
+        while True:
+            collectData = self.collectQueues[num].get()
+            if collectData is None:
+                break
+
+            testOk, jobData = collectData
+            if testOk:
+                self.collectXp(num, **jobData)
+            self.remoteCall(num, "rm -rf " + jobData["tmpfs"])
 
     def addWork(self, **kwargs):
-        self.workQueue.put(kwargs)
+        if self.resultCache is not None:
+            # Even for jobs skipped below, so that the replicas stay aligned with the jobs
+            kwargs["resultCacheKey"] = self.resultCache.nextKey(softwareVersions=self.softwareVersions(), **kwargs)
+
+        if self.journal is not None:
+            kwargs["jobId"], doneArtifacts = self.journal.newJob(**kwargs)
+            if doneArtifacts is not None:
+                linked = self.linkDoneArtifacts(doneArtifacts, **kwargs)
+                if linked is not None:
+                    print("Skip " + kwargs["workingDir"] + ": already done according to " + self.journal.path)
+                    self.journal.update(kwargs["jobId"], DONE, workingDir=kwargs["workingDir"], artifacts=linked)
+                    self.ingestXp(linked, **kwargs)
+                    return
+
+                print("Artifacts of " + kwargs["workingDir"] + " done according to " + self.journal.path +
+                      " are missing: run it again")
+                self.journal.update(kwargs["jobId"], PENDING, workingDir=kwargs["workingDir"])
+
+        if self.resultCache is not None:
+            linked = self.resultCache.link(kwargs["resultCacheKey"], self.resultCacheFiles(**kwargs))
+            if linked is not None:
+                print("Reuse " + kwargs["resultCacheKey"] + " in " + kwargs["workingDir"])
+                self.journalUpdate(None, DONE, artifacts=linked, **kwargs)
+                self.ingestXp(linked, **kwargs)
+                return
+
+        with self.outstandingCondition:
+            self.outstanding += 1
+        self.workQueue.put(kwargs, self.timeoutModel.expectedRuntime(**kwargs))
+
+    def softwareVersions(self):
+        """ Kernel release and Minitopo commit of each host, probed once; part of the keys of the resultCache """
+        if self.hostSoftwareVersions is None:
+            versions = []
+            versionsCmd = "uname -r; cd " + posixpath.dirname(self.minitopoPath) + " && git rev-parse HEAD"
+            hosts = [slot.host for slot in self.slots]
+            for host in sorted(set(hosts)):
+                # Through the first slot of the host
+                num = hosts.index(host)
+                process = subprocess.Popen(self.transport.shellCmd(num, versionsCmd), stdout=subprocess.PIPE)
+                out = process.communicate()[0].decode()
+                if process.returncode != 0:
+                    print("Cannot get the kernel and Minitopo versions of " + self.slotName(num) + ": continue")
+                versions.append(" ".join(out.split()))
+            self.hostSoftwareVersions = "\n".join(sorted(set(versions)))
+        return self.hostSoftwareVersions
+
+    def linkDoneArtifacts(self, doneArtifacts, **kwargs):
+        """ Link the artifacts of a job done by a previous run (as recorded by the journal) in its new working directory
+            Return the list of linked files, or None if some of them are missing
+        """
+        previous = dict((os.path.basename(filename), filename) for filename in doneArtifacts if os.path.exists(filename))
+        newFilenames = [newFilename for _, _, newFilename in self.postProcessingFiles(**kwargs)]
+        if any(os.path.basename(newFilename) not in previous for newFilename in newFilenames):
+            return None
+
+        for newFilename in newFilenames:
+            if os.path.abspath(previous[os.path.basename(newFilename)]) != os.path.abspath(newFilename):
+                linkArtifact(previous[os.path.basename(newFilename)], newFilename)
+        return newFilenames
 
     def finish(self):
         """ Function to call to clean properly the experiences """
         if not self.finished:
             self.finished = True
+            with self.outstandingCondition:
+                while self.outstanding > 0:
+                    # With a timeout, so that the wait can be interrupted
+                    self.outstandingCondition.wait(1)
+            self.workQueue.close()
             for thread in self.threads:
                 thread.join()
 
+            lines = self.workQueue.report() + self.transport.report() + self.kernelState.report() + self.timeoutModel.report()
+            if self.uploadStore is not None:
+                lines += self.uploadStore.report()
+            if self.resultCache is not None:
+                lines += self.resultCache.report()
+            if self.resultStore is not None:
+                lines += self.resultStore.report()
+            for line in lines:
+                print(line)
+            self.transport.closeAll()
+            self.events.close()
+
     def __del__(self):
         self.finish()
 
 
 def experiment(experienceLauncher, xpDict, **kwargs):
+    """ kwargs["workingDir"] is the directory of the experience, as computed by experimentTopos and experimentFor """
     xpFilename = kwargs["xpName"] + "Test"
-    generateXpFile(xpFilename, xpDict)
-    xpAbsPath = os.path.abspath(xpFilename)
-    kwargs["workingDir"] = os.getcwd()
+    xpAbsPath = os.path.join(kwargs["workingDir"], xpFilename)
+    generateXpFile(xpAbsPath, xpDict)
     kwargs["xpAbsPath"] = xpAbsPath
     experienceLauncher.addWork(**kwargs)
 
 
 def experimentFor(keyword, elems, xpFnct, **kwargs):
+    parentDir = kwargs["workingDir"]
     for elem in elems:
         if "skipIf" in kwargs and kwargs["skipIf"](elem, **kwargs):
             continue
 
-        if isinstance(elem, tuple):
-            strElem = "_".join(elem)
-        else:
-            strElem = str(elem)
-        check_directory_exists(strElem)
-        os.chdir(strElem)
+        # Each elem gets its own copy, so that skipIf always sees the kwargs of the parent
+        childKwargs = dict(kwargs, workingDir=os.path.join(parentDir, elemToDirname(elem)), **{keyword: elem})
+        check_directory_exists(childKwargs["workingDir"])
+        xpFnct(**childKwargs)
 
-        kwargs[keyword] = elem
-        xpFnct(**kwargs)
 
-        os.chdir("..")
+class Sweep(object):
+    """ Declarative Cartesian product of named dimensions, to replace nested experimentFor closures
 
+        Each dimension is a tuple (keyword, elems) or (keyword, elems, skipIf). elems is an iterable (which must be
+        re-iterable, except for the first dimension) or a function called with the current kwargs and returning one.
+        skipIf(elem, **kwargs) has the same semantics as in experimentFor. Predicates given to skipIf() are instead
+        called with the kwargs of the complete job. As experimentFor, each elem gets its own directory in workingDir, only
+        created for the jobs that are generated.
+    """
+    def __init__(self, *dimensions):
+        self.dimensions = []
+        for dimension in dimensions:
+            if len(dimension) == 2:
+                self.dimensions.append((dimension[0], dimension[1], None))
+            elif len(dimension) == 3:
+                self.dimensions.append(tuple(dimension))
+            else:
+                raise Exception("Invalid number of elements in dimension: " + str(dimension))
+        self.predicates = []
+
+    def skipIf(self, predicate):
+        self.predicates.append(predicate)
+        return self
+
+    def elems(self, level, kwargs):
+        elems = self.dimensions[level][1]
+        return elems(**kwargs) if callable(elems) else elems
+
+    def jobs(self, **kwargs):
+        """ Lazily yield the kwargs of each job, only the dimensions that changed are advanced (O(1) amortized per job) """
+        depth = len(self.dimensions)
+        if depth == 0:
+            yield kwargs
+            return
+
+        bindings = [kwargs] + [None] * depth
+        iterators = [iter(self.elems(0, kwargs))] + [None] * (depth - 1)
+        level = 0
+        while level >= 0:
+            try:
+                elem = next(iterators[level])
+            except StopIteration:
+                level -= 1
+                continue
+
+            keyword, _, skipIf = self.dimensions[level]
+            parent = bindings[level]
+            if skipIf is not None and skipIf(elem, **parent):
+                continue
+
+            binding = dict(parent)
+            binding[keyword] = elem
+            if "workingDir" in parent:
+                binding["workingDir"] = os.path.join(parent["workingDir"], elemToDirname(elem))
+
+            if level + 1 < depth:
+                level += 1
+                bindings[level] = binding
+                iterators[level] = iter(self.elems(level, binding))
+            elif not any(predicate(**binding) for predicate in self.predicates):
+                # Only the directories of the jobs actually generated are created
+                if "workingDir" in binding:
+                    check_directory_exists(binding["workingDir"])
+                yield binding
+
+    def expand(self, xpFnct):
+        """ Return a function usable as xpFnct of experimentTopos, calling xpFnct for each job of the sweep """
+        def expandedXpFnct(**kwargs):
+            for job in self.jobs(**kwargs):
+                xpFnct(**job)
+
+        return expandedXpFnct
+
+
+def experimentTopos(topos, xpName, protocol, tmpfs, xpFnct, baseDir=None, **kwargs):
+    """ Output paths are computed from baseDir (default: the current directory), the current directory is never changed
+        so that several campaigns can be generated at the same time (e.g., in different threads)
+        Return the campaign directory
+    """
+    if baseDir is None:
+        baseDir = os.getcwd()
 
-def experimentTopos(topos, xpName, protocol, tmpfs, xpFnct, **kwargs):
     testDirectory = xpName + "_" + time.strftime("%Y%m%d_%H%M%S") + "_" + protocol
-    check_directory_exists(testDirectory)
-    os.chdir(testDirectory)
+    testDirectoryPath = os.path.abspath(os.path.join(baseDir, testDirectory))
+    check_directory_exists(testDirectoryPath)
 
     for topo in topos:
         topoFilename = topoToFilename(topo)
-        check_directory_exists(topoFilename)
-        os.chdir(topoFilename)
-        generateTopoFile(topoFilename, topo)
-        topoAbsPath = os.path.abspath(topoFilename)
-
-        xpFnct(xpName=xpName, testDirectory=testDirectory, topoAbsPath=topoAbsPath, protocol=protocol, topo=topo, tmpfs=tmpfs, **kwargs)
-
-        os.chdir("..")
-
-    os.chdir("..")
+        workingDir = os.path.join(testDirectoryPath, topoFilename)
+        check_directory_exists(workingDir)
+        topoAbsPath = os.path.join(workingDir, topoFilename)
+        generateTopoFile(topoAbsPath, topo)
+
+        xpFnct(xpName=xpName, testDirectory=testDirectory, topoAbsPath=topoAbsPath, protocol=protocol, topo=topo, tmpfs=tmpfs,
+               workingDir=workingDir, campaignDir=testDirectoryPath, **kwargs)
+        if os.listdir(workingDir) == [topoFilename]:
+            # All the jobs of the topology were skipped
+            shutil.rmtree(workingDir)
+
+    return testDirectoryPath
 
 
 if __name__ == '__main__':
@@ -0,0 +1,103 @@
+from __future__ import print_function
+
+from generate_topo import PATHS, NETEM
+
+import csv
+import json
+
+""" A design is stored in two files: path + COLUMNS_EXTENSION and path + SCHEMA_EXTENSION """
+COLUMNS_EXTENSION = ".csv"
+SCHEMA_EXTENSION = ".json"
+
+""" Netem commands of the designs of the campaign scripts, by column """
+DEFAULT_NETEM_TEMPLATES = {"loss": "loss {0}%"}
+
+
+def designColumn(name, nbPath):
+    return name + str(nbPath)
+
+
+class TopoDesignFile(object):
+    """ A topology design stored once on disk, to be shared by the campaign scripts instead of a literal in each of them
+
+        The CSV file has one row per topology and one column per parameter of each path (e.g., bandwidth0, delay1), the
+        values being kept as the strings found in the topologies. The JSON schema gives the number of paths, the path
+        parameters, the netem commands built from the other columns (e.g., "loss {0}%" for loss0 and loss1) with their
+        start time, and whether each row also stands for its twin with the paths in reverse order, right after it.
+
+        Only the schema is read when the design is opened: iterating over it streams the topologies from the CSV file,
+        so that it can directly be given as topos to experimentTopos, as many times as needed.
+    """
+    def __init__(self, path):
+        self.path = path
+        schemaFile = open(path + SCHEMA_EXTENSION)
+        self.schema = json.load(schemaFile)
+        schemaFile.close()
+
+    def __len__(self):
+        return self.schema["rows"] * (2 if self.schema["withReversed"] else 1)
+
+    def topo(self, row, nbPaths):
+        """ Return the topology of the CSV row, with its paths in the order given by nbPaths """
+        topo = {PATHS: [], NETEM: []}
+        for nbPath, nbColumn in enumerate(nbPaths):
+            topo[PATHS].append(dict((parameter, row[designColumn(parameter, nbColumn)]) for parameter in self.schema["pathParameters"]))
+            for name in sorted(self.schema["netemTemplates"]):
+                template = self.schema["netemTemplates"][name]
+                topo[NETEM].append((nbPath, self.schema["netemAt"], template.format(row[designColumn(name, nbColumn)])))
+        return topo
+
+    def __iter__(self):
+        nbPaths = list(range(self.schema["paths"]))
+        designFile = open(self.path + COLUMNS_EXTENSION)
+        try:
+            for row in csv.DictReader(designFile):
+                yield self.topo(row, nbPaths)
+                if self.schema["withReversed"]:
+                    yield self.topo(row, nbPaths[::-1])
+        finally:
+            designFile.close()
+
+
+def netemValue(command, template):
+    """ Return the value of the netem command built from template, or None if it was not """
+    prefix, suffix = template.split("{0}")
+    if command.startswith(prefix) and command.endswith(suffix):
+        return command[len(prefix):len(command) - len(suffix)]
+    return None
+
+
+def writeDesignFile(path, topos, withReversed=True, netemTemplates=DEFAULT_NETEM_TEMPLATES, netemAt=0):
+    """ Store topos (as generated by core.topo_design, or written in the campaign scripts) as a TopoDesignFile at path
+        If withReversed, every other topology must be the twin of the previous one, with the paths in reverse order
+        Raise an Exception if the topologies cannot be read back identically
+    """
+    paths = len(topos[0][PATHS])
+    pathParameters = sorted(topos[0][PATHS][0])
+    rows = topos[::2] if withReversed else topos
+    columns = [designColumn(name, nbPath) for nbPath in range(paths) for name in pathParameters + sorted(netemTemplates)]
+
+    designFile = open(path + COLUMNS_EXTENSION, "w")
+    writer = csv.DictWriter(designFile, columns, lineterminator="\n")
+    writer.writeheader()
+    for topo in rows:
+        row = {}
+        for nbPath, pathDict in enumerate(topo[PATHS]):
+            for parameter in pathParameters:
+                row[designColumn(parameter, nbPath)] = pathDict[parameter]
+        for nbPath, _, command in topo.get(NETEM, []):
+            for name, template in netemTemplates.items():
+                value = netemValue(command, template)
+                if value is not None:
+                    row[designColumn(name, nbPath)] = value
+        writer.writerow(row)
+    designFile.close()
+
+    schemaFile = open(path + SCHEMA_EXTENSION, "w")
+    json.dump({"rows": len(rows), "paths": paths, "pathParameters": pathParameters, "netemTemplates": netemTemplates,
+               "netemAt": netemAt, "withReversed": withReversed}, schemaFile, indent=4, separators=(",", ": "), sort_keys=True)
+    schemaFile.write("\n")
+    schemaFile.close()
+
+    if list(TopoDesignFile(path)) != list(topos):
+        raise Exception("Topologies cannot be stored as a design file (e.g., unsupported netem commands or missing twins)")
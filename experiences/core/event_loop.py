@@ -0,0 +1,207 @@
+from __future__ import print_function
+
+from Queue import Queue
+
+import os
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+import types
+
+""" Seconds between two checks of the pending operations when none completed """
+DEFAULT_POLL_INTERVAL = 0.05
+
+
+class Return(Exception):
+    """ Raised by a sub-task to return a value to the task that yielded it (Python 2 generators cannot return one) """
+    def __init__(self, value=None):
+        Exception.__init__(self)
+        self.value = value
+
+
+class CommandResult(object):
+    def __init__(self, returnCode, out=b"", timedOut=False):
+        self.returnCode = returnCode
+        self.out = out
+        self.timedOut = timedOut
+
+
+class Command(object):
+    """ Yielded by a task to run cmd (a list) as a subprocess; the task is resumed with a CommandResult
+
+        stdout and stderr are files (or None for devnull), since pipes cannot be read without blocking the loop. If capture,
+        stdout goes to a temporary file whose content is given in CommandResult.out. If the command lasts more than timeout
+        seconds, it is killed with the processes it started (its process group) and CommandResult.timedOut is set.
+    """
+    def __init__(self, cmd, timeout=None, stdout=None, stderr=None, capture=False):
+        self.cmd = cmd
+        self.timeout = timeout
+        self.stdout = stdout
+        self.stderr = stderr
+        self.capture = capture
+        self.process = None
+
+    def start(self):
+        self.deadline = None if self.timeout is None else time.time() + self.timeout
+        self.devnull = open(os.devnull, "w")
+        self.captureFile = tempfile.TemporaryFile() if self.capture else None
+        stdout = self.captureFile if self.capture else self.stdout
+        try:
+            self.process = subprocess.Popen(self.cmd, stdout=self.devnull if stdout is None else stdout,
+                                            stderr=self.devnull if self.stderr is None else self.stderr,
+                                            preexec_fn=os.setsid)
+        except OSError as e:
+            print(str(e) + ": continue")
+
+    def poll(self):
+        """ Return the CommandResult if the command is over, None otherwise """
+        if self.process is None:
+            result = CommandResult(-1)
+        elif self.process.poll() is not None:
+            result = CommandResult(self.process.returncode)
+        elif self.deadline is not None and time.time() >= self.deadline:
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except OSError:
+                # Already gone
+                pass
+            self.process.wait()
+            result = CommandResult(self.process.returncode, timedOut=True)
+        else:
+            return None
+
+        if self.captureFile is not None:
+            self.captureFile.seek(0)
+            result.out = self.captureFile.read()
+            self.captureFile.close()
+        self.devnull.close()
+        return result
+
+
+class Poll(object):
+    """ Yielded by a task to wait until fnct() returns something else than None; the task is resumed with this value """
+    def __init__(self, fnct):
+        self.fnct = fnct
+
+    def start(self):
+        pass
+
+    def poll(self):
+        return self.fnct()
+
+
+def Sleep(seconds):
+    deadline = time.time() + seconds
+    return Poll(lambda: True if time.time() >= deadline else None)
+
+
+class Worker(object):
+    """ A thread running the blocking calls of the tasks (e.g., hashing or parsing files, SQLite commits) one at a time,
+        so that they do not stall the loop
+    """
+    def __init__(self):
+        self.queue = Queue()
+        self.thread = threading.Thread(target=self.work)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def work(self):
+        while True:
+            call = self.queue.get()
+            if call is None:
+                return
+
+            fnct, args, kwargs, outcome = call
+            try:
+                outcome.append((fnct(*args, **kwargs), None))
+            except Exception as e:
+                outcome.append((None, e))
+
+    def call(self, fnct, *args, **kwargs):
+        """ Task running fnct(*args, **kwargs) in the thread; it returns the value of fnct or raises its exception """
+        outcome = []
+        self.queue.put((fnct, args, kwargs, outcome))
+        yield Poll(lambda: True if outcome else None)
+        value, error = outcome[0]
+        if error is not None:
+            raise error
+        raise Return(value)
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+
+
+class EventLoop(object):
+    """ Single-threaded scheduler of generator-based tasks, the equivalent of asyncio for this Python 2 code
+
+        A task is a generator yielding Command, Poll or other tasks (generators). A yielded task runs until it ends and
+        its parent is resumed with the value of the Return it raised (None by default); its exceptions are propagated.
+    """
+    def __init__(self, pollInterval=DEFAULT_POLL_INTERVAL):
+        self.pollInterval = pollInterval
+        # Each entry is [stack of generators, operation waited for]
+        self.tasks = []
+        self.newTasks = []
+
+    def spawn(self, task):
+        """ Must be called before run() or from a task """
+        self.newTasks.append([[task], None])
+
+    def step(self, entry, value=None, error=None):
+        """ Resume the task of entry until it waits for an operation or ends """
+        stack = entry[0]
+        while stack:
+            generator = stack[-1]
+            try:
+                if error is not None:
+                    operation = generator.throw(error)
+                else:
+                    operation = generator.send(value)
+            except Return as e:
+                stack.pop()
+                value, error = e.value, None
+                continue
+            except StopIteration as e:
+                stack.pop()
+                value, error = getattr(e, "value", None), None
+                continue
+            except Exception as e:
+                stack.pop()
+                value, error = None, e
+                continue
+
+            if isinstance(operation, types.GeneratorType):
+                stack.append(operation)
+                value, error = None, None
+                continue
+
+            operation.start()
+            entry[1] = operation
+            return True
+
+        if error is not None:
+            print("Task failed: " + str(error))
+        return False
+
+    def run(self):
+        """ Run until all the tasks are over """
+        while self.tasks or self.newTasks:
+            newTasks, self.newTasks = self.newTasks, []
+            progressed = len(newTasks) > 0
+            running = [entry for entry in newTasks if self.step(entry)]
+            for entry in self.tasks:
+                result = entry[1].poll()
+                if result is None:
+                    running.append(entry)
+                    continue
+
+                progressed = True
+                if self.step(entry, result):
+                    running.append(entry)
+            self.tasks = running
+
+            if not progressed:
+                time.sleep(self.pollInterval)
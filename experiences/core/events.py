@@ -0,0 +1,78 @@
+from __future__ import print_function
+
+import contextlib
+import json
+import os
+import threading
+import time
+
+""" Name of the file of the campaign directory receiving the events """
+EVENTS_FILENAME = "events.jsonl"
+
+
+class PhaseEvents(object):
+    """ Timing of each phase (upload, lease, kernel, clean, run, collect) of each job; lease is the wait for the other
+        slots of the host to release the kernel parameters, if any
+
+        Each event is a dict with the phase, the host (and slot) and the identity of the job (jobId if a journal is
+        used, workingDir, xp file and attempt), its start time, duration and whether it succeeded. It is appended as a
+        JSON line to EVENTS_FILENAME in the campaign directory of the job (or its workingDir if it has none), and given
+        to every callback registered with subscribe().
+    """
+    def __init__(self, filename=EVENTS_FILENAME):
+        self.filename = filename
+        self.lock = threading.Lock()
+        self.files = {}
+        self.callbacks = []
+
+    def subscribe(self, callback):
+        """ callback(event) is called for every event, from the thread running the job """
+        with self.lock:
+            self.callbacks.append(callback)
+
+    def emit(self, event, **kwargs):
+        path = os.path.join(kwargs.get("campaignDir", kwargs["workingDir"]), self.filename)
+        with self.lock:
+            if path not in self.files:
+                self.files[path] = open(path, "a")
+            self.files[path].write(json.dumps(event, sort_keys=True) + "\n")
+            self.files[path].flush()
+            callbacks = list(self.callbacks)
+
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                print(str(e) + ": continue")
+
+    def newEvent(self, phase, host, **kwargs):
+        """ Return the event of phase of the job kwargs on host, starting now; emit() it once its duration is set """
+        return {
+            "phase": phase,
+            "host": host,
+            "job": kwargs.get("jobId"),
+            "workingDir": kwargs["workingDir"],
+            "xp": os.path.basename(kwargs["xpAbsPath"]),
+            "attempt": kwargs.get("attempts", 1),
+            "start": time.time(),
+            "ok": True,
+        }
+
+    @contextlib.contextmanager
+    def timed(self, phase, host, **kwargs):
+        """ Time the enclosed block as phase of the job kwargs on host; the block can set the "ok" of the event """
+        event = self.newEvent(phase, host, **kwargs)
+        try:
+            yield event
+        except Exception:
+            event["ok"] = False
+            raise
+        finally:
+            event["duration"] = time.time() - event["start"]
+            self.emit(event, **kwargs)
+
+    def close(self):
+        with self.lock:
+            for eventsFile in self.files.values():
+                eventsFile.close()
+            self.files = {}
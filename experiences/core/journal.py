@@ -0,0 +1,83 @@
+from __future__ import print_function
+
+from kernel_state import xpKernelParameters
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+""" States of a job in the journal """
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+def jobSpecHash(**kwargs):
+    """ Canonical hash of an experience: generated topo and xp files and applied kernel parameters """
+    specHash = hashlib.sha1()
+    for filename in [kwargs["topoAbsPath"], kwargs["xpAbsPath"]]:
+        specFile = open(filename, "rb")
+        specHash.update(specFile.read())
+        specFile.close()
+        specHash.update(b"\0")
+    for path, value in xpKernelParameters(**kwargs):
+        specHash.update((path + "=" + value + "\n").encode())
+    return specHash.hexdigest()
+
+
+class CampaignJournal(object):
+    """ Persistent record (SQLite) of the jobs of a campaign, to resume it after a crash
+
+        A job is identified by the hash of its specification and its occurrence number, i.e., the k-th job with the same
+        specification generated by this process is the k-th repetition. When a campaign is restarted with the same
+        journal, the repetitions already done are not run again (their artifacts are linked in the new campaign
+        directory) and all the others (including the ones that were running when the controller died) are enqueued
+        again.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.occurrences = {}
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS jobs (specHash TEXT, occurrence INTEGER, state TEXT, host TEXT, "
+                                "workingDir TEXT, artifacts TEXT, updated REAL, PRIMARY KEY (specHash, occurrence))")
+        self.connection.commit()
+
+    def newJob(self, **kwargs):
+        """ Return (jobId, artifacts) for the experience described by kwargs; artifacts is the list of files pulled by
+            a previous run that completed it, or None if it was not done yet (it is then recorded as pending)
+        """
+        specHash = jobSpecHash(**kwargs)
+        with self.lock:
+            occurrence = self.occurrences.get(specHash, 0) + 1
+            self.occurrences[specHash] = occurrence
+            row = self.connection.execute("SELECT state, artifacts FROM jobs WHERE specHash = ? AND occurrence = ?",
+                                          (specHash, occurrence)).fetchone()
+
+        jobId = specHash + "-" + str(occurrence)
+        if row is not None and row[0] == DONE:
+            return jobId, [] if row[1] is None else json.loads(row[1])
+
+        self.update(jobId, PENDING, workingDir=kwargs["workingDir"])
+        return jobId, None
+
+    def update(self, jobId, state, host=None, workingDir=None, artifacts=None):
+        specHash, occurrence = jobId.rsplit("-", 1)
+        with self.lock:
+            self.connection.execute("INSERT OR IGNORE INTO jobs (specHash, occurrence) VALUES (?, ?)", (specHash, int(occurrence)))
+            self.connection.execute("UPDATE jobs SET state = ?, updated = ?, host = COALESCE(?, host), workingDir = COALESCE(?, workingDir), "
+                                    "artifacts = COALESCE(?, artifacts) WHERE specHash = ? AND occurrence = ?",
+                                    (state, time.time(), host, workingDir, None if artifacts is None else json.dumps(artifacts),
+                                     specHash, int(occurrence)))
+            self.connection.commit()
+
+    def count(self, state):
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM jobs WHERE state = ?", (state,)).fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
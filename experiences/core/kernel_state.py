@@ -0,0 +1,197 @@
+from __future__ import print_function
+
+import subprocess
+import threading
+
+MPTCP_ENABLED_PATH = "/proc/sys/net/mptcp/mptcp_enabled"
+OPEN_BUP_PATH = "/sys/module/mptcp_fullmesh/parameters/open_bup"
+ORACLE_PARAMETERS_DIR = "/sys/module/mptcp_oracle/parameters/"
+BOOT_ID_PATH = "/proc/sys/kernel/random/boot_id"
+
+""" Parameters of the oracle, in the order they are written """
+ORACLE_PARAMETERS = ("sloss_threshold", "sretrans_threshold", "rto_ms_threshold", "idle_periods_threshold", "timer_period_ms")
+
+""" Values of ORACLE_PARAMETERS for each openBup value """
+OPEN_BUP_ORACLE_THRESHOLDS = {
+    "0": ("250", "500", "1500", "0", "500"),
+    "0-250": ("250", "500", "1500", "0", "500"),
+    "0-400": ("400", "500", "1500", "0", "500"),
+    "0-100": ("100", "500", "1500", "0", "500"),
+    "0-t1": ("250", "500", "1500", "0", "1"),
+    "0-t10": ("250", "500", "1500", "0", "10"),
+    "0-t100": ("250", "500", "1500", "0", "100"),
+    "0-t500": ("250", "500", "1500", "0", "500"),
+    "0-t1000": ("250", "500", "1500", "0", "1000"),
+    "0-T750": ("250", "500", "750", "0", "100"),
+    "0-t100-T500": ("250", "500", "500", "0", "100"),
+}
+""" Disable the oracle if openBup is enabled """
+DEFAULT_ORACLE_THRESHOLDS = ("0", "0", "0", "0", "500")
+
+
+def mptcpEnabledParameters(value):
+    return [(MPTCP_ENABLED_PATH, str(value))]
+
+
+def openBupParameters(value):
+    """ Return the list of (path, value) to write for the openBup value, open_bup first """
+    thresholds = OPEN_BUP_ORACLE_THRESHOLDS.get(str(value), DEFAULT_ORACLE_THRESHOLDS)
+    parameters = [(OPEN_BUP_PATH, str(value).split('-')[0])]
+    for name, threshold in zip(ORACLE_PARAMETERS, thresholds):
+        parameters.append((ORACLE_PARAMETERS_DIR + name, threshold))
+    return parameters
+
+
+def xpKernelParameters(**kwargs):
+    """ Return the list of (path, value) needed by an experience, from its protocol and optional openBup """
+    if kwargs["protocol"] == "tcp":
+        parameters = mptcpEnabledParameters(0)
+    elif kwargs["protocol"] == "mptcp":
+        parameters = mptcpEnabledParameters(1)
+    else:
+        raise Exception("Unknown protocol " + kwargs["protocol"])
+
+    if "openBup" in kwargs:
+        parameters += openBupParameters(kwargs["openBup"])
+
+    return parameters
+
+
+def writeParametersCmd(parameters):
+    return " && ".join(["echo " + value + " | sudo tee " + path + " > /dev/null" for path, value in parameters])
+
+
+class KernelStateCache(object):
+    """ Remember the kernel parameters last applied on each host and only push the ones that changed
+
+        The cache is tied to the boot_id of the host: if it rebooted in between, all the parameters are written again.
+        It is also re-checked each time the transport had to reopen the connection to the host (e.g., after a recovery).
+        If several entries of the pool are slots of the same machine (hosts gives the machine of each entry), they share
+        its kernel: a slot must hold a lease on the parameters of its experience (see acquire()) while it runs. The leases
+        of a machine are granted in the order they were asked for, so that slots running with the current parameters
+        cannot starve a slot waiting for other ones.
+    """
+    def __init__(self, transport, hosts=None):
+        self.transport = transport
+        nbHosts = len(transport.remoteHostnames)
+        self.hosts = list(range(nbHosts)) if hosts is None else hosts
+        self.leaseCondition = threading.Condition()
+        # For each machine, [parameters, number of slots running with them]
+        self.leases = {}
+        # For each machine, the (slot, parameters) waiting for a lease, in the order they asked for it
+        self.waiters = {}
+        self.locks = [threading.Lock() for _ in range(nbHosts)]
+        self.states = [{} for _ in range(nbHosts)]
+        self.bootIds = [None] * nbHosts
+        self.handshakes = [None] * nbHosts
+        self.writes = [0] * nbHosts
+        self.skipped = [0] * nbHosts
+
+    def invalidate(self, num):
+        with self.locks[num]:
+            self.states[num] = {}
+            self.bootIds[num] = None
+
+    def isValid(self, num):
+        return self.bootIds[num] is not None and self.handshakes[num] == self.transport.handshakes[num]
+
+    def prepare(self, num, parameters):
+        """ Return (remoteCmd, changed) to make host num hold parameters, or None if the cache says it already does
+            The caller must serialize prepare() and commit() for a given host
+        """
+        state = self.states[num]
+        changed = [(path, value) for path, value in parameters if state.get(path) != value]
+        if not changed and self.isValid(num):
+            self.skipped[num] += len(parameters)
+            return None
+
+        if self.bootIds[num] is None:
+            remoteCmd = writeParametersCmd(parameters) + " && cat " + BOOT_ID_PATH
+        else:
+            # If the host rebooted since the last time, the cached state is meaningless
+            remoteCmd = "B=$(cat " + BOOT_ID_PATH + "); if [ \"$B\" = \"" + self.bootIds[num] + "\" ]; then " + \
+                        (writeParametersCmd(changed) if changed else "true") + "; else " + writeParametersCmd(parameters) + \
+                        "; fi && echo $B"
+        return remoteCmd, changed
+
+    def commit(self, num, parameters, changed, returnCode, out):
+        """ Update the cache with the result (exit code and output) of the remoteCmd returned by prepare() """
+        if returnCode != 0:
+            self.states[num] = {}
+            self.bootIds[num] = None
+            raise Exception("Cannot change kernel parameters " + ", ".join([path + "=" + value for path, value in changed]))
+
+        bootId = out.decode().strip().split("\n")[-1]
+        if bootId != self.bootIds[num]:
+            self.states[num] = {}
+            self.writes[num] += len(parameters)
+        else:
+            self.writes[num] += len(changed)
+            self.skipped[num] += len(parameters) - len(changed)
+
+        self.states[num].update(parameters)
+        self.bootIds[num] = bootId
+        self.handshakes[num] = self.transport.handshakes[num]
+
+    def apply(self, num, parameters):
+        """ Make sure host num holds parameters (list of (path, value)), with at most one remote invocation """
+        with self.locks[num]:
+            prepared = self.prepare(num, parameters)
+            if prepared is None:
+                return
+
+            remoteCmd, changed = prepared
+            process = subprocess.Popen(self.transport.shellCmd(num, remoteCmd), stdout=subprocess.PIPE)
+            out = process.communicate()[0]
+            self.commit(num, parameters, changed, process.returncode, out)
+
+    def tryAcquire(self, num, parameters):
+        """ Return True if num can run an experience with parameters, i.e., no other slot of its machine runs one with
+            different parameters; num then holds a lease on them until release(). Return None otherwise
+        """
+        with self.leaseCondition:
+            host = self.hosts[num]
+            waiters = self.waiters.setdefault(host, [])
+            if num not in [waiter for waiter, _ in waiters]:
+                waiters.append((num, parameters))
+            # A slot does not overtake the ones which asked before it for other parameters
+            for waiter, waiterParameters in waiters:
+                if waiter == num:
+                    break
+                if waiterParameters != parameters:
+                    return None
+
+            lease = self.leases.get(host)
+            if lease is not None and lease[1] > 0 and lease[0] != parameters:
+                return None
+
+            if lease is None or lease[0] != parameters:
+                # The parameters are about to change behind the cache of the other slots of the machine
+                for other in range(len(self.hosts)):
+                    if other != num and self.hosts[other] == host:
+                        self.invalidate(other)
+                self.leases[host] = [parameters, 0]
+            self.leases[host][1] += 1
+            self.waiters[host] = [(waiter, waiterParameters) for waiter, waiterParameters in waiters if waiter != num]
+            self.leaseCondition.notify_all()
+            return True
+
+    def acquire(self, num, parameters):
+        """ Wait until num can hold a lease on parameters (see tryAcquire()) """
+        with self.leaseCondition:
+            while not self.tryAcquire(num, parameters):
+                # With a timeout, so that the wait can be interrupted
+                self.leaseCondition.wait(1)
+
+    def release(self, num):
+        with self.leaseCondition:
+            self.leases[self.hosts[num]][1] -= 1
+            self.leaseCondition.notify_all()
+
+    def report(self):
+        """ Return one line per host with the number of parameter writes done and avoided """
+        lines = []
+        for num in range(len(self.states)):
+            lines.append(self.transport.remoteHostnames[num] + ":" + self.transport.remotePorts[num] + " " + str(self.writes[num]) +
+                         " kernel parameter writes (" + str(self.skipped[num]) + " skipped)")
+        return lines
@@ -0,0 +1,302 @@
+#! /usr/bin/env python
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import shutil
+import socket
+import struct
+import sys
+
+""" Summary of the pcap files of a job, run on the emulation host right after Minitopo (see ExperienceLauncher pcapSummary)
+
+    Each pcap is reduced to one summary per subflow (a TCP connection or a UDP flow, both directions together) and per
+    path (the pair of IP addresses its subflows use): packets and bytes (at the IP layer, so that a small snaplen does
+    not matter), TCP payload bytes, retransmissions, the time from the data to the first ACK covering it (skipping
+    retransmitted data), and timelines of the bytes sent in each interval. The summary of X.pcap is written in
+    X.pcap.summary.json, then the pcap is moved to the directory given by --keep, or removed with --discard.
+
+    The time from the data to its ACK is only an RTT for the direction sent by the endpoint on the capturing side: for
+    the other one, the capture sees the data once it crossed the network and only measures the ACK delay of the local
+    receiver. The capturing side of a TCP subflow is found from its handshake (see localEndpoint()), then its direction
+    has "rttSamples" and "rtt" and the other one "ackDelaySamples" and "ackDelay". If the handshake was not captured,
+    "local" is None and both directions report "rtt", which is then only an upper bound of the ACK delay for one of them.
+
+    This file is copied as is on the hosts: it only depends on the standard library of their Python, 2 or 3.
+"""
+
+SUMMARY_EXTENSION = ".summary.json"
+""" Width of the bins of the timelines, in seconds """
+DEFAULT_INTERVAL = 0.1
+
+PCAP_MAGICS = {
+    b"\xa1\xb2\xc3\xd4": (">", 1e-6),
+    b"\xd4\xc3\xb2\xa1": ("<", 1e-6),
+    b"\xa1\xb2\x3c\x4d": (">", 1e-9),
+    b"\x4d\x3c\xb2\xa1": ("<", 1e-9),
+}
+""" Offset of the network layer protocol and of the network layer in the frames of each supported link type """
+LINK_TYPES = {
+    # Ethernet
+    1: (12, 14),
+    # Linux cooked capture (tcpdump -i any), v1 and v2
+    113: (14, 16),
+    276: (0, 20),
+}
+""" First bytes of a pcapng file (its section header block), which tcpdump -w writes on some systems """
+PCAPNG_MAGIC = b"\x0a\x0d\x0d\x0a"
+""" Link types of raw IP captures """
+RAW_LINK_TYPES = (101, 228)
+ETHERTYPE_IPV4 = 0x0800
+IPPROTO_TCP = 6
+IPPROTO_UDP = 17
+TCP_SYN = 0x02
+TCP_ACK = 0x10
+SEQUENCE_SPACE = 1 << 32
+
+
+def readPackets(pcapFile):
+    """ Yield (timestamp, IPv4 header and beyond) for each IPv4 packet of the pcap file """
+    header = pcapFile.read(24)
+    if header[:4] == PCAPNG_MAGIC:
+        raise Exception("pcapng files are not supported, convert it to pcap first (editcap -F pcap)")
+    if len(header) < 24 or header[:4] not in PCAP_MAGICS:
+        raise Exception("Not a pcap file")
+
+    endianness, resolution = PCAP_MAGICS[header[:4]]
+    linkType = struct.unpack(endianness + "I", header[20:24])[0]
+    if linkType not in LINK_TYPES and linkType not in RAW_LINK_TYPES:
+        raise Exception("Unsupported link type " + str(linkType))
+
+    recordHeader = struct.Struct(endianness + "IIII")
+    while True:
+        record = pcapFile.read(recordHeader.size)
+        if len(record) < recordHeader.size:
+            return
+
+        seconds, fraction, capturedLength, _ = recordHeader.unpack(record)
+        frame = pcapFile.read(capturedLength)
+        if linkType in RAW_LINK_TYPES:
+            packet = frame
+        else:
+            protocolOffset, networkOffset = LINK_TYPES[linkType]
+            if len(frame) < networkOffset or struct.unpack(">H", frame[protocolOffset:protocolOffset + 2])[0] != ETHERTYPE_IPV4:
+                continue
+            packet = frame[networkOffset:]
+        if len(packet) >= 20 and (ord(packet[0:1]) >> 4) == 4:
+            yield seconds + fraction * resolution, packet
+
+
+class Direction(object):
+    """ What one endpoint of a subflow sent """
+    def __init__(self, source):
+        self.source = source
+        # Whether the source is on the capturing side, None if unknown (see localEndpoint())
+        self.local = None
+        self.packets = 0
+        self.bytes = 0
+        self.payloadBytes = 0
+        self.retransmissions = 0
+        self.timeline = {}
+        # TCP sequence numbers, relative to the first one seen
+        self.firstSeq = None
+        self.highestSeq = 0
+        # (relative end sequence number, time sent) of the data not acknowledged yet, without retransmitted data
+        self.unacked = []
+        self.rttSamples = []
+
+    def sent(self, timeBin, length):
+        self.packets += 1
+        self.bytes += length
+        self.timeline[timeBin] = self.timeline.get(timeBin, 0) + length
+
+    def sentData(self, timestamp, seq, payloadLength, syn):
+        if self.firstSeq is None:
+            self.firstSeq = seq
+        start = (seq - self.firstSeq) % SEQUENCE_SPACE
+        end = start + payloadLength + (1 if syn else 0)
+        if payloadLength == 0:
+            return
+
+        self.payloadBytes += payloadLength
+        if start < self.highestSeq:
+            self.retransmissions += 1
+            # Karn: an ACK covering retransmitted data does not tell which copy it acknowledges
+            self.unacked = [(unackedEnd, sentAt) for unackedEnd, sentAt in self.unacked if unackedEnd <= start]
+        else:
+            self.unacked.append((end, timestamp))
+        self.highestSeq = max(self.highestSeq, end)
+
+    def acked(self, timestamp, ack):
+        if self.firstSeq is None:
+            return
+
+        ack = (ack - self.firstSeq) % SEQUENCE_SPACE
+        covered = 0
+        while covered < len(self.unacked) and self.unacked[covered][0] <= ack:
+            covered += 1
+        if covered > 0:
+            # The most recent data covered by the ACK gives the closest sample
+            self.rttSamples.append((timestamp, timestamp - self.unacked[covered - 1][1]))
+            del self.unacked[:covered]
+
+    def summary(self, start):
+        summary = {
+            "source": self.source,
+            "packets": self.packets,
+            "bytes": self.bytes,
+            "timeline": timelineSummary(self.timeline),
+        }
+        if self.firstSeq is not None:
+            rtts = [rtt for _, rtt in self.rttSamples]
+            # Sent by the remote endpoint, the data is only seen once it crossed the network
+            name = "ackDelay" if self.local is False else "rtt"
+            summary.update({
+                "local": self.local,
+                "payloadBytes": self.payloadBytes,
+                "retransmissions": self.retransmissions,
+                # In seconds from the start of the capture
+                name + "Samples": [[round(timestamp - start, 6), round(rtt, 6)] for timestamp, rtt in self.rttSamples],
+                name: None if not rtts else {"count": len(rtts), "min": min(rtts), "avg": sum(rtts) / len(rtts),
+                                             "max": max(rtts)},
+            })
+        return summary
+
+
+def timelineSummary(timeline):
+    """ Bytes of each bin, from the first bin with some """
+    if not timeline:
+        return {"firstBin": 0, "bytes": []}
+    firstBin = min(timeline)
+    return {"firstBin": firstBin, "bytes": [timeline.get(timeBin, 0) for timeBin in range(firstBin, max(timeline) + 1)]}
+
+
+def handshakeSeen(handshake, sender, flags, timestamp):
+    """ Record in handshake the times of the last SYN before the SYN/ACK, of the SYN/ACK and of the ACK of the client """
+    if flags & TCP_SYN and not flags & TCP_ACK and "synAck" not in handshake:
+        handshake["client"] = sender
+        handshake["syn"] = timestamp
+    elif flags & TCP_SYN and flags & TCP_ACK and "syn" in handshake and "synAck" not in handshake:
+        handshake["synAck"] = timestamp
+    elif not flags & TCP_SYN and flags & TCP_ACK and "synAck" in handshake and "ack" not in handshake and \
+            sender == handshake["client"]:
+        handshake["ack"] = timestamp
+
+
+def localEndpoint(handshake, ends):
+    """ Return the endpoint of the subflow on the capturing side, or None if its handshake was not captured
+
+        On the client side, the SYN/ACK comes one RTT after the SYN and the ACK right after the SYN/ACK; on the server
+        side, the SYN/ACK comes right after the SYN and the ACK one RTT later.
+    """
+    if "ack" not in handshake:
+        return None
+    if handshake["synAck"] - handshake["syn"] >= handshake["ack"] - handshake["synAck"]:
+        return handshake["client"]
+    return [end for end in ends if end != handshake["client"]][0]
+
+
+def endpoint(address, port):
+    return socket.inet_ntoa(address) + ":" + str(port)
+
+
+def pathName(pathKey):
+    return "-".join(socket.inet_ntoa(address) for address in pathKey)
+
+
+def summarizePcap(filename, interval=DEFAULT_INTERVAL):
+    """ Return the summary of the pcap file as a dict, ready to be dumped as JSON """
+    subflows = {}
+    paths = {}
+    start = None
+    end = None
+    packets = 0
+    pcapFile = open(filename, "rb")
+    for timestamp, packet in readPackets(pcapFile):
+        headerLength = (ord(packet[0:1]) & 0x0f) * 4
+        length, protocol, source, destination = struct.unpack(">2xH5xB2x4s4s", packet[:20])
+        if start is None:
+            start = timestamp
+        end = timestamp
+        packets += 1
+        timeBin = int((timestamp - start) / interval)
+
+        pathKey = tuple(sorted([source, destination]))
+        path = paths.setdefault(pathKey, {"packets": 0, "bytes": 0, "timeline": {}})
+        path["packets"] += 1
+        path["bytes"] += length
+        path["timeline"][timeBin] = path["timeline"].get(timeBin, 0) + length
+        if protocol not in (IPPROTO_TCP, IPPROTO_UDP) or len(packet) < headerLength + 4:
+            continue
+
+        sourcePort, destinationPort = struct.unpack(">HH", packet[headerLength:headerLength + 4])
+        ends = [endpoint(source, sourcePort), endpoint(destination, destinationPort)]
+        key = (protocol, tuple(sorted(ends)))
+        if key not in subflows:
+            subflows[key] = {"protocol": "tcp" if protocol == IPPROTO_TCP else "udp", "path": pathKey,
+                             "directions": dict((end, Direction(end)) for end in ends), "handshake": {}}
+        sender = subflows[key]["directions"][ends[0]]
+        receiver = subflows[key]["directions"][ends[1]]
+        sender.sent(timeBin, length)
+        if protocol == IPPROTO_TCP and len(packet) >= headerLength + 14:
+            seq, ack, dataOffset, flags = struct.unpack(">IIBB", packet[headerLength + 4:headerLength + 14])
+            payloadLength = length - headerLength - (dataOffset >> 4) * 4
+            sender.sentData(timestamp, seq, payloadLength, flags & TCP_SYN)
+            receiver.acked(timestamp, ack)
+            handshakeSeen(subflows[key]["handshake"], ends[0], flags, timestamp)
+    pcapFile.close()
+
+    for subflow in subflows.values():
+        local = localEndpoint(subflow["handshake"], list(subflow["directions"]))
+        if local is not None:
+            for direction in subflow["directions"].values():
+                direction.local = direction.source == local
+
+    return {
+        "pcap": os.path.basename(filename),
+        "start": start,
+        "duration": 0.0 if start is None else end - start,
+        "packets": packets,
+        "interval": interval,
+        "subflows": [{"protocol": subflow["protocol"], "path": pathName(subflow["path"]),
+                      "directions": [subflow["directions"][end].summary(start) for end in sorted(subflow["directions"])]}
+                     for _, subflow in sorted(subflows.items())],
+        "paths": [{"path": pathName(pathKey), "packets": path["packets"], "bytes": path["bytes"],
+                   "timeline": timelineSummary(path["timeline"])} for pathKey, path in sorted(paths.items())],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize pcap files per subflow and per path")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="width of the bins of the timelines (s)")
+    policy = parser.add_mutually_exclusive_group()
+    policy.add_argument("--keep", help="directory where the pcap files are moved once summarized")
+    policy.add_argument("--discard", action="store_true", help="remove the pcap files once summarized")
+    parser.add_argument("pcaps", nargs="+")
+    args = parser.parse_args()
+
+    failed = False
+    for filename in args.pcaps:
+        try:
+            summary = summarizePcap(filename, interval=args.interval)
+        except Exception as e:
+            print(filename + ": " + str(e), file=sys.stderr)
+            failed = True
+            continue
+
+        summaryFile = open(filename + SUMMARY_EXTENSION, "w")
+        json.dump(summary, summaryFile, sort_keys=True)
+        summaryFile.close()
+        if args.keep is not None:
+            if not os.path.isdir(args.keep):
+                os.makedirs(args.keep)
+            shutil.move(filename, os.path.join(args.keep, os.path.basename(filename)))
+        elif args.discard:
+            os.remove(filename)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+from __future__ import print_function
+
+import math
+import os
+import re
+import sqlite3
+import threading
+
+""" Logs of the clients, whose last duration line is the completion time of the transfer """
+CLIENT_LOGS = ("https_client.log", "quic_client.log")
+""" Go durations, as printed by the clients (e.g., 1m2.5s, 12.345s, 850ms) """
+DURATION_PART = re.compile(r"([0-9]+(?:\.[0-9]*)?)(h|ms|m|s)")
+DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+""" A configuration is run at least MIN_ROUNDS times, then until its interval is narrow enough """
+MIN_ROUNDS = 3
+""" Target half-width of the 95% confidence interval of the completion time, relative to its mean """
+DEFAULT_RELATIVE_HALF_WIDTH = 0.05
+""" Two-sided 95% quantiles of the Student t distribution, for 1 to 30 degrees of freedom """
+STUDENT_T_95 = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228, 2.201, 2.179, 2.160, 2.145, 2.131,
+                2.120, 2.110, 2.101, 2.093, 2.086, 2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042)
+NORMAL_95 = 1.960
+
+
+def parseDuration(text):
+    """ Return the Go duration text in seconds, or None if text is not one """
+    text = text.strip()
+    parts = DURATION_PART.findall(text)
+    if not parts or "".join(value + unit for value, unit in parts) != text:
+        return None
+    return sum(float(value) * DURATION_UNITS[unit] for value, unit in parts)
+
+
+def completionTime(logPath):
+    """ Return the completion time (in seconds) printed by the client in logPath, or None if it did not print one """
+    logFile = open(logPath)
+    lines = logFile.readlines()
+    logFile.close()
+    for line in reversed(lines):
+        duration = parseDuration(line)
+        if duration is not None:
+            return duration
+    return None
+
+
+def confidenceHalfWidth(samples):
+    """ Return (mean, half-width of its 95% confidence interval) of the samples, the half-width being None with less than 2 """
+    mean = sum(samples) / len(samples)
+    if len(samples) < 2:
+        return mean, None
+
+    variance = sum((sample - mean) ** 2 for sample in samples) / (len(samples) - 1)
+    quantile = STUDENT_T_95[len(samples) - 2] if len(samples) - 1 <= len(STUDENT_T_95) else NORMAL_95
+    return mean, quantile * math.sqrt(variance / len(samples))
+
+
+def configurationKey(**kwargs):
+    """ A configuration is the directory of a job relative to its campaign directory: its topology, then the dimensions
+        of the sweep (e.g., xp and multipath), so it is the same from one repetition of the campaign to the next
+    """
+    return os.path.relpath(kwargs["workingDir"], kwargs["campaignDir"])
+
+
+class AdaptiveReplication(object):
+    """ Repeat each configuration of a campaign only until its completion time is known precisely enough
+
+        The campaign is still run in rounds, but given to an ExperienceLauncher (replication), this records the
+        completion time of each completed job from its client log (see ingest()), and converged(**kwargs), given as skipIf
+        of the Sweep of the next round, skips the configurations that ran at least minRounds times and whose 95%
+        confidence interval is narrower than the target (relativeHalfWidth of the mean, or absolute halfWidth seconds if
+        given). The samples are stored in SQLite if path is given, one per job (its jobId with a journal), so that a
+        resumed campaign keeps them without counting twice the jobs it links from its journal.
+    """
+    def __init__(self, path=None, relativeHalfWidth=DEFAULT_RELATIVE_HALF_WIDTH, halfWidth=None, minRounds=MIN_ROUNDS,
+                 clientLogs=CLIENT_LOGS):
+        self.path = path
+        self.relativeHalfWidth = relativeHalfWidth
+        self.halfWidth = halfWidth
+        self.minRounds = max(minRounds, 2)
+        self.clientLogs = clientLogs
+        self.lock = threading.Lock()
+        # For each configuration, the completion time of each of its rounds
+        self.samples = {}
+        self.skipped = 0
+        self.connection = sqlite3.connect(":memory:" if path is None else path, check_same_thread=False)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS samples (configuration TEXT, job TEXT, completionTime REAL, "
+                                "PRIMARY KEY (configuration, job))")
+        self.connection.commit()
+        for configuration, value in self.connection.execute("SELECT configuration, completionTime FROM samples"):
+            self.samples.setdefault(configuration, []).append(value)
+
+    def ingest(self, artifacts, **kwargs):
+        """ Record the completion time of the completed job kwargs, from the client log among its artifacts (local
+            paths); return True if it was recorded
+        """
+        values = [completionTime(path) for path in artifacts if os.path.basename(path) in self.clientLogs]
+        values = [value for value in values if value is not None]
+        if not values:
+            return False
+
+        configuration = configurationKey(**kwargs)
+        job = kwargs.get("jobId", os.path.abspath(kwargs["workingDir"]))
+        with self.lock:
+            cursor = self.connection.execute("INSERT OR IGNORE INTO samples (configuration, job, completionTime) "
+                                             "VALUES (?, ?, ?)", (configuration, job, values[0]))
+            self.connection.commit()
+            if cursor.rowcount == 0:
+                return False
+            self.samples.setdefault(configuration, []).append(values[0])
+        return True
+
+    def isConverged(self, configuration):
+        """ Must be called with the lock """
+        samples = self.samples.get(configuration, [])
+        if len(samples) < self.minRounds:
+            return False
+
+        mean, halfWidth = confidenceHalfWidth(samples)
+        target = self.halfWidth if self.halfWidth is not None else self.relativeHalfWidth * mean
+        return halfWidth <= target
+
+    def converged(self, **kwargs):
+        """ Predicate for Sweep.skipIf(): True if the configuration of the job does not need more repetitions """
+        with self.lock:
+            if self.isConverged(configurationKey(**kwargs)):
+                self.skipped += 1
+                return True
+        return False
+
+    def pending(self):
+        """ Return the number of configurations seen so far that still need repetitions """
+        with self.lock:
+            return len([configuration for configuration in self.samples if not self.isConverged(configuration)])
+
+    def done(self):
+        """ Return True if configurations were seen and none of them needs more repetitions """
+        with self.lock:
+            return len(self.samples) > 0 and all(self.isConverged(configuration) for configuration in self.samples)
+
+    def report(self):
+        lines = []
+        with self.lock:
+            converged = [configuration for configuration in self.samples if self.isConverged(configuration)]
+            for configuration in sorted(self.samples):
+                mean, halfWidth = confidenceHalfWidth(self.samples[configuration])
+                lines.append(configuration + ": " + str(len(self.samples[configuration])) + " rounds, completion time " +
+                             "%.3f" % mean + " s" + ("" if halfWidth is None else " +- %.3f s" % halfWidth))
+            lines.append(str(len(converged)) + "/" + str(len(self.samples)) + " configurations converged, " +
+                         str(self.skipped) + " repetitions skipped")
+        return lines
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
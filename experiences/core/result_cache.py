@@ -0,0 +1,88 @@
+from __future__ import print_function
+
+from journal import jobSpecHash
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+
+
+def linkArtifact(source, destination):
+    """ Hard link source at destination, or copy it if they are not on the same file system """
+    if os.path.exists(destination):
+        os.remove(destination)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+class ResultCache(object):
+    """ Results of experiences keyed by the canonical hash of their specification, shared by campaign scripts
+
+        Each specification can have several replicas. The k-th job with the same specification generated by this process
+        reuses replica k, or replica ((k - 1) % replications) + 1 if replications is set; if this replica does not exist
+        yet, the job is run and its artifacts become that replica. Artifacts are identified by their remote name, so
+        that a hit can link them in the new campaign directory under the local names it asks for. The software versions
+        given to nextKey() (e.g., kernel release and Minitopo commit of the hosts) are part of the key, so that results
+        obtained before an upgrade are not reused after it.
+    """
+    def __init__(self, path, replications=None):
+        self.path = path
+        self.replications = replications
+        self.lock = threading.Lock()
+        self.occurrences = {}
+        self.hits = 0
+        self.misses = 0
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS results (specHash TEXT, replica INTEGER, artifacts TEXT, "
+                                "PRIMARY KEY (specHash, replica))")
+        self.connection.commit()
+
+    def nextKey(self, softwareVersions="", **kwargs):
+        """ Return the resultCacheKey of the next job with this specification, to be called once per generated job """
+        specHash = hashlib.sha1((jobSpecHash(**kwargs) + "\0" + softwareVersions).encode()).hexdigest()
+        with self.lock:
+            occurrence = self.occurrences.get(specHash, 0) + 1
+            self.occurrences[specHash] = occurrence
+
+        replica = occurrence if self.replications is None else ((occurrence - 1) % self.replications) + 1
+        return specHash + "-" + str(replica)
+
+    def link(self, resultCacheKey, files):
+        """ files is a list of (remoteKey, newFilename). If the replica exists, link its artifacts and return the list of
+            linked files; otherwise return None (the job must be run and then stored with the same resultCacheKey)
+        """
+        specHash, replica = resultCacheKey.rsplit("-", 1)
+        with self.lock:
+            row = self.connection.execute("SELECT artifacts FROM results WHERE specHash = ? AND replica = ?",
+                                          (specHash, int(replica))).fetchone()
+
+        artifacts = {} if row is None else json.loads(row[0])
+        if row is None or any(remoteKey not in artifacts or not os.path.exists(artifacts[remoteKey]) for remoteKey, _ in files):
+            self.misses += 1
+            return None
+
+        for remoteKey, newFilename in files:
+            linkArtifact(artifacts[remoteKey], newFilename)
+        self.hits += 1
+        return [newFilename for _, newFilename in files]
+
+    def store(self, resultCacheKey, files):
+        """ Record the files (list of (remoteKey, newFilename)) of a job that was run after a miss """
+        specHash, replica = resultCacheKey.rsplit("-", 1)
+        artifacts = dict((remoteKey, os.path.abspath(newFilename)) for remoteKey, newFilename in files)
+        with self.lock:
+            self.connection.execute("INSERT OR REPLACE INTO results (specHash, replica, artifacts) VALUES (?, ?, ?)",
+                                    (specHash, int(replica), json.dumps(artifacts)))
+            self.connection.commit()
+
+    def report(self):
+        return [self.path + ": " + str(self.hits) + " hits, " + str(self.misses) + " misses"]
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
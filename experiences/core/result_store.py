@@ -0,0 +1,409 @@
+from __future__ import print_function
+
+from replication import CLIENT_LOGS, completionTime
+from timeout_model import readSpecFile, readTopoPaths
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import struct
+import threading
+
+""" Types of the columns, with the struct format of their values and the value of the rows that do not have one """
+FLOAT = "float"
+INT = "int"
+# Stored as the index of the value in the dictionary of the column
+STRING = "string"
+COLUMN_FORMATS = {FLOAT: "d", INT: "q", STRING: "i"}
+MISSING_VALUES = {FLOAT: float("nan"), INT: -2 ** 63, STRING: -1}
+
+SCHEMA_FILENAME = "schema.json"
+INDEX_FILENAME = "ingested.sqlite"
+COLUMN_EXTENSION = ".col"
+DICTIONARY_EXTENSION = ".dict"
+COLUMN_NAME = re.compile(r"^[A-Za-z0-9_.]+$")
+
+""" 0 for the rows of a job that was ingested again since its artifacts changed, 1 otherwise """
+VALID_COLUMN = "valid"
+
+PING_LOG = "ping.log"
+PING_LOSS = re.compile(r"([0-9.]+)% packet loss")
+PING_RTT = re.compile(r"= ([0-9.]+)/([0-9.]+)/([0-9.]+)/([0-9.]+) ms")
+
+""" netstat -s counters kept, as (section, label, column); the column holds the difference between the after and before
+    files of the client and of the server (e.g., client.segmentsRetransmitted)
+"""
+NETSTAT_COUNTERS = (
+    ("Tcp", "segments received", "segmentsReceived"),
+    ("Tcp", "segments send out", "segmentsSent"),
+    ("Tcp", "segments sent out", "segmentsSent"),
+    ("Tcp", "segments retransmitted", "segmentsRetransmitted"),
+    ("TcpExt", "fast retransmits", "fastRetransmits"),
+    ("TcpExt", "other TCP timeouts", "timeouts"),
+    ("Udp", "packets received", "udpPacketsReceived"),
+    ("Udp", "packets sent", "udpPacketsSent"),
+    ("Udp", "packet receive errors", "udpReceiveErrors"),
+)
+NETSTAT_COUNTER_LINE = re.compile(r"^([0-9]+) (.+)$")
+NETSTAT_NAMED_COUNTER_LINE = re.compile(r"^(.+): ([0-9]+)$")
+
+
+def parsePingLog(filename):
+    """ Return one dict per ping summary of the file (one per path, in order), with its loss and rtt min/avg/max/mdev """
+    summaries = []
+    pingFile = open(filename)
+    for line in pingFile:
+        loss = PING_LOSS.search(line)
+        rtt = PING_RTT.search(line)
+        if loss is not None:
+            summaries.append({"loss": float(loss.group(1))})
+        elif rtt is not None and summaries:
+            summaries[-1].update(zip(("min", "avg", "max", "mdev"), [float(value) for value in rtt.groups()]))
+    pingFile.close()
+    return summaries
+
+
+def parseNetstat(filename):
+    """ Return the counters of a netstat -s output as a dict mapping (section, label) to their value """
+    counters = {}
+    section = None
+    netstatFile = open(filename)
+    for line in netstatFile:
+        if line.strip() and not line[0].isspace():
+            section = line.strip().rstrip(":")
+            continue
+
+        counter = NETSTAT_COUNTER_LINE.match(line.strip())
+        if counter is not None:
+            counters[(section, counter.group(2))] = int(counter.group(1))
+            continue
+
+        counter = NETSTAT_NAMED_COUNTER_LINE.match(line.strip())
+        if counter is not None:
+            counters[(section, counter.group(1))] = int(counter.group(2))
+    netstatFile.close()
+    return counters
+
+
+def parseJob(artifacts, **kwargs):
+    """ Return the row of the job described by kwargs: its configuration, the parameters of the paths of its topo file,
+        the settings of its xp file, then what its artifacts (local filenames, as pulled by postProcessing) tell
+    """
+    row = {
+        VALID_COLUMN: 1,
+        "campaign": os.path.basename(kwargs["campaignDir"]),
+        "configuration": os.path.relpath(kwargs["workingDir"], kwargs["campaignDir"]),
+        "protocol": kwargs["protocol"],
+    }
+    for nbPath, path in enumerate(readTopoPaths(kwargs["topoAbsPath"])):
+        for parameter in ("delay", "queueSize", "bandwidth", "loss"):
+            row["path" + str(nbPath) + "." + parameter] = getattr(path, parameter)
+    for key, value in readSpecFile(kwargs["xpAbsPath"]).items():
+        row["xp." + key] = value
+
+    files = dict((os.path.basename(filename), filename) for filename in artifacts if os.path.exists(filename))
+    for clientLog in CLIENT_LOGS:
+        if clientLog in files:
+            value = completionTime(files[clientLog])
+            if value is not None:
+                row["completionTime"] = value
+
+    if PING_LOG in files:
+        for nbPath, summary in enumerate(parsePingLog(files[PING_LOG])):
+            for key, value in summary.items():
+                row["ping" + str(nbPath) + "." + key] = value
+
+    for side in ("client", "server"):
+        before, after = "netstat_" + side + "_before", "netstat_" + side + "_after"
+        if before in files and after in files:
+            countersBefore, countersAfter = parseNetstat(files[before]), parseNetstat(files[after])
+            for section, label, column in NETSTAT_COUNTERS:
+                if (section, label) in countersBefore and (section, label) in countersAfter:
+                    row[side + "." + column] = countersAfter[(section, label)] - countersBefore[(section, label)]
+    return row
+
+
+def filesSignature(filenames):
+    """ Cheap identity of the files, from their size and modification time """
+    signature = []
+    for filename in filenames:
+        stat = os.stat(filename)
+        signature.append((os.path.basename(filename), stat.st_size, stat.st_mtime))
+    return json.dumps(signature)
+
+
+def filesDigest(filenames):
+    """ SHA-1 of the contents of the files, whatever their names and order, so that the artifacts of a job linked in
+        another directory (e.g., by the journal or the result cache of a later campaign) have the same digest
+    """
+    digests = []
+    for filename in filenames:
+        digestFile = open(filename, "rb")
+        digests.append(hashlib.sha1(digestFile.read()).hexdigest())
+        digestFile.close()
+    return hashlib.sha1(" ".join(sorted(digests)).encode()).hexdigest()
+
+
+def columnType(value):
+    if isinstance(value, bool) or isinstance(value, int):
+        return INT
+    if isinstance(value, float):
+        return FLOAT
+    return STRING
+
+
+class ResultStore(object):
+    """ Columnar store of the parsed results of the jobs, filled while the campaign runs
+
+        The store is a directory holding one file per column with one fixed-size value per row (see COLUMN_FORMATS), so
+        that an analysis reading a few columns of many jobs only maps these files in memory (see column()) instead of
+        reparsing the campaign directories. String values are stored as indexes in the dictionary of their column,
+        one JSON string per line. Rows are only appended: schema.json gives the number of rows and the columns, and is
+        rewritten after each row, so that a crash never leaves a partial row visible. Columns are created when a row
+        first has them, the previous rows then miss them (see MISSING_VALUES). The type of a column is the one of its first
+        value, except that an INT column is widened to FLOAT when a float value comes (see widenColumn()).
+
+        ingest() parses the artifacts of a job (see parseJob) and appends its row, unless the same job directory was
+        already ingested with the same files: their size and modification time are compared first, then their SHA-1.
+        If they changed, the previous row of the job is no longer valid (see VALID_COLUMN). A new job directory whose
+        files have the SHA-1 of an ingested job holds the same measurement, e.g., a job of a resumed campaign linked
+        from the journal or a hit of the result cache: it is mapped to the row of that job instead of adding one. With readOnly, the store can
+        be read while a campaign is adding rows to it; it then only sees the rows present when it was opened.
+    """
+    def __init__(self, path, readOnly=False):
+        self.path = path
+        self.readOnly = readOnly
+        self.lock = threading.Lock()
+        self.ingested = 0
+        self.skipped = 0
+        self.reused = 0
+        if not readOnly and not os.path.exists(path):
+            os.makedirs(path)
+
+        schemaPath = os.path.join(path, SCHEMA_FILENAME)
+        if os.path.exists(schemaPath):
+            schemaFile = open(schemaPath)
+            schema = json.load(schemaFile)
+            schemaFile.close()
+        else:
+            schema = {"rows": 0, "columns": [], "dictionarySizes": {}}
+        self.rows = schema["rows"]
+        self.types = dict((name, valueType) for name, valueType in schema["columns"])
+        self.order = [name for name, _ in schema["columns"]]
+        self.dictionaries = {}
+        self.codes = {}
+        for name in self.order:
+            if self.types[name] == STRING:
+                self.loadDictionary(name, schema["dictionarySizes"][name])
+        if readOnly:
+            self.connection = None
+            return
+
+        # Drop what a crashed writer appended after the last complete row
+        for name in self.order:
+            columnFile = open(self.columnPath(name), "r+b")
+            columnFile.truncate(self.rows * struct.calcsize("<" + COLUMN_FORMATS[self.types[name]]))
+            columnFile.close()
+        self.connection = sqlite3.connect(os.path.join(path, INDEX_FILENAME), check_same_thread=False)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS jobs (workingDir TEXT PRIMARY KEY, signature TEXT, digest TEXT, "
+                                "row INTEGER)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS jobsDigest ON jobs (digest)")
+        self.connection.commit()
+
+    def columnPath(self, name):
+        return os.path.join(self.path, name + COLUMN_EXTENSION)
+
+    def dictionaryPath(self, name):
+        return os.path.join(self.path, name + DICTIONARY_EXTENSION)
+
+    def loadDictionary(self, name, size):
+        dictionaryFile = open(self.dictionaryPath(name))
+        lines = dictionaryFile.readlines()
+        dictionaryFile.close()
+        self.dictionaries[name] = [json.loads(line) for line in lines[:size]]
+        self.codes[name] = dict((value, code) for code, value in enumerate(self.dictionaries[name]))
+        if len(lines) > size and not self.readOnly:
+            dictionaryFile = open(self.dictionaryPath(name), "w")
+            dictionaryFile.writelines(lines[:size])
+            dictionaryFile.close()
+
+    def writeSchema(self):
+        """ Must be called with the lock """
+        schemaPath = os.path.join(self.path, SCHEMA_FILENAME)
+        schemaFile = open(schemaPath + ".tmp", "w")
+        json.dump({"rows": self.rows, "columns": [[name, self.types[name]] for name in self.order],
+                   "dictionarySizes": dict((name, len(values)) for name, values in self.dictionaries.items())}, schemaFile)
+        schemaFile.close()
+        os.rename(schemaPath + ".tmp", schemaPath)
+
+    def addColumn(self, name, valueType):
+        """ Must be called with the lock """
+        if COLUMN_NAME.match(name) is None:
+            raise Exception("Invalid column name " + name)
+
+        columnFile = open(self.columnPath(name), "wb")
+        columnFile.write(struct.pack("<" + COLUMN_FORMATS[valueType] * self.rows, *([MISSING_VALUES[valueType]] * self.rows)))
+        columnFile.close()
+        if valueType == STRING:
+            open(self.dictionaryPath(name), "w").close()
+            self.dictionaries[name] = []
+            self.codes[name] = {}
+        self.types[name] = valueType
+        self.order.append(name)
+
+    def widenColumn(self, name):
+        """ Must be called with the lock; rewrite the INT column as a FLOAT one, so that a float value is not truncated """
+        size = struct.calcsize("<" + COLUMN_FORMATS[INT])
+        columnFile = open(self.columnPath(name), "rb")
+        values = struct.unpack("<" + COLUMN_FORMATS[INT] * self.rows, columnFile.read(self.rows * size))
+        columnFile.close()
+
+        # Replaced by a rename, so that a reader keeps the file it mapped
+        columnFile = open(self.columnPath(name) + ".tmp", "wb")
+        columnFile.write(struct.pack("<" + COLUMN_FORMATS[FLOAT] * self.rows,
+                                     *[MISSING_VALUES[FLOAT] if value == MISSING_VALUES[INT] else float(value)
+                                       for value in values]))
+        columnFile.close()
+        os.rename(self.columnPath(name) + ".tmp", self.columnPath(name))
+        self.types[name] = FLOAT
+        self.writeSchema()
+
+    def encode(self, name, value, newValues):
+        """ Must be called with the lock; the values new to the dictionary of the column are added to newValues, the
+            dictionary itself is only extended once the whole row is encoded
+        """
+        valueType = self.types[name]
+        if value is None:
+            return MISSING_VALUES[valueType]
+        if valueType == FLOAT:
+            return float(value)
+        if valueType == INT:
+            return int(value)
+
+        value = str(value)
+        if value in self.codes[name]:
+            return self.codes[name][value]
+        pending = newValues.setdefault(name, [])
+        if value not in pending:
+            pending.append(value)
+        return len(self.dictionaries[name]) + pending.index(value)
+
+    def appendRow(self, row):
+        """ Must be called with the lock; return the index of the row """
+        for name in sorted(row):
+            if name not in self.types and row[name] is not None:
+                self.addColumn(name, columnType(row[name]))
+            elif self.types.get(name) == INT and columnType(row[name]) == FLOAT:
+                self.widenColumn(name)
+
+        # Encoded before any file is written, so that a value that cannot be encoded leaves the columns aligned
+        newValues = {}
+        encoded = [(name, self.encode(name, row.get(name), newValues)) for name in self.order]
+        for name, value in encoded:
+            columnFile = open(self.columnPath(name), "ab")
+            columnFile.write(struct.pack("<" + COLUMN_FORMATS[self.types[name]], value))
+            columnFile.close()
+        for name, values in newValues.items():
+            dictionaryFile = open(self.dictionaryPath(name), "a")
+            dictionaryFile.writelines(json.dumps(value) + "\n" for value in values)
+            dictionaryFile.close()
+            for value in values:
+                self.codes[name][value] = len(self.dictionaries[name])
+                self.dictionaries[name].append(value)
+
+        self.rows += 1
+        self.writeSchema()
+        return self.rows - 1
+
+    def invalidate(self, rowIndex):
+        """ Must be called with the lock """
+        columnFile = open(self.columnPath(VALID_COLUMN), "r+b")
+        columnFile.seek(rowIndex * struct.calcsize("<" + COLUMN_FORMATS[INT]))
+        columnFile.write(struct.pack("<" + COLUMN_FORMATS[INT], 0))
+        columnFile.close()
+
+    def append(self, row):
+        """ Append the row (a dict mapping column names to int, float or str values) and return its index """
+        with self.lock:
+            return self.appendRow(row)
+
+    def ingest(self, artifacts, **kwargs):
+        """ Parse the artifacts (local filenames) of the job described by kwargs into a new row, unless they were already,
+            in this job directory or another one. Return True if a row was appended
+        """
+        workingDir = os.path.abspath(kwargs["workingDir"])
+        pulled = [filename for filename in artifacts if os.path.exists(filename)]
+        filenames = [filename for filename in [kwargs["topoAbsPath"], kwargs["xpAbsPath"]] if os.path.exists(filename)] + pulled
+        signature = filesSignature(filenames)
+        with self.lock:
+            previous = self.connection.execute("SELECT signature, digest, row FROM jobs WHERE workingDir = ?",
+                                               (workingDir,)).fetchone()
+        if previous is not None and previous[0] == signature:
+            self.skipped += 1
+            return False
+
+        digest = filesDigest(filenames)
+        if previous is not None and previous[1] == digest:
+            with self.lock:
+                self.connection.execute("UPDATE jobs SET signature = ? WHERE workingDir = ?", (signature, workingDir))
+                self.connection.commit()
+            self.skipped += 1
+            return False
+
+        # Without any artifact, the replicas of a specification would all have the same digest
+        if previous is None and len(pulled) > 0:
+            with self.lock:
+                same = self.connection.execute("SELECT row FROM jobs WHERE digest = ?", (digest,)).fetchone()
+                if same is not None:
+                    self.connection.execute("INSERT INTO jobs (workingDir, signature, digest, row) VALUES (?, ?, ?, ?)",
+                                            (workingDir, signature, digest, same[0]))
+                    self.connection.commit()
+            if same is not None:
+                self.reused += 1
+                return False
+
+        row = parseJob(artifacts, **kwargs)
+        with self.lock:
+            rowIndex = self.appendRow(row)
+            if previous is not None:
+                self.invalidate(previous[2])
+            self.connection.execute("INSERT OR REPLACE INTO jobs (workingDir, signature, digest, row) VALUES (?, ?, ?, ?)",
+                                    (workingDir, signature, digest, rowIndex))
+            self.connection.commit()
+        self.ingested += 1
+        return True
+
+    def columns(self):
+        return list(self.order)
+
+    def column(self, name):
+        """ Return the values of the column as a read-only numpy array mapped from its file (the dictionary indexes for
+            STRING columns, see values())
+        """
+        # Only the analyses need numpy, not the campaigns filling the store
+        import numpy as np
+
+        dtype = np.dtype("<" + COLUMN_FORMATS[self.types[name]])
+        if self.rows == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(self.columnPath(name), dtype=dtype, mode="r", shape=(self.rows,))
+
+    def values(self, name):
+        """ Return the values of the column as a numpy array, None for the rows missing a STRING value """
+        import numpy as np
+
+        codes = self.column(name)
+        if self.types[name] != STRING:
+            return codes
+        return np.array(self.dictionaries[name] + [None], dtype=object)[codes]
+
+    def report(self):
+        return [str(self.ingested) + " jobs ingested in " + self.path + " (" + str(self.rows) + " rows, " + str(self.skipped) +
+                " unchanged ones skipped, " + str(self.reused) + " already ingested from another directory)"]
+
+    def close(self):
+        if self.connection is not None:
+            with self.lock:
+                self.connection.close()
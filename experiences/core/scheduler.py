@@ -0,0 +1,102 @@
+from __future__ import print_function
+
+from Queue import Empty
+
+import collections
+import heapq
+import itertools
+import threading
+import time
+
+""" Number of pending jobs (in the order they were added) among which the longest one is dispatched """
+DEFAULT_LOOKAHEAD = 256
+
+
+def listScheduleMakespan(costs, hostCount):
+    """ Makespan of running the jobs of the given costs in this order, each on the host that becomes free first """
+    hosts = [0.0] * hostCount
+    for cost in costs:
+        heapq.heapreplace(hosts, hosts[0] + cost)
+    return max(hosts)
+
+
+class JobScheduler(object):
+    """ Queue of the pending jobs, used as the work queue of ExperienceLauncher
+
+        The jobs are dispatched as soon as they are added, so that the hosts start while the campaign is still being
+        generated. If lpt, a free host takes the longest expected runtime among the lookahead oldest pending jobs: once
+        the window holds all the pending jobs, this is the LPT list scheduling, whose makespan is at most 4/3 of the
+        optimal one, while a short job never waits behind more than lookahead jobs added after it. Otherwise, the jobs
+        are dispatched in the order they were added. Once close() was called and all the jobs were dispatched, get()
+        returns None.
+    """
+    def __init__(self, hostCount, lpt=True, lookahead=DEFAULT_LOOKAHEAD):
+        self.hostCount = hostCount
+        self.lpt = lpt
+        self.lookahead = lookahead
+        self.condition = threading.Condition()
+        # The window of the pending jobs, and the ones added after it is full
+        self.heap = []
+        self.overflow = collections.deque()
+        self.counter = itertools.count()
+        self.closed = False
+        # Expected runtimes of the jobs, in the order they were dispatched
+        self.dispatched = []
+        self.firstDispatch = None
+        self.lastDone = None
+
+    def put(self, workData, cost):
+        """ cost is the expected runtime of the job, in seconds """
+        with self.condition:
+            priority = -cost if self.lpt else 0
+            job = (priority, next(self.counter), cost, workData)
+            if len(self.heap) < self.lookahead:
+                heapq.heappush(self.heap, job)
+            else:
+                self.overflow.append(job)
+            self.condition.notify()
+
+    def close(self):
+        """ Once the pending jobs are dispatched, get() returns None """
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def pop(self):
+        """ Must be called with the condition, with a pending job """
+        _, _, cost, workData = heapq.heappop(self.heap)
+        if self.overflow:
+            heapq.heappush(self.heap, self.overflow.popleft())
+        if self.firstDispatch is None:
+            self.firstDispatch = time.time()
+        self.dispatched.append(cost)
+        return workData
+
+    def get(self):
+        with self.condition:
+            while not self.heap and not self.closed:
+                # With a timeout, so that the wait can be interrupted
+                self.condition.wait(1)
+            return self.pop() if self.heap else None
+
+    def get_nowait(self):
+        with self.condition:
+            if not self.heap and not self.closed:
+                raise Empty
+            return self.pop() if self.heap else None
+
+    def done(self):
+        """ Record the end of a dispatched job """
+        with self.condition:
+            self.lastDone = time.time()
+
+    def report(self):
+        with self.condition:
+            if self.firstDispatch is None or self.lastDone is None:
+                return []
+
+            expected = listScheduleMakespan(self.dispatched, self.hostCount)
+            lowerBound = max(max(self.dispatched), sum(self.dispatched) / self.hostCount)
+            achieved = self.lastDone - self.firstDispatch
+            return ["Makespan of " + str(len(self.dispatched)) + " jobs on " + str(self.hostCount) + " slots: expected " +
+                    "%.0f" % expected + " s (lower bound " + "%.0f" % lowerBound + " s), achieved " + "%.0f" % achieved + " s"]
@@ -0,0 +1,88 @@
+from __future__ import print_function
+
+from kernel_state import MPTCP_ENABLED_PATH
+
+""" Succeeds if the MPTCP kernel is up (e.g., its modules are loaded after a reboot) """
+KERNEL_READY_CMD = "test -e " + MPTCP_ENABLED_PATH
+""" Succeeds if no experience, Mininet host nor Mininet interface (named <node>-eth<N>) is left and the kernel is up
+    (brackets avoid matching the shell running the command, quotes keep the shell from expanding them)
+"""
+HOST_READY_CMD = "! pgrep -f '[m]pPerf.py' > /dev/null && ! pgrep -f '[m]ininet:' > /dev/null && " + \
+                 "! ip -o link show | grep -q -- '-eth[0-9]' && " + KERNEL_READY_CMD
+MININET_CLEAN_CMD = "timeout 20 sudo mn -c"
+""" Succeeds if the switches of Mininet can be isolated in network namespaces: Open vSwitch bridges live in the single
+    ovs-vswitchd of the host, whatever the namespace they are created from, so its slots would share (and clean) them
+"""
+ISOLATION_CHECK_CMD = "! pgrep -x ovs-vswitchd > /dev/null"
+
+
+def expandSlots(remoteHostnames, slots):
+    """ slots is the number of slots of every host, or a list with the number of slots of each host
+        Return the list of Slot, the slots of a host being consecutive
+    """
+    counts = slots if isinstance(slots, (list, tuple)) else [slots] * len(remoteHostnames)
+    if not len(counts) == len(remoteHostnames):
+        raise Exception("remoteHostnames and slots with different lengths")
+
+    expanded = []
+    for host, count in enumerate(counts):
+        if count <= 0:
+            raise Exception("Host " + remoteHostnames[host] + " needs at least one slot")
+        expanded += [Slot(host, index, count) for index in range(count)]
+    return expanded
+
+
+class Slot(object):
+    """ An execution slot of a remote host, i.e., one experience at a time
+
+        A host with a single slot is used as a whole, with the global Mininet clean up. On a host with several slots,
+        the experience of each slot runs in its own network namespace, so that the interfaces created by Mininet do not
+        clash with the ones of the other slots, and in its own systemd scope, so that all its processes (including the
+        detached Mininet hosts) can be killed without touching the neighbours. Each slot then uses its own tmpfs
+        subdirectory, and is never rebooted to recover it. Only the switches living in the namespace (e.g., Linux
+        bridges) are isolated this way, not the ones of Open vSwitch: a host with several slots must pass
+        ISOLATION_CHECK_CMD.
+    """
+    def __init__(self, host, index, count):
+        self.host = host
+        self.index = index
+        self.count = count
+
+    def isolated(self):
+        return self.count > 1
+
+    def name(self):
+        return "minitopo_slot" + str(self.index)
+
+    def tmpfs(self, tmpfs):
+        return tmpfs + "/slot_" + str(self.index) if self.isolated() else tmpfs
+
+    def wrapCmd(self, cmd):
+        """ Return the remote command running cmd (run as root) in the slot """
+        if not self.isolated():
+            return "sudo " + cmd
+
+        return "sudo ip netns add " + self.name() + " 2> /dev/null; sudo ip netns exec " + self.name() + " ip link set lo up && " + \
+               "sudo systemd-run --scope --quiet --unit=" + self.name() + " ip netns exec " + self.name() + " " + cmd
+
+    def cleanCmd(self):
+        """ Return the remote command cleaning what the experience of the slot could have left """
+        if not self.isolated():
+            return MININET_CLEAN_CMD
+
+        # Deleting the namespace removes the interfaces left inside, and with them their peers in the Mininet hosts
+        return "sudo systemctl kill --signal=SIGKILL " + self.name() + ".scope 2> /dev/null; " + \
+               "sudo systemctl reset-failed " + self.name() + ".scope 2> /dev/null; " + \
+               "sudo ip netns delete " + self.name() + " 2> /dev/null; true"
+
+    def killCmd(self):
+        """ Return the remote command killing the experience of the slot, whatever its state """
+        return self.cleanCmd() if self.isolated() else "sudo pkill -f mpPerf.py; " + MININET_CLEAN_CMD
+
+    def readyCmd(self):
+        """ Return the remote command succeeding if the slot is ready for the next experience """
+        if not self.isolated():
+            return HOST_READY_CMD
+
+        return "! systemctl is-active --quiet " + self.name() + ".scope && ! test -e /var/run/netns/" + self.name() + " && " + \
+               KERNEL_READY_CMD
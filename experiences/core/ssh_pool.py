@@ -0,0 +1,144 @@
+from __future__ import print_function
+
+from transport import Transport
+
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+
+""" Keep the master connection open this number of seconds after the last use """
+DEFAULT_CONTROL_PERSIST = 600
+""" Don't wait longer than this number of seconds for an unreachable host """
+CONNECT_TIMEOUT = 10
+""" A master connection is checked again after this number of seconds, or at the next operation after a failure """
+MASTER_CHECK_INTERVAL = 60
+
+
+class SshConnectionPool(Transport):
+    """ Keep one multiplexed SSH connection (ControlMaster) per remote host
+
+        Every ssh and scp command built by the pool goes through the master connection of its host, so only the
+        first operation (or the first one after the master died) pays the SSH handshake. The entries of the pool that
+        are the same host and port (e.g., the slots of a host) share its master connection. The master is only checked
+        (with a local ssh -O check) before the first operation, after a failure reported by masterLost(), and then every
+        checkInterval seconds; meanwhile, ControlMaster=auto lets a command open it again if it died.
+    """
+    def __init__(self, remoteHostnames, remotePorts, controlDir=None, controlPersist=DEFAULT_CONTROL_PERSIST,
+                 checkInterval=MASTER_CHECK_INTERVAL):
+        Transport.__init__(self, remoteHostnames, remotePorts)
+        self.controlPersist = controlPersist
+        self.checkInterval = checkInterval
+        # Unix socket paths are limited to ~100 characters, so keep the directory short
+        self.ownControlDir = controlDir is None
+        self.controlDir = tempfile.mkdtemp(prefix="mtssh") if controlDir is None else controlDir
+        # Index of the master connection of each entry, the first entry of each (host, port) names it
+        self.masterKeys = []
+        self.masters = []
+        for num in range(len(remoteHostnames)):
+            if (remoteHostnames[num], remotePorts[num]) not in self.masterKeys:
+                self.masterKeys.append((remoteHostnames[num], remotePorts[num]))
+            self.masters.append(self.masterKeys.index((remoteHostnames[num], remotePorts[num])))
+        self.locks = [threading.Lock() for _ in self.masterKeys]
+        self.lastChecks = [None] * len(self.masterKeys)
+        self.masterHandshakes = [0] * len(self.masterKeys)
+
+    def controlPath(self, num):
+        return os.path.join(self.controlDir, str(self.masters[num]))
+
+    def controlOptions(self, num):
+        return ["-o", "ControlMaster=auto", "-o", "ControlPath=" + self.controlPath(num),
+                "-o", "ControlPersist=" + str(self.controlPersist), "-o", "ConnectTimeout=" + str(CONNECT_TIMEOUT)]
+
+    def masterCheckCmd(self, num):
+        return ["ssh", "-p", self.remotePorts[num], "-o", "ControlPath=" + self.controlPath(num), "-O", "check",
+                self.remoteHostnames[num]]
+
+    def isAlive(self, num):
+        devnull = open(os.devnull, "w")
+        returnCode = subprocess.call(self.masterCheckCmd(num), stdout=devnull, stderr=devnull)
+        devnull.close()
+        return returnCode == 0
+
+    def masterCheckDue(self, num):
+        lastCheck = self.lastChecks[self.masters[num]]
+        return lastCheck is None or time.time() - lastCheck >= self.checkInterval
+
+    def masterChecked(self, num):
+        self.lastChecks[self.masters[num]] = time.time()
+
+    def masterOpened(self, num):
+        """ All the entries sharing the master of num see the new connection """
+        master = self.masters[num]
+        self.masterHandshakes[master] += 1
+        for other in range(len(self.masters)):
+            if self.masters[other] == master:
+                self.handshakes[other] += 1
+
+    def masterLost(self, num):
+        self.lastChecks[self.masters[num]] = None
+
+    def ensureMaster(self, num):
+        """ Open the master connection of host num if a check is due and finds it down; count the operation that will
+            use it
+        """
+        with self.locks[self.masters[num]]:
+            self.operations[num] += 1
+            if self.managedMasters or not self.masterCheckDue(num):
+                return
+
+            if self.isAlive(num):
+                self.masterChecked(num)
+                return
+
+            if subprocess.call(self.openMasterCmd(num)) == 0:
+                self.masterChecked(num)
+            else:
+                # The operation itself will then fall back on its own handshake
+                print("Cannot open master SSH connection to " + self.remoteHostnames[num] + ": continue")
+            self.masterOpened(num)
+
+    def openMasterCmd(self, num):
+        """ Return the command opening the master connection of host num in background """
+        return ["ssh", "-p", self.remotePorts[num]] + self.controlOptions(num) + ["-M", "-N", "-f", self.remoteHostnames[num]]
+
+    def shellCmd(self, num, remoteCmd):
+        """ Return the ssh command (as a list) running remoteCmd on host num through its master connection """
+        self.ensureMaster(num)
+        return ["ssh", "-p", self.remotePorts[num]] + self.controlOptions(num) + [self.remoteHostnames[num], remoteCmd]
+
+    def putCmd(self, num, filename, path):
+        self.ensureMaster(num)
+        return ["scp", "-P", self.remotePorts[num]] + self.controlOptions(num) + [filename, self.remoteHostnames[num] + ":" + path]
+
+    def getCmd(self, num, remoteFilename, newFilename):
+        self.ensureMaster(num)
+        return ["scp", "-P", self.remotePorts[num]] + self.controlOptions(num) + [self.remoteHostnames[num] + ":" + remoteFilename,
+                                                                                   newFilename]
+
+    def closeMaster(self, num):
+        cmd = ["ssh", "-p", self.remotePorts[num], "-o", "ControlPath=" + self.controlPath(num), "-O", "exit",
+               self.remoteHostnames[num]]
+        devnull = open(os.devnull, "w")
+        subprocess.call(cmd, stdout=devnull, stderr=devnull)
+        devnull.close()
+
+    def closeAll(self):
+        for num in range(len(self.remoteHostnames)):
+            if num == self.masters.index(self.masters[num]):
+                self.closeMaster(num)
+
+        if self.ownControlDir:
+            shutil.rmtree(self.controlDir, ignore_errors=True)
+
+    def report(self):
+        """ Return one line per host with the number of SSH handshakes saved by the pool """
+        lines = []
+        for master, (hostname, port) in enumerate(self.masterKeys):
+            operations = sum(self.operations[num] for num in range(len(self.masters)) if self.masters[num] == master)
+            saved = operations - self.masterHandshakes[master]
+            lines.append(hostname + ":" + port + " " + str(operations) + " remote operations with " +
+                         str(self.masterHandshakes[master]) + " handshakes (" + str(saved) + " saved)")
+        return lines
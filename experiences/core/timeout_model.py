@@ -0,0 +1,207 @@
+from __future__ import print_function
+
+from generate_topo import DEFAULT_MTU
+from generate_xp import XP_TYPE, QUICREQRES, HTTPS_RANDOM_SIZE, QUIC_MULTIPATH, QUICREQRES_RUN_TIME, \
+    DEFAULT_XP_TYPE, DEFAULT_HTTPS_RANDOM_SIZE, DEFAULT_QUIC_MULTIPATH, DEFAULT_QUICREQRES_RUN_TIME
+
+import math
+import sqlite3
+import threading
+import time
+
+""" Bounds of the timeout of a job, in seconds """
+MIN_TIMEOUT = 60
+DEFAULT_MAX_TIMEOUT = 7200
+""" Fixed cost of a run (Mininet setup and teardown, pcap flush) before any runtime was recorded """
+DEFAULT_OVERHEAD = 30.0
+""" The timeout is this factor times the expected runtime once the model learned from SAMPLES_TO_LEARN runtimes """
+SAFETY_FACTOR = 2.0
+""" ... and this factor before """
+UNTRAINED_SAFETY_FACTOR = 4.0
+SAMPLES_TO_LEARN = 5
+""" Round-trips before the first byte of data (TCP/MPTCP + TLS, or QUIC handshake and request) """
+HANDSHAKE_RTTS = 4
+""" Loss rate considered when a path has none, so that the Mathis model stays finite """
+MIN_LOSS = 1e-6
+
+
+class PathParameters(object):
+    """ A path of a generated topo file; delay in ms, queueSize in packets, bandwidth in Mbps and loss in percent """
+    def __init__(self, delay, queueSize, bandwidth, loss):
+        self.delay = delay
+        self.queueSize = queueSize
+        self.bandwidth = bandwidth
+        self.loss = loss
+
+    def rtt(self):
+        """ In seconds, with a full queue """
+        return 2.0 * self.delay / 1000.0 + self.queueSize * DEFAULT_MTU * 8.0 / (self.bandwidth * 1000000.0)
+
+    def rate(self):
+        """ Expected goodput in bytes per second: the bandwidth, limited by the Mathis model under loss """
+        if self.bandwidth <= 0.0 or self.loss >= 100.0:
+            return 0.0
+
+        lossRate = max(self.loss / 100.0, MIN_LOSS)
+        mathisRate = (DEFAULT_MTU - 40) / self.rtt() * 1.22 / math.sqrt(lossRate)
+        return min(self.bandwidth * 125000.0, mathisRate)
+
+
+def readSpecFile(filename):
+    """ Return the key:value lines of a generated topo or xp file as a dict """
+    spec = {}
+    specFile = open(filename)
+    for line in specFile:
+        if ":" in line:
+            key, value = line.strip().split(":", 1)
+            spec[key] = value
+    specFile.close()
+    return spec
+
+
+def readTopoPaths(topoAbsPath):
+    """ Return the list of PathParameters of the topo file; the loss of a path is the worst one set by netem """
+    paths = {}
+    netemLosses = []
+    topoFile = open(topoAbsPath)
+    for line in topoFile:
+        key, _, value = line.strip().partition(":")
+        if key.startswith("path_"):
+            delay, queueSize, bandwidth, loss = value.split(",")
+            paths[int(key[len("path_"):])] = PathParameters(float(delay), float(queueSize), float(bandwidth), float(loss))
+        elif key.startswith("netemAt_") and "loss" in value:
+            # A path can have several netem lines, e.g., a loss added in the middle of the experience
+            netemLosses.append((int(key[len("netemAt_"):]), float(value.split("loss", 1)[1].strip().rstrip("%"))))
+    topoFile.close()
+
+    for pathId, loss in netemLosses:
+        if pathId in paths:
+            paths[pathId].loss = max(paths[pathId].loss, loss)
+    return [paths[pathId] for pathId in sorted(paths)]
+
+
+def expectedTransferTime(**kwargs):
+    """ Runtime of the experience described by kwargs predicted from its topo and xp files, without the fixed overhead
+
+        Return None if the experience cannot complete according to the model (e.g., all its paths are lossy at 100%)
+    """
+    paths = readTopoPaths(kwargs["topoAbsPath"])
+    xp = readSpecFile(kwargs["xpAbsPath"])
+    if xp.get(XP_TYPE, DEFAULT_XP_TYPE) == QUICREQRES:
+        return float(xp.get(QUICREQRES_RUN_TIME, DEFAULT_QUICREQRES_RUN_TIME))
+
+    multipath = kwargs.get("protocol") == "mptcp" or xp.get(QUIC_MULTIPATH, DEFAULT_QUIC_MULTIPATH) == "1"
+    # Single path experiences use the first path
+    usedPaths = paths if multipath else paths[:1]
+    rate = sum(path.rate() for path in usedPaths)
+    if rate <= 0.0:
+        return None
+
+    size = float(xp.get(HTTPS_RANDOM_SIZE, DEFAULT_HTTPS_RANDOM_SIZE)) * 1024.0
+    return HANDSHAKE_RTTS * max(path.rtt() for path in usedPaths) + size / rate
+
+
+class TimeoutModel(object):
+    """ Per-job timeout derived from the topology and experience parameters, learned from the recorded runtimes
+
+        For each experience type, the runtime is modeled as overhead + scale * expectedTransferTime(), fitted by least
+        squares on the runtimes of the completed jobs (stored in SQLite if path is given, so that later campaigns start
+        with a trained model). The timeout is the model prediction times the safety factor, or times the largest ratio
+        between a recorded runtime and its prediction if it is higher, doubled at each attempt of the job.
+    """
+    def __init__(self, path=None, maxTimeout=DEFAULT_MAX_TIMEOUT, safetyFactor=SAFETY_FACTOR):
+        self.path = path
+        self.maxTimeout = maxTimeout
+        self.safetyFactor = safetyFactor
+        self.lock = threading.Lock()
+        # For each experience type, the list of (expected transfer time, runtime)
+        self.samples = {}
+        self.fits = {}
+        self.timeouts = 0
+        self.connection = sqlite3.connect(":memory:" if path is None else path, check_same_thread=False)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS runtimes (xpType TEXT, expected REAL, runtime REAL, recorded REAL)")
+        self.connection.commit()
+        for xpType, expected, runtime in self.connection.execute("SELECT xpType, expected, runtime FROM runtimes"):
+            self.samples.setdefault(xpType, []).append((expected, runtime))
+
+    def fit(self, xpType):
+        """ Return (overhead, scale, safetyFactor) for the experience type; must be called with the lock """
+        samples = self.samples.get(xpType, [])
+        if len(samples) < SAMPLES_TO_LEARN:
+            return DEFAULT_OVERHEAD, 1.0, UNTRAINED_SAFETY_FACTOR
+
+        if xpType in self.fits and self.fits[xpType][0] == len(samples):
+            return self.fits[xpType][1]
+
+        meanExpected = sum(expected for expected, _ in samples) / len(samples)
+        meanRuntime = sum(runtime for _, runtime in samples) / len(samples)
+        variance = sum((expected - meanExpected) ** 2 for expected, _ in samples)
+        covariance = sum((expected - meanExpected) * (runtime - meanRuntime) for expected, runtime in samples)
+        scale = covariance / variance if variance > 0.0 else 0.0
+        if scale <= 0.0:
+            # All jobs look the same to the model (e.g., quicreqres), only learn the overhead
+            scale = 1.0
+        overhead = max(meanRuntime - scale * meanExpected, 0.0)
+
+        worstRatio = max(runtime / (overhead + scale * expected) for expected, runtime in samples if overhead + scale * expected > 0.0)
+        fitted = (overhead, scale, max(self.safetyFactor, worstRatio * 1.1))
+        self.fits[xpType] = (len(samples), fitted)
+        return fitted
+
+    def predict(self, **kwargs):
+        """ Return (expected runtime in seconds, safety factor) of the experience described by kwargs, or None if the
+            model predicts that it cannot complete
+        """
+        expected = expectedTransferTime(**kwargs)
+        if expected is None:
+            return None
+
+        with self.lock:
+            overhead, scale, safetyFactor = self.fit(readSpecFile(kwargs["xpAbsPath"]).get(XP_TYPE, DEFAULT_XP_TYPE))
+        return overhead + scale * expected, safetyFactor
+
+    def expectedRuntime(self, **kwargs):
+        """ Return the expected runtime in seconds of the experience described by kwargs, at most the maximum timeout """
+        prediction = self.predict(**kwargs)
+        return self.maxTimeout if prediction is None else min(prediction[0], self.maxTimeout)
+
+    def timeout(self, **kwargs):
+        """ Return the timeout in seconds of the experience described by kwargs """
+        prediction = self.predict(**kwargs)
+        if prediction is None:
+            return self.maxTimeout
+
+        runtime, safetyFactor = prediction
+        timeout = runtime * safetyFactor * 2 ** (kwargs.get("attempts", 1) - 1)
+        return int(min(max(timeout, MIN_TIMEOUT), self.maxTimeout))
+
+    def observe(self, runtime, **kwargs):
+        """ Record the runtime of a completed experience """
+        expected = expectedTransferTime(**kwargs)
+        if expected is None:
+            return
+
+        xpType = readSpecFile(kwargs["xpAbsPath"]).get(XP_TYPE, DEFAULT_XP_TYPE)
+        with self.lock:
+            self.samples.setdefault(xpType, []).append((expected, runtime))
+            self.connection.execute("INSERT INTO runtimes (xpType, expected, runtime, recorded) VALUES (?, ?, ?, ?)",
+                                    (xpType, expected, runtime, time.time()))
+            self.connection.commit()
+
+    def timedOut(self):
+        with self.lock:
+            self.timeouts += 1
+
+    def report(self):
+        lines = []
+        with self.lock:
+            for xpType in sorted(self.samples):
+                overhead, scale, safetyFactor = self.fit(xpType)
+                lines.append(xpType + ": " + str(len(self.samples[xpType])) + " runtimes, " + "%.1f" % overhead + " s + " +
+                             "%.2f" % scale + " x expected, safety factor " + "%.2f" % safetyFactor)
+            lines.append(str(self.timeouts) + " jobs timed out")
+        return lines
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,170 @@
+from __future__ import print_function
+
+from generate_topo import PATHS, NETEM, BANDWIDTH, DELAY, QUEUING_DELAY
+
+import numpy as np
+
+""" Designs of the unit hypercube the topologies are drawn from """
+UNIFORM = "uniform"
+LATIN_HYPERCUBE = "lhs"
+SOBOL = "sobol"
+HALTON = "halton"
+
+""" Parameters of each path, in the order of the dimensions of the design (a topology with P paths has 4 * P) """
+PATH_PARAMETERS = ("bandwidth", "rtt", "queuingDelay", "loss")
+
+""" Bits of the Sobol points """
+SOBOL_BITS = 30
+""" Primitive polynomials (degree s, coefficients a) and initial direction numbers m of the Sobol dimensions after the
+    first one, from the new-joe-kuo-6.21201 file of Joe and Kuo
+"""
+SOBOL_DIRECTIONS = [
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+]
+""" Bases of the Halton dimensions """
+HALTON_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53)
+
+
+def uniformDesign(nbPoints, dimensions, randomState):
+    return randomState.random_sample((nbPoints, dimensions))
+
+
+def latinHypercubeDesign(nbPoints, dimensions, randomState):
+    """ Each of the nbPoints strata of each dimension holds exactly one point """
+    strata = np.argsort(randomState.random_sample((nbPoints, dimensions)), axis=0)
+    return (strata + randomState.random_sample((nbPoints, dimensions))) / nbPoints
+
+
+def sobolDirections(dimensions):
+    """ Return the direction numbers (dimensions x SOBOL_BITS integers) of the first dimensions of the Sobol sequence """
+    if dimensions > len(SOBOL_DIRECTIONS) + 1:
+        raise Exception("Sobol designs are limited to " + str(len(SOBOL_DIRECTIONS) + 1) + " dimensions")
+
+    directions = np.zeros((dimensions, SOBOL_BITS), dtype=np.int64)
+    # The first dimension is the van der Corput sequence in base 2
+    directions[0] = [1 << (SOBOL_BITS - 1 - bit) for bit in range(SOBOL_BITS)]
+    for dimension in range(1, dimensions):
+        degree, coefficients, initial = SOBOL_DIRECTIONS[dimension - 1]
+        m = list(initial)
+        for bit in range(degree, SOBOL_BITS):
+            value = m[bit - degree] ^ (m[bit - degree] << degree)
+            for k in range(1, degree):
+                if (coefficients >> (degree - 1 - k)) & 1:
+                    value ^= m[bit - k] << k
+            m.append(value)
+        directions[dimension] = [m[bit] << (SOBOL_BITS - 1 - bit) for bit in range(SOBOL_BITS)]
+    return directions
+
+
+def sobolDesign(nbPoints, dimensions, randomState):
+    """ The first nbPoints points of the Sobol sequence, with a random digital shift; balanced if nbPoints is a power of 2 """
+    directions = sobolDirections(dimensions)
+    indices = np.arange(nbPoints, dtype=np.int64)
+    points = np.zeros((nbPoints, dimensions), dtype=np.int64)
+    for bit in range(SOBOL_BITS):
+        # Each index is the XOR of the directions of its set bits
+        points ^= ((indices >> bit) & 1)[:, np.newaxis] * directions[:, bit]
+    shift = randomState.randint(0, 1 << SOBOL_BITS, size=dimensions).astype(np.int64)
+    return (points ^ shift) / float(1 << SOBOL_BITS)
+
+
+def haltonDesign(nbPoints, dimensions, randomState):
+    """ The first nbPoints points of the Halton sequence (the radical inverses of the indices in prime bases), with a random
+        shift modulo 1
+    """
+    if dimensions > len(HALTON_PRIMES):
+        raise Exception("Halton designs are limited to " + str(len(HALTON_PRIMES)) + " dimensions")
+
+    points = np.zeros((nbPoints, dimensions))
+    for dimension in range(dimensions):
+        base = HALTON_PRIMES[dimension]
+        # Start at 1, since 0 is the origin in every base
+        indices = np.arange(1, nbPoints + 1)
+        factor = 1.0 / base
+        while np.any(indices > 0):
+            points[:, dimension] += factor * (indices % base)
+            indices //= base
+            factor /= base
+    return (points + randomState.random_sample(dimensions)) % 1.0
+
+
+DESIGNS = {
+    UNIFORM: uniformDesign,
+    LATIN_HYPERCUBE: latinHypercubeDesign,
+    SOBOL: sobolDesign,
+    HALTON: haltonDesign,
+}
+
+
+def unitDesign(method, nbPoints, dimensions, seed=None):
+    """ Return nbPoints points of the unit hypercube of dimensions (as a nbPoints x dimensions array) following method
+        The same seed always gives the same design
+    """
+    if method not in DESIGNS:
+        raise Exception("Unknown design " + str(method))
+
+    return DESIGNS[method](nbPoints, dimensions, np.random.RandomState(seed))
+
+
+def designPathValues(nbTopos, pathsPerTopo=2, bandwidth=(0.1, 100), rtt=(0, 50), queuingDelay=(0.0, 0.1), loss=(0.0, 2.5),
+                     method=UNIFORM, seed=None):
+    """ Return a dict mapping each of PATH_PARAMETERS to a nbTopos x pathsPerTopo array of its values, scaled from a unit
+        design in the (low, high) range of the parameter
+    """
+    ranges = {"bandwidth": bandwidth, "rtt": rtt, "queuingDelay": queuingDelay, "loss": loss}
+    points = unitDesign(method, nbTopos, len(PATH_PARAMETERS) * pathsPerTopo, seed=seed)
+    points = points.reshape((nbTopos, pathsPerTopo, len(PATH_PARAMETERS)))
+    values = {}
+    for index, parameter in enumerate(PATH_PARAMETERS):
+        low, high = ranges[parameter]
+        values[parameter] = low + points[:, :, index] * (high - low)
+    return values
+
+
+def toposFromPathValues(values, withReversed=True):
+    """ Return the topos of the values of designPathValues(), formatted as the campaign scripts always did; if withReversed,
+        each topology is followed by its twin with the paths in reverse order
+    """
+    if withReversed:
+        # Interleave each row with its mirror
+        values = dict((parameter, np.stack([array, array[:, ::-1]], axis=1).reshape((-1, array.shape[1])))
+                      for parameter, array in values.items())
+
+    # The delay is half the RTT, rounded to the ms
+    delays = np.round(values["rtt"]) / 2.0
+    topos = []
+    for nbTopo in range(values["rtt"].shape[0]):
+        topo = {PATHS: [], NETEM: []}
+        for nbPath in range(values["rtt"].shape[1]):
+            topo[PATHS].append({BANDWIDTH: "{0:.2f}".format(values["bandwidth"][nbTopo, nbPath]),
+                                DELAY: "{0:.1f}".format(delays[nbTopo, nbPath]),
+                                QUEUING_DELAY: "{0:.3f}".format(values["queuingDelay"][nbTopo, nbPath])})
+            topo[NETEM].append((nbPath, 0, "loss " + "{0:.2f}".format(values["loss"][nbTopo, nbPath]) + "%"))
+        topos.append(topo)
+    return topos
+
+
+def designTopos(nbTopos, pathsPerTopo=2, bandwidth=(0.1, 100), rtt=(0, 50), queuingDelay=(0.0, 0.1), loss=(0.0, 2.5),
+                method=UNIFORM, seed=None, withReversed=True):
+    """ Return nbTopos topologies (2 * nbTopos withReversed) covering the parameter ranges following the design method
+
+        Space-filling designs (LATIN_HYPERCUBE, SOBOL, HALTON) cover the ranges more evenly than UNIFORM draws, so fewer
+        topologies are needed for the same coverage.
+    """
+    values = designPathValues(nbTopos, pathsPerTopo=pathsPerTopo, bandwidth=bandwidth, rtt=rtt, queuingDelay=queuingDelay,
+                              loss=loss, method=method, seed=seed)
+    return toposFromPathValues(values, withReversed=withReversed)
@@ -0,0 +1,96 @@
+from __future__ import print_function
+
+from abc import ABCMeta, abstractmethod
+
+
+class Transport(object):
+    """ How the launcher runs commands on the hosts and moves files from and to them
+
+        A transport gives the commands (as lists, for subprocess) doing so for host num: SshConnectionPool goes through
+        pooled SSH connections, LocalTransport runs everything on this machine. Transports without connections to
+        maintain keep the defaults of isAlive(), masterCheckCmd(), openMasterCmd() and of the bookkeeping of the
+        connections (masterCheckDue() and the methods after it); all must implement shellCmd(), putCmd() and getCmd().
+    """
+    __metaclass__ = ABCMeta
+
+    def __init__(self, remoteHostnames, remotePorts):
+        if not len(remoteHostnames) == len(remotePorts):
+            raise Exception("remoteHostnames and remotePorts with different lengths")
+
+        self.remoteHostnames = remoteHostnames
+        self.remotePorts = remotePorts
+        self.operations = [0] * len(remoteHostnames)
+        # Number of times the connection to each host was (re)opened
+        self.handshakes = [0] * len(remoteHostnames)
+        self.managedMasters = False
+
+    def isAlive(self, num):
+        return True
+
+    def masterCheckCmd(self, num):
+        """ Return the command succeeding if the connection to host num is open """
+        return ["true"]
+
+    def openMasterCmd(self, num):
+        return ["true"]
+
+    def masterCheckDue(self, num):
+        """ Return True if the connection to host num must be checked before its next operation """
+        return False
+
+    def masterChecked(self, num):
+        """ Record that the connection to host num was found open """
+
+    def masterOpened(self, num):
+        """ Record that the connection to host num was (re)opened """
+        self.handshakes[num] += 1
+
+    def masterLost(self, num):
+        """ An operation on host num failed, e.g., it rebooted: check its connection before the next one """
+
+    def manageMasters(self):
+        """ The caller opens the connections itself, with masterCheckCmd() and openMasterCmd() (e.g., without blocking an
+            event loop), so the commands do not check them anymore
+        """
+        self.managedMasters = True
+
+    @abstractmethod
+    def shellCmd(self, num, remoteCmd):
+        """ Return the command running the shell command remoteCmd on host num """
+
+    @abstractmethod
+    def putCmd(self, num, filename, path):
+        """ Return the command copying the local filename in the directory path of host num """
+
+    @abstractmethod
+    def getCmd(self, num, remoteFilename, newFilename):
+        """ Return the command copying remoteFilename of host num to the local newFilename """
+
+    def report(self):
+        return []
+
+    def closeAll(self):
+        pass
+
+
+class LocalTransport(Transport):
+    """ Run the commands of every host on this machine, without SSH nor scp
+
+        For single-box deployments where the launcher runs on the emulation host itself, or to exercise the launcher
+        against a stand-in mpPerf.py. The hostnames and ports are only used to name the hosts.
+    """
+    def shellCmd(self, num, remoteCmd):
+        self.operations[num] += 1
+        return ["sh", "-c", remoteCmd]
+
+    def putCmd(self, num, filename, path):
+        self.operations[num] += 1
+        return ["cp", filename, path]
+
+    def getCmd(self, num, remoteFilename, newFilename):
+        self.operations[num] += 1
+        return ["cp", remoteFilename, newFilename]
+
+    def report(self):
+        return [self.remoteHostnames[num] + ":" + self.remotePorts[num] + " " + str(self.operations[num]) + " local operations"
+                for num in range(len(self.remoteHostnames))]
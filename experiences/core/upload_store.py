@@ -0,0 +1,166 @@
+from __future__ import print_function
+
+import hashlib
+import os
+import posixpath
+import subprocess
+import threading
+
+""" Directory of the store on the hosts, expanded by their shell: in the home directory, so that it outlives the tmpfs and
+    does not depend on the directory the transport runs the commands in
+"""
+UPLOAD_STORE_DIR = "$HOME/.minitopo_store"
+""" Files of the store unused for more days than this are removed when it is listed """
+MAX_STORE_AGE = 30
+""" Bytes of the store above which the least recently used files are removed """
+MAX_STORE_SIZE = 64 * 1024 * 1024
+
+
+def fileHash(filename):
+    hashFile = open(filename, "rb")
+    digest = hashlib.sha1(hashFile.read()).hexdigest()
+    hashFile.close()
+    return digest
+
+
+class UploadStore(object):
+    """ Content-addressed store of the uploaded topo and xp files on each host, so that a file is only sent once
+
+        A file is put in the store under its SHA-1, then copied from there to the tmpfs directory of each job needing it:
+        the same topology used by every xp variant and every repetition only costs a remote copy. The files already in
+        the store of a host are listed at its first upload, so that a new campaign reuses the ones of the previous ones.
+        If several entries of the pool are slots of the same machine (hosts gives the machine of each entry), they share
+        its store. If the store of a host disappears (e.g., someone removed it), the caller falls back on plain uploads
+        and the store is listed again at the next upload.
+        Each job touches the files it uses: the listing removes the ones unused for more than maxAge days, then the least
+        recently used ones beyond maxSize bytes (with the next upload to the host).
+    """
+    def __init__(self, transport, hosts=None, storeDir=UPLOAD_STORE_DIR, maxAge=MAX_STORE_AGE, maxSize=MAX_STORE_SIZE):
+        self.transport = transport
+        self.storeDir = storeDir
+        self.maxAge = maxAge
+        self.maxSize = maxSize
+        nbHosts = len(transport.remoteHostnames)
+        self.hosts = list(range(nbHosts)) if hosts is None else hosts
+        self.lock = threading.Lock()
+        # For each machine, the set of hashes known to be in its store, or None if it was not listed yet
+        self.stored = {}
+        # For each listed machine, the absolute path of its store and the files to remove from it
+        self.paths = {}
+        self.evictions = {}
+        self.sent = [0] * nbHosts
+        self.saved = [0] * nbHosts
+
+    def isListed(self, num):
+        with self.lock:
+            return self.stored.get(self.hosts[num]) is not None
+
+    def listCmd(self):
+        """ Return the remote command creating the store if needed, removing its old files, then printing its absolute
+            path and the modification time, size and name of each of its files
+        """
+        return "mkdir -p " + self.storeDir + " && cd " + self.storeDir + " && find . -type f -mtime +" + str(self.maxAge) + \
+               " -delete && pwd && find . -type f -printf '%T@ %s %f\\n'"
+
+    def setListing(self, num, out):
+        """ out is the output of listCmd() on host num """
+        lines = out.decode().splitlines()
+        files = []
+        for line in lines[1:]:
+            modified, size, name = line.split()
+            # The parts of interrupted uploads are removed with the old files
+            if ".part" not in name:
+                files.append((float(modified), int(size), name))
+
+        stored = set()
+        evictions = []
+        storeSize = 0
+        for _, size, name in sorted(files, reverse=True):
+            storeSize += size
+            if storeSize > self.maxSize:
+                evictions.append(name)
+            else:
+                stored.add(name)
+
+        with self.lock:
+            self.paths[self.hosts[num]] = lines[0]
+            self.evictions[self.hosts[num]] = evictions
+            self.stored[self.hosts[num]] = stored
+
+    def forget(self, num):
+        with self.lock:
+            self.stored[self.hosts[num]] = None
+
+    def prepare(self, num, filenames, path):
+        """ Return (puts, remoteCmd, hashes) to make the files available in the remote directory path of host num (created
+            if needed): first put each (filename, remotePath) of puts, then run remoteCmd; give its result to commit()
+            The host must have been listed (see isListed())
+        """
+        hashes = [fileHash(filename) for filename in filenames]
+        with self.lock:
+            # Another slot of the machine may have forgotten the store in the meantime
+            stored = self.stored.get(self.hosts[num]) or set()
+            missing = set([digest for digest in hashes if digest not in stored])
+            storePath = self.paths[self.hosts[num]]
+            evictions = self.evictions.get(self.hosts[num], [])
+            self.evictions[self.hosts[num]] = []
+
+        puts = []
+        moves = []
+        for filename, digest in zip(filenames, hashes):
+            if digest in missing:
+                missing.remove(digest)
+                # Under a name of its own, so that two slots of the machine uploading the same file cannot mix them
+                partPath = posixpath.join(storePath, digest + ".part" + str(num))
+                puts.append((filename, partPath))
+                moves.append("mv -f " + partPath + " " + posixpath.join(storePath, digest))
+
+        storedPaths = [posixpath.join(storePath, digest) for digest in hashes]
+        copies = ["cp " + storedPath + " " + posixpath.join(path, os.path.basename(filename))
+                  for filename, storedPath in zip(filenames, storedPaths)]
+        steps = ["mkdir -p " + path] + moves + copies + ["touch " + " ".join(storedPaths)]
+        if evictions:
+            steps.insert(0, "rm -f " + " ".join([posixpath.join(storePath, name) for name in evictions]))
+        return puts, " && ".join(steps), hashes
+
+    def commit(self, num, puts, hashes, returnCode):
+        """ Record the result of the remoteCmd returned by prepare(); return False if the files are not available, the
+            caller must then upload them without the store
+        """
+        if returnCode != 0:
+            self.forget(num)
+            return False
+
+        with self.lock:
+            stored = self.stored.get(self.hosts[num])
+            if stored is not None:
+                stored.update(hashes)
+        self.sent[num] += len(puts)
+        self.saved[num] += len(hashes) - len(puts)
+        return True
+
+    def upload(self, num, filenames, path):
+        """ Make the files available in the remote directory path of host num with as few transfers as possible
+            Return False if the store could not be used
+        """
+        if not self.isListed(num):
+            process = subprocess.Popen(self.transport.shellCmd(num, self.listCmd()), stdout=subprocess.PIPE)
+            out = process.communicate()[0]
+            if process.returncode != 0:
+                return False
+            self.setListing(num, out)
+
+        puts, remoteCmd, hashes = self.prepare(num, filenames, path)
+        for filename, remotePath in puts:
+            if subprocess.call(self.transport.putCmd(num, filename, remotePath)) != 0:
+                raise Exception("File " + filename + " could not be put on remote server at path " + remotePath)
+
+        return self.commit(num, puts, hashes, subprocess.call(self.transport.shellCmd(num, remoteCmd)))
+
+    def report(self):
+        """ Return one line per host with the number of files sent and uploads saved by the store """
+        lines = []
+        for num in range(len(self.sent)):
+            lines.append(self.transport.remoteHostnames[num] + ":" + self.transport.remotePorts[num] + " " + str(self.sent[num]) +
+                         " files sent to the upload store (" + str(self.saved[num]) + " uploads saved)")
+        return lines
@@ -7,12 +7,27 @@ from core.generate_topo import *
 from core.generate_xp import *
 
 import core.core as core
-import numpy as np
+import core.topo_design as topo_design
 import os
 
 REMOTE_SERVER_RUNNER_HOSTNAME = ["mininet@localhost"]
 REMOTE_SERVER_RUNNER_PORT = ["8022"]
 
+# Remove this file to run the campaign again instead of resuming it; the jobs already run with the same
+# specification, kernel and Minitopo are still linked from RESULT_CACHE_PATH unless it is removed too
+JOURNAL_PATH = os.path.splitext(os.path.basename(__file__))[0] + ".journal"
+# Shared by all the campaign scripts, so that identical experiences (same specification, kernel and Minitopo of the
+# hosts) are only run once
+RESULT_CACHE_PATH = "results.cache"
+# Parsed results of all the campaigns, for the analyses (see core.ResultStore)
+RESULT_STORE_PATH = "results.store"
+# Runtimes of the experiences, from which the timeout of each job is predicted
+RUNTIMES_PATH = "runtimes.model"
+# Topologies of the campaign, stored once for all the scripts sharing them (see core.TopoDesignFile)
+DESIGN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "designs", "highbdp")
+# Completion times of each configuration, to stop repeating it once it converged (see core.AdaptiveReplication)
+REPLICATION_PATH = os.path.splitext(os.path.basename(__file__))[0] + ".replication"
+
 
 def getPostProcessingList(**kwargs):
     toReturn = []
@@ -40,79 +55,76 @@ def getPostProcessingList(**kwargs):
     return toReturn
 
 
-def quicTests(topos, protocol="mptcp", tmpfs="/mnt/tmpfs"):
-    experienceLauncher = core.ExperienceLauncher(REMOTE_SERVER_RUNNER_HOSTNAME, REMOTE_SERVER_RUNNER_PORT)
-
-    def testsXp(**kwargs):
-        def testsMultipath(**kwargs):
-            def test(**kwargs):
-                xpDict = {
-                    XP_TYPE: kwargs["xp"],
-                    SCHEDULER_CLIENT: "default",
-                    SCHEDULER_SERVER: "default",
-                    CC: "olia" if kwargs["multipath"] == 1 else "cubic",
-                    CLIENT_PCAP: "yes",
-                    SERVER_PCAP: "yes",
-                    HTTPS_FILE: "random",
-                    HTTPS_RANDOM_SIZE: "20000",
-                    QUIC_MULTIPATH: kwargs["multipath"],
-                    RMEM: (10240, 87380, 16777216),
-                }
-                if int(kwargs["multipath"]) == 0:
-                    kwargs["protocol"] = "tcp"
-
-                kwargs["postProcessing"] = getPostProcessingList(**kwargs)
-                core.experiment(experienceLauncher, xpDict, **kwargs)
-
-            core.experimentFor("multipath", [0, 1], test, **kwargs)
-            # core.experimentFor("multipath", [1], test, **kwargs)
-
-        # core.experimentFor("xp", [HTTPS, QUIC], testsMultipath, **kwargs)
-        core.experimentFor("xp", [HTTPS], testsMultipath, **kwargs)
-
-    core.experimentTopos(topos, "https_quic", protocol, tmpfs, testsXp)
+def quicTests(topos, protocol="mptcp", tmpfs="/mnt/tmpfs", journal=None, resultCache=None, timeoutModel=None, resultStore=None,
+              replication=None):
+    experienceLauncher = core.ExperienceLauncher(REMOTE_SERVER_RUNNER_HOSTNAME, REMOTE_SERVER_RUNNER_PORT, journal=journal,
+                                                 resultCache=resultCache, timeoutModel=timeoutModel, resultStore=resultStore,
+                                                 replication=replication)
+
+    def test(**kwargs):
+        xpDict = {
+            XP_TYPE: kwargs["xp"],
+            SCHEDULER_CLIENT: "default",
+            SCHEDULER_SERVER: "default",
+            CC: "olia" if kwargs["multipath"] == 1 else "cubic",
+            CLIENT_PCAP: "yes",
+            SERVER_PCAP: "yes",
+            HTTPS_FILE: "random",
+            HTTPS_RANDOM_SIZE: "20000",
+            QUIC_MULTIPATH: kwargs["multipath"],
+            RMEM: (10240, 87380, 16777216),
+        }
+        if int(kwargs["multipath"]) == 0:
+            kwargs["protocol"] = "tcp"
+
+        kwargs["postProcessing"] = getPostProcessingList(**kwargs)
+        core.experiment(experienceLauncher, xpDict, **kwargs)
+
+    # sweep = core.Sweep(("xp", [HTTPS, QUIC]), ("multipath", [0, 1]))
+    sweep = core.Sweep(("xp", [HTTPS]), ("multipath", [0, 1]))
+    if replication is not None:
+        sweep.skipIf(replication.converged)
+    core.experimentTopos(topos, "https_quic", protocol, tmpfs, sweep.expand(test))
     experienceLauncher.finish()
 
 
-def generateExperimentalDesignRandomTopos(nbMptcpTopos=10, pathsPerTopo=2, bandwidth=(0.1, 100), rtt=(0, 50), queuingDelay=(0.0, 0.1), loss=(0.0, 2.5)):
-    """ Assume only two paths per MPTCP topology, uniform distribution """
-    mptcpTopos = []
-    for nbTopo in range(nbMptcpTopos):
-        mptcpTopo = {PATHS: [], NETEM: []}
-        for nbPath in range(pathsPerTopo):
-            bandwidthPath = "{0:.2f}".format(np.random.uniform(low=bandwidth[0], high=bandwidth[1]))
-            rttPath = "{0:.0f}".format(np.random.uniform(low=rtt[0], high=rtt[1]))
-            delayPath = "{0:.1f}".format(float(rttPath) / 2.0)
-            lossPath = "{0:.2f}".format(np.random.uniform(low=loss[0], high=loss[1]))
-            queuingDelayPath = "{0:.3f}".format(np.random.uniform(low=queuingDelay[0], high=queuingDelay[1]))
-            # tcpTopos.append({PATHS: [{BANDWIDTH: bandwidthPath, DELAY: delayPath}], NETEM: [(0, 0, "loss " + str(lossPath) + "%")]})
-            mptcpTopo[PATHS].append({BANDWIDTH: bandwidthPath, DELAY: delayPath, QUEUING_DELAY: queuingDelayPath})
-            mptcpTopo[NETEM].append((nbPath, 0, "loss " + str(lossPath) + "%"))
-
-        mptcpTopos.append(mptcpTopo)
-        reversedMptcpTopoPaths = mptcpTopo[PATHS][::-1]
-        reversedMptcpTopoNetem = []
-        nbPath = 0
-        for netem in mptcpTopo[NETEM][::-1]:
-            reversedMptcpTopoNetem.append((nbPath, netem[1], netem[2]))
-            nbPath += 1
-
-        reversedMptcpTopo = {PATHS: reversedMptcpTopoPaths, NETEM: reversedMptcpTopoNetem}
-        mptcpTopos.append(reversedMptcpTopo)
-
-    return mptcpTopos
-
-
-def launchTests(times=5):
+def generateExperimentalDesignRandomTopos(nbMptcpTopos=10, pathsPerTopo=2, bandwidth=(0.1, 100), rtt=(0, 50), queuingDelay=(0.0, 0.1), loss=(0.0, 2.5),
+                                           method=topo_design.UNIFORM, seed=None):
+    """ Assume only two paths per MPTCP topology, uniform distribution unless another design method is given (see
+        core.topo_design); each topology is followed by its twin with the paths reversed
+    """
+    return topo_design.designTopos(nbMptcpTopos, pathsPerTopo=pathsPerTopo, bandwidth=bandwidth, rtt=rtt,
+                                   queuingDelay=queuingDelay, loss=loss, method=method, seed=seed)
+
+
+def launchTests(times=5, adaptiveReplication=False):
     """ Notice that the loss must occur at time + 2 sec since the minitopo test waits for 2 seconds between launching the server and the client """
     # mptcpTopos = generateExperimentalDesignRandomTopos(nbMptcpTopos=200)
     # logging = open("topos_lowbdp_with_loss.log", 'w')
     # print(mptcpTopos, file=logging)
     # logging.close()
-    mptcpTopos = [{'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.954', 'delay': '84.1', 'bandwidth': '51.83'}, {'queuingDelay': '1.269', 'delay': '106.1', 'bandwidth': '45.38'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.269', 'delay': '106.1', 'bandwidth': '45.38'}, {'queuingDelay': '0.954', 'delay': '84.1', 'bandwidth': '51.83'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.577', 'delay': '165.0', 'bandwidth': '49.44'}, {'queuingDelay': '1.239', 'delay': '176.4', 'bandwidth': '34.80'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.239', 'delay': '176.4', 'bandwidth': '34.80'}, {'queuingDelay': '0.577', 'delay': '165.0', 'bandwidth': '49.44'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.945', 'delay': '185.5', 'bandwidth': '49.72'}, {'queuingDelay': '0.682', 'delay': '108.9', 'bandwidth': '0.14'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.682', 'delay': '108.9', 'bandwidth': '0.14'}, {'queuingDelay': '0.945', 'delay': '185.5', 'bandwidth': '49.72'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.223', 'delay': '139.5', 'bandwidth': '84.79'}, {'queuingDelay': '0.554', 'delay': '51.9', 'bandwidth': '5.93'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.554', 'delay': '51.9', 'bandwidth': '5.93'}, {'queuingDelay': '1.223', 'delay': '139.5', 'bandwidth': '84.79'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.115', 'delay': '155.1', 'bandwidth': '89.55'}, {'queuingDelay': '1.538', 'delay': '24.8', 'bandwidth': '40.86'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.538', 'delay': '24.8', 'bandwidth': '40.86'}, {'queuingDelay': '1.115', 'delay': '155.1', 'bandwidth': '89.55'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.488', 'delay': '92.9', 'bandwidth': '89.13'}, {'queuingDelay': '1.974', 'delay': '34.6', 'bandwidth': '8.97'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.974', 'delay': '34.6', 'bandwidth': '8.97'}, {'queuingDelay': '0.488', 'delay': '92.9', 'bandwidth': '89.13'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.131', 'delay': '85.8', 'bandwidth': '84.62'}, {'queuingDelay': '1.480', 'delay': '60.7', 'bandwidth': '32.00'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.480', 'delay': '60.7', 'bandwidth': '32.00'}, {'queuingDelay': '0.131', 'delay': '85.8', 'bandwidth': '84.62'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.502', 'delay': '33.6', 'bandwidth': '93.83'}, {'queuingDelay': '1.818', 'delay': '68.1', 'bandwidth': '64.68'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.818', 'delay': '68.1', 'bandwidth': '64.68'}, {'queuingDelay': '0.502', 'delay': '33.6', 'bandwidth': '93.83'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.280', 'delay': '97.0', 'bandwidth': '56.25'}, {'queuingDelay': '1.710', 'delay': '21.8', 'bandwidth': '74.61'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.710', 'delay': '21.8', 'bandwidth': '74.61'}, {'queuingDelay': '0.280', 'delay': '97.0', 'bandwidth': '56.25'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.494', 'delay': '122.0', 'bandwidth': '65.62'}, {'queuingDelay': '0.696', 'delay': '0.1', 'bandwidth': '48.51'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.696', 'delay': '0.1', 'bandwidth': '48.51'}, {'queuingDelay': '0.494', 'delay': '122.0', 'bandwidth': '65.62'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.478', 'delay': '134.8', 'bandwidth': '73.50'}, {'queuingDelay': '0.398', 'delay': '19.6', 'bandwidth': '53.33'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.398', 'delay': '19.6', 'bandwidth': '53.33'}, {'queuingDelay': '1.478', 'delay': '134.8', 'bandwidth': '73.50'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.511', 'delay': '130.6', 'bandwidth': '69.58'}, {'queuingDelay': '0.135', 'delay': '138.9', 'bandwidth': '73.61'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.135', 'delay': '138.9', 'bandwidth': '73.61'}, {'queuingDelay': '1.511', 'delay': '130.6', 'bandwidth': '69.58'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.531', 'delay': '72.0', 'bandwidth': '73.90'}, {'queuingDelay': '0.102', 'delay': '123.4', 'bandwidth': '83.14'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.102', 'delay': '123.4', 'bandwidth': '83.14'}, {'queuingDelay': '0.531', 'delay': '72.0', 'bandwidth': '73.90'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.921', 'delay': '35.8', 'bandwidth': '83.42'}, {'queuingDelay': '0.758', 'delay': '190.3', 'bandwidth': '64.52'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.758', 'delay': '190.3', 'bandwidth': '64.52'}, {'queuingDelay': '0.921', 'delay': '35.8', 'bandwidth': '83.42'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.091', 'delay': '64.3', 'bandwidth': '97.55'}, {'queuingDelay': '1.676', 'delay': '141.9', 'bandwidth': '33.23'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.676', 'delay': '141.9', 'bandwidth': '33.23'}, {'queuingDelay': '1.091', 'delay': '64.3', 'bandwidth': '97.55'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.293', 'delay': '4.2', 'bandwidth': '53.39'}, {'queuingDelay': '1.455', 'delay': '129.5', 'bandwidth': '28.30'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.455', 'delay': '129.5', 'bandwidth': '28.30'}, {'queuingDelay': '1.293', 'delay': '4.2', 'bandwidth': '53.39'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.369', 'delay': '23.2', 'bandwidth': '15.46'}, {'queuingDelay': '1.476', 'delay': '48.2', 'bandwidth': '31.74'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.476', 'delay': '48.2', 'bandwidth': '31.74'}, {'queuingDelay': '1.369', 'delay': '23.2', 'bandwidth': '15.46'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.955', 'delay': '29.9', 'bandwidth': '31.10'}, {'queuingDelay': '1.131', 'delay': '12.7', 'bandwidth': '74.41'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.131', 'delay': '12.7', 'bandwidth': '74.41'}, {'queuingDelay': '1.955', 'delay': '29.9', 'bandwidth': '31.10'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.912', 'delay': '47.6', 'bandwidth': '82.30'}, {'queuingDelay': '1.145', 'delay': '26.2', 'bandwidth': '60.23'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.145', 'delay': '26.2', 'bandwidth': '60.23'}, {'queuingDelay': '1.912', 'delay': '47.6', 'bandwidth': '82.30'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.875', 'delay': '24.6', 'bandwidth': '63.20'}, {'queuingDelay': '1.980', 'delay': '34.8', 'bandwidth': '29.43'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.980', 'delay': '34.8', 'bandwidth': '29.43'}, {'queuingDelay': '1.875', 'delay': '24.6', 'bandwidth': '63.20'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.513', 'delay': '4.9', 'bandwidth': '24.83'}, {'queuingDelay': '1.821', 'delay': '50.5', 'bandwidth': '67.70'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.821', 'delay': '50.5', 'bandwidth': '67.70'}, {'queuingDelay': '1.513', 'delay': '4.9', 'bandwidth': '24.83'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.850', 'delay': '43.7', 'bandwidth': '11.49'}, {'queuingDelay': '1.328', 'delay': '118.4', 'bandwidth': '38.20'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.328', 'delay': '118.4', 'bandwidth': '38.20'}, {'queuingDelay': '1.850', 'delay': '43.7', 'bandwidth': '11.49'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.925', 'delay': '101.6', 'bandwidth': '17.79'}, {'queuingDelay': '1.993', 'delay': '42.4', 'bandwidth': '15.10'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.993', 'delay': '42.4', 'bandwidth': '15.10'}, {'queuingDelay': '1.925', 'delay': '101.6', 'bandwidth': '17.79'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.277', 'delay': '131.8', 'bandwidth': '50.51'}, {'queuingDelay': '1.405', 'delay': '85.6', 'bandwidth': '32.70'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.405', 'delay': '85.6', 'bandwidth': '32.70'}, {'queuingDelay': '1.277', 'delay': '131.8', 'bandwidth': '50.51'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.977', 'delay': '78.0', 'bandwidth': '26.29'}, {'queuingDelay': '0.449', 'delay': '62.1', 'bandwidth': '16.35'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.449', 'delay': '62.1', 'bandwidth': '16.35'}, {'queuingDelay': '0.977', 'delay': '78.0', 'bandwidth': '26.29'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.198', 'delay': '88.6', 'bandwidth': '12.28'}, {'queuingDelay': '0.094', 'delay': '41.2', 'bandwidth': '29.29'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.094', 'delay': '41.2', 'bandwidth': '29.29'}, {'queuingDelay': '0.198', 'delay': '88.6', 'bandwidth': '12.28'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.047', 'delay': '184.2', 'bandwidth': '33.61'}, {'queuingDelay': '0.481', 'delay': '50.5', 'bandwidth': '36.49'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.481', 'delay': '50.5', 'bandwidth': '36.49'}, {'queuingDelay': '0.047', 'delay': '184.2', 'bandwidth': '33.61'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.374', 'delay': '192.3', 'bandwidth': '73.12'}, {'queuingDelay': '0.874', 'delay': '65.3', 'bandwidth': '74.20'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.874', 'delay': '65.3', 'bandwidth': '74.20'}, {'queuingDelay': '0.374', 'delay': '192.3', 'bandwidth': '73.12'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.284', 'delay': '162.5', 'bandwidth': '90.57'}, {'queuingDelay': '0.182', 'delay': '142.8', 'bandwidth': '48.20'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.182', 'delay': '142.8', 'bandwidth': '48.20'}, {'queuingDelay': '0.284', 'delay': '162.5', 'bandwidth': '90.57'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.350', 'delay': '193.0', 'bandwidth': '84.09'}, {'queuingDelay': '1.081', 'delay': '138.4', 'bandwidth': '52.96'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.081', 'delay': '138.4', 'bandwidth': '52.96'}, {'queuingDelay': '0.350', 'delay': '193.0', 'bandwidth': '84.09'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.228', 'delay': '132.4', 'bandwidth': '84.71'}, {'queuingDelay': '1.141', 'delay': '126.0', 'bandwidth': '5.90'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.141', 'delay': '126.0', 'bandwidth': '5.90'}, {'queuingDelay': '0.228', 'delay': '132.4', 'bandwidth': '84.71'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.512', 'delay': '163.8', 'bandwidth': '61.57'}, {'queuingDelay': '1.807', 'delay': '112.8', 'bandwidth': '16.32'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.807', 'delay': '112.8', 'bandwidth': '16.32'}, {'queuingDelay': '0.512', 'delay': '163.8', 'bandwidth': '61.57'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.379', 'delay': '192.4', 'bandwidth': '64.40'}, {'queuingDelay': '1.185', 'delay': '102.4', 'bandwidth': '23.40'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.185', 'delay': '102.4', 'bandwidth': '23.40'}, {'queuingDelay': '1.379', 'delay': '192.4', 'bandwidth': '64.40'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.996', 'delay': '151.9', 'bandwidth': '43.22'}, {'queuingDelay': '0.766', 'delay': '133.0', 'bandwidth': '39.63'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.766', 'delay': '133.0', 'bandwidth': '39.63'}, {'queuingDelay': '1.996', 'delay': '151.9', 'bandwidth': '43.22'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.984', 'delay': '150.4', 'bandwidth': '5.68'}, {'queuingDelay': '0.646', 'delay': '170.0', 'bandwidth': '80.48'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.646', 'delay': '170.0', 'bandwidth': '80.48'}, {'queuingDelay': '1.984', 'delay': '150.4', 'bandwidth': '5.68'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.800', 'delay': '153.0', 'bandwidth': '12.88'}, {'queuingDelay': '1.465', 'delay': '195.5', 'bandwidth': '70.95'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.465', 'delay': '195.5', 'bandwidth': '70.95'}, {'queuingDelay': '1.800', 'delay': '153.0', 'bandwidth': '12.88'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.702', 'delay': '52.1', 'bandwidth': '16.08'}, {'queuingDelay': '1.208', 'delay': '147.0', 'bandwidth': '50.44'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.208', 'delay': '147.0', 'bandwidth': '50.44'}, {'queuingDelay': '1.702', 'delay': '52.1', 'bandwidth': '16.08'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.133', 'delay': '78.6', 'bandwidth': '6.51'}, {'queuingDelay': '1.909', 'delay': '140.2', 'bandwidth': '22.26'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.909', 'delay': '140.2', 'bandwidth': '22.26'}, {'queuingDelay': '1.133', 'delay': '78.6', 'bandwidth': '6.51'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.790', 'delay': '71.1', 'bandwidth': '37.50'}, {'queuingDelay': '1.673', 'delay': '52.2', 'bandwidth': '16.16'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.673', 'delay': '52.2', 'bandwidth': '16.16'}, {'queuingDelay': '1.790', 'delay': '71.1', 'bandwidth': '37.50'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.152', 'delay': '52.6', 'bandwidth': '47.35'}, {'queuingDelay': '1.836', 'delay': '45.2', 'bandwidth': '8.28'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.836', 'delay': '45.2', 'bandwidth': '8.28'}, {'queuingDelay': '1.152', 'delay': '52.6', 'bandwidth': '47.35'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.486', 'delay': '106.0', 'bandwidth': '25.02'}, {'queuingDelay': '0.949', 'delay': '6.6', 'bandwidth': '16.70'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.949', 'delay': '6.6', 'bandwidth': '16.70'}, {'queuingDelay': '1.486', 'delay': '106.0', 'bandwidth': '25.02'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.266', 'delay': '5.6', 'bandwidth': '13.10'}, {'queuingDelay': '0.526', 'delay': '25.8', 'bandwidth': '25.02'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.526', 'delay': '25.8', 'bandwidth': '25.02'}, {'queuingDelay': '1.266', 'delay': '5.6', 'bandwidth': '13.10'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.359', 'delay': '49.0', 'bandwidth': '10.07'}, {'queuingDelay': '0.701', 'delay': '99.7', 'bandwidth': '24.40'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.701', 'delay': '99.7', 'bandwidth': '24.40'}, {'queuingDelay': '0.359', 'delay': '49.0', 'bandwidth': '10.07'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.471', 'delay': '1.7', 'bandwidth': '15.50'}, {'queuingDelay': '1.051', 'delay': '173.2', 'bandwidth': '60.60'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.051', 'delay': '173.2', 'bandwidth': '60.60'}, {'queuingDelay': '0.471', 'delay': '1.7', 'bandwidth': '15.50'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.493', 'delay': '44.3', 'bandwidth': '34.51'}, {'queuingDelay': '0.590', 'delay': '180.2', 'bandwidth': '74.38'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.590', 'delay': '180.2', 'bandwidth': '74.38'}, {'queuingDelay': '1.493', 'delay': '44.3', 'bandwidth': '34.51'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.764', 'delay': '17.3', 'bandwidth': '3.53'}, {'queuingDelay': '0.603', 'delay': '189.5', 'bandwidth': '21.47'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.603', 'delay': '189.5', 'bandwidth': '21.47'}, {'queuingDelay': '1.764', 'delay': '17.3', 'bandwidth': '3.53'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.779', 'delay': '81.7', 'bandwidth': '12.65'}, {'queuingDelay': '0.162', 'delay': '103.9', 'bandwidth': '1.05'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.162', 'delay': '103.9', 'bandwidth': '1.05'}, {'queuingDelay': '1.779', 'delay': '81.7', 'bandwidth': '12.65'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.780', 'delay': '126.1', 'bandwidth': '59.26'}, {'queuingDelay': '0.241', 'delay': '156.0', 'bandwidth': '18.49'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.241', 'delay': '156.0', 'bandwidth': '18.49'}, {'queuingDelay': '1.780', 'delay': '126.1', 'bandwidth': '59.26'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.337', 'delay': '15.1', 'bandwidth': '49.33'}, {'queuingDelay': '0.166', 'delay': '142.3', 'bandwidth': '5.47'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.166', 'delay': '142.3', 'bandwidth': '5.47'}, {'queuingDelay': '1.337', 'delay': '15.1', 'bandwidth': '49.33'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.850', 'delay': '45.1', 'bandwidth': '73.96'}, {'queuingDelay': '0.005', 'delay': '174.5', 'bandwidth': '42.62'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.005', 'delay': '174.5', 'bandwidth': '42.62'}, {'queuingDelay': '0.850', 'delay': '45.1', 'bandwidth': '73.96'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.194', 'delay': '7.1', 'bandwidth': '71.93'}, {'queuingDelay': '0.072', 'delay': '149.0', 'bandwidth': '5.35'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.072', 'delay': '149.0', 'bandwidth': '5.35'}, {'queuingDelay': '0.194', 'delay': '7.1', 'bandwidth': '71.93'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.451', 'delay': '44.3', 'bandwidth': '97.06'}, {'queuingDelay': '0.161', 'delay': '179.7', 'bandwidth': '28.74'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.161', 'delay': '179.7', 'bandwidth': '28.74'}, {'queuingDelay': '0.451', 'delay': '44.3', 'bandwidth': '97.06'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.515', 'delay': '34.2', 'bandwidth': '79.58'}, {'queuingDelay': '0.307', 'delay': '198.9', 'bandwidth': '3.54'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.307', 'delay': '198.9', 'bandwidth': '3.54'}, {'queuingDelay': '1.515', 'delay': '34.2', 'bandwidth': '79.58'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.008', 'delay': '103.8', 'bandwidth': '96.76'}, {'queuingDelay': '0.548', 'delay': '154.0', 'bandwidth': '21.45'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.548', 'delay': '154.0', 'bandwidth': '21.45'}, {'queuingDelay': '1.008', 'delay': '103.8', 'bandwidth': '96.76'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.754', 'delay': '46.3', 'bandwidth': '80.71'}, {'queuingDelay': '0.671', 'delay': '96.3', 'bandwidth': '5.10'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.671', 'delay': '96.3', 'bandwidth': '5.10'}, {'queuingDelay': '1.754', 'delay': '46.3', 'bandwidth': '80.71'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.863', 'delay': '95.5', 'bandwidth': '84.84'}, {'queuingDelay': '1.107', 'delay': '58.4', 'bandwidth': '4.62'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.107', 'delay': '58.4', 'bandwidth': '4.62'}, {'queuingDelay': '1.863', 'delay': '95.5', 'bandwidth': '84.84'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.635', 'delay': '18.3', 'bandwidth': '76.51'}, {'queuingDelay': '0.327', 'delay': '67.6', 'bandwidth': '18.83'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.327', 'delay': '67.6', 'bandwidth': '18.83'}, {'queuingDelay': '1.635', 'delay': '18.3', 'bandwidth': '76.51'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.508', 'delay': '3.5', 'bandwidth': '97.20'}, {'queuingDelay': '0.056', 'delay': '45.8', 'bandwidth': '27.80'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.056', 'delay': '45.8', 'bandwidth': '27.80'}, {'queuingDelay': '0.508', 'delay': '3.5', 'bandwidth': '97.20'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.389', 'delay': '45.1', 'bandwidth': '68.25'}, {'queuingDelay': '0.165', 'delay': '18.3', 'bandwidth': '55.98'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.165', 'delay': '18.3', 'bandwidth': '55.98'}, {'queuingDelay': '0.389', 'delay': '45.1', 'bandwidth': '68.25'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.183', 'delay': '63.1', 'bandwidth': '32.69'}, {'queuingDelay': '0.581', 'delay': '17.4', 'bandwidth': '15.29'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.581', 'delay': '17.4', 'bandwidth': '15.29'}, {'queuingDelay': '0.183', 'delay': '63.1', 'bandwidth': '32.69'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.274', 'delay': '82.7', 'bandwidth': '41.36'}, {'queuingDelay': '0.331', 'delay': '53.7', 'bandwidth': '39.94'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.331', 'delay': '53.7', 'bandwidth': '39.94'}, {'queuingDelay': '1.274', 'delay': '82.7', 'bandwidth': '41.36'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.829', 'delay': '75.9', 'bandwidth': '51.82'}, {'queuingDelay': '0.235', 'delay': '25.8', 'bandwidth': '63.85'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.235', 'delay': '25.8', 'bandwidth': '63.85'}, {'queuingDelay': '1.829', 'delay': '75.9', 'bandwidth': '51.82'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.902', 'delay': '44.8', 'bandwidth': '43.99'}, {'queuingDelay': '0.358', 'delay': '29.2', 'bandwidth': '92.00'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.358', 'delay': '29.2', 'bandwidth': '92.00'}, {'queuingDelay': '0.902', 'delay': '44.8', 'bandwidth': '43.99'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.202', 'delay': '76.7', 'bandwidth': '23.87'}, {'queuingDelay': '0.188', 'delay': '22.2', 'bandwidth': '98.88'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.188', 'delay': '22.2', 'bandwidth': '98.88'}, {'queuingDelay': '1.202', 'delay': '76.7', 'bandwidth': '23.87'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.556', 'delay': '89.7', 'bandwidth': '27.19'}, {'queuingDelay': '0.108', 'delay': '130.7', 'bandwidth': '93.86'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.108', 'delay': '130.7', 'bandwidth': '93.86'}, {'queuingDelay': '0.556', 'delay': '89.7', 'bandwidth': '27.19'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.751', 'delay': '68.7', 'bandwidth': '12.33'}, {'queuingDelay': '0.911', 'delay': '179.7', 'bandwidth': '86.04'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.911', 'delay': '179.7', 'bandwidth': '86.04'}, {'queuingDelay': '0.751', 'delay': '68.7', 'bandwidth': '12.33'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.963', 'delay': '156.2', 'bandwidth': '5.66'}, {'queuingDelay': '1.556', 'delay': '144.0', 'bandwidth': '87.70'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.556', 'delay': '144.0', 'bandwidth': '87.70'}, {'queuingDelay': '0.963', 'delay': '156.2', 'bandwidth': '5.66'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.763', 'delay': '167.3', 'bandwidth': '30.16'}, {'queuingDelay': '1.189', 'delay': '70.2', 'bandwidth': '97.12'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.189', 'delay': '70.2', 'bandwidth': '97.12'}, {'queuingDelay': '0.763', 'delay': '167.3', 'bandwidth': '30.16'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.291', 'delay': '191.7', 'bandwidth': '4.69'}, {'queuingDelay': '0.904', 'delay': '125.7', 'bandwidth': '85.06'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.904', 'delay': '125.7', 'bandwidth': '85.06'}, {'queuingDelay': '0.291', 'delay': '191.7', 'bandwidth': '4.69'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.826', 'delay': '168.3', 'bandwidth': '18.34'}, {'queuingDelay': '0.331', 'delay': '49.3', 'bandwidth': '72.69'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.331', 'delay': '49.3', 'bandwidth': '72.69'}, {'queuingDelay': '0.826', 'delay': '168.3', 'bandwidth': '18.34'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.669', 'delay': '194.9', 'bandwidth': '20.14'}, {'queuingDelay': '0.344', 'delay': '164.5', 'bandwidth': '57.34'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.344', 'delay': '164.5', 'bandwidth': '57.34'}, {'queuingDelay': '0.669', 'delay': '194.9', 'bandwidth': '20.14'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.158', 'delay': '166.0', 'bandwidth': '14.93'}, {'queuingDelay': '0.822', 'delay': '127.1', 'bandwidth': '13.46'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.822', 'delay': '127.1', 'bandwidth': '13.46'}, {'queuingDelay': '1.158', 'delay': '166.0', 'bandwidth': '14.93'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.363', 'delay': '132.8', 'bandwidth': '8.41'}, {'queuingDelay': '1.645', 'delay': '157.2', 'bandwidth': '47.79'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.645', 'delay': '157.2', 'bandwidth': '47.79'}, {'queuingDelay': '1.363', 'delay': '132.8', 'bandwidth': '8.41'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.828', 'delay': '133.9', 'bandwidth': '59.59'}, {'queuingDelay': '1.980', 'delay': '111.5', 'bandwidth': '57.76'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.980', 'delay': '111.5', 'bandwidth': '57.76'}, {'queuingDelay': '1.828', 'delay': '133.9', 'bandwidth': '59.59'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.631', 'delay': '151.0', 'bandwidth': '99.78'}, {'queuingDelay': '1.421', 'delay': '72.7', 'bandwidth': '70.86'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.421', 'delay': '72.7', 'bandwidth': '70.86'}, {'queuingDelay': '1.631', 'delay': '151.0', 'bandwidth': '99.78'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.686', 'delay': '96.1', 'bandwidth': '65.72'}, {'queuingDelay': '1.935', 'delay': '5.9', 'bandwidth': '68.58'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.935', 'delay': '5.9', 'bandwidth': '68.58'}, {'queuingDelay': '1.686', 'delay': '96.1', 'bandwidth': '65.72'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.662', 'delay': '67.3', 'bandwidth': '65.00'}, {'queuingDelay': '1.270', 'delay': '91.4', 'bandwidth': '84.89'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.270', 'delay': '91.4', 'bandwidth': '84.89'}, {'queuingDelay': '1.662', 'delay': '67.3', 'bandwidth': '65.00'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.936', 'delay': '99.4', 'bandwidth': '88.66'}, {'queuingDelay': '0.672', 'delay': '105.0', 'bandwidth': '67.67'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.672', 'delay': '105.0', 'bandwidth': '67.67'}, {'queuingDelay': '0.936', 'delay': '99.4', 'bandwidth': '88.66'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.554', 'delay': '135.7', 'bandwidth': '87.10'}, {'queuingDelay': '0.084', 'delay': '127.7', 'bandwidth': '84.81'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.084', 'delay': '127.7', 'bandwidth': '84.81'}, {'queuingDelay': '0.554', 'delay': '135.7', 'bandwidth': '87.10'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.057', 'delay': '130.3', 'bandwidth': '44.06'}, {'queuingDelay': '0.081', 'delay': '69.2', 'bandwidth': '86.69'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.081', 'delay': '69.2', 'bandwidth': '86.69'}, {'queuingDelay': '1.057', 'delay': '130.3', 'bandwidth': '44.06'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.413', 'delay': '34.8', 'bandwidth': '48.72'}, {'queuingDelay': '0.401', 'delay': '83.2', 'bandwidth': '87.11'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.401', 'delay': '83.2', 'bandwidth': '87.11'}, {'queuingDelay': '0.413', 'delay': '34.8', 'bandwidth': '48.72'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.886', 'delay': '30.6', 'bandwidth': '13.65'}, {'queuingDelay': '1.110', 'delay': '85.8', 'bandwidth': '97.37'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.110', 'delay': '85.8', 'bandwidth': '97.37'}, {'queuingDelay': '0.886', 'delay': '30.6', 'bandwidth': '13.65'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.540', 'delay': '52.8', 'bandwidth': '5.17'}, {'queuingDelay': '1.699', 'delay': '122.4', 'bandwidth': '62.44'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.699', 'delay': '122.4', 'bandwidth': '62.44'}, {'queuingDelay': '1.540', 'delay': '52.8', 'bandwidth': '5.17'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.893', 'delay': '58.4', 'bandwidth': '59.19'}, {'queuingDelay': '1.924', 'delay': '120.6', 'bandwidth': '91.86'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.924', 'delay': '120.6', 'bandwidth': '91.86'}, {'queuingDelay': '1.893', 'delay': '58.4', 'bandwidth': '59.19'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.835', 'delay': '51.5', 'bandwidth': '88.62'}, {'queuingDelay': '1.957', 'delay': '148.9', 'bandwidth': '84.05'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.957', 'delay': '148.9', 'bandwidth': '84.05'}, {'queuingDelay': '1.835', 'delay': '51.5', 'bandwidth': '88.62'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.495', 'delay': '107.4', 'bandwidth': '63.63'}, {'queuingDelay': '1.554', 'delay': '197.7', 'bandwidth': '81.17'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.554', 'delay': '197.7', 'bandwidth': '81.17'}, {'queuingDelay': '1.495', 'delay': '107.4', 'bandwidth': '63.63'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.598', 'delay': '160.1', 'bandwidth': '72.05'}, {'queuingDelay': '1.138', 'delay': '187.9', 'bandwidth': '83.99'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.138', 'delay': '187.9', 'bandwidth': '83.99'}, {'queuingDelay': '1.598', 'delay': '160.1', 'bandwidth': '72.05'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.661', 'delay': '160.4', 'bandwidth': '50.93'}, {'queuingDelay': '1.818', 'delay': '180.5', 'bandwidth': '88.13'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.818', 'delay': '180.5', 'bandwidth': '88.13'}, {'queuingDelay': '0.661', 'delay': '160.4', 'bandwidth': '50.93'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.114', 'delay': '118.7', 'bandwidth': '80.95'}, {'queuingDelay': '1.311', 'delay': '178.5', 'bandwidth': '72.36'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.311', 'delay': '178.5', 'bandwidth': '72.36'}, {'queuingDelay': '0.114', 'delay': '118.7', 'bandwidth': '80.95'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.015', 'delay': '34.4', 'bandwidth': '96.77'}, {'queuingDelay': '1.338', 'delay': '179.8', 'bandwidth': '46.01'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.338', 'delay': '179.8', 'bandwidth': '46.01'}, {'queuingDelay': '0.015', 'delay': '34.4', 'bandwidth': '96.77'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.680', 'delay': '30.5', 'bandwidth': '67.98'}, {'queuingDelay': '1.287', 'delay': '174.6', 'bandwidth': '91.60'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.287', 'delay': '174.6', 'bandwidth': '91.60'}, {'queuingDelay': '0.680', 'delay': '30.5', 'bandwidth': '67.98'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.139', 'delay': '124.6', 'bandwidth': '73.91'}, {'queuingDelay': '1.489', 'delay': '99.0', 'bandwidth': '93.66'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.489', 'delay': '99.0', 'bandwidth': '93.66'}, {'queuingDelay': '0.139', 'delay': '124.6', 'bandwidth': '73.91'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.228', 'delay': '178.8', 'bandwidth': '73.22'}, {'queuingDelay': '1.872', 'delay': '18.8', 'bandwidth': '81.44'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.872', 'delay': '18.8', 'bandwidth': '81.44'}, {'queuingDelay': '0.228', 'delay': '178.8', 'bandwidth': '73.22'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.694', 'delay': '185.4', 'bandwidth': '23.51'}, {'queuingDelay': '1.737', 'delay': '62.1', 'bandwidth': '93.04'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.737', 'delay': '62.1', 'bandwidth': '93.04'}, {'queuingDelay': '0.694', 'delay': '185.4', 'bandwidth': '23.51'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.105', 'delay': '189.1', 'bandwidth': '16.82'}, {'queuingDelay': '1.994', 'delay': '23.7', 'bandwidth': '76.86'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.994', 'delay': '23.7', 'bandwidth': '76.86'}, {'queuingDelay': '1.105', 'delay': '189.1', 'bandwidth': '16.82'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.708', 'delay': '174.3', 'bandwidth': '66.78'}, {'queuingDelay': '1.893', 'delay': '21.4', 'bandwidth': '62.12'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.893', 'delay': '21.4', 'bandwidth': '62.12'}, {'queuingDelay': '1.708', 'delay': '174.3', 'bandwidth': '66.78'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.787', 'delay': '191.5', 'bandwidth': '85.40'}, {'queuingDelay': '1.128', 'delay': '113.6', 'bandwidth': '51.07'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.128', 'delay': '113.6', 'bandwidth': '51.07'}, {'queuingDelay': '1.787', 'delay': '191.5', 'bandwidth': '85.40'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.761', 'delay': '196.0', 'bandwidth': '43.04'}, {'queuingDelay': '1.371', 'delay': '117.3', 'bandwidth': '95.03'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.371', 'delay': '117.3', 'bandwidth': '95.03'}, {'queuingDelay': '1.761', 'delay': '196.0', 'bandwidth': '43.04'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.768', 'delay': '149.5', 'bandwidth': '37.60'}, {'queuingDelay': '1.281', 'delay': '36.7', 'bandwidth': '76.76'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.281', 'delay': '36.7', 'bandwidth': '76.76'}, {'queuingDelay': '1.768', 'delay': '149.5', 'bandwidth': '37.60'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.571', 'delay': '55.2', 'bandwidth': '19.43'}, {'queuingDelay': '1.983', 'delay': '31.2', 'bandwidth': '87.03'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.983', 'delay': '31.2', 'bandwidth': '87.03'}, {'queuingDelay': '1.571', 'delay': '55.2', 'bandwidth': '19.43'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.805', 'delay': '4.2', 'bandwidth': '25.50'}, {'queuingDelay': '1.832', 'delay': '101.2', 'bandwidth': '78.37'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.832', 'delay': '101.2', 'bandwidth': '78.37'}, {'queuingDelay': '0.805', 'delay': '4.2', 'bandwidth': '25.50'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.129', 'delay': '6.6', 'bandwidth': '23.17'}, {'queuingDelay': '1.752', 'delay': '28.7', 'bandwidth': '53.80'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.752', 'delay': '28.7', 'bandwidth': '53.80'}, {'queuingDelay': '0.129', 'delay': '6.6', 'bandwidth': '23.17'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.219', 'delay': '74.5', 'bandwidth': '18.22'}, {'queuingDelay': '1.121', 'delay': '10.2', 'bandwidth': '67.83'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.121', 'delay': '10.2', 'bandwidth': '67.83'}, {'queuingDelay': '0.219', 'delay': '74.5', 'bandwidth': '18.22'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.341', 'delay': '147.4', 'bandwidth': '30.96'}, {'queuingDelay': '0.855', 'delay': '6.7', 'bandwidth': '41.14'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.855', 'delay': '6.7', 'bandwidth': '41.14'}, {'queuingDelay': '0.341', 'delay': '147.4', 'bandwidth': '30.96'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.251', 'delay': '157.2', 'bandwidth': '1.12'}, {'queuingDelay': '1.269', 'delay': '23.7', 'bandwidth': '13.32'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.269', 'delay': '23.7', 'bandwidth': '13.32'}, {'queuingDelay': '0.251', 'delay': '157.2', 'bandwidth': '1.12'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.180', 'delay': '185.4', 'bandwidth': '21.44'}, {'queuingDelay': '1.486', 'delay': '101.5', 'bandwidth': '30.85'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.486', 'delay': '101.5', 'bandwidth': '30.85'}, {'queuingDelay': '0.180', 'delay': '185.4', 'bandwidth': '21.44'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.553', 'delay': '120.8', 'bandwidth': '18.94'}, {'queuingDelay': '1.550', 'delay': '53.3', 'bandwidth': '55.33'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.550', 'delay': '53.3', 'bandwidth': '55.33'}, {'queuingDelay': '0.553', 'delay': '120.8', 'bandwidth': '18.94'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.613', 'delay': '154.3', 'bandwidth': '2.67'}, {'queuingDelay': '1.394', 'delay': '44.9', 'bandwidth': '76.89'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.394', 'delay': '44.9', 'bandwidth': '76.89'}, {'queuingDelay': '1.613', 'delay': '154.3', 'bandwidth': '2.67'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.432', 'delay': '188.1', 'bandwidth': '2.33'}, {'queuingDelay': '1.651', 'delay': '49.5', 'bandwidth': '20.79'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.651', 'delay': '49.5', 'bandwidth': '20.79'}, {'queuingDelay': '1.432', 'delay': '188.1', 'bandwidth': '2.33'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.856', 'delay': '192.3', 'bandwidth': '6.23'}, {'queuingDelay': '1.785', 'delay': '32.7', 'bandwidth': '17.74'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.785', 'delay': '32.7', 'bandwidth': '17.74'}, {'queuingDelay': '1.856', 'delay': '192.3', 'bandwidth': '6.23'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.662', 'delay': '170.0', 'bandwidth': '4.90'}, {'queuingDelay': '0.674', 'delay': '76.4', 'bandwidth': '1.43'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.674', 'delay': '76.4', 'bandwidth': '1.43'}, {'queuingDelay': '1.662', 'delay': '170.0', 'bandwidth': '4.90'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.639', 'delay': '197.6', 'bandwidth': '18.90'}, {'queuingDelay': '0.216', 'delay': '42.5', 'bandwidth': '0.43'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.216', 'delay': '42.5', 'bandwidth': '0.43'}, {'queuingDelay': '1.639', 'delay': '197.6', 'bandwidth': '18.90'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.962', 'delay': '170.8', 'bandwidth': '37.36'}, {'queuingDelay': '0.010', 'delay': '55.3', 'bandwidth': '16.46'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.010', 'delay': '55.3', 'bandwidth': '16.46'}, {'queuingDelay': '1.962', 'delay': '170.8', 'bandwidth': '37.36'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.951', 'delay': '176.3', 'bandwidth': '6.42'}, {'queuingDelay': '0.784', 'delay': '110.3', 'bandwidth': '13.06'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.784', 'delay': '110.3', 'bandwidth': '13.06'}, {'queuingDelay': '1.951', 'delay': '176.3', 'bandwidth': '6.42'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.559', 'delay': '143.0', 'bandwidth': '0.63'}, {'queuingDelay': '1.723', 'delay': '173.4', 'bandwidth': '20.59'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.723', 'delay': '173.4', 'bandwidth': '20.59'}, {'queuingDelay': '1.559', 'delay': '143.0', 'bandwidth': '0.63'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.985', 'delay': '166.4', 'bandwidth': '27.13'}, {'queuingDelay': '1.881', 'delay': '118.3', 'bandwidth': '53.57'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.881', 'delay': '118.3', 'bandwidth': '53.57'}, {'queuingDelay': '1.985', 'delay': '166.4', 'bandwidth': '27.13'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.788', 'delay': '95.7', 'bandwidth': '2.65'}, {'queuingDelay': '1.953', 'delay': '100.2', 'bandwidth': '97.49'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.953', 'delay': '100.2', 'bandwidth': '97.49'}, {'queuingDelay': '1.788', 'delay': '95.7', 'bandwidth': '2.65'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.166', 'delay': '67.8', 'bandwidth': '54.40'}, {'queuingDelay': '1.690', 'delay': '109.6', 'bandwidth': '88.10'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.690', 'delay': '109.6', 'bandwidth': '88.10'}, {'queuingDelay': '1.166', 'delay': '67.8', 'bandwidth': '54.40'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.117', 'delay': '76.6', 'bandwidth': '44.67'}, {'queuingDelay': '1.827', 'delay': '119.4', 'bandwidth': '55.49'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.827', 'delay': '119.4', 'bandwidth': '55.49'}, {'queuingDelay': '0.117', 'delay': '76.6', 'bandwidth': '44.67'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.237', 'delay': '76.8', 'bandwidth': '17.75'}, {'queuingDelay': '1.794', 'delay': '196.2', 'bandwidth': '33.90'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.794', 'delay': '196.2', 'bandwidth': '33.90'}, {'queuingDelay': '0.237', 'delay': '76.8', 'bandwidth': '17.75'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.561', 'delay': '93.8', 'bandwidth': '3.49'}, {'queuingDelay': '0.951', 'delay': '152.8', 'bandwidth': '41.25'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.951', 'delay': '152.8', 'bandwidth': '41.25'}, {'queuingDelay': '0.561', 'delay': '93.8', 'bandwidth': '3.49'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.800', 'delay': '19.6', 'bandwidth': '0.93'}, {'queuingDelay': '0.693', 'delay': '166.1', 'bandwidth': '87.23'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.693', 'delay': '166.1', 'bandwidth': '87.23'}, {'queuingDelay': '0.800', 'delay': '19.6', 'bandwidth': '0.93'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.433', 'delay': '57.7', 'bandwidth': '11.78'}, {'queuingDelay': '1.824', 'delay': '181.0', 'bandwidth': '94.16'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.824', 'delay': '181.0', 'bandwidth': '94.16'}, {'queuingDelay': '0.433', 'delay': '57.7', 'bandwidth': '11.78'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.060', 'delay': '139.1', 'bandwidth': '34.77'}, {'queuingDelay': '0.979', 'delay': '186.2', 'bandwidth': '96.31'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.979', 'delay': '186.2', 'bandwidth': '96.31'}, {'queuingDelay': '0.060', 'delay': '139.1', 'bandwidth': '34.77'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.219', 'delay': '164.3', 'bandwidth': '7.18'}, {'queuingDelay': '0.280', 'delay': '116.8', 'bandwidth': '82.49'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.280', 'delay': '116.8', 'bandwidth': '82.49'}, {'queuingDelay': '0.219', 'delay': '164.3', 'bandwidth': '7.18'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.333', 'delay': '195.3', 'bandwidth': '16.63'}, {'queuingDelay': '0.607', 'delay': '182.4', 'bandwidth': '95.59'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.607', 'delay': '182.4', 'bandwidth': '95.59'}, {'queuingDelay': '0.333', 'delay': '195.3', 'bandwidth': '16.63'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.504', 'delay': '184.1', 'bandwidth': '23.74'}, {'queuingDelay': '1.069', 'delay': '128.2', 'bandwidth': '51.00'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.069', 'delay': '128.2', 'bandwidth': '51.00'}, {'queuingDelay': '0.504', 'delay': '184.1', 'bandwidth': '23.74'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.311', 'delay': '155.8', 'bandwidth': '11.83'}, {'queuingDelay': '0.592', 'delay': '189.9', 'bandwidth': '1.60'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.592', 'delay': '189.9', 'bandwidth': '1.60'}, {'queuingDelay': '0.311', 'delay': '155.8', 'bandwidth': '11.83'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.267', 'delay': '162.4', 'bandwidth': '10.22'}, {'queuingDelay': '1.740', 'delay': '186.2', 'bandwidth': '6.09'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.740', 'delay': '186.2', 'bandwidth': '6.09'}, {'queuingDelay': '0.267', 'delay': '162.4', 'bandwidth': '10.22'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.002', 'delay': '67.6', 'bandwidth': '2.38'}, {'queuingDelay': '1.310', 'delay': '153.9', 'bandwidth': '12.34'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.310', 'delay': '153.9', 'bandwidth': '12.34'}, {'queuingDelay': '0.002', 'delay': '67.6', 'bandwidth': '2.38'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.452', 'delay': '46.4', 'bandwidth': '11.82'}, {'queuingDelay': '0.336', 'delay': '175.8', 'bandwidth': '25.83'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.336', 'delay': '175.8', 'bandwidth': '25.83'}, {'queuingDelay': '0.452', 'delay': '46.4', 'bandwidth': '11.82'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.769', 'delay': '2.1', 'bandwidth': '42.78'}, {'queuingDelay': '0.840', 'delay': '123.7', 'bandwidth': '60.58'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.840', 'delay': '123.7', 'bandwidth': '60.58'}, {'queuingDelay': '0.769', 'delay': '2.1', 'bandwidth': '42.78'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.569', 'delay': '23.8', 'bandwidth': '68.02'}, {'queuingDelay': '0.349', 'delay': '153.0', 'bandwidth': '65.81'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.349', 'delay': '153.0', 'bandwidth': '65.81'}, {'queuingDelay': '1.569', 'delay': '23.8', 'bandwidth': '68.02'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.946', 'delay': '59.2', 'bandwidth': '63.87'}, {'queuingDelay': '0.063', 'delay': '189.6', 'bandwidth': '95.72'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.063', 'delay': '189.6', 'bandwidth': '95.72'}, {'queuingDelay': '1.946', 'delay': '59.2', 'bandwidth': '63.87'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.826', 'delay': '128.1', 'bandwidth': '88.88'}, {'queuingDelay': '0.666', 'delay': '192.5', 'bandwidth': '83.41'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.666', 'delay': '192.5', 'bandwidth': '83.41'}, {'queuingDelay': '1.826', 'delay': '128.1', 'bandwidth': '88.88'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.729', 'delay': '84.4', 'bandwidth': '97.08'}, {'queuingDelay': '1.331', 'delay': '132.5', 'bandwidth': '44.59'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.331', 'delay': '132.5', 'bandwidth': '44.59'}, {'queuingDelay': '1.729', 'delay': '84.4', 'bandwidth': '97.08'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.270', 'delay': '41.0', 'bandwidth': '87.66'}, {'queuingDelay': '1.955', 'delay': '165.4', 'bandwidth': '29.68'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.955', 'delay': '165.4', 'bandwidth': '29.68'}, {'queuingDelay': '1.270', 'delay': '41.0', 'bandwidth': '87.66'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.471', 'delay': '13.9', 'bandwidth': '86.76'}, {'queuingDelay': '1.350', 'delay': '81.0', 'bandwidth': '16.91'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.350', 'delay': '81.0', 'bandwidth': '16.91'}, {'queuingDelay': '1.471', 'delay': '13.9', 'bandwidth': '86.76'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.019', 'delay': '51.2', 'bandwidth': '94.35'}, {'queuingDelay': '1.302', 'delay': '69.9', 'bandwidth': '57.28'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.302', 'delay': '69.9', 'bandwidth': '57.28'}, {'queuingDelay': '1.019', 'delay': '51.2', 'bandwidth': '94.35'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.514', 'delay': '47.5', 'bandwidth': '92.63'}, {'queuingDelay': '1.851', 'delay': '171.3', 'bandwidth': '72.24'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.851', 'delay': '171.3', 'bandwidth': '72.24'}, {'queuingDelay': '0.514', 'delay': '47.5', 'bandwidth': '92.63'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.248', 'delay': '5.2', 'bandwidth': '98.49'}, {'queuingDelay': '1.858', 'delay': '183.1', 'bandwidth': '39.97'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.858', 'delay': '183.1', 'bandwidth': '39.97'}, {'queuingDelay': '0.248', 'delay': '5.2', 'bandwidth': '98.49'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.385', 'delay': '24.0', 'bandwidth': '89.95'}, {'queuingDelay': '1.657', 'delay': '105.3', 'bandwidth': '6.66'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.657', 'delay': '105.3', 'bandwidth': '6.66'}, {'queuingDelay': '0.385', 'delay': '24.0', 'bandwidth': '89.95'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.242', 'delay': '4.4', 'bandwidth': '57.84'}, {'queuingDelay': '1.722', 'delay': '22.3', 'bandwidth': '0.78'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.722', 'delay': '22.3', 'bandwidth': '0.78'}, {'queuingDelay': '0.242', 'delay': '4.4', 'bandwidth': '57.84'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.039', 'delay': '6.0', 'bandwidth': '63.62'}, {'queuingDelay': '1.698', 'delay': '31.1', 'bandwidth': '25.77'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.698', 'delay': '31.1', 'bandwidth': '25.77'}, {'queuingDelay': '0.039', 'delay': '6.0', 'bandwidth': '63.62'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.030', 'delay': '48.1', 'bandwidth': '22.65'}, {'queuingDelay': '1.673', 'delay': '117.7', 'bandwidth': '49.54'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.673', 'delay': '117.7', 'bandwidth': '49.54'}, {'queuingDelay': '0.030', 'delay': '48.1', 'bandwidth': '22.65'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.651', 'delay': '116.9', 'bandwidth': '10.22'}, {'queuingDelay': '1.886', 'delay': '29.3', 'bandwidth': '26.89'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.886', 'delay': '29.3', 'bandwidth': '26.89'}, {'queuingDelay': '0.651', 'delay': '116.9', 'bandwidth': '10.22'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.926', 'delay': '151.3', 'bandwidth': '9.25'}, {'queuingDelay': '1.618', 'delay': '65.8', 'bandwidth': '12.66'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.618', 'delay': '65.8', 'bandwidth': '12.66'}, {'queuingDelay': '0.926', 'delay': '151.3', 'bandwidth': '9.25'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.283', 'delay': '101.2', 'bandwidth': '14.84'}, {'queuingDelay': '1.922', 'delay': '74.3', 'bandwidth': '56.29'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.922', 'delay': '74.3', 'bandwidth': '56.29'}, {'queuingDelay': '0.283', 'delay': '101.2', 'bandwidth': '14.84'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.513', 'delay': '85.8', 'bandwidth': '31.02'}, {'queuingDelay': '1.776', 'delay': '0.4', 'bandwidth': '97.25'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.776', 'delay': '0.4', 'bandwidth': '97.25'}, {'queuingDelay': '0.513', 'delay': '85.8', 'bandwidth': '31.02'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.303', 'delay': '94.3', 'bandwidth': '91.86'}, {'queuingDelay': '1.505', 'delay': '0.1', 'bandwidth': '99.01'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.505', 'delay': '0.1', 'bandwidth': '99.01'}, {'queuingDelay': '1.303', 'delay': '94.3', 'bandwidth': '91.86'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '2.000', 'delay': '23.0', 'bandwidth': '60.48'}, {'queuingDelay': '1.185', 'delay': '14.8', 'bandwidth': '83.14'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.185', 'delay': '14.8', 'bandwidth': '83.14'}, {'queuingDelay': '2.000', 'delay': '23.0', 'bandwidth': '60.48'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.994', 'delay': '20.2', 'bandwidth': '7.16'}, {'queuingDelay': '0.857', 'delay': '57.9', 'bandwidth': '85.87'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.857', 'delay': '57.9', 'bandwidth': '85.87'}, {'queuingDelay': '1.994', 'delay': '20.2', 'bandwidth': '7.16'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.914', 'delay': '22.7', 'bandwidth': '18.89'}, {'queuingDelay': '0.217', 'delay': '115.6', 'bandwidth': '54.95'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.217', 'delay': '115.6', 'bandwidth': '54.95'}, {'queuingDelay': '1.914', 'delay': '22.7', 'bandwidth': '18.89'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.765', 'delay': '102.6', 'bandwidth': '11.36'}, {'queuingDelay': '0.137', 'delay': '194.7', 'bandwidth': '23.54'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.137', 'delay': '194.7', 'bandwidth': '23.54'}, {'queuingDelay': '1.765', 'delay': '102.6', 'bandwidth': '11.36'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.555', 'delay': '193.9', 'bandwidth': '5.99'}, {'queuingDelay': '0.225', 'delay': '186.4', 'bandwidth': '10.99'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.225', 'delay': '186.4', 'bandwidth': '10.99'}, {'queuingDelay': '1.555', 'delay': '193.9', 'bandwidth': '5.99'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.611', 'delay': '171.7', 'bandwidth': '0.45'}, {'queuingDelay': '0.200', 'delay': '95.4', 'bandwidth': '4.76'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.200', 'delay': '95.4', 'bandwidth': '4.76'}, {'queuingDelay': '0.611', 'delay': '171.7', 'bandwidth': '0.45'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.133', 'delay': '195.6', 'bandwidth': '40.60'}, {'queuingDelay': '0.247', 'delay': '141.0', 'bandwidth': '2.83'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.247', 'delay': '141.0', 'bandwidth': '2.83'}, {'queuingDelay': '0.133', 'delay': '195.6', 'bandwidth': '40.60'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.175', 'delay': '182.2', 'bandwidth': '2.19'}, {'queuingDelay': '0.114', 'delay': '190.6', 'bandwidth': '39.20'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.114', 'delay': '190.6', 'bandwidth': '39.20'}, {'queuingDelay': '0.175', 'delay': '182.2', 'bandwidth': '2.19'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.206', 'delay': '56.5', 'bandwidth': '2.74'}, {'queuingDelay': '0.021', 'delay': '133.9', 'bandwidth': '24.89'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.021', 'delay': '133.9', 'bandwidth': '24.89'}, {'queuingDelay': '0.206', 'delay': '56.5', 'bandwidth': '2.74'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.145', 'delay': '39.4', 'bandwidth': '58.17'}, {'queuingDelay': '0.058', 'delay': '69.0', 'bandwidth': '26.29'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.058', 'delay': '69.0', 'bandwidth': '26.29'}, {'queuingDelay': '0.145', 'delay': '39.4', 'bandwidth': '58.17'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.442', 'delay': '141.6', 'bandwidth': '64.71'}, {'queuingDelay': '0.304', 'delay': '14.8', 'bandwidth': '2.85'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.304', 'delay': '14.8', 'bandwidth': '2.85'}, {'queuingDelay': '0.442', 'delay': '141.6', 'bandwidth': '64.71'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.260', 'delay': '150.4', 'bandwidth': '70.38'}, {'queuingDelay': '0.033', 'delay': '2.0', 'bandwidth': '64.93'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.033', 'delay': '2.0', 'bandwidth': '64.93'}, {'queuingDelay': '0.260', 'delay': '150.4', 'bandwidth': '70.38'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.628', 'delay': '194.7', 'bandwidth': '83.00'}, {'queuingDelay': '1.035', 'delay': '37.2', 'bandwidth': '42.54'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.035', 'delay': '37.2', 'bandwidth': '42.54'}, {'queuingDelay': '0.628', 'delay': '194.7', 'bandwidth': '83.00'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.872', 'delay': '175.3', 'bandwidth': '89.71'}, {'queuingDelay': '1.665', 'delay': '11.1', 'bandwidth': '26.67'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.665', 'delay': '11.1', 'bandwidth': '26.67'}, {'queuingDelay': '0.872', 'delay': '175.3', 'bandwidth': '89.71'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.795', 'delay': '199.9', 'bandwidth': '83.94'}, {'queuingDelay': '1.083', 'delay': '55.3', 'bandwidth': '4.25'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.083', 'delay': '55.3', 'bandwidth': '4.25'}, {'queuingDelay': '1.795', 'delay': '199.9', 'bandwidth': '83.94'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.523', 'delay': '113.8', 'bandwidth': '99.94'}, {'queuingDelay': '0.959', 'delay': '69.1', 'bandwidth': '6.33'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.959', 'delay': '69.1', 'bandwidth': '6.33'}, {'queuingDelay': '1.523', 'delay': '113.8', 'bandwidth': '99.94'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.604', 'delay': '197.6', 'bandwidth': '85.80'}, {'queuingDelay': '0.110', 'delay': '118.2', 'bandwidth': '6.23'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.110', 'delay': '118.2', 'bandwidth': '6.23'}, {'queuingDelay': '1.604', 'delay': '197.6', 'bandwidth': '85.80'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.995', 'delay': '186.2', 'bandwidth': '92.71'}, {'queuingDelay': '0.033', 'delay': '77.4', 'bandwidth': '67.90'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.033', 'delay': '77.4', 'bandwidth': '67.90'}, {'queuingDelay': '1.995', 'delay': '186.2', 'bandwidth': '92.71'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.627', 'delay': '88.5', 'bandwidth': '99.62'}, {'queuingDelay': '0.161', 'delay': '57.3', 'bandwidth': '78.72'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.161', 'delay': '57.3', 'bandwidth': '78.72'}, {'queuingDelay': '1.627', 'delay': '88.5', 'bandwidth': '99.62'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.694', 'delay': '171.8', 'bandwidth': '91.71'}, {'queuingDelay': '0.124', 'delay': '84.0', 'bandwidth': '87.69'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.124', 'delay': '84.0', 'bandwidth': '87.69'}, {'queuingDelay': '0.694', 'delay': '171.8', 'bandwidth': '91.71'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.224', 'delay': '182.8', 'bandwidth': '98.35'}, {'queuingDelay': '0.015', 'delay': '36.7', 'bandwidth': '89.87'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.015', 'delay': '36.7', 'bandwidth': '89.87'}, {'queuingDelay': '1.224', 'delay': '182.8', 'bandwidth': '98.35'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.207', 'delay': '192.5', 'bandwidth': '84.33'}, {'queuingDelay': '0.543', 'delay': '11.3', 'bandwidth': '47.41'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.543', 'delay': '11.3', 'bandwidth': '47.41'}, {'queuingDelay': '0.207', 'delay': '192.5', 'bandwidth': '84.33'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.423', 'delay': '159.0', 'bandwidth': '40.59'}, {'queuingDelay': '0.587', 'delay': '27.4', 'bandwidth': '92.39'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.587', 'delay': '27.4', 'bandwidth': '92.39'}, {'queuingDelay': '0.423', 'delay': '159.0', 'bandwidth': '40.59'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.550', 'delay': '101.6', 'bandwidth': '88.56'}, {'queuingDelay': '0.559', 'delay': '27.7', 'bandwidth': '68.61'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.559', 'delay': '27.7', 'bandwidth': '68.61'}, {'queuingDelay': '0.550', 'delay': '101.6', 'bandwidth': '88.56'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.021', 'delay': '165.9', 'bandwidth': '90.28'}, {'queuingDelay': '0.909', 'delay': '62.1', 'bandwidth': '8.35'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.909', 'delay': '62.1', 'bandwidth': '8.35'}, {'queuingDelay': '0.021', 'delay': '165.9', 'bandwidth': '90.28'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.879', 'delay': '185.8', 'bandwidth': '74.78'}, {'queuingDelay': '1.922', 'delay': '71.6', 'bandwidth': '1.99'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.922', 'delay': '71.6', 'bandwidth': '1.99'}, {'queuingDelay': '0.879', 'delay': '185.8', 'bandwidth': '74.78'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.532', 'delay': '89.4', 'bandwidth': '51.60'}, {'queuingDelay': '1.911', 'delay': '151.7', 'bandwidth': '0.56'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.911', 'delay': '151.7', 'bandwidth': '0.56'}, {'queuingDelay': '0.532', 'delay': '89.4', 'bandwidth': '51.60'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.023', 'delay': '158.2', 'bandwidth': '96.04'}, {'queuingDelay': '1.846', 'delay': '197.2', 'bandwidth': '18.94'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.846', 'delay': '197.2', 'bandwidth': '18.94'}, {'queuingDelay': '0.023', 'delay': '158.2', 'bandwidth': '96.04'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.111', 'delay': '117.3', 'bandwidth': '73.76'}, {'queuingDelay': '1.218', 'delay': '160.3', 'bandwidth': '1.72'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.218', 'delay': '160.3', 'bandwidth': '1.72'}, {'queuingDelay': '0.111', 'delay': '117.3', 'bandwidth': '73.76'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.923', 'delay': '197.4', 'bandwidth': '95.91'}, {'queuingDelay': '1.941', 'delay': '170.1', 'bandwidth': '12.44'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.941', 'delay': '170.1', 'bandwidth': '12.44'}, {'queuingDelay': '0.923', 'delay': '197.4', 'bandwidth': '95.91'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.227', 'delay': '124.3', 'bandwidth': '91.54'}, {'queuingDelay': '1.739', 'delay': '189.2', 'bandwidth': '0.84'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.739', 'delay': '189.2', 'bandwidth': '0.84'}, {'queuingDelay': '1.227', 'delay': '124.3', 'bandwidth': '91.54'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.751', 'delay': '147.7', 'bandwidth': '46.12'}, {'queuingDelay': '1.702', 'delay': '192.5', 'bandwidth': '12.97'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.702', 'delay': '192.5', 'bandwidth': '12.97'}, {'queuingDelay': '1.751', 'delay': '147.7', 'bandwidth': '46.12'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.112', 'delay': '151.6', 'bandwidth': '37.53'}, {'queuingDelay': '1.142', 'delay': '192.2', 'bandwidth': '38.49'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.142', 'delay': '192.2', 'bandwidth': '38.49'}, {'queuingDelay': '1.112', 'delay': '151.6', 'bandwidth': '37.53'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.338', 'delay': '162.8', 'bandwidth': '95.67'}, {'queuingDelay': '0.739', 'delay': '192.5', 'bandwidth': '17.78'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.739', 'delay': '192.5', 'bandwidth': '17.78'}, {'queuingDelay': '1.338', 'delay': '162.8', 'bandwidth': '95.67'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.899', 'delay': '195.3', 'bandwidth': '97.76'}, {'queuingDelay': '0.076', 'delay': '111.5', 'bandwidth': '45.52'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.076', 'delay': '111.5', 'bandwidth': '45.52'}, {'queuingDelay': '0.899', 'delay': '195.3', 'bandwidth': '97.76'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.910', 'delay': '194.1', 'bandwidth': '95.73'}, {'queuingDelay': '0.840', 'delay': '187.2', 'bandwidth': '75.61'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.840', 'delay': '187.2', 'bandwidth': '75.61'}, {'queuingDelay': '0.910', 'delay': '194.1', 'bandwidth': '95.73'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.442', 'delay': '193.7', 'bandwidth': '94.08'}, {'queuingDelay': '1.924', 'delay': '199.5', 'bandwidth': '71.87'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.924', 'delay': '199.5', 'bandwidth': '71.87'}, {'queuingDelay': '1.442', 'delay': '193.7', 'bandwidth': '94.08'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.932', 'delay': '107.3', 'bandwidth': '60.04'}, {'queuingDelay': '0.846', 'delay': '199.1', 'bandwidth': '53.83'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.846', 'delay': '199.1', 'bandwidth': '53.83'}, {'queuingDelay': '0.932', 'delay': '107.3', 'bandwidth': '60.04'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.954', 'delay': '62.6', 'bandwidth': '81.98'}, {'queuingDelay': '0.804', 'delay': '199.2', 'bandwidth': '83.93'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.804', 'delay': '199.2', 'bandwidth': '83.93'}, {'queuingDelay': '1.954', 'delay': '62.6', 'bandwidth': '81.98'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.735', 'delay': '27.8', 'bandwidth': '94.43'}, {'queuingDelay': '0.267', 'delay': '116.3', 'bandwidth': '82.58'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.267', 'delay': '116.3', 'bandwidth': '82.58'}, {'queuingDelay': '1.735', 'delay': '27.8', 'bandwidth': '94.43'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.817', 'delay': '23.9', 'bandwidth': '89.77'}, {'queuingDelay': '1.033', 'delay': '58.7', 'bandwidth': '88.99'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.033', 'delay': '58.7', 'bandwidth': '88.99'}, {'queuingDelay': '0.817', 'delay': '23.9', 'bandwidth': '89.77'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.043', 'delay': '67.9', 'bandwidth': '96.03'}, {'queuingDelay': '1.896', 'delay': '34.3', 'bandwidth': '85.34'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.896', 'delay': '34.3', 'bandwidth': '85.34'}, {'queuingDelay': '0.043', 'delay': '67.9', 'bandwidth': '96.03'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.118', 'delay': '20.6', 'bandwidth': '38.68'}, {'queuingDelay': '1.271', 'delay': '24.5', 'bandwidth': '98.68'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.271', 'delay': '24.5', 'bandwidth': '98.68'}, {'queuingDelay': '0.118', 'delay': '20.6', 'bandwidth': '38.68'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.962', 'delay': '20.6', 'bandwidth': '13.03'}, {'queuingDelay': '1.883', 'delay': '8.3', 'bandwidth': '96.20'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.883', 'delay': '8.3', 'bandwidth': '96.20'}, {'queuingDelay': '0.962', 'delay': '20.6', 'bandwidth': '13.03'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.244', 'delay': '3.9', 'bandwidth': '9.84'}, {'queuingDelay': '0.584', 'delay': '5.4', 'bandwidth': '83.46'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.584', 'delay': '5.4', 'bandwidth': '83.46'}, {'queuingDelay': '1.244', 'delay': '3.9', 'bandwidth': '9.84'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.533', 'delay': '115.6', 'bandwidth': '2.09'}, {'queuingDelay': '1.058', 'delay': '3.2', 'bandwidth': '72.94'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.058', 'delay': '3.2', 'bandwidth': '72.94'}, {'queuingDelay': '1.533', 'delay': '115.6', 'bandwidth': '2.09'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.419', 'delay': '108.7', 'bandwidth': '8.64'}, {'queuingDelay': '0.274', 'delay': '13.6', 'bandwidth': '75.93'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.274', 'delay': '13.6', 'bandwidth': '75.93'}, {'queuingDelay': '1.419', 'delay': '108.7', 'bandwidth': '8.64'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.964', 'delay': '188.0', 'bandwidth': '7.65'}, {'queuingDelay': '0.460', 'delay': '1.6', 'bandwidth': '83.33'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.460', 'delay': '1.6', 'bandwidth': '83.33'}, {'queuingDelay': '1.964', 'delay': '188.0', 'bandwidth': '7.65'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.923', 'delay': '161.5', 'bandwidth': '8.13'}, {'queuingDelay': '0.060', 'delay': '84.9', 'bandwidth': '81.72'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.060', 'delay': '84.9', 'bandwidth': '81.72'}, {'queuingDelay': '1.923', 'delay': '161.5', 'bandwidth': '8.13'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.985', 'delay': '197.0', 'bandwidth': '13.87'}, {'queuingDelay': '0.660', 'delay': '170.6', 'bandwidth': '92.98'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.660', 'delay': '170.6', 'bandwidth': '92.98'}, {'queuingDelay': '1.985', 'delay': '197.0', 'bandwidth': '13.87'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '2.000', 'delay': '166.3', 'bandwidth': '54.09'}, {'queuingDelay': '1.056', 'delay': '53.1', 'bandwidth': '96.60'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.056', 'delay': '53.1', 'bandwidth': '96.60'}, {'queuingDelay': '2.000', 'delay': '166.3', 'bandwidth': '54.09'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.626', 'delay': '173.9', 'bandwidth': '93.44'}, {'queuingDelay': '0.137', 'delay': '55.8', 'bandwidth': '97.94'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.137', 'delay': '55.8', 'bandwidth': '97.94'}, {'queuingDelay': '1.626', 'delay': '173.9', 'bandwidth': '93.44'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.986', 'delay': '41.7', 'bandwidth': '47.41'}, {'queuingDelay': '0.174', 'delay': '10.3', 'bandwidth': '39.47'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.174', 'delay': '10.3', 'bandwidth': '39.47'}, {'queuingDelay': '1.986', 'delay': '41.7', 'bandwidth': '47.41'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.933', 'delay': '43.9', 'bandwidth': '80.36'}, {'queuingDelay': '1.243', 'delay': '2.1', 'bandwidth': '9.81'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.243', 'delay': '2.1', 'bandwidth': '9.81'}, {'queuingDelay': '0.933', 'delay': '43.9', 'bandwidth': '80.36'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.970', 'delay': '7.5', 'bandwidth': '99.25'}, {'queuingDelay': '1.601', 'delay': '92.9', 'bandwidth': '2.48'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.601', 'delay': '92.9', 'bandwidth': '2.48'}, {'queuingDelay': '0.970', 'delay': '7.5', 'bandwidth': '99.25'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.946', 'delay': '2.5', 'bandwidth': '62.67'}, {'queuingDelay': '1.881', 'delay': '186.4', 'bandwidth': '34.34'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.881', 'delay': '186.4', 'bandwidth': '34.34'}, {'queuingDelay': '0.946', 'delay': '2.5', 'bandwidth': '62.67'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.975', 'delay': '56.1', 'bandwidth': '52.52'}, {'queuingDelay': '1.992', 'delay': '138.7', 'bandwidth': '17.04'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.992', 'delay': '138.7', 'bandwidth': '17.04'}, {'queuingDelay': '1.975', 'delay': '56.1', 'bandwidth': '52.52'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.625', 'delay': '132.2', 'bandwidth': '38.10'}, {'queuingDelay': '1.684', 'delay': '180.7', 'bandwidth': '39.29'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.684', 'delay': '180.7', 'bandwidth': '39.29'}, {'queuingDelay': '1.625', 'delay': '132.2', 'bandwidth': '38.10'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.824', 'delay': '122.8', 'bandwidth': '69.77'}, {'queuingDelay': '1.307', 'delay': '197.2', 'bandwidth': '1.36'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.307', 'delay': '197.2', 'bandwidth': '1.36'}, {'queuingDelay': '1.824', 'delay': '122.8', 'bandwidth': '69.77'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.608', 'delay': '197.3', 'bandwidth': '14.79'}, {'queuingDelay': '1.595', 'delay': '193.5', 'bandwidth': '4.87'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.595', 'delay': '193.5', 'bandwidth': '4.87'}, {'queuingDelay': '1.608', 'delay': '197.3', 'bandwidth': '14.79'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.239', 'delay': '151.0', 'bandwidth': '44.00'}, {'queuingDelay': '0.114', 'delay': '196.3', 'bandwidth': '60.02'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.114', 'delay': '196.3', 'bandwidth': '60.02'}, {'queuingDelay': '1.239', 'delay': '151.0', 'bandwidth': '44.00'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.653', 'delay': '93.0', 'bandwidth': '1.70'}, {'queuingDelay': '0.130', 'delay': '196.0', 'bandwidth': '78.44'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.130', 'delay': '196.0', 'bandwidth': '78.44'}, {'queuingDelay': '1.653', 'delay': '93.0', 'bandwidth': '1.70'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.507', 'delay': '38.5', 'bandwidth': '0.89'}, {'queuingDelay': '0.043', 'delay': '129.2', 'bandwidth': '57.26'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.043', 'delay': '129.2', 'bandwidth': '57.26'}, {'queuingDelay': '1.507', 'delay': '38.5', 'bandwidth': '0.89'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.121', 'delay': '31.9', 'bandwidth': '22.23'}, {'queuingDelay': '0.043', 'delay': '146.5', 'bandwidth': '34.59'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.043', 'delay': '146.5', 'bandwidth': '34.59'}, {'queuingDelay': '0.121', 'delay': '31.9', 'bandwidth': '22.23'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.007', 'delay': '37.7', 'bandwidth': '42.93'}, {'queuingDelay': '0.006', 'delay': '88.3', 'bandwidth': '2.53'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.006', 'delay': '88.3', 'bandwidth': '2.53'}, {'queuingDelay': '1.007', 'delay': '37.7', 'bandwidth': '42.93'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.854', 'delay': '2.6', 'bandwidth': '48.05'}, {'queuingDelay': '0.317', 'delay': '32.9', 'bandwidth': '12.12'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.317', 'delay': '32.9', 'bandwidth': '12.12'}, {'queuingDelay': '1.854', 'delay': '2.6', 'bandwidth': '48.05'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.938', 'delay': '139.7', 'bandwidth': '28.31'}, {'queuingDelay': '0.343', 'delay': '25.3', 'bandwidth': '17.72'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.343', 'delay': '25.3', 'bandwidth': '17.72'}, {'queuingDelay': '1.938', 'delay': '139.7', 'bandwidth': '28.31'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.939', 'delay': '199.7', 'bandwidth': '91.70'}, {'queuingDelay': '0.385', 'delay': '20.6', 'bandwidth': '19.01'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.385', 'delay': '20.6', 'bandwidth': '19.01'}, {'queuingDelay': '1.939', 'delay': '199.7', 'bandwidth': '91.70'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.950', 'delay': '69.8', 'bandwidth': '76.19'}, {'queuingDelay': '0.186', 'delay': '3.5', 'bandwidth': '2.17'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.186', 'delay': '3.5', 'bandwidth': '2.17'}, {'queuingDelay': '1.950', 'delay': '69.8', 'bandwidth': '76.19'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.116', 'delay': '19.7', 'bandwidth': '89.87'}, {'queuingDelay': '0.476', 'delay': '79.7', 'bandwidth': '12.00'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.476', 'delay': '79.7', 'bandwidth': '12.00'}, {'queuingDelay': '1.116', 'delay': '19.7', 'bandwidth': '89.87'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.458', 'delay': '72.0', 'bandwidth': '97.05'}, {'queuingDelay': '0.183', 'delay': '47.8', 'bandwidth': '1.23'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.183', 'delay': '47.8', 'bandwidth': '1.23'}, {'queuingDelay': '0.458', 'delay': '72.0', 'bandwidth': '97.05'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.201', 'delay': '5.2', 'bandwidth': '69.47'}, {'queuingDelay': '0.003', 'delay': '172.4', 'bandwidth': '11.15'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.003', 'delay': '172.4', 'bandwidth': '11.15'}, {'queuingDelay': '0.201', 'delay': '5.2', 'bandwidth': '69.47'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.041', 'delay': '3.2', 'bandwidth': '51.98'}, {'queuingDelay': '1.013', 'delay': '136.1', 'bandwidth': '3.09'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.013', 'delay': '136.1', 'bandwidth': '3.09'}, {'queuingDelay': '0.041', 'delay': '3.2', 'bandwidth': '51.98'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.622', 'delay': '91.8', 'bandwidth': '13.56'}, {'queuingDelay': '0.423', 'delay': '197.0', 'bandwidth': '13.81'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.423', 'delay': '197.0', 'bandwidth': '13.81'}, {'queuingDelay': '0.622', 'delay': '91.8', 'bandwidth': '13.56'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.256', 'delay': '188.3', 'bandwidth': '61.83'}, {'queuingDelay': '0.141', 'delay': '184.9', 'bandwidth': '45.38'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.141', 'delay': '184.9', 'bandwidth': '45.38'}, {'queuingDelay': '0.256', 'delay': '188.3', 'bandwidth': '61.83'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.439', 'delay': '194.2', 'bandwidth': '87.65'}, {'queuingDelay': '0.529', 'delay': '187.4', 'bandwidth': '5.48'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.529', 'delay': '187.4', 'bandwidth': '5.48'}, {'queuingDelay': '0.439', 'delay': '194.2', 'bandwidth': '87.65'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.192', 'delay': '32.5', 'bandwidth': '96.66'}, {'queuingDelay': '1.443', 'delay': '156.3', 'bandwidth': '1.00'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.443', 'delay': '156.3', 'bandwidth': '1.00'}, {'queuingDelay': '0.192', 'delay': '32.5', 'bandwidth': '96.66'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.257', 'delay': '2.2', 'bandwidth': '86.66'}, {'queuingDelay': '1.276', 'delay': '92.4', 'bandwidth': '90.23'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.276', 'delay': '92.4', 'bandwidth': '90.23'}, {'queuingDelay': '0.257', 'delay': '2.2', 'bandwidth': '86.66'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.733', 'delay': '2.8', 'bandwidth': '97.08'}, {'queuingDelay': '0.764', 'delay': '4.4', 'bandwidth': '99.73'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.764', 'delay': '4.4', 'bandwidth': '99.73'}, {'queuingDelay': '0.733', 'delay': '2.8', 'bandwidth': '97.08'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.279', 'delay': '161.9', 'bandwidth': '99.34'}, {'queuingDelay': '1.528', 'delay': '2.1', 'bandwidth': '94.80'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.528', 'delay': '2.1', 'bandwidth': '94.80'}, {'queuingDelay': '0.279', 'delay': '161.9', 'bandwidth': '99.34'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.857', 'delay': '113.2', 'bandwidth': '95.86'}, {'queuingDelay': '1.997', 'delay': '105.6', 'bandwidth': '97.73'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.997', 'delay': '105.6', 'bandwidth': '97.73'}, {'queuingDelay': '0.857', 'delay': '113.2', 'bandwidth': '95.86'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.845', 'delay': '170.9', 'bandwidth': '95.12'}, {'queuingDelay': '1.783', 'delay': '96.0', 'bandwidth': '77.31'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.783', 'delay': '96.0', 'bandwidth': '77.31'}, {'queuingDelay': '1.845', 'delay': '170.9', 'bandwidth': '95.12'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.955', 'delay': '12.6', 'bandwidth': '98.79'}, {'queuingDelay': '0.675', 'delay': '142.5', 'bandwidth': '90.75'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.675', 'delay': '142.5', 'bandwidth': '90.75'}, {'queuingDelay': '1.955', 'delay': '12.6', 'bandwidth': '98.79'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.488', 'delay': '8.0', 'bandwidth': '65.09'}, {'queuingDelay': '1.986', 'delay': '188.0', 'bandwidth': '94.21'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.986', 'delay': '188.0', 'bandwidth': '94.21'}, {'queuingDelay': '1.488', 'delay': '8.0', 'bandwidth': '65.09'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.849', 'delay': '29.0', 'bandwidth': '13.43'}, {'queuingDelay': '1.745', 'delay': '194.5', 'bandwidth': '99.15'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.745', 'delay': '194.5', 'bandwidth': '99.15'}, {'queuingDelay': '1.849', 'delay': '29.0', 'bandwidth': '13.43'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.845', 'delay': '58.2', 'bandwidth': '62.86'}, {'queuingDelay': '1.878', 'delay': '189.2', 'bandwidth': '24.70'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.878', 'delay': '189.2', 'bandwidth': '24.70'}, {'queuingDelay': '1.845', 'delay': '58.2', 'bandwidth': '62.86'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.438', 'delay': '11.8', 'bandwidth': '0.89'}, {'queuingDelay': '1.873', 'delay': '89.0', 'bandwidth': '10.25'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.873', 'delay': '89.0', 'bandwidth': '10.25'}, {'queuingDelay': '0.438', 'delay': '11.8', 'bandwidth': '0.89'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.366', 'delay': '5.8', 'bandwidth': '11.55'}, {'queuingDelay': '1.777', 'delay': '17.2', 'bandwidth': '0.96'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.777', 'delay': '17.2', 'bandwidth': '0.96'}, {'queuingDelay': '1.366', 'delay': '5.8', 'bandwidth': '11.55'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.233', 'delay': '62.0', 'bandwidth': '2.83'}, {'queuingDelay': '0.375', 'delay': '13.1', 'bandwidth': '3.64'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.375', 'delay': '13.1', 'bandwidth': '3.64'}, {'queuingDelay': '0.233', 'delay': '62.0', 'bandwidth': '2.83'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.144', 'delay': '15.0', 'bandwidth': '17.10'}, {'queuingDelay': '0.214', 'delay': '21.8', 'bandwidth': '78.52'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.214', 'delay': '21.8', 'bandwidth': '78.52'}, {'queuingDelay': '0.144', 'delay': '15.0', 'bandwidth': '17.10'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.576', 'delay': '27.7', 'bandwidth': '88.42'}, {'queuingDelay': '0.101', 'delay': '16.5', 'bandwidth': '79.24'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.101', 'delay': '16.5', 'bandwidth': '79.24'}, {'queuingDelay': '1.576', 'delay': '27.7', 'bandwidth': '88.42'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.816', 'delay': '10.8', 'bandwidth': '97.19'}, {'queuingDelay': '1.924', 'delay': '10.4', 'bandwidth': '39.16'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.924', 'delay': '10.4', 'bandwidth': '39.16'}, {'queuingDelay': '1.816', 'delay': '10.8', 'bandwidth': '97.19'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.763', 'delay': '12.9', 'bandwidth': '95.13'}, {'queuingDelay': '0.516', 'delay': '199.3', 'bandwidth': '7.86'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.516', 'delay': '199.3', 'bandwidth': '7.86'}, {'queuingDelay': '1.763', 'delay': '12.9', 'bandwidth': '95.13'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.308', 'delay': '62.6', 'bandwidth': '92.06'}, {'queuingDelay': '0.505', 'delay': '198.3', 'bandwidth': '96.06'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.505', 'delay': '198.3', 'bandwidth': '96.06'}, {'queuingDelay': '0.308', 'delay': '62.6', 'bandwidth': '92.06'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.046', 'delay': '90.6', 'bandwidth': '90.57'}, {'queuingDelay': '1.374', 'delay': '169.0', 'bandwidth': '99.72'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.374', 'delay': '169.0', 'bandwidth': '99.72'}, {'queuingDelay': '0.046', 'delay': '90.6', 'bandwidth': '90.57'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.165', 'delay': '192.8', 'bandwidth': '59.93'}, {'queuingDelay': '1.784', 'delay': '71.3', 'bandwidth': '75.47'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.784', 'delay': '71.3', 'bandwidth': '75.47'}, {'queuingDelay': '0.165', 'delay': '192.8', 'bandwidth': '59.93'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.137', 'delay': '183.9', 'bandwidth': '25.73'}, {'queuingDelay': '1.859', 'delay': '199.4', 'bandwidth': '12.85'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.859', 'delay': '199.4', 'bandwidth': '12.85'}, {'queuingDelay': '0.137', 'delay': '183.9', 'bandwidth': '25.73'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.108', 'delay': '185.0', 'bandwidth': '0.86'}, {'queuingDelay': '1.893', 'delay': '192.0', 'bandwidth': '68.30'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.893', 'delay': '192.0', 'bandwidth': '68.30'}, {'queuingDelay': '0.108', 'delay': '185.0', 'bandwidth': '0.86'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.053', 'delay': '193.8', 'bandwidth': '25.53'}, {'queuingDelay': '1.699', 'delay': '149.6', 'bandwidth': '86.49'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.699', 'delay': '149.6', 'bandwidth': '86.49'}, {'queuingDelay': '0.053', 'delay': '193.8', 'bandwidth': '25.53'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.060', 'delay': '199.0', 'bandwidth': '6.04'}, {'queuingDelay': '1.012', 'delay': '197.5', 'bandwidth': '95.21'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.012', 'delay': '197.5', 'bandwidth': '95.21'}, {'queuingDelay': '1.060', 'delay': '199.0', 'bandwidth': '6.04'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.094', 'delay': '199.7', 'bandwidth': '0.57'}, {'queuingDelay': '0.447', 'delay': '5.7', 'bandwidth': '88.00'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.447', 'delay': '5.7', 'bandwidth': '88.00'}, {'queuingDelay': '0.094', 'delay': '199.7', 'bandwidth': '0.57'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.155', 'delay': '44.9', 'bandwidth': '37.37'}, {'queuingDelay': '1.065', 'delay': '7.9', 'bandwidth': '3.30'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.065', 'delay': '7.9', 'bandwidth': '3.30'}, {'queuingDelay': '0.155', 'delay': '44.9', 'bandwidth': '37.37'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '0.245', 'delay': '17.9', 'bandwidth': '1.07'}, {'queuingDelay': '1.979', 'delay': '55.5', 'bandwidth': '1.71'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')], 'paths': [{'queuingDelay': '1.979', 'delay': '55.5', 'bandwidth': '1.71'}, {'queuingDelay': '0.245', 'delay': '17.9', 'bandwidth': '1.07'}]}]
+    mptcpTopos = core.TopoDesignFile(DESIGN_PATH)
 
 
+    journal = core.CampaignJournal(JOURNAL_PATH)
+    resultCache = core.ResultCache(RESULT_CACHE_PATH)
+    timeoutModel = core.TimeoutModel(RUNTIMES_PATH, maxTimeout=core.THREAD_TIMEOUT)
+    resultStore = core.ResultStore(RESULT_STORE_PATH)
+    # If adaptiveReplication, a configuration is not repeated anymore once its completion time converged, and the
+    # campaign stops before times rounds if all did
+    replication = core.AdaptiveReplication(REPLICATION_PATH) if adaptiveReplication else None
     for i in range(times):
-        quicTests(mptcpTopos)
+        quicTests(mptcpTopos, journal=journal, resultCache=resultCache, timeoutModel=timeoutModel, resultStore=resultStore,
+                  replication=replication)
+        if replication is not None and replication.done():
+            break
+    journal.close()
+    resultCache.close()
+    timeoutModel.close()
+    resultStore.close()
+    if replication is not None:
+        for line in replication.report():
+            print(line)
+        replication.close()
 
 launchTests(times=3)
@@ -7,12 +7,27 @@ from core.generate_topo import *
 from core.generate_xp import *
 
 import core.core as core
-import numpy as np
+import core.topo_design as topo_design
 import os
 
 REMOTE_SERVER_RUNNER_HOSTNAME = ["mininet@localhost"]
 REMOTE_SERVER_RUNNER_PORT = ["8022"]
 
+# Remove this file to run the campaign again instead of resuming it; the jobs already run with the same
+# specification, kernel and Minitopo are still linked from RESULT_CACHE_PATH unless it is removed too
+JOURNAL_PATH = os.path.splitext(os.path.basename(__file__))[0] + ".journal"
+# Shared by all the campaign scripts, so that identical experiences (same specification, kernel and Minitopo of the
+# hosts) are only run once
+RESULT_CACHE_PATH = "results.cache"
+# Parsed results of all the campaigns, for the analyses (see core.ResultStore)
+RESULT_STORE_PATH = "results.store"
+# Runtimes of the experiences, from which the timeout of each job is predicted
+RUNTIMES_PATH = "runtimes.model"
+# Topologies of the campaign, stored once for all the scripts sharing them (see core.TopoDesignFile)
+DESIGN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "designs", "lowbdp_loss")
+# Completion times of each configuration, to stop repeating it once it converged (see core.AdaptiveReplication)
+REPLICATION_PATH = os.path.splitext(os.path.basename(__file__))[0] + ".replication"
+
 
 def getPostProcessingList(**kwargs):
     toReturn = []
@@ -40,79 +55,76 @@ def getPostProcessingList(**kwargs):
     return toReturn
 
 
-def quicTests(topos, protocol="mptcp", tmpfs="/mnt/tmpfs"):
-    experienceLauncher = core.ExperienceLauncher(REMOTE_SERVER_RUNNER_HOSTNAME, REMOTE_SERVER_RUNNER_PORT)
-
-    def testsXp(**kwargs):
-        def testsMultipath(**kwargs):
-            def test(**kwargs):
-                xpDict = {
-                    XP_TYPE: kwargs["xp"],
-                    SCHEDULER_CLIENT: "default",
-                    SCHEDULER_SERVER: "default",
-                    CC: "olia" if kwargs["multipath"] == 1 else "cubic",
-                    CLIENT_PCAP: "yes",
-                    SERVER_PCAP: "yes",
-                    HTTPS_FILE: "random",
-                    HTTPS_RANDOM_SIZE: "20000",
-                    QUIC_MULTIPATH: kwargs["multipath"],
-                    RMEM: (10240, 87380, 16777216),
-                }
-                if int(kwargs["multipath"]) == 0:
-                    kwargs["protocol"] = "tcp"
-
-                kwargs["postProcessing"] = getPostProcessingList(**kwargs)
-                core.experiment(experienceLauncher, xpDict, **kwargs)
-
-            core.experimentFor("multipath", [0, 1], test, **kwargs)
-            # core.experimentFor("multipath", [1], test, **kwargs)
-
-        # core.experimentFor("xp", [HTTPS, QUIC], testsMultipath, **kwargs)
-        core.experimentFor("xp", [HTTPS], testsMultipath, **kwargs)
-
-    core.experimentTopos(topos, "https_quic", protocol, tmpfs, testsXp)
+def quicTests(topos, protocol="mptcp", tmpfs="/mnt/tmpfs", journal=None, resultCache=None, timeoutModel=None, resultStore=None,
+              replication=None):
+    experienceLauncher = core.ExperienceLauncher(REMOTE_SERVER_RUNNER_HOSTNAME, REMOTE_SERVER_RUNNER_PORT, journal=journal,
+                                                 resultCache=resultCache, timeoutModel=timeoutModel, resultStore=resultStore,
+                                                 replication=replication)
+
+    def test(**kwargs):
+        xpDict = {
+            XP_TYPE: kwargs["xp"],
+            SCHEDULER_CLIENT: "default",
+            SCHEDULER_SERVER: "default",
+            CC: "olia" if kwargs["multipath"] == 1 else "cubic",
+            CLIENT_PCAP: "yes",
+            SERVER_PCAP: "yes",
+            HTTPS_FILE: "random",
+            HTTPS_RANDOM_SIZE: "20000",
+            QUIC_MULTIPATH: kwargs["multipath"],
+            RMEM: (10240, 87380, 16777216),
+        }
+        if int(kwargs["multipath"]) == 0:
+            kwargs["protocol"] = "tcp"
+
+        kwargs["postProcessing"] = getPostProcessingList(**kwargs)
+        core.experiment(experienceLauncher, xpDict, **kwargs)
+
+    # sweep = core.Sweep(("xp", [HTTPS, QUIC]), ("multipath", [0, 1]))
+    sweep = core.Sweep(("xp", [HTTPS]), ("multipath", [0, 1]))
+    if replication is not None:
+        sweep.skipIf(replication.converged)
+    core.experimentTopos(topos, "https_quic", protocol, tmpfs, sweep.expand(test))
     experienceLauncher.finish()
 
 
-def generateExperimentalDesignRandomTopos(nbMptcpTopos=10, pathsPerTopo=2, bandwidth=(0.1, 100), rtt=(0, 50), queuingDelay=(0.0, 0.1), loss=(0.0, 2.5)):
-    """ Assume only two paths per MPTCP topology, uniform distribution """
-    mptcpTopos = []
-    for nbTopo in range(nbMptcpTopos):
-        mptcpTopo = {PATHS: [], NETEM: []}
-        for nbPath in range(pathsPerTopo):
-            bandwidthPath = "{0:.2f}".format(np.random.uniform(low=bandwidth[0], high=bandwidth[1]))
-            rttPath = "{0:.0f}".format(np.random.uniform(low=rtt[0], high=rtt[1]))
-            delayPath = "{0:.1f}".format(float(rttPath) / 2.0)
-            lossPath = "{0:.2f}".format(np.random.uniform(low=loss[0], high=loss[1]))
-            queuingDelayPath = "{0:.3f}".format(np.random.uniform(low=queuingDelay[0], high=queuingDelay[1]))
-            # tcpTopos.append({PATHS: [{BANDWIDTH: bandwidthPath, DELAY: delayPath}], NETEM: [(0, 0, "loss " + str(lossPath) + "%")]})
-            mptcpTopo[PATHS].append({BANDWIDTH: bandwidthPath, DELAY: delayPath, QUEUING_DELAY: queuingDelayPath})
-            mptcpTopo[NETEM].append((nbPath, 0, "loss " + str(lossPath) + "%"))
-
-        mptcpTopos.append(mptcpTopo)
-        reversedMptcpTopoPaths = mptcpTopo[PATHS][::-1]
-        reversedMptcpTopoNetem = []
-        nbPath = 0
-        for netem in mptcpTopo[NETEM][::-1]:
-            reversedMptcpTopoNetem.append((nbPath, netem[1], netem[2]))
-            nbPath += 1
-
-        reversedMptcpTopo = {PATHS: reversedMptcpTopoPaths, NETEM: reversedMptcpTopoNetem}
-        mptcpTopos.append(reversedMptcpTopo)
-
-    return mptcpTopos
-
-
-def launchTests(times=5):
+def generateExperimentalDesignRandomTopos(nbMptcpTopos=10, pathsPerTopo=2, bandwidth=(0.1, 100), rtt=(0, 50), queuingDelay=(0.0, 0.1), loss=(0.0, 2.5),
+                                           method=topo_design.UNIFORM, seed=None):
+    """ Assume only two paths per MPTCP topology, uniform distribution unless another design method is given (see
+        core.topo_design); each topology is followed by its twin with the paths reversed
+    """
+    return topo_design.designTopos(nbMptcpTopos, pathsPerTopo=pathsPerTopo, bandwidth=bandwidth, rtt=rtt,
+                                   queuingDelay=queuingDelay, loss=loss, method=method, seed=seed)
+
+
+def launchTests(times=5, adaptiveReplication=False):
     """ Notice that the loss must occur at time + 2 sec since the minitopo test waits for 2 seconds between launching the server and the client """
     # mptcpTopos = generateExperimentalDesignRandomTopos(nbMptcpTopos=200)
     # logging = open("topos_lowbdp_with_loss.log", 'w')
     # print(mptcpTopos, file=logging)
     # logging.close()
-    mptcpTopos = [{'netem': [(0, 0, 'loss 1.56%'), (1, 0, 'loss 1.19%')], 'paths': [{'bandwidth': '51.83', 'delay': '10.5', 'queuingDelay': '0.048'}, {'bandwidth': '45.38', 'delay': '13.3', 'queuingDelay': '0.063'}]}, {'netem': [(0, 0, 'loss 1.19%'), (1, 0, 'loss 1.56%')], 'paths': [{'bandwidth': '45.38', 'delay': '13.3', 'queuingDelay': '0.063'}, {'bandwidth': '51.83', 'delay': '10.5', 'queuingDelay': '0.048'}]}, {'netem': [(0, 0, 'loss 1.63%'), (1, 0, 'loss 1.92%')], 'paths': [{'bandwidth': '49.44', 'delay': '20.6', 'queuingDelay': '0.029'}, {'bandwidth': '34.80', 'delay': '22.1', 'queuingDelay': '0.062'}]}, {'netem': [(0, 0, 'loss 1.92%'), (1, 0, 'loss 1.63%')], 'paths': [{'bandwidth': '34.80', 'delay': '22.1', 'queuingDelay': '0.062'}, {'bandwidth': '49.44', 'delay': '20.6', 'queuingDelay': '0.029'}]}, {'netem': [(0, 0, 'loss 2.23%'), (1, 0, 'loss 2.17%')], 'paths': [{'bandwidth': '49.72', 'delay': '23.2', 'queuingDelay': '0.047'}, {'bandwidth': '0.14', 'delay': '13.6', 'queuingDelay': '0.034'}]}, {'netem': [(0, 0, 'loss 2.17%'), (1, 0, 'loss 2.23%')], 'paths': [{'bandwidth': '0.14', 'delay': '13.6', 'queuingDelay': '0.034'}, {'bandwidth': '49.72', 'delay': '23.2', 'queuingDelay': '0.047'}]}, {'netem': [(0, 0, 'loss 2.37%'), (1, 0, 'loss 1.25%')], 'paths': [{'bandwidth': '84.79', 'delay': '17.4', 'queuingDelay': '0.061'}, {'bandwidth': '5.93', 'delay': '6.5', 'queuingDelay': '0.028'}]}, {'netem': [(0, 0, 'loss 1.25%'), (1, 0, 'loss 2.37%')], 'paths': [{'bandwidth': '5.93', 'delay': '6.5', 'queuingDelay': '0.028'}, {'bandwidth': '84.79', 'delay': '17.4', 'queuingDelay': '0.061'}]}, {'netem': [(0, 0, 'loss 2.27%'), (1, 0, 'loss 0.84%')], 'paths': [{'bandwidth': '89.55', 'delay': '19.4', 'queuingDelay': '0.056'}, {'bandwidth': '40.86', 'delay': '3.1', 'queuingDelay': '0.077'}]}, {'netem': [(0, 0, 'loss 0.84%'), (1, 0, 'loss 2.27%')], 'paths': [{'bandwidth': '40.86', 'delay': '3.1', 'queuingDelay': '0.077'}, {'bandwidth': '89.55', 'delay': '19.4', 'queuingDelay': '0.056'}]}, {'netem': [(0, 0, 'loss 1.58%'), (1, 0, 'loss 0.80%')], 'paths': [{'bandwidth': '89.13', 'delay': '11.6', 'queuingDelay': '0.024'}, {'bandwidth': '8.97', 'delay': '4.3', 'queuingDelay': '0.099'}]}, {'netem': [(0, 0, 'loss 0.80%'), (1, 0, 'loss 1.58%')], 'paths': [{'bandwidth': '8.97', 'delay': '4.3', 'queuingDelay': '0.099'}, {'bandwidth': '89.13', 'delay': '11.6', 'queuingDelay': '0.024'}]}, {'netem': [(0, 0, 'loss 1.21%'), (1, 0, 'loss 2.02%')], 'paths': [{'bandwidth': '84.62', 'delay': '10.7', 'queuingDelay': '0.007'}, {'bandwidth': '32.00', 'delay': '7.6', 'queuingDelay': '0.074'}]}, {'netem': [(0, 0, 'loss 2.02%'), (1, 0, 'loss 1.21%')], 'paths': [{'bandwidth': '32.00', 'delay': '7.6', 'queuingDelay': '0.074'}, {'bandwidth': '84.62', 'delay': '10.7', 'queuingDelay': '0.007'}]}, {'netem': [(0, 0, 'loss 1.80%'), (1, 0, 'loss 1.15%')], 'paths': [{'bandwidth': '93.83', 'delay': '4.2', 'queuingDelay': '0.025'}, {'bandwidth': '64.68', 'delay': '8.5', 'queuingDelay': '0.091'}]}, {'netem': [(0, 0, 'loss 1.15%'), (1, 0, 'loss 1.80%')], 'paths': [{'bandwidth': '64.68', 'delay': '8.5', 'queuingDelay': '0.091'}, {'bandwidth': '93.83', 'delay': '4.2', 'queuingDelay': '0.025'}]}, {'netem': [(0, 0, 'loss 1.15%'), (1, 0, 'loss 0.67%')], 'paths': [{'bandwidth': '56.25', 'delay': '12.1', 'queuingDelay': '0.014'}, {'bandwidth': '74.61', 'delay': '2.7', 'queuingDelay': '0.086'}]}, {'netem': [(0, 0, 'loss 0.67%'), (1, 0, 'loss 1.15%')], 'paths': [{'bandwidth': '74.61', 'delay': '2.7', 'queuingDelay': '0.086'}, {'bandwidth': '56.25', 'delay': '12.1', 'queuingDelay': '0.014'}]}, {'netem': [(0, 0, 'loss 0.59%'), (1, 0, 'loss 0.61%')], 'paths': [{'bandwidth': '65.62', 'delay': '15.2', 'queuingDelay': '0.025'}, {'bandwidth': '48.51', 'delay': '0.0', 'queuingDelay': '0.035'}]}, {'netem': [(0, 0, 'loss 0.61%'), (1, 0, 'loss 0.59%')], 'paths': [{'bandwidth': '48.51', 'delay': '0.0', 'queuingDelay': '0.035'}, {'bandwidth': '65.62', 'delay': '15.2', 'queuingDelay': '0.025'}]}, {'netem': [(0, 0, 'loss 1.05%'), (1, 0, 'loss 1.41%')], 'paths': [{'bandwidth': '73.50', 'delay': '16.9', 'queuingDelay': '0.074'}, {'bandwidth': '53.33', 'delay': '2.5', 'queuingDelay': '0.020'}]}, {'netem': [(0, 0, 'loss 1.41%'), (1, 0, 'loss 1.05%')], 'paths': [{'bandwidth': '53.33', 'delay': '2.5', 'queuingDelay': '0.020'}, {'bandwidth': '73.50', 'delay': '16.9', 'queuingDelay': '0.074'}]}, {'netem': [(0, 0, 'loss 0.90%'), (1, 0, 'loss 1.59%')], 'paths': [{'bandwidth': '69.58', 'delay': '16.3', 'queuingDelay': '0.076'}, {'bandwidth': '73.61', 'delay': '17.4', 'queuingDelay': '0.007'}]}, {'netem': [(0, 0, 'loss 1.59%'), (1, 0, 'loss 0.90%')], 'paths': [{'bandwidth': '73.61', 'delay': '17.4', 'queuingDelay': '0.007'}, {'bandwidth': '69.58', 'delay': '16.3', 'queuingDelay': '0.076'}]}, {'netem': [(0, 0, 'loss 0.20%'), (1, 0, 'loss 1.60%')], 'paths': [{'bandwidth': '73.90', 'delay': '9.0', 'queuingDelay': '0.027'}, {'bandwidth': '83.14', 'delay': '15.4', 'queuingDelay': '0.005'}]}, {'netem': [(0, 0, 'loss 1.60%'), (1, 0, 'loss 0.20%')], 'paths': [{'bandwidth': '83.14', 'delay': '15.4', 'queuingDelay': '0.005'}, {'bandwidth': '73.90', 'delay': '9.0', 'queuingDelay': '0.027'}]}, {'netem': [(0, 0, 'loss 0.29%'), (1, 0, 'loss 2.34%')], 'paths': [{'bandwidth': '83.42', 'delay': '4.5', 'queuingDelay': '0.046'}, {'bandwidth': '64.52', 'delay': '23.8', 'queuingDelay': '0.038'}]}, {'netem': [(0, 0, 'loss 2.34%'), (1, 0, 'loss 0.29%')], 'paths': [{'bandwidth': '64.52', 'delay': '23.8', 'queuingDelay': '0.038'}, {'bandwidth': '83.42', 'delay': '4.5', 'queuingDelay': '0.046'}]}, {'netem': [(0, 0, 'loss 0.46%'), (1, 0, 'loss 2.14%')], 'paths': [{'bandwidth': '97.55', 'delay': '8.0', 'queuingDelay': '0.055'}, {'bandwidth': '33.23', 'delay': '17.7', 'queuingDelay': '0.084'}]}, {'netem': [(0, 0, 'loss 2.14%'), (1, 0, 'loss 0.46%')], 'paths': [{'bandwidth': '33.23', 'delay': '17.7', 'queuingDelay': '0.084'}, {'bandwidth': '97.55', 'delay': '8.0', 'queuingDelay': '0.055'}]}, {'netem': [(0, 0, 'loss 0.39%'), (1, 0, 'loss 1.32%')], 'paths': [{'bandwidth': '53.39', 'delay': '0.5', 'queuingDelay': '0.065'}, {'bandwidth': '28.30', 'delay': '16.2', 'queuingDelay': '0.073'}]}, {'netem': [(0, 0, 'loss 1.32%'), (1, 0, 'loss 0.39%')], 'paths': [{'bandwidth': '28.30', 'delay': '16.2', 'queuingDelay': '0.073'}, {'bandwidth': '53.39', 'delay': '0.5', 'queuingDelay': '0.065'}]}, {'netem': [(0, 0, 'loss 0.57%'), (1, 0, 'loss 0.54%')], 'paths': [{'bandwidth': '15.46', 'delay': '2.9', 'queuingDelay': '0.068'}, {'bandwidth': '31.74', 'delay': '6.0', 'queuingDelay': '0.074'}]}, {'netem': [(0, 0, 'loss 0.54%'), (1, 0, 'loss 0.57%')], 'paths': [{'bandwidth': '31.74', 'delay': '6.0', 'queuingDelay': '0.074'}, {'bandwidth': '15.46', 'delay': '2.9', 'queuingDelay': '0.068'}]}, {'netem': [(0, 0, 'loss 0.07%'), (1, 0, 'loss 0.96%')], 'paths': [{'bandwidth': '31.10', 'delay': '3.7', 'queuingDelay': '0.098'}, {'bandwidth': '74.41', 'delay': '1.6', 'queuingDelay': '0.057'}]}, {'netem': [(0, 0, 'loss 0.96%'), (1, 0, 'loss 0.07%')], 'paths': [{'bandwidth': '74.41', 'delay': '1.6', 'queuingDelay': '0.057'}, {'bandwidth': '31.10', 'delay': '3.7', 'queuingDelay': '0.098'}]}, {'netem': [(0, 0, 'loss 0.60%'), (1, 0, 'loss 1.68%')], 'paths': [{'bandwidth': '82.30', 'delay': '6.0', 'queuingDelay': '0.096'}, {'bandwidth': '60.23', 'delay': '3.3', 'queuingDelay': '0.057'}]}, {'netem': [(0, 0, 'loss 1.68%'), (1, 0, 'loss 0.60%')], 'paths': [{'bandwidth': '60.23', 'delay': '3.3', 'queuingDelay': '0.057'}, {'bandwidth': '82.30', 'delay': '6.0', 'queuingDelay': '0.096'}]}, {'netem': [(0, 0, 'loss 0.37%'), (1, 0, 'loss 2.45%')], 'paths': [{'bandwidth': '63.20', 'delay': '3.1', 'queuingDelay': '0.094'}, {'bandwidth': '29.43', 'delay': '4.4', 'queuingDelay': '0.099'}]}, {'netem': [(0, 0, 'loss 2.45%'), (1, 0, 'loss 0.37%')], 'paths': [{'bandwidth': '29.43', 'delay': '4.4', 'queuingDelay': '0.099'}, {'bandwidth': '63.20', 'delay': '3.1', 'queuingDelay': '0.094'}]}, {'netem': [(0, 0, 'loss 1.01%'), (1, 0, 'loss 2.22%')], 'paths': [{'bandwidth': '24.83', 'delay': '0.6', 'queuingDelay': '0.076'}, {'bandwidth': '67.70', 'delay': '6.3', 'queuingDelay': '0.091'}]}, {'netem': [(0, 0, 'loss 2.22%'), (1, 0, 'loss 1.01%')], 'paths': [{'bandwidth': '67.70', 'delay': '6.3', 'queuingDelay': '0.091'}, {'bandwidth': '24.83', 'delay': '0.6', 'queuingDelay': '0.076'}]}, {'netem': [(0, 0, 'loss 0.32%'), (1, 0, 'loss 2.31%')], 'paths': [{'bandwidth': '11.49', 'delay': '5.5', 'queuingDelay': '0.092'}, {'bandwidth': '38.20', 'delay': '14.8', 'queuingDelay': '0.066'}]}, {'netem': [(0, 0, 'loss 2.31%'), (1, 0, 'loss 0.32%')], 'paths': [{'bandwidth': '38.20', 'delay': '14.8', 'queuingDelay': '0.066'}, {'bandwidth': '11.49', 'delay': '5.5', 'queuingDelay': '0.092'}]}, {'netem': [(0, 0, 'loss 0.05%'), (1, 0, 'loss 1.97%')], 'paths': [{'bandwidth': '17.79', 'delay': '12.7', 'queuingDelay': '0.096'}, {'bandwidth': '15.10', 'delay': '5.3', 'queuingDelay': '0.100'}]}, {'netem': [(0, 0, 'loss 1.97%'), (1, 0, 'loss 0.05%')], 'paths': [{'bandwidth': '15.10', 'delay': '5.3', 'queuingDelay': '0.100'}, {'bandwidth': '17.79', 'delay': '12.7', 'queuingDelay': '0.096'}]}, {'netem': [(0, 0, 'loss 0.13%'), (1, 0, 'loss 1.55%')], 'paths': [{'bandwidth': '50.51', 'delay': '16.5', 'queuingDelay': '0.064'}, {'bandwidth': '32.70', 'delay': '10.7', 'queuingDelay': '0.070'}]}, {'netem': [(0, 0, 'loss 1.55%'), (1, 0, 'loss 0.13%')], 'paths': [{'bandwidth': '32.70', 'delay': '10.7', 'queuingDelay': '0.070'}, {'bandwidth': '50.51', 'delay': '16.5', 'queuingDelay': '0.064'}]}, {'netem': [(0, 0, 'loss 0.14%'), (1, 0, 'loss 1.51%')], 'paths': [{'bandwidth': '26.29', 'delay': '9.8', 'queuingDelay': '0.049'}, {'bandwidth': '16.35', 'delay': '7.8', 'queuingDelay': '0.022'}]}, {'netem': [(0, 0, 'loss 1.51%'), (1, 0, 'loss 0.14%')], 'paths': [{'bandwidth': '16.35', 'delay': '7.8', 'queuingDelay': '0.022'}, {'bandwidth': '26.29', 'delay': '9.8', 'queuingDelay': '0.049'}]}, {'netem': [(0, 0, 'loss 0.72%'), (1, 0, 'loss 0.60%')], 'paths': [{'bandwidth': '12.28', 'delay': '11.1', 'queuingDelay': '0.010'}, {'bandwidth': '29.29', 'delay': '5.2', 'queuingDelay': '0.005'}]}, {'netem': [(0, 0, 'loss 0.60%'), (1, 0, 'loss 0.72%')], 'paths': [{'bandwidth': '29.29', 'delay': '5.2', 'queuingDelay': '0.005'}, {'bandwidth': '12.28', 'delay': '11.1', 'queuingDelay': '0.010'}]}, {'netem': [(0, 0, 'loss 1.51%'), (1, 0, 'loss 0.65%')], 'paths': [{'bandwidth': '33.61', 'delay': '23.0', 'queuingDelay': '0.002'}, {'bandwidth': '36.49', 'delay': '6.3', 'queuingDelay': '0.024'}]}, {'netem': [(0, 0, 'loss 0.65%'), (1, 0, 'loss 1.51%')], 'paths': [{'bandwidth': '36.49', 'delay': '6.3', 'queuingDelay': '0.024'}, {'bandwidth': '33.61', 'delay': '23.0', 'queuingDelay': '0.002'}]}, {'netem': [(0, 0, 'loss 1.50%'), (1, 0, 'loss 0.08%')], 'paths': [{'bandwidth': '73.12', 'delay': '24.0', 'queuingDelay': '0.019'}, {'bandwidth': '74.20', 'delay': '8.2', 'queuingDelay': '0.044'}]}, {'netem': [(0, 0, 'loss 0.08%'), (1, 0, 'loss 1.50%')], 'paths': [{'bandwidth': '74.20', 'delay': '8.2', 'queuingDelay': '0.044'}, {'bandwidth': '73.12', 'delay': '24.0', 'queuingDelay': '0.019'}]}, {'netem': [(0, 0, 'loss 1.06%'), (1, 0, 'loss 0.13%')], 'paths': [{'bandwidth': '90.57', 'delay': '20.3', 'queuingDelay': '0.014'}, {'bandwidth': '48.20', 'delay': '17.9', 'queuingDelay': '0.009'}]}, {'netem': [(0, 0, 'loss 0.13%'), (1, 0, 'loss 1.06%')], 'paths': [{'bandwidth': '48.20', 'delay': '17.9', 'queuingDelay': '0.009'}, {'bandwidth': '90.57', 'delay': '20.3', 'queuingDelay': '0.014'}]}, {'netem': [(0, 0, 'loss 0.28%'), (1, 0, 'loss 0.91%')], 'paths': [{'bandwidth': '84.09', 'delay': '24.1', 'queuingDelay': '0.017'}, {'bandwidth': '52.96', 'delay': '17.3', 'queuingDelay': '0.054'}]}, {'netem': [(0, 0, 'loss 0.91%'), (1, 0, 'loss 0.28%')], 'paths': [{'bandwidth': '52.96', 'delay': '17.3', 'queuingDelay': '0.054'}, {'bandwidth': '84.09', 'delay': '24.1', 'queuingDelay': '0.017'}]}, {'netem': [(0, 0, 'loss 0.88%'), (1, 0, 'loss 0.39%')], 'paths': [{'bandwidth': '84.71', 'delay': '16.5', 'queuingDelay': '0.011'}, {'bandwidth': '5.90', 'delay': '15.8', 'queuingDelay': '0.057'}]}, {'netem': [(0, 0, 'loss 0.39%'), (1, 0, 'loss 0.88%')], 'paths': [{'bandwidth': '5.90', 'delay': '15.8', 'queuingDelay': '0.057'}, {'bandwidth': '84.71', 'delay': '16.5', 'queuingDelay': '0.011'}]}, {'netem': [(0, 0, 'loss 2.00%'), (1, 0, 'loss 0.29%')], 'paths': [{'bandwidth': '61.57', 'delay': '20.5', 'queuingDelay': '0.026'}, {'bandwidth': '16.32', 'delay': '14.1', 'queuingDelay': '0.090'}]}, {'netem': [(0, 0, 'loss 0.29%'), (1, 0, 'loss 2.00%')], 'paths': [{'bandwidth': '16.32', 'delay': '14.1', 'queuingDelay': '0.090'}, {'bandwidth': '61.57', 'delay': '20.5', 'queuingDelay': '0.026'}]}, {'netem': [(0, 0, 'loss 1.20%'), (1, 0, 'loss 0.05%')], 'paths': [{'bandwidth': '64.40', 'delay': '24.0', 'queuingDelay': '0.069'}, {'bandwidth': '23.40', 'delay': '12.8', 'queuingDelay': '0.059'}]}, {'netem': [(0, 0, 'loss 0.05%'), (1, 0, 'loss 1.20%')], 'paths': [{'bandwidth': '23.40', 'delay': '12.8', 'queuingDelay': '0.059'}, {'bandwidth': '64.40', 'delay': '24.0', 'queuingDelay': '0.069'}]}, {'netem': [(0, 0, 'loss 1.96%'), (1, 0, 'loss 0.64%')], 'paths': [{'bandwidth': '43.22', 'delay': '19.0', 'queuingDelay': '0.100'}, {'bandwidth': '39.63', 'delay': '16.6', 'queuingDelay': '0.038'}]}, {'netem': [(0, 0, 'loss 0.64%'), (1, 0, 'loss 1.96%')], 'paths': [{'bandwidth': '39.63', 'delay': '16.6', 'queuingDelay': '0.038'}, {'bandwidth': '43.22', 'delay': '19.0', 'queuingDelay': '0.100'}]}, {'netem': [(0, 0, 'loss 1.91%'), (1, 0, 'loss 1.33%')], 'paths': [{'bandwidth': '5.68', 'delay': '18.8', 'queuingDelay': '0.099'}, {'bandwidth': '80.48', 'delay': '21.3', 'queuingDelay': '0.032'}]}, {'netem': [(0, 0, 'loss 1.33%'), (1, 0, 'loss 1.91%')], 'paths': [{'bandwidth': '80.48', 'delay': '21.3', 'queuingDelay': '0.032'}, {'bandwidth': '5.68', 'delay': '18.8', 'queuingDelay': '0.099'}]}, {'netem': [(0, 0, 'loss 2.00%'), (1, 0, 'loss 0.17%')], 'paths': [{'bandwidth': '12.88', 'delay': '19.1', 'queuingDelay': '0.090'}, {'bandwidth': '70.95', 'delay': '24.4', 'queuingDelay': '0.073'}]}, {'netem': [(0, 0, 'loss 0.17%'), (1, 0, 'loss 2.00%')], 'paths': [{'bandwidth': '70.95', 'delay': '24.4', 'queuingDelay': '0.073'}, {'bandwidth': '12.88', 'delay': '19.1', 'queuingDelay': '0.090'}]}, {'netem': [(0, 0, 'loss 1.44%'), (1, 0, 'loss 0.42%')], 'paths': [{'bandwidth': '16.08', 'delay': '6.5', 'queuingDelay': '0.085'}, {'bandwidth': '50.44', 'delay': '18.4', 'queuingDelay': '0.060'}]}, {'netem': [(0, 0, 'loss 0.42%'), (1, 0, 'loss 1.44%')], 'paths': [{'bandwidth': '50.44', 'delay': '18.4', 'queuingDelay': '0.060'}, {'bandwidth': '16.08', 'delay': '6.5', 'queuingDelay': '0.085'}]}, {'netem': [(0, 0, 'loss 2.28%'), (1, 0, 'loss 0.45%')], 'paths': [{'bandwidth': '6.51', 'delay': '9.8', 'queuingDelay': '0.057'}, {'bandwidth': '22.26', 'delay': '17.5', 'queuingDelay': '0.095'}]}, {'netem': [(0, 0, 'loss 0.45%'), (1, 0, 'loss 2.28%')], 'paths': [{'bandwidth': '22.26', 'delay': '17.5', 'queuingDelay': '0.095'}, {'bandwidth': '6.51', 'delay': '9.8', 'queuingDelay': '0.057'}]}, {'netem': [(0, 0, 'loss 2.23%'), (1, 0, 'loss 0.67%')], 'paths': [{'bandwidth': '37.50', 'delay': '8.9', 'queuingDelay': '0.089'}, {'bandwidth': '16.16', 'delay': '6.5', 'queuingDelay': '0.084'}]}, {'netem': [(0, 0, 'loss 0.67%'), (1, 0, 'loss 2.23%')], 'paths': [{'bandwidth': '16.16', 'delay': '6.5', 'queuingDelay': '0.084'}, {'bandwidth': '37.50', 'delay': '8.9', 'queuingDelay': '0.089'}]}, {'netem': [(0, 0, 'loss 2.20%'), (1, 0, 'loss 2.01%')], 'paths': [{'bandwidth': '47.35', 'delay': '6.6', 'queuingDelay': '0.058'}, {'bandwidth': '8.28', 'delay': '5.7', 'queuingDelay': '0.092'}]}, {'netem': [(0, 0, 'loss 2.01%'), (1, 0, 'loss 2.20%')], 'paths': [{'bandwidth': '8.28', 'delay': '5.7', 'queuingDelay': '0.092'}, {'bandwidth': '47.35', 'delay': '6.6', 'queuingDelay': '0.058'}]}, {'netem': [(0, 0, 'loss 1.74%'), (1, 0, 'loss 2.09%')], 'paths': [{'bandwidth': '25.02', 'delay': '13.3', 'queuingDelay': '0.074'}, {'bandwidth': '16.70', 'delay': '0.8', 'queuingDelay': '0.047'}]}, {'netem': [(0, 0, 'loss 2.09%'), (1, 0, 'loss 1.74%')], 'paths': [{'bandwidth': '16.70', 'delay': '0.8', 'queuingDelay': '0.047'}, {'bandwidth': '25.02', 'delay': '13.3', 'queuingDelay': '0.074'}]}, {'netem': [(0, 0, 'loss 1.58%'), (1, 0, 'loss 1.38%')], 'paths': [{'bandwidth': '13.10', 'delay': '0.7', 'queuingDelay': '0.063'}, {'bandwidth': '25.02', 'delay': '3.2', 'queuingDelay': '0.026'}]}, {'netem': [(0, 0, 'loss 1.38%'), (1, 0, 'loss 1.58%')], 'paths': [{'bandwidth': '25.02', 'delay': '3.2', 'queuingDelay': '0.026'}, {'bandwidth': '13.10', 'delay': '0.7', 'queuingDelay': '0.063'}]}, {'netem': [(0, 0, 'loss 2.00%'), (1, 0, 'loss 1.38%')], 'paths': [{'bandwidth': '10.07', 'delay': '6.1', 'queuingDelay': '0.018'}, {'bandwidth': '24.40', 'delay': '12.5', 'queuingDelay': '0.035'}]}, {'netem': [(0, 0, 'loss 1.38%'), (1, 0, 'loss 2.00%')], 'paths': [{'bandwidth': '24.40', 'delay': '12.5', 'queuingDelay': '0.035'}, {'bandwidth': '10.07', 'delay': '6.1', 'queuingDelay': '0.018'}]}, {'netem': [(0, 0, 'loss 2.08%'), (1, 0, 'loss 2.01%')], 'paths': [{'bandwidth': '15.50', 'delay': '0.2', 'queuingDelay': '0.024'}, {'bandwidth': '60.60', 'delay': '21.7', 'queuingDelay': '0.053'}]}, {'netem': [(0, 0, 'loss 2.01%'), (1, 0, 'loss 2.08%')], 'paths': [{'bandwidth': '60.60', 'delay': '21.7', 'queuingDelay': '0.053'}, {'bandwidth': '15.50', 'delay': '0.2', 'queuingDelay': '0.024'}]}, {'netem': [(0, 0, 'loss 1.87%'), (1, 0, 'loss 1.98%')], 'paths': [{'bandwidth': '34.51', 'delay': '5.5', 'queuingDelay': '0.075'}, {'bandwidth': '74.38', 'delay': '22.5', 'queuingDelay': '0.029'}]}, {'netem': [(0, 0, 'loss 1.98%'), (1, 0, 'loss 1.87%')], 'paths': [{'bandwidth': '74.38', 'delay': '22.5', 'queuingDelay': '0.029'}, {'bandwidth': '34.51', 'delay': '5.5', 'queuingDelay': '0.075'}]}, {'netem': [(0, 0, 'loss 1.69%'), (1, 0, 'loss 1.83%')], 'paths': [{'bandwidth': '3.53', 'delay': '2.2', 'queuingDelay': '0.088'}, {'bandwidth': '21.47', 'delay': '23.7', 'queuingDelay': '0.030'}]}, {'netem': [(0, 0, 'loss 1.83%'), (1, 0, 'loss 1.69%')], 'paths': [{'bandwidth': '21.47', 'delay': '23.7', 'queuingDelay': '0.030'}, {'bandwidth': '3.53', 'delay': '2.2', 'queuingDelay': '0.088'}]}, {'netem': [(0, 0, 'loss 1.92%'), (1, 0, 'loss 1.34%')], 'paths': [{'bandwidth': '12.65', 'delay': '10.2', 'queuingDelay': '0.089'}, {'bandwidth': '1.05', 'delay': '13.0', 'queuingDelay': '0.008'}]}, {'netem': [(0, 0, 'loss 1.34%'), (1, 0, 'loss 1.92%')], 'paths': [{'bandwidth': '1.05', 'delay': '13.0', 'queuingDelay': '0.008'}, {'bandwidth': '12.65', 'delay': '10.2', 'queuingDelay': '0.089'}]}, {'netem': [(0, 0, 'loss 1.63%'), (1, 0, 'loss 1.91%')], 'paths': [{'bandwidth': '59.26', 'delay': '15.8', 'queuingDelay': '0.089'}, {'bandwidth': '18.49', 'delay': '19.5', 'queuingDelay': '0.012'}]}, {'netem': [(0, 0, 'loss 1.91%'), (1, 0, 'loss 1.63%')], 'paths': [{'bandwidth': '18.49', 'delay': '19.5', 'queuingDelay': '0.012'}, {'bandwidth': '59.26', 'delay': '15.8', 'queuingDelay': '0.089'}]}, {'netem': [(0, 0, 'loss 1.36%'), (1, 0, 'loss 2.33%')], 'paths': [{'bandwidth': '49.33', 'delay': '1.9', 'queuingDelay': '0.067'}, {'bandwidth': '5.47', 'delay': '17.8', 'queuingDelay': '0.008'}]}, {'netem': [(0, 0, 'loss 2.33%'), (1, 0, 'loss 1.36%')], 'paths': [{'bandwidth': '5.47', 'delay': '17.8', 'queuingDelay': '0.008'}, {'bandwidth': '49.33', 'delay': '1.9', 'queuingDelay': '0.067'}]}, {'netem': [(0, 0, 'loss 1.90%'), (1, 0, 'loss 1.69%')], 'paths': [{'bandwidth': '73.96', 'delay': '5.6', 'queuingDelay': '0.043'}, {'bandwidth': '42.62', 'delay': '21.8', 'queuingDelay': '0.000'}]}, {'netem': [(0, 0, 'loss 1.69%'), (1, 0, 'loss 1.90%')], 'paths': [{'bandwidth': '42.62', 'delay': '21.8', 'queuingDelay': '0.000'}, {'bandwidth': '73.96', 'delay': '5.6', 'queuingDelay': '0.043'}]}, {'netem': [(0, 0, 'loss 2.20%'), (1, 0, 'loss 0.87%')], 'paths': [{'bandwidth': '71.93', 'delay': '0.9', 'queuingDelay': '0.010'}, {'bandwidth': '5.35', 'delay': '18.6', 'queuingDelay': '0.004'}]}, {'netem': [(0, 0, 'loss 0.87%'), (1, 0, 'loss 2.20%')], 'paths': [{'bandwidth': '5.35', 'delay': '18.6', 'queuingDelay': '0.004'}, {'bandwidth': '71.93', 'delay': '0.9', 'queuingDelay': '0.010'}]}, {'netem': [(0, 0, 'loss 1.29%'), (1, 0, 'loss 0.10%')], 'paths': [{'bandwidth': '97.06', 'delay': '5.5', 'queuingDelay': '0.023'}, {'bandwidth': '28.74', 'delay': '22.5', 'queuingDelay': '0.008'}]}, {'netem': [(0, 0, 'loss 0.10%'), (1, 0, 'loss 1.29%')], 'paths': [{'bandwidth': '28.74', 'delay': '22.5', 'queuingDelay': '0.008'}, {'bandwidth': '97.06', 'delay': '5.5', 'queuingDelay': '0.023'}]}, {'netem': [(0, 0, 'loss 1.06%'), (1, 0, 'loss 0.45%')], 'paths': [{'bandwidth': '79.58', 'delay': '4.3', 'queuingDelay': '0.076'}, {'bandwidth': '3.54', 'delay': '24.9', 'queuingDelay': '0.015'}]}, {'netem': [(0, 0, 'loss 0.45%'), (1, 0, 'loss 1.06%')], 'paths': [{'bandwidth': '3.54', 'delay': '24.9', 'queuingDelay': '0.015'}, {'bandwidth': '79.58', 'delay': '4.3', 'queuingDelay': '0.076'}]}, {'netem': [(0, 0, 'loss 0.86%'), (1, 0, 'loss 1.27%')], 'paths': [{'bandwidth': '96.76', 'delay': '13.0', 'queuingDelay': '0.050'}, {'bandwidth': '21.45', 'delay': '19.2', 'queuingDelay': '0.027'}]}, {'netem': [(0, 0, 'loss 1.27%'), (1, 0, 'loss 0.86%')], 'paths': [{'bandwidth': '21.45', 'delay': '19.2', 'queuingDelay': '0.027'}, {'bandwidth': '96.76', 'delay': '13.0', 'queuingDelay': '0.050'}]}, {'netem': [(0, 0, 'loss 0.46%'), (1, 0, 'loss 1.75%')], 'paths': [{'bandwidth': '80.71', 'delay': '5.8', 'queuingDelay': '0.088'}, {'bandwidth': '5.10', 'delay': '12.0', 'queuingDelay': '0.034'}]}, {'netem': [(0, 0, 'loss 1.75%'), (1, 0, 'loss 0.46%')], 'paths': [{'bandwidth': '5.10', 'delay': '12.0', 'queuingDelay': '0.034'}, {'bandwidth': '80.71', 'delay': '5.8', 'queuingDelay': '0.088'}]}, {'netem': [(0, 0, 'loss 1.70%'), (1, 0, 'loss 2.21%')], 'paths': [{'bandwidth': '84.84', 'delay': '11.9', 'queuingDelay': '0.093'}, {'bandwidth': '4.62', 'delay': '7.3', 'queuingDelay': '0.055'}]}, {'netem': [(0, 0, 'loss 2.21%'), (1, 0, 'loss 1.70%')], 'paths': [{'bandwidth': '4.62', 'delay': '7.3', 'queuingDelay': '0.055'}, {'bandwidth': '84.84', 'delay': '11.9', 'queuingDelay': '0.093'}]}, {'netem': [(0, 0, 'loss 2.19%'), (1, 0, 'loss 1.67%')], 'paths': [{'bandwidth': '76.51', 'delay': '2.3', 'queuingDelay': '0.082'}, {'bandwidth': '18.83', 'delay': '8.5', 'queuingDelay': '0.016'}]}, {'netem': [(0, 0, 'loss 1.67%'), (1, 0, 'loss 2.19%')], 'paths': [{'bandwidth': '18.83', 'delay': '8.5', 'queuingDelay': '0.016'}, {'bandwidth': '76.51', 'delay': '2.3', 'queuingDelay': '0.082'}]}, {'netem': [(0, 0, 'loss 2.44%'), (1, 0, 'loss 1.93%')], 'paths': [{'bandwidth': '97.20', 'delay': '0.4', 'queuingDelay': '0.025'}, {'bandwidth': '27.80', 'delay': '5.7', 'queuingDelay': '0.003'}]}, {'netem': [(0, 0, 'loss 1.93%'), (1, 0, 'loss 2.44%')], 'paths': [{'bandwidth': '27.80', 'delay': '5.7', 'queuingDelay': '0.003'}, {'bandwidth': '97.20', 'delay': '0.4', 'queuingDelay': '0.025'}]}, {'netem': [(0, 0, 'loss 1.97%'), (1, 0, 'loss 0.86%')], 'paths': [{'bandwidth': '68.25', 'delay': '5.6', 'queuingDelay': '0.019'}, {'bandwidth': '55.98', 'delay': '2.3', 'queuingDelay': '0.008'}]}, {'netem': [(0, 0, 'loss 0.86%'), (1, 0, 'loss 1.97%')], 'paths': [{'bandwidth': '55.98', 'delay': '2.3', 'queuingDelay': '0.008'}, {'bandwidth': '68.25', 'delay': '5.6', 'queuingDelay': '0.019'}]}, {'netem': [(0, 0, 'loss 2.36%'), (1, 0, 'loss 0.32%')], 'paths': [{'bandwidth': '32.69', 'delay': '7.9', 'queuingDelay': '0.009'}, {'bandwidth': '15.29', 'delay': '2.2', 'queuingDelay': '0.029'}]}, {'netem': [(0, 0, 'loss 0.32%'), (1, 0, 'loss 2.36%')], 'paths': [{'bandwidth': '15.29', 'delay': '2.2', 'queuingDelay': '0.029'}, {'bandwidth': '32.69', 'delay': '7.9', 'queuingDelay': '0.009'}]}, {'netem': [(0, 0, 'loss 2.38%'), (1, 0, 'loss 0.26%')], 'paths': [{'bandwidth': '41.36', 'delay': '10.3', 'queuingDelay': '0.064'}, {'bandwidth': '39.94', 'delay': '6.7', 'queuingDelay': '0.017'}]}, {'netem': [(0, 0, 'loss 0.26%'), (1, 0, 'loss 2.38%')], 'paths': [{'bandwidth': '39.94', 'delay': '6.7', 'queuingDelay': '0.017'}, {'bandwidth': '41.36', 'delay': '10.3', 'queuingDelay': '0.064'}]}, {'netem': [(0, 0, 'loss 1.13%'), (1, 0, 'loss 0.02%')], 'paths': [{'bandwidth': '51.82', 'delay': '9.5', 'queuingDelay': '0.091'}, {'bandwidth': '63.85', 'delay': '3.2', 'queuingDelay': '0.012'}]}, {'netem': [(0, 0, 'loss 0.02%'), (1, 0, 'loss 1.13%')], 'paths': [{'bandwidth': '63.85', 'delay': '3.2', 'queuingDelay': '0.012'}, {'bandwidth': '51.82', 'delay': '9.5', 'queuingDelay': '0.091'}]}, {'netem': [(0, 0, 'loss 0.52%'), (1, 0, 'loss 0.50%')], 'paths': [{'bandwidth': '43.99', 'delay': '5.6', 'queuingDelay': '0.045'}, {'bandwidth': '92.00', 'delay': '3.7', 'queuingDelay': '0.018'}]}, {'netem': [(0, 0, 'loss 0.50%'), (1, 0, 'loss 0.52%')], 'paths': [{'bandwidth': '92.00', 'delay': '3.7', 'queuingDelay': '0.018'}, {'bandwidth': '43.99', 'delay': '5.6', 'queuingDelay': '0.045'}]}, {'netem': [(0, 0, 'loss 1.94%'), (1, 0, 'loss 0.60%')], 'paths': [{'bandwidth': '23.87', 'delay': '9.6', 'queuingDelay': '0.060'}, {'bandwidth': '98.88', 'delay': '2.8', 'queuingDelay': '0.009'}]}, {'netem': [(0, 0, 'loss 0.60%'), (1, 0, 'loss 1.94%')], 'paths': [{'bandwidth': '98.88', 'delay': '2.8', 'queuingDelay': '0.009'}, {'bandwidth': '23.87', 'delay': '9.6', 'queuingDelay': '0.060'}]}, {'netem': [(0, 0, 'loss 2.18%'), (1, 0, 'loss 0.41%')], 'paths': [{'bandwidth': '27.19', 'delay': '11.2', 'queuingDelay': '0.028'}, {'bandwidth': '93.86', 'delay': '16.3', 'queuingDelay': '0.005'}]}, {'netem': [(0, 0, 'loss 0.41%'), (1, 0, 'loss 2.18%')], 'paths': [{'bandwidth': '93.86', 'delay': '16.3', 'queuingDelay': '0.005'}, {'bandwidth': '27.19', 'delay': '11.2', 'queuingDelay': '0.028'}]}, {'netem': [(0, 0, 'loss 1.24%'), (1, 0, 'loss 0.66%')], 'paths': [{'bandwidth': '12.33', 'delay': '8.6', 'queuingDelay': '0.038'}, {'bandwidth': '86.04', 'delay': '22.5', 'queuingDelay': '0.046'}]}, {'netem': [(0, 0, 'loss 0.66%'), (1, 0, 'loss 1.24%')], 'paths': [{'bandwidth': '86.04', 'delay': '22.5', 'queuingDelay': '0.046'}, {'bandwidth': '12.33', 'delay': '8.6', 'queuingDelay': '0.038'}]}, {'netem': [(0, 0, 'loss 1.13%'), (1, 0, 'loss 1.36%')], 'paths': [{'bandwidth': '5.66', 'delay': '19.5', 'queuingDelay': '0.048'}, {'bandwidth': '87.70', 'delay': '18.0', 'queuingDelay': '0.078'}]}, {'netem': [(0, 0, 'loss 1.36%'), (1, 0, 'loss 1.13%')], 'paths': [{'bandwidth': '87.70', 'delay': '18.0', 'queuingDelay': '0.078'}, {'bandwidth': '5.66', 'delay': '19.5', 'queuingDelay': '0.048'}]}, {'netem': [(0, 0, 'loss 1.07%'), (1, 0, 'loss 2.39%')], 'paths': [{'bandwidth': '30.16', 'delay': '20.9', 'queuingDelay': '0.038'}, {'bandwidth': '97.12', 'delay': '8.8', 'queuingDelay': '0.059'}]}, {'netem': [(0, 0, 'loss 2.39%'), (1, 0, 'loss 1.07%')], 'paths': [{'bandwidth': '97.12', 'delay': '8.8', 'queuingDelay': '0.059'}, {'bandwidth': '30.16', 'delay': '20.9', 'queuingDelay': '0.038'}]}, {'netem': [(0, 0, 'loss 0.09%'), (1, 0, 'loss 2.02%')], 'paths': [{'bandwidth': '4.69', 'delay': '24.0', 'queuingDelay': '0.015'}, {'bandwidth': '85.06', 'delay': '15.7', 'queuingDelay': '0.045'}]}, {'netem': [(0, 0, 'loss 2.02%'), (1, 0, 'loss 0.09%')], 'paths': [{'bandwidth': '85.06', 'delay': '15.7', 'queuingDelay': '0.045'}, {'bandwidth': '4.69', 'delay': '24.0', 'queuingDelay': '0.015'}]}, {'netem': [(0, 0, 'loss 0.30%'), (1, 0, 'loss 1.34%')], 'paths': [{'bandwidth': '18.34', 'delay': '21.0', 'queuingDelay': '0.041'}, {'bandwidth': '72.69', 'delay': '6.2', 'queuingDelay': '0.017'}]}, {'netem': [(0, 0, 'loss 1.34%'), (1, 0, 'loss 0.30%')], 'paths': [{'bandwidth': '72.69', 'delay': '6.2', 'queuingDelay': '0.017'}, {'bandwidth': '18.34', 'delay': '21.0', 'queuingDelay': '0.041'}]}, {'netem': [(0, 0, 'loss 0.07%'), (1, 0, 'loss 0.86%')], 'paths': [{'bandwidth': '20.14', 'delay': '24.4', 'queuingDelay': '0.033'}, {'bandwidth': '57.34', 'delay': '20.6', 'queuingDelay': '0.017'}]}, {'netem': [(0, 0, 'loss 0.86%'), (1, 0, 'loss 0.07%')], 'paths': [{'bandwidth': '57.34', 'delay': '20.6', 'queuingDelay': '0.017'}, {'bandwidth': '20.14', 'delay': '24.4', 'queuingDelay': '0.033'}]}, {'netem': [(0, 0, 'loss 0.65%'), (1, 0, 'loss 0.82%')], 'paths': [{'bandwidth': '14.93', 'delay': '20.8', 'queuingDelay': '0.058'}, {'bandwidth': '13.46', 'delay': '15.9', 'queuingDelay': '0.041'}]}, {'netem': [(0, 0, 'loss 0.82%'), (1, 0, 'loss 0.65%')], 'paths': [{'bandwidth': '13.46', 'delay': '15.9', 'queuingDelay': '0.041'}, {'bandwidth': '14.93', 'delay': '20.8', 'queuingDelay': '0.058'}]}, {'netem': [(0, 0, 'loss 0.19%'), (1, 0, 'loss 0.34%')], 'paths': [{'bandwidth': '8.41', 'delay': '16.6', 'queuingDelay': '0.068'}, {'bandwidth': '47.79', 'delay': '19.6', 'queuingDelay': '0.082'}]}, {'netem': [(0, 0, 'loss 0.34%'), (1, 0, 'loss 0.19%')], 'paths': [{'bandwidth': '47.79', 'delay': '19.6', 'queuingDelay': '0.082'}, {'bandwidth': '8.41', 'delay': '16.6', 'queuingDelay': '0.068'}]}, {'netem': [(0, 0, 'loss 0.09%'), (1, 0, 'loss 0.03%')], 'paths': [{'bandwidth': '59.59', 'delay': '16.7', 'queuingDelay': '0.091'}, {'bandwidth': '57.76', 'delay': '13.9', 'queuingDelay': '0.099'}]}, {'netem': [(0, 0, 'loss 0.03%'), (1, 0, 'loss 0.09%')], 'paths': [{'bandwidth': '57.76', 'delay': '13.9', 'queuingDelay': '0.099'}, {'bandwidth': '59.59', 'delay': '16.7', 'queuingDelay': '0.091'}]}, {'netem': [(0, 0, 'loss 0.43%'), (1, 0, 'loss 0.82%')], 'paths': [{'bandwidth': '99.78', 'delay': '18.9', 'queuingDelay': '0.082'}, {'bandwidth': '70.86', 'delay': '9.1', 'queuingDelay': '0.071'}]}, {'netem': [(0, 0, 'loss 0.82%'), (1, 0, 'loss 0.43%')], 'paths': [{'bandwidth': '70.86', 'delay': '9.1', 'queuingDelay': '0.071'}, {'bandwidth': '99.78', 'delay': '18.9', 'queuingDelay': '0.082'}]}, {'netem': [(0, 0, 'loss 0.90%'), (1, 0, 'loss 0.47%')], 'paths': [{'bandwidth': '65.72', 'delay': '12.0', 'queuingDelay': '0.084'}, {'bandwidth': '68.58', 'delay': '0.7', 'queuingDelay': '0.097'}]}, {'netem': [(0, 0, 'loss 0.47%'), (1, 0, 'loss 0.90%')], 'paths': [{'bandwidth': '68.58', 'delay': '0.7', 'queuingDelay': '0.097'}, {'bandwidth': '65.72', 'delay': '12.0', 'queuingDelay': '0.084'}]}, {'netem': [(0, 0, 'loss 1.54%'), (1, 0, 'loss 0.15%')], 'paths': [{'bandwidth': '65.00', 'delay': '8.4', 'queuingDelay': '0.083'}, {'bandwidth': '84.89', 'delay': '11.4', 'queuingDelay': '0.064'}]}, {'netem': [(0, 0, 'loss 0.15%'), (1, 0, 'loss 1.54%')], 'paths': [{'bandwidth': '84.89', 'delay': '11.4', 'queuingDelay': '0.064'}, {'bandwidth': '65.00', 'delay': '8.4', 'queuingDelay': '0.083'}]}, {'netem': [(0, 0, 'loss 2.28%'), (1, 0, 'loss 0.26%')], 'paths': [{'bandwidth': '88.66', 'delay': '12.4', 'queuingDelay': '0.047'}, {'bandwidth': '67.67', 'delay': '13.1', 'queuingDelay': '0.034'}]}, {'netem': [(0, 0, 'loss 0.26%'), (1, 0, 'loss 2.28%')], 'paths': [{'bandwidth': '67.67', 'delay': '13.1', 'queuingDelay': '0.034'}, {'bandwidth': '88.66', 'delay': '12.4', 'queuingDelay': '0.047'}]}, {'netem': [(0, 0, 'loss 2.08%'), (1, 0, 'loss 1.48%')], 'paths': [{'bandwidth': '87.10', 'delay': '17.0', 'queuingDelay': '0.028'}, {'bandwidth': '84.81', 'delay': '16.0', 'queuingDelay': '0.004'}]}, {'netem': [(0, 0, 'loss 1.48%'), (1, 0, 'loss 2.08%')], 'paths': [{'bandwidth': '84.81', 'delay': '16.0', 'queuingDelay': '0.004'}, {'bandwidth': '87.10', 'delay': '17.0', 'queuingDelay': '0.028'}]}, {'netem': [(0, 0, 'loss 2.46%'), (1, 0, 'loss 2.12%')], 'paths': [{'bandwidth': '44.06', 'delay': '16.3', 'queuingDelay': '0.053'}, {'bandwidth': '86.69', 'delay': '8.6', 'queuingDelay': '0.004'}]}, {'netem': [(0, 0, 'loss 2.12%'), (1, 0, 'loss 2.46%')], 'paths': [{'bandwidth': '86.69', 'delay': '8.6', 'queuingDelay': '0.004'}, {'bandwidth': '44.06', 'delay': '16.3', 'queuingDelay': '0.053'}]}, {'netem': [(0, 0, 'loss 1.89%'), (1, 0, 'loss 2.35%')], 'paths': [{'bandwidth': '48.72', 'delay': '4.3', 'queuingDelay': '0.021'}, {'bandwidth': '87.11', 'delay': '10.4', 'queuingDelay': '0.020'}]}, {'netem': [(0, 0, 'loss 2.35%'), (1, 0, 'loss 1.89%')], 'paths': [{'bandwidth': '87.11', 'delay': '10.4', 'queuingDelay': '0.020'}, {'bandwidth': '48.72', 'delay': '4.3', 'queuingDelay': '0.021'}]}, {'netem': [(0, 0, 'loss 2.50%'), (1, 0, 'loss 1.79%')], 'paths': [{'bandwidth': '13.65', 'delay': '3.8', 'queuingDelay': '0.044'}, {'bandwidth': '97.37', 'delay': '10.7', 'queuingDelay': '0.055'}]}, {'netem': [(0, 0, 'loss 1.79%'), (1, 0, 'loss 2.50%')], 'paths': [{'bandwidth': '97.37', 'delay': '10.7', 'queuingDelay': '0.055'}, {'bandwidth': '13.65', 'delay': '3.8', 'queuingDelay': '0.044'}]}, {'netem': [(0, 0, 'loss 2.46%'), (1, 0, 'loss 2.39%')], 'paths': [{'bandwidth': '5.17', 'delay': '6.6', 'queuingDelay': '0.077'}, {'bandwidth': '62.44', 'delay': '15.3', 'queuingDelay': '0.085'}]}, {'netem': [(0, 0, 'loss 2.39%'), (1, 0, 'loss 2.46%')], 'paths': [{'bandwidth': '62.44', 'delay': '15.3', 'queuingDelay': '0.085'}, {'bandwidth': '5.17', 'delay': '6.6', 'queuingDelay': '0.077'}]}, {'netem': [(0, 0, 'loss 2.28%'), (1, 0, 'loss 2.31%')], 'paths': [{'bandwidth': '59.19', 'delay': '7.3', 'queuingDelay': '0.095'}, {'bandwidth': '91.86', 'delay': '15.1', 'queuingDelay': '0.096'}]}, {'netem': [(0, 0, 'loss 2.31%'), (1, 0, 'loss 2.28%')], 'paths': [{'bandwidth': '91.86', 'delay': '15.1', 'queuingDelay': '0.096'}, {'bandwidth': '59.19', 'delay': '7.3', 'queuingDelay': '0.095'}]}, {'netem': [(0, 0, 'loss 1.36%'), (1, 0, 'loss 1.27%')], 'paths': [{'bandwidth': '88.62', 'delay': '6.4', 'queuingDelay': '0.092'}, {'bandwidth': '84.05', 'delay': '18.6', 'queuingDelay': '0.098'}]}, {'netem': [(0, 0, 'loss 1.27%'), (1, 0, 'loss 1.36%')], 'paths': [{'bandwidth': '84.05', 'delay': '18.6', 'queuingDelay': '0.098'}, {'bandwidth': '88.62', 'delay': '6.4', 'queuingDelay': '0.092'}]}, {'netem': [(0, 0, 'loss 1.07%'), (1, 0, 'loss 2.21%')], 'paths': [{'bandwidth': '63.63', 'delay': '13.4', 'queuingDelay': '0.075'}, {'bandwidth': '81.17', 'delay': '24.7', 'queuingDelay': '0.078'}]}, {'netem': [(0, 0, 'loss 2.21%'), (1, 0, 'loss 1.07%')], 'paths': [{'bandwidth': '81.17', 'delay': '24.7', 'queuingDelay': '0.078'}, {'bandwidth': '63.63', 'delay': '13.4', 'queuingDelay': '0.075'}]}, {'netem': [(0, 0, 'loss 1.24%'), (1, 0, 'loss 0.85%')], 'paths': [{'bandwidth': '72.05', 'delay': '20.0', 'queuingDelay': '0.080'}, {'bandwidth': '83.99', 'delay': '23.5', 'queuingDelay': '0.057'}]}, {'netem': [(0, 0, 'loss 0.85%'), (1, 0, 'loss 1.24%')], 'paths': [{'bandwidth': '83.99', 'delay': '23.5', 'queuingDelay': '0.057'}, {'bandwidth': '72.05', 'delay': '20.0', 'queuingDelay': '0.080'}]}, {'netem': [(0, 0, 'loss 1.60%'), (1, 0, 'loss 0.49%')], 'paths': [{'bandwidth': '50.93', 'delay': '20.1', 'queuingDelay': '0.033'}, {'bandwidth': '88.13', 'delay': '22.6', 'queuingDelay': '0.091'}]}, {'netem': [(0, 0, 'loss 0.49%'), (1, 0, 'loss 1.60%')], 'paths': [{'bandwidth': '88.13', 'delay': '22.6', 'queuingDelay': '0.091'}, {'bandwidth': '50.93', 'delay': '20.1', 'queuingDelay': '0.033'}]}, {'netem': [(0, 0, 'loss 2.48%'), (1, 0, 'loss 0.62%')], 'paths': [{'bandwidth': '80.95', 'delay': '14.8', 'queuingDelay': '0.006'}, {'bandwidth': '72.36', 'delay': '22.3', 'queuingDelay': '0.066'}]}, {'netem': [(0, 0, 'loss 0.62%'), (1, 0, 'loss 2.48%')], 'paths': [{'bandwidth': '72.36', 'delay': '22.3', 'queuingDelay': '0.066'}, {'bandwidth': '80.95', 'delay': '14.8', 'queuingDelay': '0.006'}]}, {'netem': [(0, 0, 'loss 1.86%'), (1, 0, 'loss 1.38%')], 'paths': [{'bandwidth': '96.77', 'delay': '4.3', 'queuingDelay': '0.001'}, {'bandwidth': '46.01', 'delay': '22.5', 'queuingDelay': '0.067'}]}, {'netem': [(0, 0, 'loss 1.38%'), (1, 0, 'loss 1.86%')], 'paths': [{'bandwidth': '46.01', 'delay': '22.5', 'queuingDelay': '0.067'}, {'bandwidth': '96.77', 'delay': '4.3', 'queuingDelay': '0.001'}]}, {'netem': [(0, 0, 'loss 2.14%'), (1, 0, 'loss 1.70%')], 'paths': [{'bandwidth': '67.98', 'delay': '3.8', 'queuingDelay': '0.034'}, {'bandwidth': '91.60', 'delay': '21.8', 'queuingDelay': '0.064'}]}, {'netem': [(0, 0, 'loss 1.70%'), (1, 0, 'loss 2.14%')], 'paths': [{'bandwidth': '91.60', 'delay': '21.8', 'queuingDelay': '0.064'}, {'bandwidth': '67.98', 'delay': '3.8', 'queuingDelay': '0.034'}]}, {'netem': [(0, 0, 'loss 2.00%'), (1, 0, 'loss 1.77%')], 'paths': [{'bandwidth': '73.91', 'delay': '15.6', 'queuingDelay': '0.007'}, {'bandwidth': '93.66', 'delay': '12.4', 'queuingDelay': '0.074'}]}, {'netem': [(0, 0, 'loss 1.77%'), (1, 0, 'loss 2.00%')], 'paths': [{'bandwidth': '93.66', 'delay': '12.4', 'queuingDelay': '0.074'}, {'bandwidth': '73.91', 'delay': '15.6', 'queuingDelay': '0.007'}]}, {'netem': [(0, 0, 'loss 2.34%'), (1, 0, 'loss 0.92%')], 'paths': [{'bandwidth': '73.22', 'delay': '22.3', 'queuingDelay': '0.011'}, {'bandwidth': '81.44', 'delay': '2.3', 'queuingDelay': '0.094'}]}, {'netem': [(0, 0, 'loss 0.92%'), (1, 0, 'loss 2.34%')], 'paths': [{'bandwidth': '81.44', 'delay': '2.3', 'queuingDelay': '0.094'}, {'bandwidth': '73.22', 'delay': '22.3', 'queuingDelay': '0.011'}]}, {'netem': [(0, 0, 'loss 1.79%'), (1, 0, 'loss 0.47%')], 'paths': [{'bandwidth': '23.51', 'delay': '23.2', 'queuingDelay': '0.035'}, {'bandwidth': '93.04', 'delay': '7.8', 'queuingDelay': '0.087'}]}, {'netem': [(0, 0, 'loss 0.47%'), (1, 0, 'loss 1.79%')], 'paths': [{'bandwidth': '93.04', 'delay': '7.8', 'queuingDelay': '0.087'}, {'bandwidth': '23.51', 'delay': '23.2', 'queuingDelay': '0.035'}]}, {'netem': [(0, 0, 'loss 1.99%'), (1, 0, 'loss 1.82%')], 'paths': [{'bandwidth': '16.82', 'delay': '23.6', 'queuingDelay': '0.055'}, {'bandwidth': '76.86', 'delay': '3.0', 'queuingDelay': '0.100'}]}, {'netem': [(0, 0, 'loss 1.82%'), (1, 0, 'loss 1.99%')], 'paths': [{'bandwidth': '76.86', 'delay': '3.0', 'queuingDelay': '0.100'}, {'bandwidth': '16.82', 'delay': '23.6', 'queuingDelay': '0.055'}]}, {'netem': [(0, 0, 'loss 2.49%'), (1, 0, 'loss 2.11%')], 'paths': [{'bandwidth': '66.78', 'delay': '21.8', 'queuingDelay': '0.085'}, {'bandwidth': '62.12', 'delay': '2.7', 'queuingDelay': '0.095'}]}, {'netem': [(0, 0, 'loss 2.11%'), (1, 0, 'loss 2.49%')], 'paths': [{'bandwidth': '62.12', 'delay': '2.7', 'queuingDelay': '0.095'}, {'bandwidth': '66.78', 'delay': '21.8', 'queuingDelay': '0.085'}]}, {'netem': [(0, 0, 'loss 2.15%'), (1, 0, 'loss 2.27%')], 'paths': [{'bandwidth': '85.40', 'delay': '23.9', 'queuingDelay': '0.089'}, {'bandwidth': '51.07', 'delay': '14.2', 'queuingDelay': '0.056'}]}, {'netem': [(0, 0, 'loss 2.27%'), (1, 0, 'loss 2.15%')], 'paths': [{'bandwidth': '51.07', 'delay': '14.2', 'queuingDelay': '0.056'}, {'bandwidth': '85.40', 'delay': '23.9', 'queuingDelay': '0.089'}]}, {'netem': [(0, 0, 'loss 1.79%'), (1, 0, 'loss 1.93%')], 'paths': [{'bandwidth': '43.04', 'delay': '24.5', 'queuingDelay': '0.088'}, {'bandwidth': '95.03', 'delay': '14.7', 'queuingDelay': '0.069'}]}, {'netem': [(0, 0, 'loss 1.93%'), (1, 0, 'loss 1.79%')], 'paths': [{'bandwidth': '95.03', 'delay': '14.7', 'queuingDelay': '0.069'}, {'bandwidth': '43.04', 'delay': '24.5', 'queuingDelay': '0.088'}]}, {'netem': [(0, 0, 'loss 2.11%'), (1, 0, 'loss 0.91%')], 'paths': [{'bandwidth': '37.60', 'delay': '18.7', 'queuingDelay': '0.088'}, {'bandwidth': '76.76', 'delay': '4.6', 'queuingDelay': '0.064'}]}, {'netem': [(0, 0, 'loss 0.91%'), (1, 0, 'loss 2.11%')], 'paths': [{'bandwidth': '76.76', 'delay': '4.6', 'queuingDelay': '0.064'}, {'bandwidth': '37.60', 'delay': '18.7', 'queuingDelay': '0.088'}]}, {'netem': [(0, 0, 'loss 2.05%'), (1, 0, 'loss 0.41%')], 'paths': [{'bandwidth': '19.43', 'delay': '6.9', 'queuingDelay': '0.079'}, {'bandwidth': '87.03', 'delay': '3.9', 'queuingDelay': '0.099'}]}, {'netem': [(0, 0, 'loss 0.41%'), (1, 0, 'loss 2.05%')], 'paths': [{'bandwidth': '87.03', 'delay': '3.9', 'queuingDelay': '0.099'}, {'bandwidth': '19.43', 'delay': '6.9', 'queuingDelay': '0.079'}]}, {'netem': [(0, 0, 'loss 1.33%'), (1, 0, 'loss 0.75%')], 'paths': [{'bandwidth': '25.50', 'delay': '0.5', 'queuingDelay': '0.040'}, {'bandwidth': '78.37', 'delay': '12.6', 'queuingDelay': '0.092'}]}, {'netem': [(0, 0, 'loss 0.75%'), (1, 0, 'loss 1.33%')], 'paths': [{'bandwidth': '78.37', 'delay': '12.6', 'queuingDelay': '0.092'}, {'bandwidth': '25.50', 'delay': '0.5', 'queuingDelay': '0.040'}]}, {'netem': [(0, 0, 'loss 1.45%'), (1, 0, 'loss 1.59%')], 'paths': [{'bandwidth': '23.17', 'delay': '0.8', 'queuingDelay': '0.006'}, {'bandwidth': '53.80', 'delay': '3.6', 'queuingDelay': '0.088'}]}, {'netem': [(0, 0, 'loss 1.59%'), (1, 0, 'loss 1.45%')], 'paths': [{'bandwidth': '53.80', 'delay': '3.6', 'queuingDelay': '0.088'}, {'bandwidth': '23.17', 'delay': '0.8', 'queuingDelay': '0.006'}]}, {'netem': [(0, 0, 'loss 0.71%'), (1, 0, 'loss 2.35%')], 'paths': [{'bandwidth': '18.22', 'delay': '9.3', 'queuingDelay': '0.011'}, {'bandwidth': '67.83', 'delay': '1.3', 'queuingDelay': '0.056'}]}, {'netem': [(0, 0, 'loss 2.35%'), (1, 0, 'loss 0.71%')], 'paths': [{'bandwidth': '67.83', 'delay': '1.3', 'queuingDelay': '0.056'}, {'bandwidth': '18.22', 'delay': '9.3', 'queuingDelay': '0.011'}]}, {'netem': [(0, 0, 'loss 1.74%'), (1, 0, 'loss 2.05%')], 'paths': [{'bandwidth': '30.96', 'delay': '18.4', 'queuingDelay': '0.017'}, {'bandwidth': '41.14', 'delay': '0.8', 'queuingDelay': '0.043'}]}, {'netem': [(0, 0, 'loss 2.05%'), (1, 0, 'loss 1.74%')], 'paths': [{'bandwidth': '41.14', 'delay': '0.8', 'queuingDelay': '0.043'}, {'bandwidth': '30.96', 'delay': '18.4', 'queuingDelay': '0.017'}]}, {'netem': [(0, 0, 'loss 0.61%'), (1, 0, 'loss 2.14%')], 'paths': [{'bandwidth': '1.12', 'delay': '19.6', 'queuingDelay': '0.013'}, {'bandwidth': '13.32', 'delay': '3.0', 'queuingDelay': '0.063'}]}, {'netem': [(0, 0, 'loss 2.14%'), (1, 0, 'loss 0.61%')], 'paths': [{'bandwidth': '13.32', 'delay': '3.0', 'queuingDelay': '0.063'}, {'bandwidth': '1.12', 'delay': '19.6', 'queuingDelay': '0.013'}]}, {'netem': [(0, 0, 'loss 0.84%'), (1, 0, 'loss 1.14%')], 'paths': [{'bandwidth': '21.44', 'delay': '23.2', 'queuingDelay': '0.009'}, {'bandwidth': '30.85', 'delay': '12.7', 'queuingDelay': '0.074'}]}, {'netem': [(0, 0, 'loss 1.14%'), (1, 0, 'loss 0.84%')], 'paths': [{'bandwidth': '30.85', 'delay': '12.7', 'queuingDelay': '0.074'}, {'bandwidth': '21.44', 'delay': '23.2', 'queuingDelay': '0.009'}]}, {'netem': [(0, 0, 'loss 0.12%'), (1, 0, 'loss 0.39%')], 'paths': [{'bandwidth': '18.94', 'delay': '15.1', 'queuingDelay': '0.028'}, {'bandwidth': '55.33', 'delay': '6.7', 'queuingDelay': '0.077'}]}, {'netem': [(0, 0, 'loss 0.39%'), (1, 0, 'loss 0.12%')], 'paths': [{'bandwidth': '55.33', 'delay': '6.7', 'queuingDelay': '0.077'}, {'bandwidth': '18.94', 'delay': '15.1', 'queuingDelay': '0.028'}]}, {'netem': [(0, 0, 'loss 0.40%'), (1, 0, 'loss 0.02%')], 'paths': [{'bandwidth': '2.67', 'delay': '19.3', 'queuingDelay': '0.081'}, {'bandwidth': '76.89', 'delay': '5.6', 'queuingDelay': '0.070'}]}, {'netem': [(0, 0, 'loss 0.02%'), (1, 0, 'loss 0.40%')], 'paths': [{'bandwidth': '76.89', 'delay': '5.6', 'queuingDelay': '0.070'}, {'bandwidth': '2.67', 'delay': '19.3', 'queuingDelay': '0.081'}]}, {'netem': [(0, 0, 'loss 0.05%'), (1, 0, 'loss 0.50%')], 'paths': [{'bandwidth': '2.33', 'delay': '23.5', 'queuingDelay': '0.072'}, {'bandwidth': '20.79', 'delay': '6.2', 'queuingDelay': '0.083'}]}, {'netem': [(0, 0, 'loss 0.50%'), (1, 0, 'loss 0.05%')], 'paths': [{'bandwidth': '20.79', 'delay': '6.2', 'queuingDelay': '0.083'}, {'bandwidth': '2.33', 'delay': '23.5', 'queuingDelay': '0.072'}]}, {'netem': [(0, 0, 'loss 1.53%'), (1, 0, 'loss 0.09%')], 'paths': [{'bandwidth': '6.23', 'delay': '24.0', 'queuingDelay': '0.093'}, {'bandwidth': '17.74', 'delay': '4.1', 'queuingDelay': '0.089'}]}, {'netem': [(0, 0, 'loss 0.09%'), (1, 0, 'loss 1.53%')], 'paths': [{'bandwidth': '17.74', 'delay': '4.1', 'queuingDelay': '0.089'}, {'bandwidth': '6.23', 'delay': '24.0', 'queuingDelay': '0.093'}]}, {'netem': [(0, 0, 'loss 2.26%'), (1, 0, 'loss 0.13%')], 'paths': [{'bandwidth': '4.90', 'delay': '21.2', 'queuingDelay': '0.083'}, {'bandwidth': '1.43', 'delay': '9.6', 'queuingDelay': '0.034'}]}, {'netem': [(0, 0, 'loss 0.13%'), (1, 0, 'loss 2.26%')], 'paths': [{'bandwidth': '1.43', 'delay': '9.6', 'queuingDelay': '0.034'}, {'bandwidth': '4.90', 'delay': '21.2', 'queuingDelay': '0.083'}]}, {'netem': [(0, 0, 'loss 2.19%'), (1, 0, 'loss 1.54%')], 'paths': [{'bandwidth': '18.90', 'delay': '24.7', 'queuingDelay': '0.082'}, {'bandwidth': '0.43', 'delay': '5.3', 'queuingDelay': '0.011'}]}, {'netem': [(0, 0, 'loss 1.54%'), (1, 0, 'loss 2.19%')], 'paths': [{'bandwidth': '0.43', 'delay': '5.3', 'queuingDelay': '0.011'}, {'bandwidth': '18.90', 'delay': '24.7', 'queuingDelay': '0.082'}]}, {'netem': [(0, 0, 'loss 0.76%'), (1, 0, 'loss 1.57%')], 'paths': [{'bandwidth': '37.36', 'delay': '21.3', 'queuingDelay': '0.098'}, {'bandwidth': '16.46', 'delay': '6.9', 'queuingDelay': '0.000'}]}, {'netem': [(0, 0, 'loss 1.57%'), (1, 0, 'loss 0.76%')], 'paths': [{'bandwidth': '16.46', 'delay': '6.9', 'queuingDelay': '0.000'}, {'bandwidth': '37.36', 'delay': '21.3', 'queuingDelay': '0.098'}]}, {'netem': [(0, 0, 'loss 0.52%'), (1, 0, 'loss 2.33%')], 'paths': [{'bandwidth': '6.42', 'delay': '22.0', 'queuingDelay': '0.098'}, {'bandwidth': '13.06', 'delay': '13.8', 'queuingDelay': '0.039'}]}, {'netem': [(0, 0, 'loss 2.33%'), (1, 0, 'loss 0.52%')], 'paths': [{'bandwidth': '13.06', 'delay': '13.8', 'queuingDelay': '0.039'}, {'bandwidth': '6.42', 'delay': '22.0', 'queuingDelay': '0.098'}]}, {'netem': [(0, 0, 'loss 0.92%'), (1, 0, 'loss 2.21%')], 'paths': [{'bandwidth': '0.63', 'delay': '17.9', 'queuingDelay': '0.078'}, {'bandwidth': '20.59', 'delay': '21.7', 'queuingDelay': '0.086'}]}, {'netem': [(0, 0, 'loss 2.21%'), (1, 0, 'loss 0.92%')], 'paths': [{'bandwidth': '20.59', 'delay': '21.7', 'queuingDelay': '0.086'}, {'bandwidth': '0.63', 'delay': '17.9', 'queuingDelay': '0.078'}]}, {'netem': [(0, 0, 'loss 0.89%'), (1, 0, 'loss 1.39%')], 'paths': [{'bandwidth': '27.13', 'delay': '20.8', 'queuingDelay': '0.099'}, {'bandwidth': '53.57', 'delay': '14.8', 'queuingDelay': '0.094'}]}, {'netem': [(0, 0, 'loss 1.39%'), (1, 0, 'loss 0.89%')], 'paths': [{'bandwidth': '53.57', 'delay': '14.8', 'queuingDelay': '0.094'}, {'bandwidth': '27.13', 'delay': '20.8', 'queuingDelay': '0.099'}]}, {'netem': [(0, 0, 'loss 0.41%'), (1, 0, 'loss 1.48%')], 'paths': [{'bandwidth': '2.65', 'delay': '12.0', 'queuingDelay': '0.089'}, {'bandwidth': '97.49', 'delay': '12.5', 'queuingDelay': '0.098'}]}, {'netem': [(0, 0, 'loss 1.48%'), (1, 0, 'loss 0.41%')], 'paths': [{'bandwidth': '97.49', 'delay': '12.5', 'queuingDelay': '0.098'}, {'bandwidth': '2.65', 'delay': '12.0', 'queuingDelay': '0.089'}]}, {'netem': [(0, 0, 'loss 0.21%'), (1, 0, 'loss 1.14%')], 'paths': [{'bandwidth': '54.40', 'delay': '8.5', 'queuingDelay': '0.058'}, {'bandwidth': '88.10', 'delay': '13.7', 'queuingDelay': '0.085'}]}, {'netem': [(0, 0, 'loss 1.14%'), (1, 0, 'loss 0.21%')], 'paths': [{'bandwidth': '88.10', 'delay': '13.7', 'queuingDelay': '0.085'}, {'bandwidth': '54.40', 'delay': '8.5', 'queuingDelay': '0.058'}]}, {'netem': [(0, 0, 'loss 0.38%'), (1, 0, 'loss 1.51%')], 'paths': [{'bandwidth': '44.67', 'delay': '9.6', 'queuingDelay': '0.006'}, {'bandwidth': '55.49', 'delay': '14.9', 'queuingDelay': '0.091'}]}, {'netem': [(0, 0, 'loss 1.51%'), (1, 0, 'loss 0.38%')], 'paths': [{'bandwidth': '55.49', 'delay': '14.9', 'queuingDelay': '0.091'}, {'bandwidth': '44.67', 'delay': '9.6', 'queuingDelay': '0.006'}]}, {'netem': [(0, 0, 'loss 1.29%'), (1, 0, 'loss 1.92%')], 'paths': [{'bandwidth': '17.75', 'delay': '9.6', 'queuingDelay': '0.012'}, {'bandwidth': '33.90', 'delay': '24.5', 'queuingDelay': '0.090'}]}, {'netem': [(0, 0, 'loss 1.92%'), (1, 0, 'loss 1.29%')], 'paths': [{'bandwidth': '33.90', 'delay': '24.5', 'queuingDelay': '0.090'}, {'bandwidth': '17.75', 'delay': '9.6', 'queuingDelay': '0.012'}]}, {'netem': [(0, 0, 'loss 0.41%'), (1, 0, 'loss 1.58%')], 'paths': [{'bandwidth': '3.49', 'delay': '11.7', 'queuingDelay': '0.028'}, {'bandwidth': '41.25', 'delay': '19.1', 'queuingDelay': '0.048'}]}, {'netem': [(0, 0, 'loss 1.58%'), (1, 0, 'loss 0.41%')], 'paths': [{'bandwidth': '41.25', 'delay': '19.1', 'queuingDelay': '0.048'}, {'bandwidth': '3.49', 'delay': '11.7', 'queuingDelay': '0.028'}]}, {'netem': [(0, 0, 'loss 0.21%'), (1, 0, 'loss 2.09%')], 'paths': [{'bandwidth': '0.93', 'delay': '2.5', 'queuingDelay': '0.040'}, {'bandwidth': '87.23', 'delay': '20.8', 'queuingDelay': '0.035'}]}, {'netem': [(0, 0, 'loss 2.09%'), (1, 0, 'loss 0.21%')], 'paths': [{'bandwidth': '87.23', 'delay': '20.8', 'queuingDelay': '0.035'}, {'bandwidth': '0.93', 'delay': '2.5', 'queuingDelay': '0.040'}]}, {'netem': [(0, 0, 'loss 0.61%'), (1, 0, 'loss 2.01%')], 'paths': [{'bandwidth': '11.78', 'delay': '7.2', 'queuingDelay': '0.022'}, {'bandwidth': '94.16', 'delay': '22.6', 'queuingDelay': '0.091'}]}, {'netem': [(0, 0, 'loss 2.01%'), (1, 0, 'loss 0.61%')], 'paths': [{'bandwidth': '94.16', 'delay': '22.6', 'queuingDelay': '0.091'}, {'bandwidth': '11.78', 'delay': '7.2', 'queuingDelay': '0.022'}]}, {'netem': [(0, 0, 'loss 1.31%'), (1, 0, 'loss 1.90%')], 'paths': [{'bandwidth': '34.77', 'delay': '17.4', 'queuingDelay': '0.003'}, {'bandwidth': '96.31', 'delay': '23.3', 'queuingDelay': '0.049'}]}, {'netem': [(0, 0, 'loss 1.90%'), (1, 0, 'loss 1.31%')], 'paths': [{'bandwidth': '96.31', 'delay': '23.3', 'queuingDelay': '0.049'}, {'bandwidth': '34.77', 'delay': '17.4', 'queuingDelay': '0.003'}]}, {'netem': [(0, 0, 'loss 1.99%'), (1, 0, 'loss 1.63%')], 'paths': [{'bandwidth': '7.18', 'delay': '20.5', 'queuingDelay': '0.011'}, {'bandwidth': '82.49', 'delay': '14.6', 'queuingDelay': '0.014'}]}, {'netem': [(0, 0, 'loss 1.63%'), (1, 0, 'loss 1.99%')], 'paths': [{'bandwidth': '82.49', 'delay': '14.6', 'queuingDelay': '0.014'}, {'bandwidth': '7.18', 'delay': '20.5', 'queuingDelay': '0.011'}]}, {'netem': [(0, 0, 'loss 1.49%'), (1, 0, 'loss 0.50%')], 'paths': [{'bandwidth': '16.63', 'delay': '24.4', 'queuingDelay': '0.017'}, {'bandwidth': '95.59', 'delay': '22.8', 'queuingDelay': '0.030'}]}, {'netem': [(0, 0, 'loss 0.50%'), (1, 0, 'loss 1.49%')], 'paths': [{'bandwidth': '95.59', 'delay': '22.8', 'queuingDelay': '0.030'}, {'bandwidth': '16.63', 'delay': '24.4', 'queuingDelay': '0.017'}]}, {'netem': [(0, 0, 'loss 2.25%'), (1, 0, 'loss 0.26%')], 'paths': [{'bandwidth': '23.74', 'delay': '23.0', 'queuingDelay': '0.025'}, {'bandwidth': '51.00', 'delay': '16.0', 'queuingDelay': '0.053'}]}, {'netem': [(0, 0, 'loss 0.26%'), (1, 0, 'loss 2.25%')], 'paths': [{'bandwidth': '51.00', 'delay': '16.0', 'queuingDelay': '0.053'}, {'bandwidth': '23.74', 'delay': '23.0', 'queuingDelay': '0.025'}]}, {'netem': [(0, 0, 'loss 2.26%'), (1, 0, 'loss 0.36%')], 'paths': [{'bandwidth': '11.83', 'delay': '19.5', 'queuingDelay': '0.016'}, {'bandwidth': '1.60', 'delay': '23.7', 'queuingDelay': '0.030'}]}, {'netem': [(0, 0, 'loss 0.36%'), (1, 0, 'loss 2.26%')], 'paths': [{'bandwidth': '1.60', 'delay': '23.7', 'queuingDelay': '0.030'}, {'bandwidth': '11.83', 'delay': '19.5', 'queuingDelay': '0.016'}]}, {'netem': [(0, 0, 'loss 1.89%'), (1, 0, 'loss 1.05%')], 'paths': [{'bandwidth': '10.22', 'delay': '20.3', 'queuingDelay': '0.013'}, {'bandwidth': '6.09', 'delay': '23.3', 'queuingDelay': '0.087'}]}, {'netem': [(0, 0, 'loss 1.05%'), (1, 0, 'loss 1.89%')], 'paths': [{'bandwidth': '6.09', 'delay': '23.3', 'queuingDelay': '0.087'}, {'bandwidth': '10.22', 'delay': '20.3', 'queuingDelay': '0.013'}]}, {'netem': [(0, 0, 'loss 1.02%'), (1, 0, 'loss 0.55%')], 'paths': [{'bandwidth': '2.38', 'delay': '8.5', 'queuingDelay': '0.000'}, {'bandwidth': '12.34', 'delay': '19.2', 'queuingDelay': '0.066'}]}, {'netem': [(0, 0, 'loss 0.55%'), (1, 0, 'loss 1.02%')], 'paths': [{'bandwidth': '12.34', 'delay': '19.2', 'queuingDelay': '0.066'}, {'bandwidth': '2.38', 'delay': '8.5', 'queuingDelay': '0.000'}]}, {'netem': [(0, 0, 'loss 0.40%'), (1, 0, 'loss 0.06%')], 'paths': [{'bandwidth': '11.82', 'delay': '5.8', 'queuingDelay': '0.023'}, {'bandwidth': '25.83', 'delay': '22.0', 'queuingDelay': '0.017'}]}, {'netem': [(0, 0, 'loss 0.06%'), (1, 0, 'loss 0.40%')], 'paths': [{'bandwidth': '25.83', 'delay': '22.0', 'queuingDelay': '0.017'}, {'bandwidth': '11.82', 'delay': '5.8', 'queuingDelay': '0.023'}]}, {'netem': [(0, 0, 'loss 0.44%'), (1, 0, 'loss 0.24%')], 'paths': [{'bandwidth': '42.78', 'delay': '0.3', 'queuingDelay': '0.038'}, {'bandwidth': '60.58', 'delay': '15.5', 'queuingDelay': '0.042'}]}, {'netem': [(0, 0, 'loss 0.24%'), (1, 0, 'loss 0.44%')], 'paths': [{'bandwidth': '60.58', 'delay': '15.5', 'queuingDelay': '0.042'}, {'bandwidth': '42.78', 'delay': '0.3', 'queuingDelay': '0.038'}]}, {'netem': [(0, 0, 'loss 1.24%'), (1, 0, 'loss 0.56%')], 'paths': [{'bandwidth': '68.02', 'delay': '3.0', 'queuingDelay': '0.078'}, {'bandwidth': '65.81', 'delay': '19.1', 'queuingDelay': '0.017'}]}, {'netem': [(0, 0, 'loss 0.56%'), (1, 0, 'loss 1.24%')], 'paths': [{'bandwidth': '65.81', 'delay': '19.1', 'queuingDelay': '0.017'}, {'bandwidth': '68.02', 'delay': '3.0', 'queuingDelay': '0.078'}]}, {'netem': [(0, 0, 'loss 2.33%'), (1, 0, 'loss 0.92%')], 'paths': [{'bandwidth': '63.87', 'delay': '7.4', 'queuingDelay': '0.097'}, {'bandwidth': '95.72', 'delay': '23.7', 'queuingDelay': '0.003'}]}, {'netem': [(0, 0, 'loss 0.92%'), (1, 0, 'loss 2.33%')], 'paths': [{'bandwidth': '95.72', 'delay': '23.7', 'queuingDelay': '0.003'}, {'bandwidth': '63.87', 'delay': '7.4', 'queuingDelay': '0.097'}]}, {'netem': [(0, 0, 'loss 2.44%'), (1, 0, 'loss 1.87%')], 'paths': [{'bandwidth': '88.88', 'delay': '16.0', 'queuingDelay': '0.091'}, {'bandwidth': '83.41', 'delay': '24.1', 'queuingDelay': '0.033'}]}, {'netem': [(0, 0, 'loss 1.87%'), (1, 0, 'loss 2.44%')], 'paths': [{'bandwidth': '83.41', 'delay': '24.1', 'queuingDelay': '0.033'}, {'bandwidth': '88.88', 'delay': '16.0', 'queuingDelay': '0.091'}]}, {'netem': [(0, 0, 'loss 2.37%'), (1, 0, 'loss 1.40%')], 'paths': [{'bandwidth': '97.08', 'delay': '10.6', 'queuingDelay': '0.086'}, {'bandwidth': '44.59', 'delay': '16.6', 'queuingDelay': '0.067'}]}, {'netem': [(0, 0, 'loss 1.40%'), (1, 0, 'loss 2.37%')], 'paths': [{'bandwidth': '44.59', 'delay': '16.6', 'queuingDelay': '0.067'}, {'bandwidth': '97.08', 'delay': '10.6', 'queuingDelay': '0.086'}]}, {'netem': [(0, 0, 'loss 1.81%'), (1, 0, 'loss 0.51%')], 'paths': [{'bandwidth': '87.66', 'delay': '5.1', 'queuingDelay': '0.064'}, {'bandwidth': '29.68', 'delay': '20.7', 'queuingDelay': '0.098'}]}, {'netem': [(0, 0, 'loss 0.51%'), (1, 0, 'loss 1.81%')], 'paths': [{'bandwidth': '29.68', 'delay': '20.7', 'queuingDelay': '0.098'}, {'bandwidth': '87.66', 'delay': '5.1', 'queuingDelay': '0.064'}]}, {'netem': [(0, 0, 'loss 1.13%'), (1, 0, 'loss 0.04%')], 'paths': [{'bandwidth': '86.76', 'delay': '1.7', 'queuingDelay': '0.074'}, {'bandwidth': '16.91', 'delay': '10.1', 'queuingDelay': '0.067'}]}, {'netem': [(0, 0, 'loss 0.04%'), (1, 0, 'loss 1.13%')], 'paths': [{'bandwidth': '16.91', 'delay': '10.1', 'queuingDelay': '0.067'}, {'bandwidth': '86.76', 'delay': '1.7', 'queuingDelay': '0.074'}]}, {'netem': [(0, 0, 'loss 0.13%'), (1, 0, 'loss 0.25%')], 'paths': [{'bandwidth': '94.35', 'delay': '6.4', 'queuingDelay': '0.051'}, {'bandwidth': '57.28', 'delay': '8.7', 'queuingDelay': '0.065'}]}, {'netem': [(0, 0, 'loss 0.25%'), (1, 0, 'loss 0.13%')], 'paths': [{'bandwidth': '57.28', 'delay': '8.7', 'queuingDelay': '0.065'}, {'bandwidth': '94.35', 'delay': '6.4', 'queuingDelay': '0.051'}]}, {'netem': [(0, 0, 'loss 0.32%'), (1, 0, 'loss 0.10%')], 'paths': [{'bandwidth': '92.63', 'delay': '5.9', 'queuingDelay': '0.026'}, {'bandwidth': '72.24', 'delay': '21.4', 'queuingDelay': '0.093'}]}, {'netem': [(0, 0, 'loss 0.10%'), (1, 0, 'loss 0.32%')], 'paths': [{'bandwidth': '72.24', 'delay': '21.4', 'queuingDelay': '0.093'}, {'bandwidth': '92.63', 'delay': '5.9', 'queuingDelay': '0.026'}]}, {'netem': [(0, 0, 'loss 0.03%'), (1, 0, 'loss 1.33%')], 'paths': [{'bandwidth': '98.49', 'delay': '0.6', 'queuingDelay': '0.012'}, {'bandwidth': '39.97', 'delay': '22.9', 'queuingDelay': '0.093'}]}, {'netem': [(0, 0, 'loss 1.33%'), (1, 0, 'loss 0.03%')], 'paths': [{'bandwidth': '39.97', 'delay': '22.9', 'queuingDelay': '0.093'}, {'bandwidth': '98.49', 'delay': '0.6', 'queuingDelay': '0.012'}]}, {'netem': [(0, 0, 'loss 0.33%'), (1, 0, 'loss 0.30%')], 'paths': [{'bandwidth': '89.95', 'delay': '3.0', 'queuingDelay': '0.019'}, {'bandwidth': '6.66', 'delay': '13.2', 'queuingDelay': '0.083'}]}, {'netem': [(0, 0, 'loss 0.30%'), (1, 0, 'loss 0.33%')], 'paths': [{'bandwidth': '6.66', 'delay': '13.2', 'queuingDelay': '0.083'}, {'bandwidth': '89.95', 'delay': '3.0', 'queuingDelay': '0.019'}]}, {'netem': [(0, 0, 'loss 0.90%'), (1, 0, 'loss 1.23%')], 'paths': [{'bandwidth': '57.84', 'delay': '0.5', 'queuingDelay': '0.012'}, {'bandwidth': '0.78', 'delay': '2.8', 'queuingDelay': '0.086'}]}, {'netem': [(0, 0, 'loss 1.23%'), (1, 0, 'loss 0.90%')], 'paths': [{'bandwidth': '0.78', 'delay': '2.8', 'queuingDelay': '0.086'}, {'bandwidth': '57.84', 'delay': '0.5', 'queuingDelay': '0.012'}]}, {'netem': [(0, 0, 'loss 2.19%'), (1, 0, 'loss 0.30%')], 'paths': [{'bandwidth': '63.62', 'delay': '0.7', 'queuingDelay': '0.002'}, {'bandwidth': '25.77', 'delay': '3.9', 'queuingDelay': '0.085'}]}, {'netem': [(0, 0, 'loss 0.30%'), (1, 0, 'loss 2.19%')], 'paths': [{'bandwidth': '25.77', 'delay': '3.9', 'queuingDelay': '0.085'}, {'bandwidth': '63.62', 'delay': '0.7', 'queuingDelay': '0.002'}]}, {'netem': [(0, 0, 'loss 2.22%'), (1, 0, 'loss 0.25%')], 'paths': [{'bandwidth': '22.65', 'delay': '6.0', 'queuingDelay': '0.001'}, {'bandwidth': '49.54', 'delay': '14.7', 'queuingDelay': '0.084'}]}, {'netem': [(0, 0, 'loss 0.25%'), (1, 0, 'loss 2.22%')], 'paths': [{'bandwidth': '49.54', 'delay': '14.7', 'queuingDelay': '0.084'}, {'bandwidth': '22.65', 'delay': '6.0', 'queuingDelay': '0.001'}]}, {'netem': [(0, 0, 'loss 1.60%'), (1, 0, 'loss 0.08%')], 'paths': [{'bandwidth': '10.22', 'delay': '14.6', 'queuingDelay': '0.033'}, {'bandwidth': '26.89', 'delay': '3.7', 'queuingDelay': '0.094'}]}, {'netem': [(0, 0, 'loss 0.08%'), (1, 0, 'loss 1.60%')], 'paths': [{'bandwidth': '26.89', 'delay': '3.7', 'queuingDelay': '0.094'}, {'bandwidth': '10.22', 'delay': '14.6', 'queuingDelay': '0.033'}]}, {'netem': [(0, 0, 'loss 2.22%'), (1, 0, 'loss 1.53%')], 'paths': [{'bandwidth': '9.25', 'delay': '18.9', 'queuingDelay': '0.046'}, {'bandwidth': '12.66', 'delay': '8.2', 'queuingDelay': '0.081'}]}, {'netem': [(0, 0, 'loss 1.53%'), (1, 0, 'loss 2.22%')], 'paths': [{'bandwidth': '12.66', 'delay': '8.2', 'queuingDelay': '0.081'}, {'bandwidth': '9.25', 'delay': '18.9', 'queuingDelay': '0.046'}]}, {'netem': [(0, 0, 'loss 1.84%'), (1, 0, 'loss 2.46%')], 'paths': [{'bandwidth': '14.84', 'delay': '12.7', 'queuingDelay': '0.014'}, {'bandwidth': '56.29', 'delay': '9.3', 'queuingDelay': '0.096'}]}, {'netem': [(0, 0, 'loss 2.46%'), (1, 0, 'loss 1.84%')], 'paths': [{'bandwidth': '56.29', 'delay': '9.3', 'queuingDelay': '0.096'}, {'bandwidth': '14.84', 'delay': '12.7', 'queuingDelay': '0.014'}]}, {'netem': [(0, 0, 'loss 2.31%'), (1, 0, 'loss 1.94%')], 'paths': [{'bandwidth': '31.02', 'delay': '10.7', 'queuingDelay': '0.026'}, {'bandwidth': '97.25', 'delay': '0.1', 'queuingDelay': '0.089'}]}, {'netem': [(0, 0, 'loss 1.94%'), (1, 0, 'loss 2.31%')], 'paths': [{'bandwidth': '97.25', 'delay': '0.1', 'queuingDelay': '0.089'}, {'bandwidth': '31.02', 'delay': '10.7', 'queuingDelay': '0.026'}]}, {'netem': [(0, 0, 'loss 1.82%'), (1, 0, 'loss 2.42%')], 'paths': [{'bandwidth': '91.86', 'delay': '11.8', 'queuingDelay': '0.065'}, {'bandwidth': '99.01', 'delay': '0.0', 'queuingDelay': '0.075'}]}, {'netem': [(0, 0, 'loss 2.42%'), (1, 0, 'loss 1.82%')], 'paths': [{'bandwidth': '99.01', 'delay': '0.0', 'queuingDelay': '0.075'}, {'bandwidth': '91.86', 'delay': '11.8', 'queuingDelay': '0.065'}]}, {'netem': [(0, 0, 'loss 2.25%'), (1, 0, 'loss 2.00%')], 'paths': [{'bandwidth': '60.48', 'delay': '2.9', 'queuingDelay': '0.100'}, {'bandwidth': '83.14', 'delay': '1.9', 'queuingDelay': '0.059'}]}, {'netem': [(0, 0, 'loss 2.00%'), (1, 0, 'loss 2.25%')], 'paths': [{'bandwidth': '83.14', 'delay': '1.9', 'queuingDelay': '0.059'}, {'bandwidth': '60.48', 'delay': '2.9', 'queuingDelay': '0.100'}]}, {'netem': [(0, 0, 'loss 1.49%'), (1, 0, 'loss 1.59%')], 'paths': [{'bandwidth': '7.16', 'delay': '2.5', 'queuingDelay': '0.100'}, {'bandwidth': '85.87', 'delay': '7.2', 'queuingDelay': '0.043'}]}, {'netem': [(0, 0, 'loss 1.59%'), (1, 0, 'loss 1.49%')], 'paths': [{'bandwidth': '85.87', 'delay': '7.2', 'queuingDelay': '0.043'}, {'bandwidth': '7.16', 'delay': '2.5', 'queuingDelay': '0.100'}]}, {'netem': [(0, 0, 'loss 0.54%'), (1, 0, 'loss 1.54%')], 'paths': [{'bandwidth': '18.89', 'delay': '2.8', 'queuingDelay': '0.096'}, {'bandwidth': '54.95', 'delay': '14.5', 'queuingDelay': '0.011'}]}, {'netem': [(0, 0, 'loss 1.54%'), (1, 0, 'loss 0.54%')], 'paths': [{'bandwidth': '54.95', 'delay': '14.5', 'queuingDelay': '0.011'}, {'bandwidth': '18.89', 'delay': '2.8', 'queuingDelay': '0.096'}]}, {'netem': [(0, 0, 'loss 0.50%'), (1, 0, 'loss 1.67%')], 'paths': [{'bandwidth': '11.36', 'delay': '12.8', 'queuingDelay': '0.088'}, {'bandwidth': '23.54', 'delay': '24.3', 'queuingDelay': '0.007'}]}, {'netem': [(0, 0, 'loss 1.67%'), (1, 0, 'loss 0.50%')], 'paths': [{'bandwidth': '23.54', 'delay': '24.3', 'queuingDelay': '0.007'}, {'bandwidth': '11.36', 'delay': '12.8', 'queuingDelay': '0.088'}]}, {'netem': [(0, 0, 'loss 1.65%'), (1, 0, 'loss 2.18%')], 'paths': [{'bandwidth': '5.99', 'delay': '24.2', 'queuingDelay': '0.078'}, {'bandwidth': '10.99', 'delay': '23.3', 'queuingDelay': '0.011'}]}, {'netem': [(0, 0, 'loss 2.18%'), (1, 0, 'loss 1.65%')], 'paths': [{'bandwidth': '10.99', 'delay': '23.3', 'queuingDelay': '0.011'}, {'bandwidth': '5.99', 'delay': '24.2', 'queuingDelay': '0.078'}]}, {'netem': [(0, 0, 'loss 1.21%'), (1, 0, 'loss 2.18%')], 'paths': [{'bandwidth': '0.45', 'delay': '21.5', 'queuingDelay': '0.031'}, {'bandwidth': '4.76', 'delay': '11.9', 'queuingDelay': '0.010'}]}, {'netem': [(0, 0, 'loss 2.18%'), (1, 0, 'loss 1.21%')], 'paths': [{'bandwidth': '4.76', 'delay': '11.9', 'queuingDelay': '0.010'}, {'bandwidth': '0.45', 'delay': '21.5', 'queuingDelay': '0.031'}]}, {'netem': [(0, 0, 'loss 0.30%'), (1, 0, 'loss 1.77%')], 'paths': [{'bandwidth': '40.60', 'delay': '24.4', 'queuingDelay': '0.007'}, {'bandwidth': '2.83', 'delay': '17.6', 'queuingDelay': '0.012'}]}, {'netem': [(0, 0, 'loss 1.77%'), (1, 0, 'loss 0.30%')], 'paths': [{'bandwidth': '2.83', 'delay': '17.6', 'queuingDelay': '0.012'}, {'bandwidth': '40.60', 'delay': '24.4', 'queuingDelay': '0.007'}]}, {'netem': [(0, 0, 'loss 0.61%'), (1, 0, 'loss 2.37%')], 'paths': [{'bandwidth': '2.19', 'delay': '22.8', 'queuingDelay': '0.009'}, {'bandwidth': '39.20', 'delay': '23.8', 'queuingDelay': '0.006'}]}, {'netem': [(0, 0, 'loss 2.37%'), (1, 0, 'loss 0.61%')], 'paths': [{'bandwidth': '39.20', 'delay': '23.8', 'queuingDelay': '0.006'}, {'bandwidth': '2.19', 'delay': '22.8', 'queuingDelay': '0.009'}]}, {'netem': [(0, 0, 'loss 0.18%'), (1, 0, 'loss 2.47%')], 'paths': [{'bandwidth': '2.74', 'delay': '7.1', 'queuingDelay': '0.010'}, {'bandwidth': '24.89', 'delay': '16.7', 'queuingDelay': '0.001'}]}, {'netem': [(0, 0, 'loss 2.47%'), (1, 0, 'loss 0.18%')], 'paths': [{'bandwidth': '24.89', 'delay': '16.7', 'queuingDelay': '0.001'}, {'bandwidth': '2.74', 'delay': '7.1', 'queuingDelay': '0.010'}]}, {'netem': [(0, 0, 'loss 0.76%'), (1, 0, 'loss 1.98%')], 'paths': [{'bandwidth': '58.17', 'delay': '4.9', 'queuingDelay': '0.007'}, {'bandwidth': '26.29', 'delay': '8.6', 'queuingDelay': '0.003'}]}, {'netem': [(0, 0, 'loss 1.98%'), (1, 0, 'loss 0.76%')], 'paths': [{'bandwidth': '26.29', 'delay': '8.6', 'queuingDelay': '0.003'}, {'bandwidth': '58.17', 'delay': '4.9', 'queuingDelay': '0.007'}]}, {'netem': [(0, 0, 'loss 0.61%'), (1, 0, 'loss 2.11%')], 'paths': [{'bandwidth': '64.71', 'delay': '17.7', 'queuingDelay': '0.022'}, {'bandwidth': '2.85', 'delay': '1.8', 'queuingDelay': '0.015'}]}, {'netem': [(0, 0, 'loss 2.11%'), (1, 0, 'loss 0.61%')], 'paths': [{'bandwidth': '2.85', 'delay': '1.8', 'queuingDelay': '0.015'}, {'bandwidth': '64.71', 'delay': '17.7', 'queuingDelay': '0.022'}]}, {'netem': [(0, 0, 'loss 0.58%'), (1, 0, 'loss 1.98%')], 'paths': [{'bandwidth': '70.38', 'delay': '18.8', 'queuingDelay': '0.013'}, {'bandwidth': '64.93', 'delay': '0.3', 'queuingDelay': '0.002'}]}, {'netem': [(0, 0, 'loss 1.98%'), (1, 0, 'loss 0.58%')], 'paths': [{'bandwidth': '64.93', 'delay': '0.3', 'queuingDelay': '0.002'}, {'bandwidth': '70.38', 'delay': '18.8', 'queuingDelay': '0.013'}]}, {'netem': [(0, 0, 'loss 1.04%'), (1, 0, 'loss 1.91%')], 'paths': [{'bandwidth': '83.00', 'delay': '24.3', 'queuingDelay': '0.031'}, {'bandwidth': '42.54', 'delay': '4.6', 'queuingDelay': '0.052'}]}, {'netem': [(0, 0, 'loss 1.91%'), (1, 0, 'loss 1.04%')], 'paths': [{'bandwidth': '42.54', 'delay': '4.6', 'queuingDelay': '0.052'}, {'bandwidth': '83.00', 'delay': '24.3', 'queuingDelay': '0.031'}]}, {'netem': [(0, 0, 'loss 0.52%'), (1, 0, 'loss 0.67%')], 'paths': [{'bandwidth': '89.71', 'delay': '21.9', 'queuingDelay': '0.044'}, {'bandwidth': '26.67', 'delay': '1.4', 'queuingDelay': '0.083'}]}, {'netem': [(0, 0, 'loss 0.67%'), (1, 0, 'loss 0.52%')], 'paths': [{'bandwidth': '26.67', 'delay': '1.4', 'queuingDelay': '0.083'}, {'bandwidth': '89.71', 'delay': '21.9', 'queuingDelay': '0.044'}]}, {'netem': [(0, 0, 'loss 0.53%'), (1, 0, 'loss 1.32%')], 'paths': [{'bandwidth': '83.94', 'delay': '25.0', 'queuingDelay': '0.090'}, {'bandwidth': '4.25', 'delay': '6.9', 'queuingDelay': '0.054'}]}, {'netem': [(0, 0, 'loss 1.32%'), (1, 0, 'loss 0.53%')], 'paths': [{'bandwidth': '4.25', 'delay': '6.9', 'queuingDelay': '0.054'}, {'bandwidth': '83.94', 'delay': '25.0', 'queuingDelay': '0.090'}]}, {'netem': [(0, 0, 'loss 0.11%'), (1, 0, 'loss 0.33%')], 'paths': [{'bandwidth': '99.94', 'delay': '14.2', 'queuingDelay': '0.076'}, {'bandwidth': '6.33', 'delay': '8.6', 'queuingDelay': '0.048'}]}, {'netem': [(0, 0, 'loss 0.33%'), (1, 0, 'loss 0.11%')], 'paths': [{'bandwidth': '6.33', 'delay': '8.6', 'queuingDelay': '0.048'}, {'bandwidth': '99.94', 'delay': '14.2', 'queuingDelay': '0.076'}]}, {'netem': [(0, 0, 'loss 0.19%'), (1, 0, 'loss 0.37%')], 'paths': [{'bandwidth': '85.80', 'delay': '24.7', 'queuingDelay': '0.080'}, {'bandwidth': '6.23', 'delay': '14.8', 'queuingDelay': '0.006'}]}, {'netem': [(0, 0, 'loss 0.37%'), (1, 0, 'loss 0.19%')], 'paths': [{'bandwidth': '6.23', 'delay': '14.8', 'queuingDelay': '0.006'}, {'bandwidth': '85.80', 'delay': '24.7', 'queuingDelay': '0.080'}]}, {'netem': [(0, 0, 'loss 0.57%'), (1, 0, 'loss 0.06%')], 'paths': [{'bandwidth': '92.71', 'delay': '23.3', 'queuingDelay': '0.100'}, {'bandwidth': '67.90', 'delay': '9.7', 'queuingDelay': '0.002'}]}, {'netem': [(0, 0, 'loss 0.06%'), (1, 0, 'loss 0.57%')], 'paths': [{'bandwidth': '67.90', 'delay': '9.7', 'queuingDelay': '0.002'}, {'bandwidth': '92.71', 'delay': '23.3', 'queuingDelay': '0.100'}]}, {'netem': [(0, 0, 'loss 0.01%'), (1, 0, 'loss 0.77%')], 'paths': [{'bandwidth': '99.62', 'delay': '11.1', 'queuingDelay': '0.081'}, {'bandwidth': '78.72', 'delay': '7.2', 'queuingDelay': '0.008'}]}, {'netem': [(0, 0, 'loss 0.77%'), (1, 0, 'loss 0.01%')], 'paths': [{'bandwidth': '78.72', 'delay': '7.2', 'queuingDelay': '0.008'}, {'bandwidth': '99.62', 'delay': '11.1', 'queuingDelay': '0.081'}]}, {'netem': [(0, 0, 'loss 0.38%'), (1, 0, 'loss 0.81%')], 'paths': [{'bandwidth': '91.71', 'delay': '21.5', 'queuingDelay': '0.035'}, {'bandwidth': '87.69', 'delay': '10.5', 'queuingDelay': '0.006'}]}, {'netem': [(0, 0, 'loss 0.81%'), (1, 0, 'loss 0.38%')], 'paths': [{'bandwidth': '87.69', 'delay': '10.5', 'queuingDelay': '0.006'}, {'bandwidth': '91.71', 'delay': '21.5', 'queuingDelay': '0.035'}]}, {'netem': [(0, 0, 'loss 1.84%'), (1, 0, 'loss 0.77%')], 'paths': [{'bandwidth': '98.35', 'delay': '22.8', 'queuingDelay': '0.061'}, {'bandwidth': '89.87', 'delay': '4.6', 'queuingDelay': '0.001'}]}, {'netem': [(0, 0, 'loss 0.77%'), (1, 0, 'loss 1.84%')], 'paths': [{'bandwidth': '89.87', 'delay': '4.6', 'queuingDelay': '0.001'}, {'bandwidth': '98.35', 'delay': '22.8', 'queuingDelay': '0.061'}]}, {'netem': [(0, 0, 'loss 2.44%'), (1, 0, 'loss 0.90%')], 'paths': [{'bandwidth': '84.33', 'delay': '24.1', 'queuingDelay': '0.010'}, {'bandwidth': '47.41', 'delay': '1.4', 'queuingDelay': '0.027'}]}, {'netem': [(0, 0, 'loss 0.90%'), (1, 0, 'loss 2.44%')], 'paths': [{'bandwidth': '47.41', 'delay': '1.4', 'queuingDelay': '0.027'}, {'bandwidth': '84.33', 'delay': '24.1', 'queuingDelay': '0.010'}]}, {'netem': [(0, 0, 'loss 2.43%'), (1, 0, 'loss 0.90%')], 'paths': [{'bandwidth': '40.59', 'delay': '19.9', 'queuingDelay': '0.021'}, {'bandwidth': '92.39', 'delay': '3.4', 'queuingDelay': '0.029'}]}, {'netem': [(0, 0, 'loss 0.90%'), (1, 0, 'loss 2.43%')], 'paths': [{'bandwidth': '92.39', 'delay': '3.4', 'queuingDelay': '0.029'}, {'bandwidth': '40.59', 'delay': '19.9', 'queuingDelay': '0.021'}]}, {'netem': [(0, 0, 'loss 2.39%'), (1, 0, 'loss 2.34%')], 'paths': [{'bandwidth': '88.56', 'delay': '12.7', 'queuingDelay': '0.027'}, {'bandwidth': '68.61', 'delay': '3.5', 'queuingDelay': '0.028'}]}, {'netem': [(0, 0, 'loss 2.34%'), (1, 0, 'loss 2.39%')], 'paths': [{'bandwidth': '68.61', 'delay': '3.5', 'queuingDelay': '0.028'}, {'bandwidth': '88.56', 'delay': '12.7', 'queuingDelay': '0.027'}]}, {'netem': [(0, 0, 'loss 2.17%'), (1, 0, 'loss 2.43%')], 'paths': [{'bandwidth': '90.28', 'delay': '20.7', 'queuingDelay': '0.001'}, {'bandwidth': '8.35', 'delay': '7.8', 'queuingDelay': '0.045'}]}, {'netem': [(0, 0, 'loss 2.43%'), (1, 0, 'loss 2.17%')], 'paths': [{'bandwidth': '8.35', 'delay': '7.8', 'queuingDelay': '0.045'}, {'bandwidth': '90.28', 'delay': '20.7', 'queuingDelay': '0.001'}]}, {'netem': [(0, 0, 'loss 2.10%'), (1, 0, 'loss 2.25%')], 'paths': [{'bandwidth': '74.78', 'delay': '23.2', 'queuingDelay': '0.044'}, {'bandwidth': '1.99', 'delay': '8.9', 'queuingDelay': '0.096'}]}, {'netem': [(0, 0, 'loss 2.25%'), (1, 0, 'loss 2.10%')], 'paths': [{'bandwidth': '1.99', 'delay': '8.9', 'queuingDelay': '0.096'}, {'bandwidth': '74.78', 'delay': '23.2', 'queuingDelay': '0.044'}]}, {'netem': [(0, 0, 'loss 2.39%'), (1, 0, 'loss 2.01%')], 'paths': [{'bandwidth': '51.60', 'delay': '11.2', 'queuingDelay': '0.027'}, {'bandwidth': '0.56', 'delay': '19.0', 'queuingDelay': '0.096'}]}, {'netem': [(0, 0, 'loss 2.01%'), (1, 0, 'loss 2.39%')], 'paths': [{'bandwidth': '0.56', 'delay': '19.0', 'queuingDelay': '0.096'}, {'bandwidth': '51.60', 'delay': '11.2', 'queuingDelay': '0.027'}]}, {'netem': [(0, 0, 'loss 1.99%'), (1, 0, 'loss 1.79%')], 'paths': [{'bandwidth': '96.04', 'delay': '19.8', 'queuingDelay': '0.001'}, {'bandwidth': '18.94', 'delay': '24.7', 'queuingDelay': '0.092'}]}, {'netem': [(0, 0, 'loss 1.79%'), (1, 0, 'loss 1.99%')], 'paths': [{'bandwidth': '18.94', 'delay': '24.7', 'queuingDelay': '0.092'}, {'bandwidth': '96.04', 'delay': '19.8', 'queuingDelay': '0.001'}]}, {'netem': [(0, 0, 'loss 0.54%'), (1, 0, 'loss 2.03%')], 'paths': [{'bandwidth': '73.76', 'delay': '14.7', 'queuingDelay': '0.006'}, {'bandwidth': '1.72', 'delay': '20.0', 'queuingDelay': '0.061'}]}, {'netem': [(0, 0, 'loss 2.03%'), (1, 0, 'loss 0.54%')], 'paths': [{'bandwidth': '1.72', 'delay': '20.0', 'queuingDelay': '0.061'}, {'bandwidth': '73.76', 'delay': '14.7', 'queuingDelay': '0.006'}]}, {'netem': [(0, 0, 'loss 0.35%'), (1, 0, 'loss 2.08%')], 'paths': [{'bandwidth': '95.91', 'delay': '24.7', 'queuingDelay': '0.046'}, {'bandwidth': '12.44', 'delay': '21.3', 'queuingDelay': '0.097'}]}, {'netem': [(0, 0, 'loss 2.08%'), (1, 0, 'loss 0.35%')], 'paths': [{'bandwidth': '12.44', 'delay': '21.3', 'queuingDelay': '0.097'}, {'bandwidth': '95.91', 'delay': '24.7', 'queuingDelay': '0.046'}]}, {'netem': [(0, 0, 'loss 1.02%'), (1, 0, 'loss 1.08%')], 'paths': [{'bandwidth': '91.54', 'delay': '15.5', 'queuingDelay': '0.061'}, {'bandwidth': '0.84', 'delay': '23.7', 'queuingDelay': '0.087'}]}, {'netem': [(0, 0, 'loss 1.08%'), (1, 0, 'loss 1.02%')], 'paths': [{'bandwidth': '0.84', 'delay': '23.7', 'queuingDelay': '0.087'}, {'bandwidth': '91.54', 'delay': '15.5', 'queuingDelay': '0.061'}]}, {'netem': [(0, 0, 'loss 0.13%'), (1, 0, 'loss 1.26%')], 'paths': [{'bandwidth': '46.12', 'delay': '18.5', 'queuingDelay': '0.088'}, {'bandwidth': '12.97', 'delay': '24.1', 'queuingDelay': '0.085'}]}, {'netem': [(0, 0, 'loss 1.26%'), (1, 0, 'loss 0.13%')], 'paths': [{'bandwidth': '12.97', 'delay': '24.1', 'queuingDelay': '0.085'}, {'bandwidth': '46.12', 'delay': '18.5', 'queuingDelay': '0.088'}]}, {'netem': [(0, 0, 'loss 0.03%'), (1, 0, 'loss 2.38%')], 'paths': [{'bandwidth': '37.53', 'delay': '18.9', 'queuingDelay': '0.056'}, {'bandwidth': '38.49', 'delay': '24.0', 'queuingDelay': '0.057'}]}, {'netem': [(0, 0, 'loss 2.38%'), (1, 0, 'loss 0.03%')], 'paths': [{'bandwidth': '38.49', 'delay': '24.0', 'queuingDelay': '0.057'}, {'bandwidth': '37.53', 'delay': '18.9', 'queuingDelay': '0.056'}]}, {'netem': [(0, 0, 'loss 0.03%'), (1, 0, 'loss 2.40%')], 'paths': [{'bandwidth': '95.67', 'delay': '20.3', 'queuingDelay': '0.067'}, {'bandwidth': '17.78', 'delay': '24.1', 'queuingDelay': '0.037'}]}, {'netem': [(0, 0, 'loss 2.40%'), (1, 0, 'loss 0.03%')], 'paths': [{'bandwidth': '17.78', 'delay': '24.1', 'queuingDelay': '0.037'}, {'bandwidth': '95.67', 'delay': '20.3', 'queuingDelay': '0.067'}]}, {'netem': [(0, 0, 'loss 0.28%'), (1, 0, 'loss 2.23%')], 'paths': [{'bandwidth': '97.76', 'delay': '24.4', 'queuingDelay': '0.045'}, {'bandwidth': '45.52', 'delay': '13.9', 'queuingDelay': '0.004'}]}, {'netem': [(0, 0, 'loss 2.23%'), (1, 0, 'loss 0.28%')], 'paths': [{'bandwidth': '45.52', 'delay': '13.9', 'queuingDelay': '0.004'}, {'bandwidth': '97.76', 'delay': '24.4', 'queuingDelay': '0.045'}]}, {'netem': [(0, 0, 'loss 0.91%'), (1, 0, 'loss 2.40%')], 'paths': [{'bandwidth': '95.73', 'delay': '24.3', 'queuingDelay': '0.046'}, {'bandwidth': '75.61', 'delay': '23.4', 'queuingDelay': '0.042'}]}, {'netem': [(0, 0, 'loss 2.40%'), (1, 0, 'loss 0.91%')], 'paths': [{'bandwidth': '75.61', 'delay': '23.4', 'queuingDelay': '0.042'}, {'bandwidth': '95.73', 'delay': '24.3', 'queuingDelay': '0.046'}]}, {'netem': [(0, 0, 'loss 0.19%'), (1, 0, 'loss 1.96%')], 'paths': [{'bandwidth': '94.08', 'delay': '24.2', 'queuingDelay': '0.072'}, {'bandwidth': '71.87', 'delay': '24.9', 'queuingDelay': '0.096'}]}, {'netem': [(0, 0, 'loss 1.96%'), (1, 0, 'loss 0.19%')], 'paths': [{'bandwidth': '71.87', 'delay': '24.9', 'queuingDelay': '0.096'}, {'bandwidth': '94.08', 'delay': '24.2', 'queuingDelay': '0.072'}]}, {'netem': [(0, 0, 'loss 0.09%'), (1, 0, 'loss 0.79%')], 'paths': [{'bandwidth': '60.04', 'delay': '13.4', 'queuingDelay': '0.047'}, {'bandwidth': '53.83', 'delay': '24.9', 'queuingDelay': '0.042'}]}, {'netem': [(0, 0, 'loss 0.79%'), (1, 0, 'loss 0.09%')], 'paths': [{'bandwidth': '53.83', 'delay': '24.9', 'queuingDelay': '0.042'}, {'bandwidth': '60.04', 'delay': '13.4', 'queuingDelay': '0.047'}]}, {'netem': [(0, 0, 'loss 0.32%'), (1, 0, 'loss 1.28%')], 'paths': [{'bandwidth': '81.98', 'delay': '7.8', 'queuingDelay': '0.098'}, {'bandwidth': '83.93', 'delay': '24.9', 'queuingDelay': '0.040'}]}, {'netem': [(0, 0, 'loss 1.28%'), (1, 0, 'loss 0.32%')], 'paths': [{'bandwidth': '83.93', 'delay': '24.9', 'queuingDelay': '0.040'}, {'bandwidth': '81.98', 'delay': '7.8', 'queuingDelay': '0.098'}]}, {'netem': [(0, 0, 'loss 1.21%'), (1, 0, 'loss 2.47%')], 'paths': [{'bandwidth': '94.43', 'delay': '3.5', 'queuingDelay': '0.087'}, {'bandwidth': '82.58', 'delay': '14.5', 'queuingDelay': '0.013'}]}, {'netem': [(0, 0, 'loss 2.47%'), (1, 0, 'loss 1.21%')], 'paths': [{'bandwidth': '82.58', 'delay': '14.5', 'queuingDelay': '0.013'}, {'bandwidth': '94.43', 'delay': '3.5', 'queuingDelay': '0.087'}]}, {'netem': [(0, 0, 'loss 0.75%'), (1, 0, 'loss 1.98%')], 'paths': [{'bandwidth': '89.77', 'delay': '3.0', 'queuingDelay': '0.041'}, {'bandwidth': '88.99', 'delay': '7.3', 'queuingDelay': '0.052'}]}, {'netem': [(0, 0, 'loss 1.98%'), (1, 0, 'loss 0.75%')], 'paths': [{'bandwidth': '88.99', 'delay': '7.3', 'queuingDelay': '0.052'}, {'bandwidth': '89.77', 'delay': '3.0', 'queuingDelay': '0.041'}]}, {'netem': [(0, 0, 'loss 0.22%'), (1, 0, 'loss 1.40%')], 'paths': [{'bandwidth': '96.03', 'delay': '8.5', 'queuingDelay': '0.002'}, {'bandwidth': '85.34', 'delay': '4.3', 'queuingDelay': '0.095'}]}, {'netem': [(0, 0, 'loss 1.40%'), (1, 0, 'loss 0.22%')], 'paths': [{'bandwidth': '85.34', 'delay': '4.3', 'queuingDelay': '0.095'}, {'bandwidth': '96.03', 'delay': '8.5', 'queuingDelay': '0.002'}]}, {'netem': [(0, 0, 'loss 0.02%'), (1, 0, 'loss 1.16%')], 'paths': [{'bandwidth': '38.68', 'delay': '2.6', 'queuingDelay': '0.006'}, {'bandwidth': '98.68', 'delay': '3.1', 'queuingDelay': '0.064'}]}, {'netem': [(0, 0, 'loss 1.16%'), (1, 0, 'loss 0.02%')], 'paths': [{'bandwidth': '98.68', 'delay': '3.1', 'queuingDelay': '0.064'}, {'bandwidth': '38.68', 'delay': '2.6', 'queuingDelay': '0.006'}]}, {'netem': [(0, 0, 'loss 0.22%'), (1, 0, 'loss 0.12%')], 'paths': [{'bandwidth': '13.03', 'delay': '2.6', 'queuingDelay': '0.048'}, {'bandwidth': '96.20', 'delay': '1.0', 'queuingDelay': '0.094'}]}, {'netem': [(0, 0, 'loss 0.12%'), (1, 0, 'loss 0.22%')], 'paths': [{'bandwidth': '96.20', 'delay': '1.0', 'queuingDelay': '0.094'}, {'bandwidth': '13.03', 'delay': '2.6', 'queuingDelay': '0.048'}]}, {'netem': [(0, 0, 'loss 0.38%'), (1, 0, 'loss 1.96%')], 'paths': [{'bandwidth': '9.84', 'delay': '0.5', 'queuingDelay': '0.062'}, {'bandwidth': '83.46', 'delay': '0.7', 'queuingDelay': '0.029'}]}, {'netem': [(0, 0, 'loss 1.96%'), (1, 0, 'loss 0.38%')], 'paths': [{'bandwidth': '83.46', 'delay': '0.7', 'queuingDelay': '0.029'}, {'bandwidth': '9.84', 'delay': '0.5', 'queuingDelay': '0.062'}]}, {'netem': [(0, 0, 'loss 0.09%'), (1, 0, 'loss 2.17%')], 'paths': [{'bandwidth': '2.09', 'delay': '14.4', 'queuingDelay': '0.077'}, {'bandwidth': '72.94', 'delay': '0.4', 'queuingDelay': '0.053'}]}, {'netem': [(0, 0, 'loss 2.17%'), (1, 0, 'loss 0.09%')], 'paths': [{'bandwidth': '72.94', 'delay': '0.4', 'queuingDelay': '0.053'}, {'bandwidth': '2.09', 'delay': '14.4', 'queuingDelay': '0.077'}]}, {'netem': [(0, 0, 'loss 1.39%'), (1, 0, 'loss 2.15%')], 'paths': [{'bandwidth': '8.64', 'delay': '13.6', 'queuingDelay': '0.071'}, {'bandwidth': '75.93', 'delay': '1.7', 'queuingDelay': '0.014'}]}, {'netem': [(0, 0, 'loss 2.15%'), (1, 0, 'loss 1.39%')], 'paths': [{'bandwidth': '75.93', 'delay': '1.7', 'queuingDelay': '0.014'}, {'bandwidth': '8.64', 'delay': '13.6', 'queuingDelay': '0.071'}]}, {'netem': [(0, 0, 'loss 2.47%'), (1, 0, 'loss 2.05%')], 'paths': [{'bandwidth': '7.65', 'delay': '23.5', 'queuingDelay': '0.098'}, {'bandwidth': '83.33', 'delay': '0.2', 'queuingDelay': '0.023'}]}, {'netem': [(0, 0, 'loss 2.05%'), (1, 0, 'loss 2.47%')], 'paths': [{'bandwidth': '83.33', 'delay': '0.2', 'queuingDelay': '0.023'}, {'bandwidth': '7.65', 'delay': '23.5', 'queuingDelay': '0.098'}]}, {'netem': [(0, 0, 'loss 1.01%'), (1, 0, 'loss 0.90%')], 'paths': [{'bandwidth': '8.13', 'delay': '20.2', 'queuingDelay': '0.096'}, {'bandwidth': '81.72', 'delay': '10.6', 'queuingDelay': '0.003'}]}, {'netem': [(0, 0, 'loss 0.90%'), (1, 0, 'loss 1.01%')], 'paths': [{'bandwidth': '81.72', 'delay': '10.6', 'queuingDelay': '0.003'}, {'bandwidth': '8.13', 'delay': '20.2', 'queuingDelay': '0.096'}]}, {'netem': [(0, 0, 'loss 0.41%'), (1, 0, 'loss 1.68%')], 'paths': [{'bandwidth': '13.87', 'delay': '24.6', 'queuingDelay': '0.099'}, {'bandwidth': '92.98', 'delay': '21.3', 'queuingDelay': '0.033'}]}, {'netem': [(0, 0, 'loss 1.68%'), (1, 0, 'loss 0.41%')], 'paths': [{'bandwidth': '92.98', 'delay': '21.3', 'queuingDelay': '0.033'}, {'bandwidth': '13.87', 'delay': '24.6', 'queuingDelay': '0.099'}]}, {'netem': [(0, 0, 'loss 0.26%'), (1, 0, 'loss 1.75%')], 'paths': [{'bandwidth': '54.09', 'delay': '20.8', 'queuingDelay': '0.100'}, {'bandwidth': '96.60', 'delay': '6.6', 'queuingDelay': '0.053'}]}, {'netem': [(0, 0, 'loss 1.75%'), (1, 0, 'loss 0.26%')], 'paths': [{'bandwidth': '96.60', 'delay': '6.6', 'queuingDelay': '0.053'}, {'bandwidth': '54.09', 'delay': '20.8', 'queuingDelay': '0.100'}]}, {'netem': [(0, 0, 'loss 0.01%'), (1, 0, 'loss 2.46%')], 'paths': [{'bandwidth': '93.44', 'delay': '21.7', 'queuingDelay': '0.081'}, {'bandwidth': '97.94', 'delay': '7.0', 'queuingDelay': '0.007'}]}, {'netem': [(0, 0, 'loss 2.46%'), (1, 0, 'loss 0.01%')], 'paths': [{'bandwidth': '97.94', 'delay': '7.0', 'queuingDelay': '0.007'}, {'bandwidth': '93.44', 'delay': '21.7', 'queuingDelay': '0.081'}]}, {'netem': [(0, 0, 'loss 0.23%'), (1, 0, 'loss 2.28%')], 'paths': [{'bandwidth': '47.41', 'delay': '5.2', 'queuingDelay': '0.099'}, {'bandwidth': '39.47', 'delay': '1.3', 'queuingDelay': '0.009'}]}, {'netem': [(0, 0, 'loss 2.28%'), (1, 0, 'loss 0.23%')], 'paths': [{'bandwidth': '39.47', 'delay': '1.3', 'queuingDelay': '0.009'}, {'bandwidth': '47.41', 'delay': '5.2', 'queuingDelay': '0.099'}]}, {'netem': [(0, 0, 'loss 0.20%'), (1, 0, 'loss 2.18%')], 'paths': [{'bandwidth': '80.36', 'delay': '5.5', 'queuingDelay': '0.047'}, {'bandwidth': '9.81', 'delay': '0.3', 'queuingDelay': '0.062'}]}, {'netem': [(0, 0, 'loss 2.18%'), (1, 0, 'loss 0.20%')], 'paths': [{'bandwidth': '9.81', 'delay': '0.3', 'queuingDelay': '0.062'}, {'bandwidth': '80.36', 'delay': '5.5', 'queuingDelay': '0.047'}]}, {'netem': [(0, 0, 'loss 1.69%'), (1, 0, 'loss 2.00%')], 'paths': [{'bandwidth': '99.25', 'delay': '0.9', 'queuingDelay': '0.049'}, {'bandwidth': '2.48', 'delay': '11.6', 'queuingDelay': '0.080'}]}, {'netem': [(0, 0, 'loss 2.00%'), (1, 0, 'loss 1.69%')], 'paths': [{'bandwidth': '2.48', 'delay': '11.6', 'queuingDelay': '0.080'}, {'bandwidth': '99.25', 'delay': '0.9', 'queuingDelay': '0.049'}]}, {'netem': [(0, 0, 'loss 1.58%'), (1, 0, 'loss 2.28%')], 'paths': [{'bandwidth': '62.67', 'delay': '0.3', 'queuingDelay': '0.047'}, {'bandwidth': '34.34', 'delay': '23.3', 'queuingDelay': '0.094'}]}, {'netem': [(0, 0, 'loss 2.28%'), (1, 0, 'loss 1.58%')], 'paths': [{'bandwidth': '34.34', 'delay': '23.3', 'queuingDelay': '0.094'}, {'bandwidth': '62.67', 'delay': '0.3', 'queuingDelay': '0.047'}]}, {'netem': [(0, 0, 'loss 1.50%'), (1, 0, 'loss 2.43%')], 'paths': [{'bandwidth': '52.52', 'delay': '7.0', 'queuingDelay': '0.099'}, {'bandwidth': '17.04', 'delay': '17.3', 'queuingDelay': '0.100'}]}, {'netem': [(0, 0, 'loss 2.43%'), (1, 0, 'loss 1.50%')], 'paths': [{'bandwidth': '17.04', 'delay': '17.3', 'queuingDelay': '0.100'}, {'bandwidth': '52.52', 'delay': '7.0', 'queuingDelay': '0.099'}]}, {'netem': [(0, 0, 'loss 2.30%'), (1, 0, 'loss 1.55%')], 'paths': [{'bandwidth': '38.10', 'delay': '16.5', 'queuingDelay': '0.081'}, {'bandwidth': '39.29', 'delay': '22.6', 'queuingDelay': '0.084'}]}, {'netem': [(0, 0, 'loss 1.55%'), (1, 0, 'loss 2.30%')], 'paths': [{'bandwidth': '39.29', 'delay': '22.6', 'queuingDelay': '0.084'}, {'bandwidth': '38.10', 'delay': '16.5', 'queuingDelay': '0.081'}]}, {'netem': [(0, 0, 'loss 2.40%'), (1, 0, 'loss 0.58%')], 'paths': [{'bandwidth': '69.77', 'delay': '15.4', 'queuingDelay': '0.091'}, {'bandwidth': '1.36', 'delay': '24.6', 'queuingDelay': '0.065'}]}, {'netem': [(0, 0, 'loss 0.58%'), (1, 0, 'loss 2.40%')], 'paths': [{'bandwidth': '1.36', 'delay': '24.6', 'queuingDelay': '0.065'}, {'bandwidth': '69.77', 'delay': '15.4', 'queuingDelay': '0.091'}]}, {'netem': [(0, 0, 'loss 2.36%'), (1, 0, 'loss 0.34%')], 'paths': [{'bandwidth': '14.79', 'delay': '24.7', 'queuingDelay': '0.080'}, {'bandwidth': '4.87', 'delay': '24.2', 'queuingDelay': '0.080'}]}, {'netem': [(0, 0, 'loss 0.34%'), (1, 0, 'loss 2.36%')], 'paths': [{'bandwidth': '4.87', 'delay': '24.2', 'queuingDelay': '0.080'}, {'bandwidth': '14.79', 'delay': '24.7', 'queuingDelay': '0.080'}]}, {'netem': [(0, 0, 'loss 2.36%'), (1, 0, 'loss 0.35%')], 'paths': [{'bandwidth': '44.00', 'delay': '18.9', 'queuingDelay': '0.062'}, {'bandwidth': '60.02', 'delay': '24.5', 'queuingDelay': '0.006'}]}, {'netem': [(0, 0, 'loss 0.35%'), (1, 0, 'loss 2.36%')], 'paths': [{'bandwidth': '60.02', 'delay': '24.5', 'queuingDelay': '0.006'}, {'bandwidth': '44.00', 'delay': '18.9', 'queuingDelay': '0.062'}]}, {'netem': [(0, 0, 'loss 1.49%'), (1, 0, 'loss 0.14%')], 'paths': [{'bandwidth': '1.70', 'delay': '11.6', 'queuingDelay': '0.083'}, {'bandwidth': '78.44', 'delay': '24.5', 'queuingDelay': '0.006'}]}, {'netem': [(0, 0, 'loss 0.14%'), (1, 0, 'loss 1.49%')], 'paths': [{'bandwidth': '78.44', 'delay': '24.5', 'queuingDelay': '0.006'}, {'bandwidth': '1.70', 'delay': '11.6', 'queuingDelay': '0.083'}]}, {'netem': [(0, 0, 'loss 2.41%'), (1, 0, 'loss 0.85%')], 'paths': [{'bandwidth': '0.89', 'delay': '4.8', 'queuingDelay': '0.075'}, {'bandwidth': '57.26', 'delay': '16.2', 'queuingDelay': '0.002'}]}, {'netem': [(0, 0, 'loss 0.85%'), (1, 0, 'loss 2.41%')], 'paths': [{'bandwidth': '57.26', 'delay': '16.2', 'queuingDelay': '0.002'}, {'bandwidth': '0.89', 'delay': '4.8', 'queuingDelay': '0.075'}]}, {'netem': [(0, 0, 'loss 2.35%'), (1, 0, 'loss 0.10%')], 'paths': [{'bandwidth': '22.23', 'delay': '4.0', 'queuingDelay': '0.006'}, {'bandwidth': '34.59', 'delay': '18.3', 'queuingDelay': '0.002'}]}, {'netem': [(0, 0, 'loss 0.10%'), (1, 0, 'loss 2.35%')], 'paths': [{'bandwidth': '34.59', 'delay': '18.3', 'queuingDelay': '0.002'}, {'bandwidth': '22.23', 'delay': '4.0', 'queuingDelay': '0.006'}]}, {'netem': [(0, 0, 'loss 1.04%'), (1, 0, 'loss 0.12%')], 'paths': [{'bandwidth': '42.93', 'delay': '4.7', 'queuingDelay': '0.050'}, {'bandwidth': '2.53', 'delay': '11.0', 'queuingDelay': '0.000'}]}, {'netem': [(0, 0, 'loss 0.12%'), (1, 0, 'loss 1.04%')], 'paths': [{'bandwidth': '2.53', 'delay': '11.0', 'queuingDelay': '0.000'}, {'bandwidth': '42.93', 'delay': '4.7', 'queuingDelay': '0.050'}]}, {'netem': [(0, 0, 'loss 0.16%'), (1, 0, 'loss 0.03%')], 'paths': [{'bandwidth': '48.05', 'delay': '0.3', 'queuingDelay': '0.093'}, {'bandwidth': '12.12', 'delay': '4.1', 'queuingDelay': '0.016'}]}, {'netem': [(0, 0, 'loss 0.03%'), (1, 0, 'loss 0.16%')], 'paths': [{'bandwidth': '12.12', 'delay': '4.1', 'queuingDelay': '0.016'}, {'bandwidth': '48.05', 'delay': '0.3', 'queuingDelay': '0.093'}]}, {'netem': [(0, 0, 'loss 0.45%'), (1, 0, 'loss 0.00%')], 'paths': [{'bandwidth': '28.31', 'delay': '17.5', 'queuingDelay': '0.097'}, {'bandwidth': '17.72', 'delay': '3.2', 'queuingDelay': '0.017'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.45%')], 'paths': [{'bandwidth': '17.72', 'delay': '3.2', 'queuingDelay': '0.017'}, {'bandwidth': '28.31', 'delay': '17.5', 'queuingDelay': '0.097'}]}, {'netem': [(0, 0, 'loss 1.48%'), (1, 0, 'loss 0.53%')], 'paths': [{'bandwidth': '91.70', 'delay': '25.0', 'queuingDelay': '0.097'}, {'bandwidth': '19.01', 'delay': '2.6', 'queuingDelay': '0.019'}]}, {'netem': [(0, 0, 'loss 0.53%'), (1, 0, 'loss 1.48%')], 'paths': [{'bandwidth': '19.01', 'delay': '2.6', 'queuingDelay': '0.019'}, {'bandwidth': '91.70', 'delay': '25.0', 'queuingDelay': '0.097'}]}, {'netem': [(0, 0, 'loss 2.21%'), (1, 0, 'loss 0.06%')], 'paths': [{'bandwidth': '76.19', 'delay': '8.7', 'queuingDelay': '0.098'}, {'bandwidth': '2.17', 'delay': '0.4', 'queuingDelay': '0.009'}]}, {'netem': [(0, 0, 'loss 0.06%'), (1, 0, 'loss 2.21%')], 'paths': [{'bandwidth': '2.17', 'delay': '0.4', 'queuingDelay': '0.009'}, {'bandwidth': '76.19', 'delay': '8.7', 'queuingDelay': '0.098'}]}, {'netem': [(0, 0, 'loss 2.32%'), (1, 0, 'loss 0.04%')], 'paths': [{'bandwidth': '89.87', 'delay': '2.5', 'queuingDelay': '0.056'}, {'bandwidth': '12.00', 'delay': '10.0', 'queuingDelay': '0.024'}]}, {'netem': [(0, 0, 'loss 0.04%'), (1, 0, 'loss 2.32%')], 'paths': [{'bandwidth': '12.00', 'delay': '10.0', 'queuingDelay': '0.024'}, {'bandwidth': '89.87', 'delay': '2.5', 'queuingDelay': '0.056'}]}, {'netem': [(0, 0, 'loss 1.03%'), (1, 0, 'loss 0.81%')], 'paths': [{'bandwidth': '97.05', 'delay': '9.0', 'queuingDelay': '0.023'}, {'bandwidth': '1.23', 'delay': '6.0', 'queuingDelay': '0.009'}]}, {'netem': [(0, 0, 'loss 0.81%'), (1, 0, 'loss 1.03%')], 'paths': [{'bandwidth': '1.23', 'delay': '6.0', 'queuingDelay': '0.009'}, {'bandwidth': '97.05', 'delay': '9.0', 'queuingDelay': '0.023'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 1.31%')], 'paths': [{'bandwidth': '69.47', 'delay': '0.7', 'queuingDelay': '0.010'}, {'bandwidth': '11.15', 'delay': '21.5', 'queuingDelay': '0.000'}]}, {'netem': [(0, 0, 'loss 1.31%'), (1, 0, 'loss 0.00%')], 'paths': [{'bandwidth': '11.15', 'delay': '21.5', 'queuingDelay': '0.000'}, {'bandwidth': '69.47', 'delay': '0.7', 'queuingDelay': '0.010'}]}, {'netem': [(0, 0, 'loss 1.44%'), (1, 0, 'loss 1.89%')], 'paths': [{'bandwidth': '51.98', 'delay': '0.4', 'queuingDelay': '0.002'}, {'bandwidth': '3.09', 'delay': '17.0', 'queuingDelay': '0.051'}]}, {'netem': [(0, 0, 'loss 1.89%'), (1, 0, 'loss 1.44%')], 'paths': [{'bandwidth': '3.09', 'delay': '17.0', 'queuingDelay': '0.051'}, {'bandwidth': '51.98', 'delay': '0.4', 'queuingDelay': '0.002'}]}, {'netem': [(0, 0, 'loss 1.67%'), (1, 0, 'loss 2.09%')], 'paths': [{'bandwidth': '13.56', 'delay': '11.5', 'queuingDelay': '0.031'}, {'bandwidth': '13.81', 'delay': '24.6', 'queuingDelay': '0.021'}]}, {'netem': [(0, 0, 'loss 2.09%'), (1, 0, 'loss 1.67%')], 'paths': [{'bandwidth': '13.81', 'delay': '24.6', 'queuingDelay': '0.021'}, {'bandwidth': '13.56', 'delay': '11.5', 'queuingDelay': '0.031'}]}, {'netem': [(0, 0, 'loss 2.47%'), (1, 0, 'loss 1.66%')], 'paths': [{'bandwidth': '61.83', 'delay': '23.5', 'queuingDelay': '0.013'}, {'bandwidth': '45.38', 'delay': '23.1', 'queuingDelay': '0.007'}]}, {'netem': [(0, 0, 'loss 1.66%'), (1, 0, 'loss 2.47%')], 'paths': [{'bandwidth': '45.38', 'delay': '23.1', 'queuingDelay': '0.007'}, {'bandwidth': '61.83', 'delay': '23.5', 'queuingDelay': '0.013'}]}, {'netem': [(0, 0, 'loss 2.04%'), (1, 0, 'loss 0.77%')], 'paths': [{'bandwidth': '87.65', 'delay': '24.3', 'queuingDelay': '0.022'}, {'bandwidth': '5.48', 'delay': '23.4', 'queuingDelay': '0.026'}]}, {'netem': [(0, 0, 'loss 0.77%'), (1, 0, 'loss 2.04%')], 'paths': [{'bandwidth': '5.48', 'delay': '23.4', 'queuingDelay': '0.026'}, {'bandwidth': '87.65', 'delay': '24.3', 'queuingDelay': '0.022'}]}, {'netem': [(0, 0, 'loss 1.94%'), (1, 0, 'loss 0.18%')], 'paths': [{'bandwidth': '96.66', 'delay': '4.1', 'queuingDelay': '0.010'}, {'bandwidth': '1.00', 'delay': '19.5', 'queuingDelay': '0.072'}]}, {'netem': [(0, 0, 'loss 0.18%'), (1, 0, 'loss 1.94%')], 'paths': [{'bandwidth': '1.00', 'delay': '19.5', 'queuingDelay': '0.072'}, {'bandwidth': '96.66', 'delay': '4.1', 'queuingDelay': '0.010'}]}, {'netem': [(0, 0, 'loss 1.07%'), (1, 0, 'loss 0.04%')], 'paths': [{'bandwidth': '86.66', 'delay': '0.3', 'queuingDelay': '0.013'}, {'bandwidth': '90.23', 'delay': '11.5', 'queuingDelay': '0.064'}]}, {'netem': [(0, 0, 'loss 0.04%'), (1, 0, 'loss 1.07%')], 'paths': [{'bandwidth': '90.23', 'delay': '11.5', 'queuingDelay': '0.064'}, {'bandwidth': '86.66', 'delay': '0.3', 'queuingDelay': '0.013'}]}, {'netem': [(0, 0, 'loss 0.04%'), (1, 0, 'loss 0.19%')], 'paths': [{'bandwidth': '97.08', 'delay': '0.4', 'queuingDelay': '0.037'}, {'bandwidth': '99.73', 'delay': '0.5', 'queuingDelay': '0.038'}]}, {'netem': [(0, 0, 'loss 0.19%'), (1, 0, 'loss 0.04%')], 'paths': [{'bandwidth': '99.73', 'delay': '0.5', 'queuingDelay': '0.038'}, {'bandwidth': '97.08', 'delay': '0.4', 'queuingDelay': '0.037'}]}, {'netem': [(0, 0, 'loss 0.05%'), (1, 0, 'loss 0.14%')], 'paths': [{'bandwidth': '99.34', 'delay': '20.2', 'queuingDelay': '0.014'}, {'bandwidth': '94.80', 'delay': '0.3', 'queuingDelay': '0.076'}]}, {'netem': [(0, 0, 'loss 0.14%'), (1, 0, 'loss 0.05%')], 'paths': [{'bandwidth': '94.80', 'delay': '0.3', 'queuingDelay': '0.076'}, {'bandwidth': '99.34', 'delay': '20.2', 'queuingDelay': '0.014'}]}, {'netem': [(0, 0, 'loss 1.40%'), (1, 0, 'loss 0.21%')], 'paths': [{'bandwidth': '95.86', 'delay': '14.2', 'queuingDelay': '0.043'}, {'bandwidth': '97.73', 'delay': '13.2', 'queuingDelay': '0.100'}]}, {'netem': [(0, 0, 'loss 0.21%'), (1, 0, 'loss 1.40%')], 'paths': [{'bandwidth': '97.73', 'delay': '13.2', 'queuingDelay': '0.100'}, {'bandwidth': '95.86', 'delay': '14.2', 'queuingDelay': '0.043'}]}, {'netem': [(0, 0, 'loss 2.49%'), (1, 0, 'loss 0.65%')], 'paths': [{'bandwidth': '95.12', 'delay': '21.4', 'queuingDelay': '0.092'}, {'bandwidth': '77.31', 'delay': '12.0', 'queuingDelay': '0.089'}]}, {'netem': [(0, 0, 'loss 0.65%'), (1, 0, 'loss 2.49%')], 'paths': [{'bandwidth': '77.31', 'delay': '12.0', 'queuingDelay': '0.089'}, {'bandwidth': '95.12', 'delay': '21.4', 'queuingDelay': '0.092'}]}, {'netem': [(0, 0, 'loss 2.45%'), (1, 0, 'loss 0.01%')], 'paths': [{'bandwidth': '98.79', 'delay': '1.6', 'queuingDelay': '0.098'}, {'bandwidth': '90.75', 'delay': '17.8', 'queuingDelay': '0.034'}]}, {'netem': [(0, 0, 'loss 0.01%'), (1, 0, 'loss 2.45%')], 'paths': [{'bandwidth': '90.75', 'delay': '17.8', 'queuingDelay': '0.034'}, {'bandwidth': '98.79', 'delay': '1.6', 'queuingDelay': '0.098'}]}, {'netem': [(0, 0, 'loss 1.96%'), (1, 0, 'loss 0.10%')], 'paths': [{'bandwidth': '65.09', 'delay': '1.0', 'queuingDelay': '0.074'}, {'bandwidth': '94.21', 'delay': '23.5', 'queuingDelay': '0.099'}]}, {'netem': [(0, 0, 'loss 0.10%'), (1, 0, 'loss 1.96%')], 'paths': [{'bandwidth': '94.21', 'delay': '23.5', 'queuingDelay': '0.099'}, {'bandwidth': '65.09', 'delay': '1.0', 'queuingDelay': '0.074'}]}, {'netem': [(0, 0, 'loss 0.33%'), (1, 0, 'loss 0.00%')], 'paths': [{'bandwidth': '13.43', 'delay': '3.6', 'queuingDelay': '0.092'}, {'bandwidth': '99.15', 'delay': '24.3', 'queuingDelay': '0.087'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.33%')], 'paths': [{'bandwidth': '99.15', 'delay': '24.3', 'queuingDelay': '0.087'}, {'bandwidth': '13.43', 'delay': '3.6', 'queuingDelay': '0.092'}]}, {'netem': [(0, 0, 'loss 0.59%'), (1, 0, 'loss 0.16%')], 'paths': [{'bandwidth': '62.86', 'delay': '7.3', 'queuingDelay': '0.092'}, {'bandwidth': '24.70', 'delay': '23.7', 'queuingDelay': '0.094'}]}, {'netem': [(0, 0, 'loss 0.16%'), (1, 0, 'loss 0.59%')], 'paths': [{'bandwidth': '24.70', 'delay': '23.7', 'queuingDelay': '0.094'}, {'bandwidth': '62.86', 'delay': '7.3', 'queuingDelay': '0.092'}]}, {'netem': [(0, 0, 'loss 0.26%'), (1, 0, 'loss 1.58%')], 'paths': [{'bandwidth': '0.89', 'delay': '1.5', 'queuingDelay': '0.022'}, {'bandwidth': '10.25', 'delay': '11.1', 'queuingDelay': '0.094'}]}, {'netem': [(0, 0, 'loss 1.58%'), (1, 0, 'loss 0.26%')], 'paths': [{'bandwidth': '10.25', 'delay': '11.1', 'queuingDelay': '0.094'}, {'bandwidth': '0.89', 'delay': '1.5', 'queuingDelay': '0.022'}]}, {'netem': [(0, 0, 'loss 0.76%'), (1, 0, 'loss 1.97%')], 'paths': [{'bandwidth': '11.55', 'delay': '0.7', 'queuingDelay': '0.068'}, {'bandwidth': '0.96', 'delay': '2.2', 'queuingDelay': '0.089'}]}, {'netem': [(0, 0, 'loss 1.97%'), (1, 0, 'loss 0.76%')], 'paths': [{'bandwidth': '0.96', 'delay': '2.2', 'queuingDelay': '0.089'}, {'bandwidth': '11.55', 'delay': '0.7', 'queuingDelay': '0.068'}]}, {'netem': [(0, 0, 'loss 1.16%'), (1, 0, 'loss 1.99%')], 'paths': [{'bandwidth': '2.83', 'delay': '7.7', 'queuingDelay': '0.012'}, {'bandwidth': '3.64', 'delay': '1.6', 'queuingDelay': '0.019'}]}, {'netem': [(0, 0, 'loss 1.99%'), (1, 0, 'loss 1.16%')], 'paths': [{'bandwidth': '3.64', 'delay': '1.6', 'queuingDelay': '0.019'}, {'bandwidth': '2.83', 'delay': '7.7', 'queuingDelay': '0.012'}]}, {'netem': [(0, 0, 'loss 1.15%'), (1, 0, 'loss 1.43%')], 'paths': [{'bandwidth': '17.10', 'delay': '1.9', 'queuingDelay': '0.007'}, {'bandwidth': '78.52', 'delay': '2.7', 'queuingDelay': '0.011'}]}, {'netem': [(0, 0, 'loss 1.43%'), (1, 0, 'loss 1.15%')], 'paths': [{'bandwidth': '78.52', 'delay': '2.7', 'queuingDelay': '0.011'}, {'bandwidth': '17.10', 'delay': '1.9', 'queuingDelay': '0.007'}]}, {'netem': [(0, 0, 'loss 2.09%'), (1, 0, 'loss 1.02%')], 'paths': [{'bandwidth': '88.42', 'delay': '3.5', 'queuingDelay': '0.079'}, {'bandwidth': '79.24', 'delay': '2.1', 'queuingDelay': '0.005'}]}, {'netem': [(0, 0, 'loss 1.02%'), (1, 0, 'loss 2.09%')], 'paths': [{'bandwidth': '79.24', 'delay': '2.1', 'queuingDelay': '0.005'}, {'bandwidth': '88.42', 'delay': '3.5', 'queuingDelay': '0.079'}]}, {'netem': [(0, 0, 'loss 2.46%'), (1, 0, 'loss 2.15%')], 'paths': [{'bandwidth': '97.19', 'delay': '1.3', 'queuingDelay': '0.091'}, {'bandwidth': '39.16', 'delay': '1.3', 'queuingDelay': '0.096'}]}, {'netem': [(0, 0, 'loss 2.15%'), (1, 0, 'loss 2.46%')], 'paths': [{'bandwidth': '39.16', 'delay': '1.3', 'queuingDelay': '0.096'}, {'bandwidth': '97.19', 'delay': '1.3', 'queuingDelay': '0.091'}]}, {'netem': [(0, 0, 'loss 2.39%'), (1, 0, 'loss 2.02%')], 'paths': [{'bandwidth': '95.13', 'delay': '1.6', 'queuingDelay': '0.088'}, {'bandwidth': '7.86', 'delay': '24.9', 'queuingDelay': '0.026'}]}, {'netem': [(0, 0, 'loss 2.02%'), (1, 0, 'loss 2.39%')], 'paths': [{'bandwidth': '7.86', 'delay': '24.9', 'queuingDelay': '0.026'}, {'bandwidth': '95.13', 'delay': '1.6', 'queuingDelay': '0.088'}]}, {'netem': [(0, 0, 'loss 1.58%'), (1, 0, 'loss 0.30%')], 'paths': [{'bandwidth': '92.06', 'delay': '7.8', 'queuingDelay': '0.015'}, {'bandwidth': '96.06', 'delay': '24.8', 'queuingDelay': '0.025'}]}, {'netem': [(0, 0, 'loss 0.30%'), (1, 0, 'loss 1.58%')], 'paths': [{'bandwidth': '96.06', 'delay': '24.8', 'queuingDelay': '0.025'}, {'bandwidth': '92.06', 'delay': '7.8', 'queuingDelay': '0.015'}]}, {'netem': [(0, 0, 'loss 0.33%'), (1, 0, 'loss 2.16%')], 'paths': [{'bandwidth': '90.57', 'delay': '11.3', 'queuingDelay': '0.002'}, {'bandwidth': '99.72', 'delay': '21.1', 'queuingDelay': '0.069'}]}, {'netem': [(0, 0, 'loss 2.16%'), (1, 0, 'loss 0.33%')], 'paths': [{'bandwidth': '99.72', 'delay': '21.1', 'queuingDelay': '0.069'}, {'bandwidth': '90.57', 'delay': '11.3', 'queuingDelay': '0.002'}]}, {'netem': [(0, 0, 'loss 0.22%'), (1, 0, 'loss 1.94%')], 'paths': [{'bandwidth': '59.93', 'delay': '24.1', 'queuingDelay': '0.008'}, {'bandwidth': '75.47', 'delay': '8.9', 'queuingDelay': '0.089'}]}, {'netem': [(0, 0, 'loss 1.94%'), (1, 0, 'loss 0.22%')], 'paths': [{'bandwidth': '75.47', 'delay': '8.9', 'queuingDelay': '0.089'}, {'bandwidth': '59.93', 'delay': '24.1', 'queuingDelay': '0.008'}]}, {'netem': [(0, 0, 'loss 0.18%'), (1, 0, 'loss 1.70%')], 'paths': [{'bandwidth': '25.73', 'delay': '23.0', 'queuingDelay': '0.007'}, {'bandwidth': '12.85', 'delay': '24.9', 'queuingDelay': '0.093'}]}, {'netem': [(0, 0, 'loss 1.70%'), (1, 0, 'loss 0.18%')], 'paths': [{'bandwidth': '12.85', 'delay': '24.9', 'queuingDelay': '0.093'}, {'bandwidth': '25.73', 'delay': '23.0', 'queuingDelay': '0.007'}]}, {'netem': [(0, 0, 'loss 0.68%'), (1, 0, 'loss 0.69%')], 'paths': [{'bandwidth': '0.86', 'delay': '23.1', 'queuingDelay': '0.005'}, {'bandwidth': '68.30', 'delay': '24.0', 'queuingDelay': '0.095'}]}, {'netem': [(0, 0, 'loss 0.69%'), (1, 0, 'loss 0.68%')], 'paths': [{'bandwidth': '68.30', 'delay': '24.0', 'queuingDelay': '0.095'}, {'bandwidth': '0.86', 'delay': '23.1', 'queuingDelay': '0.005'}]}, {'netem': [(0, 0, 'loss 2.39%'), (1, 0, 'loss 2.27%')], 'paths': [{'bandwidth': '25.53', 'delay': '24.2', 'queuingDelay': '0.003'}, {'bandwidth': '86.49', 'delay': '18.7', 'queuingDelay': '0.085'}]}, {'netem': [(0, 0, 'loss 2.27%'), (1, 0, 'loss 2.39%')], 'paths': [{'bandwidth': '86.49', 'delay': '18.7', 'queuingDelay': '0.085'}, {'bandwidth': '25.53', 'delay': '24.2', 'queuingDelay': '0.003'}]}, {'netem': [(0, 0, 'loss 2.39%'), (1, 0, 'loss 1.97%')], 'paths': [{'bandwidth': '6.04', 'delay': '24.9', 'queuingDelay': '0.053'}, {'bandwidth': '95.21', 'delay': '24.7', 'queuingDelay': '0.051'}]}, {'netem': [(0, 0, 'loss 1.97%'), (1, 0, 'loss 2.39%')], 'paths': [{'bandwidth': '95.21', 'delay': '24.7', 'queuingDelay': '0.051'}, {'bandwidth': '6.04', 'delay': '24.9', 'queuingDelay': '0.053'}]}, {'netem': [(0, 0, 'loss 0.37%'), (1, 0, 'loss 0.21%')], 'paths': [{'bandwidth': '0.57', 'delay': '25.0', 'queuingDelay': '0.005'}, {'bandwidth': '88.00', 'delay': '0.7', 'queuingDelay': '0.022'}]}, {'netem': [(0, 0, 'loss 0.21%'), (1, 0, 'loss 0.37%')], 'paths': [{'bandwidth': '88.00', 'delay': '0.7', 'queuingDelay': '0.022'}, {'bandwidth': '0.57', 'delay': '25.0', 'queuingDelay': '0.005'}]}, {'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.09%')], 'paths': [{'bandwidth': '37.37', 'delay': '5.6', 'queuingDelay': '0.008'}, {'bandwidth': '3.30', 'delay': '1.0', 'queuingDelay': '0.053'}]}, {'netem': [(0, 0, 'loss 0.09%'), (1, 0, 'loss 0.00%')], 'paths': [{'bandwidth': '3.30', 'delay': '1.0', 'queuingDelay': '0.053'}, {'bandwidth': '37.37', 'delay': '5.6', 'queuingDelay': '0.008'}]}, {'netem': [(0, 0, 'loss 0.40%'), (1, 0, 'loss 0.02%')], 'paths': [{'bandwidth': '1.07', 'delay': '2.2', 'queuingDelay': '0.012'}, {'bandwidth': '1.71', 'delay': '6.9', 'queuingDelay': '0.099'}]}, {'netem': [(0, 0, 'loss 0.02%'), (1, 0, 'loss 0.40%')], 'paths': [{'bandwidth': '1.71', 'delay': '6.9', 'queuingDelay': '0.099'}, {'bandwidth': '1.07', 'delay': '2.2', 'queuingDelay': '0.012'}]}]
+    mptcpTopos = core.TopoDesignFile(DESIGN_PATH)
 
 
+    journal = core.CampaignJournal(JOURNAL_PATH)
+    resultCache = core.ResultCache(RESULT_CACHE_PATH)
+    timeoutModel = core.TimeoutModel(RUNTIMES_PATH, maxTimeout=core.THREAD_TIMEOUT)
+    resultStore = core.ResultStore(RESULT_STORE_PATH)
+    # If adaptiveReplication, a configuration is not repeated anymore once its completion time converged, and the
+    # campaign stops before times rounds if all did
+    replication = core.AdaptiveReplication(REPLICATION_PATH) if adaptiveReplication else None
     for i in range(times):
-        quicTests(mptcpTopos)
+        quicTests(mptcpTopos, journal=journal, resultCache=resultCache, timeoutModel=timeoutModel, resultStore=resultStore,
+                  replication=replication)
+        if replication is not None and replication.done():
+            break
+    journal.close()
+    resultCache.close()
+    timeoutModel.close()
+    resultStore.close()
+    if replication is not None:
+        for line in replication.report():
+            print(line)
+        replication.close()
 
 launchTests(times=3)
@@ -13,6 +13,21 @@ import os
 REMOTE_SERVER_RUNNER_HOSTNAME = ["mininet@localhost"]
 REMOTE_SERVER_RUNNER_PORT = ["8022"]
 
+# Remove this file to run the campaign again instead of resuming it; the jobs already run with the same
+# specification, kernel and Minitopo are still linked from RESULT_CACHE_PATH unless it is removed too
+JOURNAL_PATH = os.path.splitext(os.path.basename(__file__))[0] + ".journal"
+# Shared by all the campaign scripts, so that identical experiences (same specification, kernel and Minitopo of the
+# hosts) are only run once
+RESULT_CACHE_PATH = "results.cache"
+# Parsed results of all the campaigns, for the analyses (see core.ResultStore)
+RESULT_STORE_PATH = "results.store"
+# Runtimes of the experiences, from which the timeout of each job is predicted
+RUNTIMES_PATH = "runtimes.model"
+# Topologies of the campaign, stored once for all the scripts sharing them (see core.TopoDesignFile)
+DESIGN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "designs", "lowbdp")
+# Completion times of each configuration, to stop repeating it once it converged (see core.AdaptiveReplication)
+REPLICATION_PATH = os.path.splitext(os.path.basename(__file__))[0] + ".replication"
+
 
 
 def getPostProcessingList(**kwargs):
@@ -41,37 +56,36 @@ def getPostProcessingList(**kwargs):
     return toReturn
 
 
-def quicTests(topos, protocol="mptcp", tmpfs="/mnt/tmpfs"):
-    experienceLauncher = core.ExperienceLauncher(REMOTE_SERVER_RUNNER_HOSTNAME, REMOTE_SERVER_RUNNER_PORT)
-
-    def testsXp(**kwargs):
-        def testsMultipath(**kwargs):
-            def test(**kwargs):
-                xpDict = {
-                    XP_TYPE: kwargs["xp"],
-                    SCHEDULER_CLIENT: "default",
-                    SCHEDULER_SERVER: "default",
-                    CC: "olia" if kwargs["multipath"] == 1 else "cubic",
-                    CLIENT_PCAP: "yes",
-                    SERVER_PCAP: "yes",
-                    HTTPS_FILE: "random",
-                    HTTPS_RANDOM_SIZE: "256",
-                    QUIC_MULTIPATH: kwargs["multipath"],
-                    RMEM: (10240, 87380, 16777216),
-                }
-                if int(kwargs["multipath"]) == 0:
-                    kwargs["protocol"] = "tcp"
-
-                kwargs["postProcessing"] = getPostProcessingList(**kwargs)
-                core.experiment(experienceLauncher, xpDict, **kwargs)
-
-            # core.experimentFor("multipath", [0, 1], test, **kwargs)
-            core.experimentFor("multipath", [0, 1], test, **kwargs)
-
-        # core.experimentFor("xp", [HTTPS, QUIC], testsMultipath, **kwargs)
-        core.experimentFor("xp", [HTTPS], testsMultipath, **kwargs)
-
-    core.experimentTopos(topos, "https_quic", protocol, tmpfs, testsXp)
+def quicTests(topos, protocol="mptcp", tmpfs="/mnt/tmpfs", journal=None, resultCache=None, timeoutModel=None, resultStore=None,
+              replication=None):
+    experienceLauncher = core.ExperienceLauncher(REMOTE_SERVER_RUNNER_HOSTNAME, REMOTE_SERVER_RUNNER_PORT, journal=journal,
+                                                 resultCache=resultCache, timeoutModel=timeoutModel, resultStore=resultStore,
+                                                 replication=replication)
+
+    def test(**kwargs):
+        xpDict = {
+            XP_TYPE: kwargs["xp"],
+            SCHEDULER_CLIENT: "default",
+            SCHEDULER_SERVER: "default",
+            CC: "olia" if kwargs["multipath"] == 1 else "cubic",
+            CLIENT_PCAP: "yes",
+            SERVER_PCAP: "yes",
+            HTTPS_FILE: "random",
+            HTTPS_RANDOM_SIZE: "256",
+            QUIC_MULTIPATH: kwargs["multipath"],
+            RMEM: (10240, 87380, 16777216),
+        }
+        if int(kwargs["multipath"]) == 0:
+            kwargs["protocol"] = "tcp"
+
+        kwargs["postProcessing"] = getPostProcessingList(**kwargs)
+        core.experiment(experienceLauncher, xpDict, **kwargs)
+
+    # sweep = core.Sweep(("xp", [HTTPS, QUIC]), ("multipath", [0, 1]))
+    sweep = core.Sweep(("xp", [HTTPS]), ("multipath", [0, 1]))
+    if replication is not None:
+        sweep.skipIf(replication.converged)
+    core.experimentTopos(topos, "https_quic", protocol, tmpfs, sweep.expand(test))
     experienceLauncher.finish()
 
 
@@ -105,16 +119,34 @@ def generateExperimentalDesignRandomTopos(nbMptcpTopos=10, pathsPerTopo=2, bandw
     return mptcpTopos
 
 
-def launchTests(times=5):
+def launchTests(times=5, adaptiveReplication=False):
     """ Notice that the loss must occur at time + 2 sec since the minitopo test waits for 2 seconds between launching the server and the client """
     # mptcpTopos = generateExperimentalDesignRandomTopos(nbMptcpTopos=200)
     # logging = open("topos_with_loss.log", 'w')
     # print(mptcpTopos, file=logging)
     # logging.close()
 
-    mptcpTopos = [{'paths': [{'queuingDelay': '0.048', 'bandwidth': '51.83', 'delay': '10.5'}, {'queuingDelay': '0.063', 'bandwidth': '45.38', 'delay': '13.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.063', 'bandwidth': '45.38', 'delay': '13.3'}, {'queuingDelay': '0.048', 'bandwidth': '51.83', 'delay': '10.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.029', 'bandwidth': '49.44', 'delay': '20.6'}, {'queuingDelay': '0.062', 'bandwidth': '34.80', 'delay': '22.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.062', 'bandwidth': '34.80', 'delay': '22.1'}, {'queuingDelay': '0.029', 'bandwidth': '49.44', 'delay': '20.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.047', 'bandwidth': '49.72', 'delay': '23.2'}, {'queuingDelay': '0.034', 'bandwidth': '0.14', 'delay': '13.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.034', 'bandwidth': '0.14', 'delay': '13.6'}, {'queuingDelay': '0.047', 'bandwidth': '49.72', 'delay': '23.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.061', 'bandwidth': '84.79', 'delay': '17.4'}, {'queuingDelay': '0.028', 'bandwidth': '5.93', 'delay': '6.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.028', 'bandwidth': '5.93', 'delay': '6.5'}, {'queuingDelay': '0.061', 'bandwidth': '84.79', 'delay': '17.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.056', 'bandwidth': '89.55', 'delay': '19.4'}, {'queuingDelay': '0.077', 'bandwidth': '40.86', 'delay': '3.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.077', 'bandwidth': '40.86', 'delay': '3.1'}, {'queuingDelay': '0.056', 'bandwidth': '89.55', 'delay': '19.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.024', 'bandwidth': '89.13', 'delay': '11.6'}, {'queuingDelay': '0.099', 'bandwidth': '8.97', 'delay': '4.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.099', 'bandwidth': '8.97', 'delay': '4.3'}, {'queuingDelay': '0.024', 'bandwidth': '89.13', 'delay': '11.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.007', 'bandwidth': '84.62', 'delay': '10.7'}, {'queuingDelay': '0.074', 'bandwidth': '32.00', 'delay': '7.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.074', 'bandwidth': '32.00', 'delay': '7.6'}, {'queuingDelay': '0.007', 'bandwidth': '84.62', 'delay': '10.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.025', 'bandwidth': '93.83', 'delay': '4.2'}, {'queuingDelay': '0.091', 'bandwidth': '64.68', 'delay': '8.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.091', 'bandwidth': '64.68', 'delay': '8.5'}, {'queuingDelay': '0.025', 'bandwidth': '93.83', 'delay': '4.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.014', 'bandwidth': '56.25', 'delay': '12.1'}, {'queuingDelay': '0.086', 'bandwidth': '74.61', 'delay': '2.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.086', 'bandwidth': '74.61', 'delay': '2.7'}, {'queuingDelay': '0.014', 'bandwidth': '56.25', 'delay': '12.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.025', 'bandwidth': '65.62', 'delay': '15.2'}, {'queuingDelay': '0.035', 'bandwidth': '48.51', 'delay': '0.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.035', 'bandwidth': '48.51', 'delay': '0.0'}, {'queuingDelay': '0.025', 'bandwidth': '65.62', 'delay': '15.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.074', 'bandwidth': '73.50', 'delay': '16.9'}, {'queuingDelay': '0.020', 'bandwidth': '53.33', 'delay': '2.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.020', 'bandwidth': '53.33', 'delay': '2.5'}, {'queuingDelay': '0.074', 'bandwidth': '73.50', 'delay': '16.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.076', 'bandwidth': '69.58', 'delay': '16.3'}, {'queuingDelay': '0.007', 'bandwidth': '73.61', 'delay': '17.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.007', 'bandwidth': '73.61', 'delay': '17.4'}, {'queuingDelay': '0.076', 'bandwidth': '69.58', 'delay': '16.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.027', 'bandwidth': '73.90', 'delay': '9.0'}, {'queuingDelay': '0.005', 'bandwidth': '83.14', 'delay': '15.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.005', 'bandwidth': '83.14', 'delay': '15.4'}, {'queuingDelay': '0.027', 'bandwidth': '73.90', 'delay': '9.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.046', 'bandwidth': '83.42', 'delay': '4.5'}, {'queuingDelay': '0.038', 'bandwidth': '64.52', 'delay': '23.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.038', 'bandwidth': '64.52', 'delay': '23.8'}, {'queuingDelay': '0.046', 'bandwidth': '83.42', 'delay': '4.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.055', 'bandwidth': '97.55', 'delay': '8.0'}, {'queuingDelay': '0.084', 'bandwidth': '33.23', 'delay': '17.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.084', 'bandwidth': '33.23', 'delay': '17.7'}, {'queuingDelay': '0.055', 'bandwidth': '97.55', 'delay': '8.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.065', 'bandwidth': '53.39', 'delay': '0.5'}, {'queuingDelay': '0.073', 'bandwidth': '28.30', 'delay': '16.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.073', 'bandwidth': '28.30', 'delay': '16.2'}, {'queuingDelay': '0.065', 'bandwidth': '53.39', 'delay': '0.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.068', 'bandwidth': '15.46', 'delay': '2.9'}, {'queuingDelay': '0.074', 'bandwidth': '31.74', 'delay': '6.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.074', 'bandwidth': '31.74', 'delay': '6.0'}, {'queuingDelay': '0.068', 'bandwidth': '15.46', 'delay': '2.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.098', 'bandwidth': '31.10', 'delay': '3.7'}, {'queuingDelay': '0.057', 'bandwidth': '74.41', 'delay': '1.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.057', 'bandwidth': '74.41', 'delay': '1.6'}, {'queuingDelay': '0.098', 'bandwidth': '31.10', 'delay': '3.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.096', 'bandwidth': '82.30', 'delay': '6.0'}, {'queuingDelay': '0.057', 'bandwidth': '60.23', 'delay': '3.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.057', 'bandwidth': '60.23', 'delay': '3.3'}, {'queuingDelay': '0.096', 'bandwidth': '82.30', 'delay': '6.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.094', 'bandwidth': '63.20', 'delay': '3.1'}, {'queuingDelay': '0.099', 'bandwidth': '29.43', 'delay': '4.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.099', 'bandwidth': '29.43', 'delay': '4.4'}, {'queuingDelay': '0.094', 'bandwidth': '63.20', 'delay': '3.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.076', 'bandwidth': '24.83', 'delay': '0.6'}, {'queuingDelay': '0.091', 'bandwidth': '67.70', 'delay': '6.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.091', 'bandwidth': '67.70', 'delay': '6.3'}, {'queuingDelay': '0.076', 'bandwidth': '24.83', 'delay': '0.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.092', 'bandwidth': '11.49', 'delay': '5.5'}, {'queuingDelay': '0.066', 'bandwidth': '38.20', 'delay': '14.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.066', 'bandwidth': '38.20', 'delay': '14.8'}, {'queuingDelay': '0.092', 'bandwidth': '11.49', 'delay': '5.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.096', 'bandwidth': '17.79', 'delay': '12.7'}, {'queuingDelay': '0.100', 'bandwidth': '15.10', 'delay': '5.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.100', 'bandwidth': '15.10', 'delay': '5.3'}, {'queuingDelay': '0.096', 'bandwidth': '17.79', 'delay': '12.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.064', 'bandwidth': '50.51', 'delay': '16.5'}, {'queuingDelay': '0.070', 'bandwidth': '32.70', 'delay': '10.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.070', 'bandwidth': '32.70', 'delay': '10.7'}, {'queuingDelay': '0.064', 'bandwidth': '50.51', 'delay': '16.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.049', 'bandwidth': '26.29', 'delay': '9.8'}, {'queuingDelay': '0.022', 'bandwidth': '16.35', 'delay': '7.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.022', 'bandwidth': '16.35', 'delay': '7.8'}, {'queuingDelay': '0.049', 'bandwidth': '26.29', 'delay': '9.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.010', 'bandwidth': '12.28', 'delay': '11.1'}, {'queuingDelay': '0.005', 'bandwidth': '29.29', 'delay': '5.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.005', 'bandwidth': '29.29', 'delay': '5.2'}, {'queuingDelay': '0.010', 'bandwidth': '12.28', 'delay': '11.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.002', 'bandwidth': '33.61', 'delay': '23.0'}, {'queuingDelay': '0.024', 'bandwidth': '36.49', 'delay': '6.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.024', 'bandwidth': '36.49', 'delay': '6.3'}, {'queuingDelay': '0.002', 'bandwidth': '33.61', 'delay': '23.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.019', 'bandwidth': '73.12', 'delay': '24.0'}, {'queuingDelay': '0.044', 'bandwidth': '74.20', 'delay': '8.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.044', 'bandwidth': '74.20', 'delay': '8.2'}, {'queuingDelay': '0.019', 'bandwidth': '73.12', 'delay': '24.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.014', 'bandwidth': '90.57', 'delay': '20.3'}, {'queuingDelay': '0.009', 'bandwidth': '48.20', 'delay': '17.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.009', 'bandwidth': '48.20', 'delay': '17.9'}, {'queuingDelay': '0.014', 'bandwidth': '90.57', 'delay': '20.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.017', 'bandwidth': '84.09', 'delay': '24.1'}, {'queuingDelay': '0.054', 'bandwidth': '52.96', 'delay': '17.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.054', 'bandwidth': '52.96', 'delay': '17.3'}, {'queuingDelay': '0.017', 'bandwidth': '84.09', 'delay': '24.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.011', 'bandwidth': '84.71', 'delay': '16.5'}, {'queuingDelay': '0.057', 'bandwidth': '5.90', 'delay': '15.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.057', 'bandwidth': '5.90', 'delay': '15.8'}, {'queuingDelay': '0.011', 'bandwidth': '84.71', 'delay': '16.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.026', 'bandwidth': '61.57', 'delay': '20.5'}, {'queuingDelay': '0.090', 'bandwidth': '16.32', 'delay': '14.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.090', 'bandwidth': '16.32', 'delay': '14.1'}, {'queuingDelay': '0.026', 'bandwidth': '61.57', 'delay': '20.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.069', 'bandwidth': '64.40', 'delay': '24.0'}, {'queuingDelay': '0.059', 'bandwidth': '23.40', 'delay': '12.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.059', 'bandwidth': '23.40', 'delay': '12.8'}, {'queuingDelay': '0.069', 'bandwidth': '64.40', 'delay': '24.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.100', 'bandwidth': '43.22', 'delay': '19.0'}, {'queuingDelay': '0.038', 'bandwidth': '39.63', 'delay': '16.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.038', 'bandwidth': '39.63', 'delay': '16.6'}, {'queuingDelay': '0.100', 'bandwidth': '43.22', 'delay': '19.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.099', 'bandwidth': '5.68', 'delay': '18.8'}, {'queuingDelay': '0.032', 'bandwidth': '80.48', 'delay': '21.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.032', 'bandwidth': '80.48', 'delay': '21.3'}, {'queuingDelay': '0.099', 'bandwidth': '5.68', 'delay': '18.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.090', 'bandwidth': '12.88', 'delay': '19.1'}, {'queuingDelay': '0.073', 'bandwidth': '70.95', 'delay': '24.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.073', 'bandwidth': '70.95', 'delay': '24.4'}, {'queuingDelay': '0.090', 'bandwidth': '12.88', 'delay': '19.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.085', 'bandwidth': '16.08', 'delay': '6.5'}, {'queuingDelay': '0.060', 'bandwidth': '50.44', 'delay': '18.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.060', 'bandwidth': '50.44', 'delay': '18.4'}, {'queuingDelay': '0.085', 'bandwidth': '16.08', 'delay': '6.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.057', 'bandwidth': '6.51', 'delay': '9.8'}, {'queuingDelay': '0.095', 'bandwidth': '22.26', 'delay': '17.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.095', 'bandwidth': '22.26', 'delay': '17.5'}, {'queuingDelay': '0.057', 'bandwidth': '6.51', 'delay': '9.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.089', 'bandwidth': '37.50', 'delay': '8.9'}, {'queuingDelay': '0.084', 'bandwidth': '16.16', 'delay': '6.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.084', 'bandwidth': '16.16', 'delay': '6.5'}, {'queuingDelay': '0.089', 'bandwidth': '37.50', 'delay': '8.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.058', 'bandwidth': '47.35', 'delay': '6.6'}, {'queuingDelay': '0.092', 'bandwidth': '8.28', 'delay': '5.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.092', 'bandwidth': '8.28', 'delay': '5.7'}, {'queuingDelay': '0.058', 'bandwidth': '47.35', 'delay': '6.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.074', 'bandwidth': '25.02', 'delay': '13.3'}, {'queuingDelay': '0.047', 'bandwidth': '16.70', 'delay': '0.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.047', 'bandwidth': '16.70', 'delay': '0.8'}, {'queuingDelay': '0.074', 'bandwidth': '25.02', 'delay': '13.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.063', 'bandwidth': '13.10', 'delay': '0.7'}, {'queuingDelay': '0.026', 'bandwidth': '25.02', 'delay': '3.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.026', 'bandwidth': '25.02', 'delay': '3.2'}, {'queuingDelay': '0.063', 'bandwidth': '13.10', 'delay': '0.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.018', 'bandwidth': '10.07', 'delay': '6.1'}, {'queuingDelay': '0.035', 'bandwidth': '24.40', 'delay': '12.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.035', 'bandwidth': '24.40', 'delay': '12.5'}, {'queuingDelay': '0.018', 'bandwidth': '10.07', 'delay': '6.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.024', 'bandwidth': '15.50', 'delay': '0.2'}, {'queuingDelay': '0.053', 'bandwidth': '60.60', 'delay': '21.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.053', 'bandwidth': '60.60', 'delay': '21.7'}, {'queuingDelay': '0.024', 'bandwidth': '15.50', 'delay': '0.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.075', 'bandwidth': '34.51', 'delay': '5.5'}, {'queuingDelay': '0.029', 'bandwidth': '74.38', 'delay': '22.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.029', 'bandwidth': '74.38', 'delay': '22.5'}, {'queuingDelay': '0.075', 'bandwidth': '34.51', 'delay': '5.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.088', 'bandwidth': '3.53', 'delay': '2.2'}, {'queuingDelay': '0.030', 'bandwidth': '21.47', 'delay': '23.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.030', 'bandwidth': '21.47', 'delay': '23.7'}, {'queuingDelay': '0.088', 'bandwidth': '3.53', 'delay': '2.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.089', 'bandwidth': '12.65', 'delay': '10.2'}, {'queuingDelay': '0.008', 'bandwidth': '1.05', 'delay': '13.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.008', 'bandwidth': '1.05', 'delay': '13.0'}, {'queuingDelay': '0.089', 'bandwidth': '12.65', 'delay': '10.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.089', 'bandwidth': '59.26', 'delay': '15.8'}, {'queuingDelay': '0.012', 'bandwidth': '18.49', 'delay': '19.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.012', 'bandwidth': '18.49', 'delay': '19.5'}, {'queuingDelay': '0.089', 'bandwidth': '59.26', 'delay': '15.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.067', 'bandwidth': '49.33', 'delay': '1.9'}, {'queuingDelay': '0.008', 'bandwidth': '5.47', 'delay': '17.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.008', 'bandwidth': '5.47', 'delay': '17.8'}, {'queuingDelay': '0.067', 'bandwidth': '49.33', 'delay': '1.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.043', 'bandwidth': '73.96', 'delay': '5.6'}, {'queuingDelay': '0.000', 'bandwidth': '42.62', 'delay': '21.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.000', 'bandwidth': '42.62', 'delay': '21.8'}, {'queuingDelay': '0.043', 'bandwidth': '73.96', 'delay': '5.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.010', 'bandwidth': '71.93', 'delay': '0.9'}, {'queuingDelay': '0.004', 'bandwidth': '5.35', 'delay': '18.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.004', 'bandwidth': '5.35', 'delay': '18.6'}, {'queuingDelay': '0.010', 'bandwidth': '71.93', 'delay': '0.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.023', 'bandwidth': '97.06', 'delay': '5.5'}, {'queuingDelay': '0.008', 'bandwidth': '28.74', 'delay': '22.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.008', 'bandwidth': '28.74', 'delay': '22.5'}, {'queuingDelay': '0.023', 'bandwidth': '97.06', 'delay': '5.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.076', 'bandwidth': '79.58', 'delay': '4.3'}, {'queuingDelay': '0.015', 'bandwidth': '3.54', 'delay': '24.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.015', 'bandwidth': '3.54', 'delay': '24.9'}, {'queuingDelay': '0.076', 'bandwidth': '79.58', 'delay': '4.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.050', 'bandwidth': '96.76', 'delay': '13.0'}, {'queuingDelay': '0.027', 'bandwidth': '21.45', 'delay': '19.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.027', 'bandwidth': '21.45', 'delay': '19.2'}, {'queuingDelay': '0.050', 'bandwidth': '96.76', 'delay': '13.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.088', 'bandwidth': '80.71', 'delay': '5.8'}, {'queuingDelay': '0.034', 'bandwidth': '5.10', 'delay': '12.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.034', 'bandwidth': '5.10', 'delay': '12.0'}, {'queuingDelay': '0.088', 'bandwidth': '80.71', 'delay': '5.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.093', 'bandwidth': '84.84', 'delay': '11.9'}, {'queuingDelay': '0.055', 'bandwidth': '4.62', 'delay': '7.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.055', 'bandwidth': '4.62', 'delay': '7.3'}, {'queuingDelay': '0.093', 'bandwidth': '84.84', 'delay': '11.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.082', 'bandwidth': '76.51', 'delay': '2.3'}, {'queuingDelay': '0.016', 'bandwidth': '18.83', 'delay': '8.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.016', 'bandwidth': '18.83', 'delay': '8.5'}, {'queuingDelay': '0.082', 'bandwidth': '76.51', 'delay': '2.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.025', 'bandwidth': '97.20', 'delay': '0.4'}, {'queuingDelay': '0.003', 'bandwidth': '27.80', 'delay': '5.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.003', 'bandwidth': '27.80', 'delay': '5.7'}, {'queuingDelay': '0.025', 'bandwidth': '97.20', 'delay': '0.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.019', 'bandwidth': '68.25', 'delay': '5.6'}, {'queuingDelay': '0.008', 'bandwidth': '55.98', 'delay': '2.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.008', 'bandwidth': '55.98', 'delay': '2.3'}, {'queuingDelay': '0.019', 'bandwidth': '68.25', 'delay': '5.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.009', 'bandwidth': '32.69', 'delay': '7.9'}, {'queuingDelay': '0.029', 'bandwidth': '15.29', 'delay': '2.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.029', 'bandwidth': '15.29', 'delay': '2.2'}, {'queuingDelay': '0.009', 'bandwidth': '32.69', 'delay': '7.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.064', 'bandwidth': '41.36', 'delay': '10.3'}, {'queuingDelay': '0.017', 'bandwidth': '39.94', 'delay': '6.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.017', 'bandwidth': '39.94', 'delay': '6.7'}, {'queuingDelay': '0.064', 'bandwidth': '41.36', 'delay': '10.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.091', 'bandwidth': '51.82', 'delay': '9.5'}, {'queuingDelay': '0.012', 'bandwidth': '63.85', 'delay': '3.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.012', 'bandwidth': '63.85', 'delay': '3.2'}, {'queuingDelay': '0.091', 'bandwidth': '51.82', 'delay': '9.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.045', 'bandwidth': '43.99', 'delay': '5.6'}, {'queuingDelay': '0.018', 'bandwidth': '92.00', 'delay': '3.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.018', 'bandwidth': '92.00', 'delay': '3.7'}, {'queuingDelay': '0.045', 'bandwidth': '43.99', 'delay': '5.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.060', 'bandwidth': '23.87', 'delay': '9.6'}, {'queuingDelay': '0.009', 'bandwidth': '98.88', 'delay': '2.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.009', 'bandwidth': '98.88', 'delay': '2.8'}, {'queuingDelay': '0.060', 'bandwidth': '23.87', 'delay': '9.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.028', 'bandwidth': '27.19', 'delay': '11.2'}, {'queuingDelay': '0.005', 'bandwidth': '93.86', 'delay': '16.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.005', 'bandwidth': '93.86', 'delay': '16.3'}, {'queuingDelay': '0.028', 'bandwidth': '27.19', 'delay': '11.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.038', 'bandwidth': '12.33', 'delay': '8.6'}, {'queuingDelay': '0.046', 'bandwidth': '86.04', 'delay': '22.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.046', 'bandwidth': '86.04', 'delay': '22.5'}, {'queuingDelay': '0.038', 'bandwidth': '12.33', 'delay': '8.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.048', 'bandwidth': '5.66', 'delay': '19.5'}, {'queuingDelay': '0.078', 'bandwidth': '87.70', 'delay': '18.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.078', 'bandwidth': '87.70', 'delay': '18.0'}, {'queuingDelay': '0.048', 'bandwidth': '5.66', 'delay': '19.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.038', 'bandwidth': '30.16', 'delay': '20.9'}, {'queuingDelay': '0.059', 'bandwidth': '97.12', 'delay': '8.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.059', 'bandwidth': '97.12', 'delay': '8.8'}, {'queuingDelay': '0.038', 'bandwidth': '30.16', 'delay': '20.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.015', 'bandwidth': '4.69', 'delay': '24.0'}, {'queuingDelay': '0.045', 'bandwidth': '85.06', 'delay': '15.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.045', 'bandwidth': '85.06', 'delay': '15.7'}, {'queuingDelay': '0.015', 'bandwidth': '4.69', 'delay': '24.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.041', 'bandwidth': '18.34', 'delay': '21.0'}, {'queuingDelay': '0.017', 'bandwidth': '72.69', 'delay': '6.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.017', 'bandwidth': '72.69', 'delay': '6.2'}, {'queuingDelay': '0.041', 'bandwidth': '18.34', 'delay': '21.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.033', 'bandwidth': '20.14', 'delay': '24.4'}, {'queuingDelay': '0.017', 'bandwidth': '57.34', 'delay': '20.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.017', 'bandwidth': '57.34', 'delay': '20.6'}, {'queuingDelay': '0.033', 'bandwidth': '20.14', 'delay': '24.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.058', 'bandwidth': '14.93', 'delay': '20.8'}, {'queuingDelay': '0.041', 'bandwidth': '13.46', 'delay': '15.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.041', 'bandwidth': '13.46', 'delay': '15.9'}, {'queuingDelay': '0.058', 'bandwidth': '14.93', 'delay': '20.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.068', 'bandwidth': '8.41', 'delay': '16.6'}, {'queuingDelay': '0.082', 'bandwidth': '47.79', 'delay': '19.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.082', 'bandwidth': '47.79', 'delay': '19.6'}, {'queuingDelay': '0.068', 'bandwidth': '8.41', 'delay': '16.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.091', 'bandwidth': '59.59', 'delay': '16.7'}, {'queuingDelay': '0.099', 'bandwidth': '57.76', 'delay': '13.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.099', 'bandwidth': '57.76', 'delay': '13.9'}, {'queuingDelay': '0.091', 'bandwidth': '59.59', 'delay': '16.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.082', 'bandwidth': '99.78', 'delay': '18.9'}, {'queuingDelay': '0.071', 'bandwidth': '70.86', 'delay': '9.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.071', 'bandwidth': '70.86', 'delay': '9.1'}, {'queuingDelay': '0.082', 'bandwidth': '99.78', 'delay': '18.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.084', 'bandwidth': '65.72', 'delay': '12.0'}, {'queuingDelay': '0.097', 'bandwidth': '68.58', 'delay': '0.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.097', 'bandwidth': '68.58', 'delay': '0.7'}, {'queuingDelay': '0.084', 'bandwidth': '65.72', 'delay': '12.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.083', 'bandwidth': '65.00', 'delay': '8.4'}, {'queuingDelay': '0.064', 'bandwidth': '84.89', 'delay': '11.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.064', 'bandwidth': '84.89', 'delay': '11.4'}, {'queuingDelay': '0.083', 'bandwidth': '65.00', 'delay': '8.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.047', 'bandwidth': '88.66', 'delay': '12.4'}, {'queuingDelay': '0.034', 'bandwidth': '67.67', 'delay': '13.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.034', 'bandwidth': '67.67', 'delay': '13.1'}, {'queuingDelay': '0.047', 'bandwidth': '88.66', 'delay': '12.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.028', 'bandwidth': '87.10', 'delay': '17.0'}, {'queuingDelay': '0.004', 'bandwidth': '84.81', 'delay': '16.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.004', 'bandwidth': '84.81', 'delay': '16.0'}, {'queuingDelay': '0.028', 'bandwidth': '87.10', 'delay': '17.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.053', 'bandwidth': '44.06', 'delay': '16.3'}, {'queuingDelay': '0.004', 'bandwidth': '86.69', 'delay': '8.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.004', 'bandwidth': '86.69', 'delay': '8.6'}, {'queuingDelay': '0.053', 'bandwidth': '44.06', 'delay': '16.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.021', 'bandwidth': '48.72', 'delay': '4.3'}, {'queuingDelay': '0.020', 'bandwidth': '87.11', 'delay': '10.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.020', 'bandwidth': '87.11', 'delay': '10.4'}, {'queuingDelay': '0.021', 'bandwidth': '48.72', 'delay': '4.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.044', 'bandwidth': '13.65', 'delay': '3.8'}, {'queuingDelay': '0.055', 'bandwidth': '97.37', 'delay': '10.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.055', 'bandwidth': '97.37', 'delay': '10.7'}, {'queuingDelay': '0.044', 'bandwidth': '13.65', 'delay': '3.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.077', 'bandwidth': '5.17', 'delay': '6.6'}, {'queuingDelay': '0.085', 'bandwidth': '62.44', 'delay': '15.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.085', 'bandwidth': '62.44', 'delay': '15.3'}, {'queuingDelay': '0.077', 'bandwidth': '5.17', 'delay': '6.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.095', 'bandwidth': '59.19', 'delay': '7.3'}, {'queuingDelay': '0.096', 'bandwidth': '91.86', 'delay': '15.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.096', 'bandwidth': '91.86', 'delay': '15.1'}, {'queuingDelay': '0.095', 'bandwidth': '59.19', 'delay': '7.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.092', 'bandwidth': '88.62', 'delay': '6.4'}, {'queuingDelay': '0.098', 'bandwidth': '84.05', 'delay': '18.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.098', 'bandwidth': '84.05', 'delay': '18.6'}, {'queuingDelay': '0.092', 'bandwidth': '88.62', 'delay': '6.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.075', 'bandwidth': '63.63', 'delay': '13.4'}, {'queuingDelay': '0.078', 'bandwidth': '81.17', 'delay': '24.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.078', 'bandwidth': '81.17', 'delay': '24.7'}, {'queuingDelay': '0.075', 'bandwidth': '63.63', 'delay': '13.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.080', 'bandwidth': '72.05', 'delay': '20.0'}, {'queuingDelay': '0.057', 'bandwidth': '83.99', 'delay': '23.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.057', 'bandwidth': '83.99', 'delay': '23.5'}, {'queuingDelay': '0.080', 'bandwidth': '72.05', 'delay': '20.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.033', 'bandwidth': '50.93', 'delay': '20.1'}, {'queuingDelay': '0.091', 'bandwidth': '88.13', 'delay': '22.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.091', 'bandwidth': '88.13', 'delay': '22.6'}, {'queuingDelay': '0.033', 'bandwidth': '50.93', 'delay': '20.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.006', 'bandwidth': '80.95', 'delay': '14.8'}, {'queuingDelay': '0.066', 'bandwidth': '72.36', 'delay': '22.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.066', 'bandwidth': '72.36', 'delay': '22.3'}, {'queuingDelay': '0.006', 'bandwidth': '80.95', 'delay': '14.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.001', 'bandwidth': '96.77', 'delay': '4.3'}, {'queuingDelay': '0.067', 'bandwidth': '46.01', 'delay': '22.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.067', 'bandwidth': '46.01', 'delay': '22.5'}, {'queuingDelay': '0.001', 'bandwidth': '96.77', 'delay': '4.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.034', 'bandwidth': '67.98', 'delay': '3.8'}, {'queuingDelay': '0.064', 'bandwidth': '91.60', 'delay': '21.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.064', 'bandwidth': '91.60', 'delay': '21.8'}, {'queuingDelay': '0.034', 'bandwidth': '67.98', 'delay': '3.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.007', 'bandwidth': '73.91', 'delay': '15.6'}, {'queuingDelay': '0.074', 'bandwidth': '93.66', 'delay': '12.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.074', 'bandwidth': '93.66', 'delay': '12.4'}, {'queuingDelay': '0.007', 'bandwidth': '73.91', 'delay': '15.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.011', 'bandwidth': '73.22', 'delay': '22.3'}, {'queuingDelay': '0.094', 'bandwidth': '81.44', 'delay': '2.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.094', 'bandwidth': '81.44', 'delay': '2.3'}, {'queuingDelay': '0.011', 'bandwidth': '73.22', 'delay': '22.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.035', 'bandwidth': '23.51', 'delay': '23.2'}, {'queuingDelay': '0.087', 'bandwidth': '93.04', 'delay': '7.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.087', 'bandwidth': '93.04', 'delay': '7.8'}, {'queuingDelay': '0.035', 'bandwidth': '23.51', 'delay': '23.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.055', 'bandwidth': '16.82', 'delay': '23.6'}, {'queuingDelay': '0.100', 'bandwidth': '76.86', 'delay': '3.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.100', 'bandwidth': '76.86', 'delay': '3.0'}, {'queuingDelay': '0.055', 'bandwidth': '16.82', 'delay': '23.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.085', 'bandwidth': '66.78', 'delay': '21.8'}, {'queuingDelay': '0.095', 'bandwidth': '62.12', 'delay': '2.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.095', 'bandwidth': '62.12', 'delay': '2.7'}, {'queuingDelay': '0.085', 'bandwidth': '66.78', 'delay': '21.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.089', 'bandwidth': '85.40', 'delay': '23.9'}, {'queuingDelay': '0.056', 'bandwidth': '51.07', 'delay': '14.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.056', 'bandwidth': '51.07', 'delay': '14.2'}, {'queuingDelay': '0.089', 'bandwidth': '85.40', 'delay': '23.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.088', 'bandwidth': '43.04', 'delay': '24.5'}, {'queuingDelay': '0.069', 'bandwidth': '95.03', 'delay': '14.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.069', 'bandwidth': '95.03', 'delay': '14.7'}, {'queuingDelay': '0.088', 'bandwidth': '43.04', 'delay': '24.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.088', 'bandwidth': '37.60', 'delay': '18.7'}, {'queuingDelay': '0.064', 'bandwidth': '76.76', 'delay': '4.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.064', 'bandwidth': '76.76', 'delay': '4.6'}, {'queuingDelay': '0.088', 'bandwidth': '37.60', 'delay': '18.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.079', 'bandwidth': '19.43', 'delay': '6.9'}, {'queuingDelay': '0.099', 'bandwidth': '87.03', 'delay': '3.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.099', 'bandwidth': '87.03', 'delay': '3.9'}, {'queuingDelay': '0.079', 'bandwidth': '19.43', 'delay': '6.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.040', 'bandwidth': '25.50', 'delay': '0.5'}, {'queuingDelay': '0.092', 'bandwidth': '78.37', 'delay': '12.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.092', 'bandwidth': '78.37', 'delay': '12.6'}, {'queuingDelay': '0.040', 'bandwidth': '25.50', 'delay': '0.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.006', 'bandwidth': '23.17', 'delay': '0.8'}, {'queuingDelay': '0.088', 'bandwidth': '53.80', 'delay': '3.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.088', 'bandwidth': '53.80', 'delay': '3.6'}, {'queuingDelay': '0.006', 'bandwidth': '23.17', 'delay': '0.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.011', 'bandwidth': '18.22', 'delay': '9.3'}, {'queuingDelay': '0.056', 'bandwidth': '67.83', 'delay': '1.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.056', 'bandwidth': '67.83', 'delay': '1.3'}, {'queuingDelay': '0.011', 'bandwidth': '18.22', 'delay': '9.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.017', 'bandwidth': '30.96', 'delay': '18.4'}, {'queuingDelay': '0.043', 'bandwidth': '41.14', 'delay': '0.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.043', 'bandwidth': '41.14', 'delay': '0.8'}, {'queuingDelay': '0.017', 'bandwidth': '30.96', 'delay': '18.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.013', 'bandwidth': '1.12', 'delay': '19.6'}, {'queuingDelay': '0.063', 'bandwidth': '13.32', 'delay': '3.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.063', 'bandwidth': '13.32', 'delay': '3.0'}, {'queuingDelay': '0.013', 'bandwidth': '1.12', 'delay': '19.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.009', 'bandwidth': '21.44', 'delay': '23.2'}, {'queuingDelay': '0.074', 'bandwidth': '30.85', 'delay': '12.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.074', 'bandwidth': '30.85', 'delay': '12.7'}, {'queuingDelay': '0.009', 'bandwidth': '21.44', 'delay': '23.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.028', 'bandwidth': '18.94', 'delay': '15.1'}, {'queuingDelay': '0.077', 'bandwidth': '55.33', 'delay': '6.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.077', 'bandwidth': '55.33', 'delay': '6.7'}, {'queuingDelay': '0.028', 'bandwidth': '18.94', 'delay': '15.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.081', 'bandwidth': '2.67', 'delay': '19.3'}, {'queuingDelay': '0.070', 'bandwidth': '76.89', 'delay': '5.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.070', 'bandwidth': '76.89', 'delay': '5.6'}, {'queuingDelay': '0.081', 'bandwidth': '2.67', 'delay': '19.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.072', 'bandwidth': '2.33', 'delay': '23.5'}, {'queuingDelay': '0.083', 'bandwidth': '20.79', 'delay': '6.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.083', 'bandwidth': '20.79', 'delay': '6.2'}, {'queuingDelay': '0.072', 'bandwidth': '2.33', 'delay': '23.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.093', 'bandwidth': '6.23', 'delay': '24.0'}, {'queuingDelay': '0.089', 'bandwidth': '17.74', 'delay': '4.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.089', 'bandwidth': '17.74', 'delay': '4.1'}, {'queuingDelay': '0.093', 'bandwidth': '6.23', 'delay': '24.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.083', 'bandwidth': '4.90', 'delay': '21.2'}, {'queuingDelay': '0.034', 'bandwidth': '1.43', 'delay': '9.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.034', 'bandwidth': '1.43', 'delay': '9.6'}, {'queuingDelay': '0.083', 'bandwidth': '4.90', 'delay': '21.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.082', 'bandwidth': '18.90', 'delay': '24.7'}, {'queuingDelay': '0.011', 'bandwidth': '0.43', 'delay': '5.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.011', 'bandwidth': '0.43', 'delay': '5.3'}, {'queuingDelay': '0.082', 'bandwidth': '18.90', 'delay': '24.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.098', 'bandwidth': '37.36', 'delay': '21.3'}, {'queuingDelay': '0.000', 'bandwidth': '16.46', 'delay': '6.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.000', 'bandwidth': '16.46', 'delay': '6.9'}, {'queuingDelay': '0.098', 'bandwidth': '37.36', 'delay': '21.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.098', 'bandwidth': '6.42', 'delay': '22.0'}, {'queuingDelay': '0.039', 'bandwidth': '13.06', 'delay': '13.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.039', 'bandwidth': '13.06', 'delay': '13.8'}, {'queuingDelay': '0.098', 'bandwidth': '6.42', 'delay': '22.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.078', 'bandwidth': '0.63', 'delay': '17.9'}, {'queuingDelay': '0.086', 'bandwidth': '20.59', 'delay': '21.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.086', 'bandwidth': '20.59', 'delay': '21.7'}, {'queuingDelay': '0.078', 'bandwidth': '0.63', 'delay': '17.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.099', 'bandwidth': '27.13', 'delay': '20.8'}, {'queuingDelay': '0.094', 'bandwidth': '53.57', 'delay': '14.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.094', 'bandwidth': '53.57', 'delay': '14.8'}, {'queuingDelay': '0.099', 'bandwidth': '27.13', 'delay': '20.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.089', 'bandwidth': '2.65', 'delay': '12.0'}, {'queuingDelay': '0.098', 'bandwidth': '97.49', 'delay': '12.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.098', 'bandwidth': '97.49', 'delay': '12.5'}, {'queuingDelay': '0.089', 'bandwidth': '2.65', 'delay': '12.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.058', 'bandwidth': '54.40', 'delay': '8.5'}, {'queuingDelay': '0.085', 'bandwidth': '88.10', 'delay': '13.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.085', 'bandwidth': '88.10', 'delay': '13.7'}, {'queuingDelay': '0.058', 'bandwidth': '54.40', 'delay': '8.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.006', 'bandwidth': '44.67', 'delay': '9.6'}, {'queuingDelay': '0.091', 'bandwidth': '55.49', 'delay': '14.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.091', 'bandwidth': '55.49', 'delay': '14.9'}, {'queuingDelay': '0.006', 'bandwidth': '44.67', 'delay': '9.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.012', 'bandwidth': '17.75', 'delay': '9.6'}, {'queuingDelay': '0.090', 'bandwidth': '33.90', 'delay': '24.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.090', 'bandwidth': '33.90', 'delay': '24.5'}, {'queuingDelay': '0.012', 'bandwidth': '17.75', 'delay': '9.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.028', 'bandwidth': '3.49', 'delay': '11.7'}, {'queuingDelay': '0.048', 'bandwidth': '41.25', 'delay': '19.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.048', 'bandwidth': '41.25', 'delay': '19.1'}, {'queuingDelay': '0.028', 'bandwidth': '3.49', 'delay': '11.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.040', 'bandwidth': '0.93', 'delay': '2.5'}, {'queuingDelay': '0.035', 'bandwidth': '87.23', 'delay': '20.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.035', 'bandwidth': '87.23', 'delay': '20.8'}, {'queuingDelay': '0.040', 'bandwidth': '0.93', 'delay': '2.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.022', 'bandwidth': '11.78', 'delay': '7.2'}, {'queuingDelay': '0.091', 'bandwidth': '94.16', 'delay': '22.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.091', 'bandwidth': '94.16', 'delay': '22.6'}, {'queuingDelay': '0.022', 'bandwidth': '11.78', 'delay': '7.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.003', 'bandwidth': '34.77', 'delay': '17.4'}, {'queuingDelay': '0.049', 'bandwidth': '96.31', 'delay': '23.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.049', 'bandwidth': '96.31', 'delay': '23.3'}, {'queuingDelay': '0.003', 'bandwidth': '34.77', 'delay': '17.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.011', 'bandwidth': '7.18', 'delay': '20.5'}, {'queuingDelay': '0.014', 'bandwidth': '82.49', 'delay': '14.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.014', 'bandwidth': '82.49', 'delay': '14.6'}, {'queuingDelay': '0.011', 'bandwidth': '7.18', 'delay': '20.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.017', 'bandwidth': '16.63', 'delay': '24.4'}, {'queuingDelay': '0.030', 'bandwidth': '95.59', 'delay': '22.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.030', 'bandwidth': '95.59', 'delay': '22.8'}, {'queuingDelay': '0.017', 'bandwidth': '16.63', 'delay': '24.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.025', 'bandwidth': '23.74', 'delay': '23.0'}, {'queuingDelay': '0.053', 'bandwidth': '51.00', 'delay': '16.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.053', 'bandwidth': '51.00', 'delay': '16.0'}, {'queuingDelay': '0.025', 'bandwidth': '23.74', 'delay': '23.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.016', 'bandwidth': '11.83', 'delay': '19.5'}, {'queuingDelay': '0.030', 'bandwidth': '1.60', 'delay': '23.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.030', 'bandwidth': '1.60', 'delay': '23.7'}, {'queuingDelay': '0.016', 'bandwidth': '11.83', 'delay': '19.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.013', 'bandwidth': '10.22', 'delay': '20.3'}, {'queuingDelay': '0.087', 'bandwidth': '6.09', 'delay': '23.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.087', 'bandwidth': '6.09', 'delay': '23.3'}, {'queuingDelay': '0.013', 'bandwidth': '10.22', 'delay': '20.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.000', 'bandwidth': '2.38', 'delay': '8.5'}, {'queuingDelay': '0.066', 'bandwidth': '12.34', 'delay': '19.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.066', 'bandwidth': '12.34', 'delay': '19.2'}, {'queuingDelay': '0.000', 'bandwidth': '2.38', 'delay': '8.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.023', 'bandwidth': '11.82', 'delay': '5.8'}, {'queuingDelay': '0.017', 'bandwidth': '25.83', 'delay': '22.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.017', 'bandwidth': '25.83', 'delay': '22.0'}, {'queuingDelay': '0.023', 'bandwidth': '11.82', 'delay': '5.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.038', 'bandwidth': '42.78', 'delay': '0.3'}, {'queuingDelay': '0.042', 'bandwidth': '60.58', 'delay': '15.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.042', 'bandwidth': '60.58', 'delay': '15.5'}, {'queuingDelay': '0.038', 'bandwidth': '42.78', 'delay': '0.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.078', 'bandwidth': '68.02', 'delay': '3.0'}, {'queuingDelay': '0.017', 'bandwidth': '65.81', 'delay': '19.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.017', 'bandwidth': '65.81', 'delay': '19.1'}, {'queuingDelay': '0.078', 'bandwidth': '68.02', 'delay': '3.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.097', 'bandwidth': '63.87', 'delay': '7.4'}, {'queuingDelay': '0.003', 'bandwidth': '95.72', 'delay': '23.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.003', 'bandwidth': '95.72', 'delay': '23.7'}, {'queuingDelay': '0.097', 'bandwidth': '63.87', 'delay': '7.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.091', 'bandwidth': '88.88', 'delay': '16.0'}, {'queuingDelay': '0.033', 'bandwidth': '83.41', 'delay': '24.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.033', 'bandwidth': '83.41', 'delay': '24.1'}, {'queuingDelay': '0.091', 'bandwidth': '88.88', 'delay': '16.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.086', 'bandwidth': '97.08', 'delay': '10.6'}, {'queuingDelay': '0.067', 'bandwidth': '44.59', 'delay': '16.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.067', 'bandwidth': '44.59', 'delay': '16.6'}, {'queuingDelay': '0.086', 'bandwidth': '97.08', 'delay': '10.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.064', 'bandwidth': '87.66', 'delay': '5.1'}, {'queuingDelay': '0.098', 'bandwidth': '29.68', 'delay': '20.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.098', 'bandwidth': '29.68', 'delay': '20.7'}, {'queuingDelay': '0.064', 'bandwidth': '87.66', 'delay': '5.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.074', 'bandwidth': '86.76', 'delay': '1.7'}, {'queuingDelay': '0.067', 'bandwidth': '16.91', 'delay': '10.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.067', 'bandwidth': '16.91', 'delay': '10.1'}, {'queuingDelay': '0.074', 'bandwidth': '86.76', 'delay': '1.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.051', 'bandwidth': '94.35', 'delay': '6.4'}, {'queuingDelay': '0.065', 'bandwidth': '57.28', 'delay': '8.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.065', 'bandwidth': '57.28', 'delay': '8.7'}, {'queuingDelay': '0.051', 'bandwidth': '94.35', 'delay': '6.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.026', 'bandwidth': '92.63', 'delay': '5.9'}, {'queuingDelay': '0.093', 'bandwidth': '72.24', 'delay': '21.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.093', 'bandwidth': '72.24', 'delay': '21.4'}, {'queuingDelay': '0.026', 'bandwidth': '92.63', 'delay': '5.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.012', 'bandwidth': '98.49', 'delay': '0.6'}, {'queuingDelay': '0.093', 'bandwidth': '39.97', 'delay': '22.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.093', 'bandwidth': '39.97', 'delay': '22.9'}, {'queuingDelay': '0.012', 'bandwidth': '98.49', 'delay': '0.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.019', 'bandwidth': '89.95', 'delay': '3.0'}, {'queuingDelay': '0.083', 'bandwidth': '6.66', 'delay': '13.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.083', 'bandwidth': '6.66', 'delay': '13.2'}, {'queuingDelay': '0.019', 'bandwidth': '89.95', 'delay': '3.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.012', 'bandwidth': '57.84', 'delay': '0.5'}, {'queuingDelay': '0.086', 'bandwidth': '0.78', 'delay': '2.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.086', 'bandwidth': '0.78', 'delay': '2.8'}, {'queuingDelay': '0.012', 'bandwidth': '57.84', 'delay': '0.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.002', 'bandwidth': '63.62', 'delay': '0.7'}, {'queuingDelay': '0.085', 'bandwidth': '25.77', 'delay': '3.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.085', 'bandwidth': '25.77', 'delay': '3.9'}, {'queuingDelay': '0.002', 'bandwidth': '63.62', 'delay': '0.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.001', 'bandwidth': '22.65', 'delay': '6.0'}, {'queuingDelay': '0.084', 'bandwidth': '49.54', 'delay': '14.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.084', 'bandwidth': '49.54', 'delay': '14.7'}, {'queuingDelay': '0.001', 'bandwidth': '22.65', 'delay': '6.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.033', 'bandwidth': '10.22', 'delay': '14.6'}, {'queuingDelay': '0.094', 'bandwidth': '26.89', 'delay': '3.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.094', 'bandwidth': '26.89', 'delay': '3.7'}, {'queuingDelay': '0.033', 'bandwidth': '10.22', 'delay': '14.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.046', 'bandwidth': '9.25', 'delay': '18.9'}, {'queuingDelay': '0.081', 'bandwidth': '12.66', 'delay': '8.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.081', 'bandwidth': '12.66', 'delay': '8.2'}, {'queuingDelay': '0.046', 'bandwidth': '9.25', 'delay': '18.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.014', 'bandwidth': '14.84', 'delay': '12.7'}, {'queuingDelay': '0.096', 'bandwidth': '56.29', 'delay': '9.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.096', 'bandwidth': '56.29', 'delay': '9.3'}, {'queuingDelay': '0.014', 'bandwidth': '14.84', 'delay': '12.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.026', 'bandwidth': '31.02', 'delay': '10.7'}, {'queuingDelay': '0.089', 'bandwidth': '97.25', 'delay': '0.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.089', 'bandwidth': '97.25', 'delay': '0.1'}, {'queuingDelay': '0.026', 'bandwidth': '31.02', 'delay': '10.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.065', 'bandwidth': '91.86', 'delay': '11.8'}, {'queuingDelay': '0.075', 'bandwidth': '99.01', 'delay': '0.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.075', 'bandwidth': '99.01', 'delay': '0.0'}, {'queuingDelay': '0.065', 'bandwidth': '91.86', 'delay': '11.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.100', 'bandwidth': '60.48', 'delay': '2.9'}, {'queuingDelay': '0.059', 'bandwidth': '83.14', 'delay': '1.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.059', 'bandwidth': '83.14', 'delay': '1.9'}, {'queuingDelay': '0.100', 'bandwidth': '60.48', 'delay': '2.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.100', 'bandwidth': '7.16', 'delay': '2.5'}, {'queuingDelay': '0.043', 'bandwidth': '85.87', 'delay': '7.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.043', 'bandwidth': '85.87', 'delay': '7.2'}, {'queuingDelay': '0.100', 'bandwidth': '7.16', 'delay': '2.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.096', 'bandwidth': '18.89', 'delay': '2.8'}, {'queuingDelay': '0.011', 'bandwidth': '54.95', 'delay': '14.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.011', 'bandwidth': '54.95', 'delay': '14.5'}, {'queuingDelay': '0.096', 'bandwidth': '18.89', 'delay': '2.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.088', 'bandwidth': '11.36', 'delay': '12.8'}, {'queuingDelay': '0.007', 'bandwidth': '23.54', 'delay': '24.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.007', 'bandwidth': '23.54', 'delay': '24.3'}, {'queuingDelay': '0.088', 'bandwidth': '11.36', 'delay': '12.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.078', 'bandwidth': '5.99', 'delay': '24.2'}, {'queuingDelay': '0.011', 'bandwidth': '10.99', 'delay': '23.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.011', 'bandwidth': '10.99', 'delay': '23.3'}, {'queuingDelay': '0.078', 'bandwidth': '5.99', 'delay': '24.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.031', 'bandwidth': '0.45', 'delay': '21.5'}, {'queuingDelay': '0.010', 'bandwidth': '4.76', 'delay': '11.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.010', 'bandwidth': '4.76', 'delay': '11.9'}, {'queuingDelay': '0.031', 'bandwidth': '0.45', 'delay': '21.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.007', 'bandwidth': '40.60', 'delay': '24.4'}, {'queuingDelay': '0.012', 'bandwidth': '2.83', 'delay': '17.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.012', 'bandwidth': '2.83', 'delay': '17.6'}, {'queuingDelay': '0.007', 'bandwidth': '40.60', 'delay': '24.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.009', 'bandwidth': '2.19', 'delay': '22.8'}, {'queuingDelay': '0.006', 'bandwidth': '39.20', 'delay': '23.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.006', 'bandwidth': '39.20', 'delay': '23.8'}, {'queuingDelay': '0.009', 'bandwidth': '2.19', 'delay': '22.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.010', 'bandwidth': '2.74', 'delay': '7.1'}, {'queuingDelay': '0.001', 'bandwidth': '24.89', 'delay': '16.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.001', 'bandwidth': '24.89', 'delay': '16.7'}, {'queuingDelay': '0.010', 'bandwidth': '2.74', 'delay': '7.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.007', 'bandwidth': '58.17', 'delay': '4.9'}, {'queuingDelay': '0.003', 'bandwidth': '26.29', 'delay': '8.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.003', 'bandwidth': '26.29', 'delay': '8.6'}, {'queuingDelay': '0.007', 'bandwidth': '58.17', 'delay': '4.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.022', 'bandwidth': '64.71', 'delay': '17.7'}, {'queuingDelay': '0.015', 'bandwidth': '2.85', 'delay': '1.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.015', 'bandwidth': '2.85', 'delay': '1.8'}, {'queuingDelay': '0.022', 'bandwidth': '64.71', 'delay': '17.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.013', 'bandwidth': '70.38', 'delay': '18.8'}, {'queuingDelay': '0.002', 'bandwidth': '64.93', 'delay': '0.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.002', 'bandwidth': '64.93', 'delay': '0.3'}, {'queuingDelay': '0.013', 'bandwidth': '70.38', 'delay': '18.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.031', 'bandwidth': '83.00', 'delay': '24.3'}, {'queuingDelay': '0.052', 'bandwidth': '42.54', 'delay': '4.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.052', 'bandwidth': '42.54', 'delay': '4.6'}, {'queuingDelay': '0.031', 'bandwidth': '83.00', 'delay': '24.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.044', 'bandwidth': '89.71', 'delay': '21.9'}, {'queuingDelay': '0.083', 'bandwidth': '26.67', 'delay': '1.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.083', 'bandwidth': '26.67', 'delay': '1.4'}, {'queuingDelay': '0.044', 'bandwidth': '89.71', 'delay': '21.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.090', 'bandwidth': '83.94', 'delay': '25.0'}, {'queuingDelay': '0.054', 'bandwidth': '4.25', 'delay': '6.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.054', 'bandwidth': '4.25', 'delay': '6.9'}, {'queuingDelay': '0.090', 'bandwidth': '83.94', 'delay': '25.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.076', 'bandwidth': '99.94', 'delay': '14.2'}, {'queuingDelay': '0.048', 'bandwidth': '6.33', 'delay': '8.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.048', 'bandwidth': '6.33', 'delay': '8.6'}, {'queuingDelay': '0.076', 'bandwidth': '99.94', 'delay': '14.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.080', 'bandwidth': '85.80', 'delay': '24.7'}, {'queuingDelay': '0.006', 'bandwidth': '6.23', 'delay': '14.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.006', 'bandwidth': '6.23', 'delay': '14.8'}, {'queuingDelay': '0.080', 'bandwidth': '85.80', 'delay': '24.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.100', 'bandwidth': '92.71', 'delay': '23.3'}, {'queuingDelay': '0.002', 'bandwidth': '67.90', 'delay': '9.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.002', 'bandwidth': '67.90', 'delay': '9.7'}, {'queuingDelay': '0.100', 'bandwidth': '92.71', 'delay': '23.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.081', 'bandwidth': '99.62', 'delay': '11.1'}, {'queuingDelay': '0.008', 'bandwidth': '78.72', 'delay': '7.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.008', 'bandwidth': '78.72', 'delay': '7.2'}, {'queuingDelay': '0.081', 'bandwidth': '99.62', 'delay': '11.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.035', 'bandwidth': '91.71', 'delay': '21.5'}, {'queuingDelay': '0.006', 'bandwidth': '87.69', 'delay': '10.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.006', 'bandwidth': '87.69', 'delay': '10.5'}, {'queuingDelay': '0.035', 'bandwidth': '91.71', 'delay': '21.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.061', 'bandwidth': '98.35', 'delay': '22.8'}, {'queuingDelay': '0.001', 'bandwidth': '89.87', 'delay': '4.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.001', 'bandwidth': '89.87', 'delay': '4.6'}, {'queuingDelay': '0.061', 'bandwidth': '98.35', 'delay': '22.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.010', 'bandwidth': '84.33', 'delay': '24.1'}, {'queuingDelay': '0.027', 'bandwidth': '47.41', 'delay': '1.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.027', 'bandwidth': '47.41', 'delay': '1.4'}, {'queuingDelay': '0.010', 'bandwidth': '84.33', 'delay': '24.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.021', 'bandwidth': '40.59', 'delay': '19.9'}, {'queuingDelay': '0.029', 'bandwidth': '92.39', 'delay': '3.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.029', 'bandwidth': '92.39', 'delay': '3.4'}, {'queuingDelay': '0.021', 'bandwidth': '40.59', 'delay': '19.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.027', 'bandwidth': '88.56', 'delay': '12.7'}, {'queuingDelay': '0.028', 'bandwidth': '68.61', 'delay': '3.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.028', 'bandwidth': '68.61', 'delay': '3.5'}, {'queuingDelay': '0.027', 'bandwidth': '88.56', 'delay': '12.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.001', 'bandwidth': '90.28', 'delay': '20.7'}, {'queuingDelay': '0.045', 'bandwidth': '8.35', 'delay': '7.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.045', 'bandwidth': '8.35', 'delay': '7.8'}, {'queuingDelay': '0.001', 'bandwidth': '90.28', 'delay': '20.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.044', 'bandwidth': '74.78', 'delay': '23.2'}, {'queuingDelay': '0.096', 'bandwidth': '1.99', 'delay': '8.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.096', 'bandwidth': '1.99', 'delay': '8.9'}, {'queuingDelay': '0.044', 'bandwidth': '74.78', 'delay': '23.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.027', 'bandwidth': '51.60', 'delay': '11.2'}, {'queuingDelay': '0.096', 'bandwidth': '0.56', 'delay': '19.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.096', 'bandwidth': '0.56', 'delay': '19.0'}, {'queuingDelay': '0.027', 'bandwidth': '51.60', 'delay': '11.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.001', 'bandwidth': '96.04', 'delay': '19.8'}, {'queuingDelay': '0.092', 'bandwidth': '18.94', 'delay': '24.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.092', 'bandwidth': '18.94', 'delay': '24.7'}, {'queuingDelay': '0.001', 'bandwidth': '96.04', 'delay': '19.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.006', 'bandwidth': '73.76', 'delay': '14.7'}, {'queuingDelay': '0.061', 'bandwidth': '1.72', 'delay': '20.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.061', 'bandwidth': '1.72', 'delay': '20.0'}, {'queuingDelay': '0.006', 'bandwidth': '73.76', 'delay': '14.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.046', 'bandwidth': '95.91', 'delay': '24.7'}, {'queuingDelay': '0.097', 'bandwidth': '12.44', 'delay': '21.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.097', 'bandwidth': '12.44', 'delay': '21.3'}, {'queuingDelay': '0.046', 'bandwidth': '95.91', 'delay': '24.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.061', 'bandwidth': '91.54', 'delay': '15.5'}, {'queuingDelay': '0.087', 'bandwidth': '0.84', 'delay': '23.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.087', 'bandwidth': '0.84', 'delay': '23.7'}, {'queuingDelay': '0.061', 'bandwidth': '91.54', 'delay': '15.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.088', 'bandwidth': '46.12', 'delay': '18.5'}, {'queuingDelay': '0.085', 'bandwidth': '12.97', 'delay': '24.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.085', 'bandwidth': '12.97', 'delay': '24.1'}, {'queuingDelay': '0.088', 'bandwidth': '46.12', 'delay': '18.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.056', 'bandwidth': '37.53', 'delay': '18.9'}, {'queuingDelay': '0.057', 'bandwidth': '38.49', 'delay': '24.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.057', 'bandwidth': '38.49', 'delay': '24.0'}, {'queuingDelay': '0.056', 'bandwidth': '37.53', 'delay': '18.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.067', 'bandwidth': '95.67', 'delay': '20.3'}, {'queuingDelay': '0.037', 'bandwidth': '17.78', 'delay': '24.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.037', 'bandwidth': '17.78', 'delay': '24.1'}, {'queuingDelay': '0.067', 'bandwidth': '95.67', 'delay': '20.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.045', 'bandwidth': '97.76', 'delay': '24.4'}, {'queuingDelay': '0.004', 'bandwidth': '45.52', 'delay': '13.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.004', 'bandwidth': '45.52', 'delay': '13.9'}, {'queuingDelay': '0.045', 'bandwidth': '97.76', 'delay': '24.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.046', 'bandwidth': '95.73', 'delay': '24.3'}, {'queuingDelay': '0.042', 'bandwidth': '75.61', 'delay': '23.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.042', 'bandwidth': '75.61', 'delay': '23.4'}, {'queuingDelay': '0.046', 'bandwidth': '95.73', 'delay': '24.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.072', 'bandwidth': '94.08', 'delay': '24.2'}, {'queuingDelay': '0.096', 'bandwidth': '71.87', 'delay': '24.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.096', 'bandwidth': '71.87', 'delay': '24.9'}, {'queuingDelay': '0.072', 'bandwidth': '94.08', 'delay': '24.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.047', 'bandwidth': '60.04', 'delay': '13.4'}, {'queuingDelay': '0.042', 'bandwidth': '53.83', 'delay': '24.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.042', 'bandwidth': '53.83', 'delay': '24.9'}, {'queuingDelay': '0.047', 'bandwidth': '60.04', 'delay': '13.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.098', 'bandwidth': '81.98', 'delay': '7.8'}, {'queuingDelay': '0.040', 'bandwidth': '83.93', 'delay': '24.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.040', 'bandwidth': '83.93', 'delay': '24.9'}, {'queuingDelay': '0.098', 'bandwidth': '81.98', 'delay': '7.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.087', 'bandwidth': '94.43', 'delay': '3.5'}, {'queuingDelay': '0.013', 'bandwidth': '82.58', 'delay': '14.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.013', 'bandwidth': '82.58', 'delay': '14.5'}, {'queuingDelay': '0.087', 'bandwidth': '94.43', 'delay': '3.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.041', 'bandwidth': '89.77', 'delay': '3.0'}, {'queuingDelay': '0.052', 'bandwidth': '88.99', 'delay': '7.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.052', 'bandwidth': '88.99', 'delay': '7.3'}, {'queuingDelay': '0.041', 'bandwidth': '89.77', 'delay': '3.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.002', 'bandwidth': '96.03', 'delay': '8.5'}, {'queuingDelay': '0.095', 'bandwidth': '85.34', 'delay': '4.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.095', 'bandwidth': '85.34', 'delay': '4.3'}, {'queuingDelay': '0.002', 'bandwidth': '96.03', 'delay': '8.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.006', 'bandwidth': '38.68', 'delay': '2.6'}, {'queuingDelay': '0.064', 'bandwidth': '98.68', 'delay': '3.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.064', 'bandwidth': '98.68', 'delay': '3.1'}, {'queuingDelay': '0.006', 'bandwidth': '38.68', 'delay': '2.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.048', 'bandwidth': '13.03', 'delay': '2.6'}, {'queuingDelay': '0.094', 'bandwidth': '96.20', 'delay': '1.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.094', 'bandwidth': '96.20', 'delay': '1.0'}, {'queuingDelay': '0.048', 'bandwidth': '13.03', 'delay': '2.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.062', 'bandwidth': '9.84', 'delay': '0.5'}, {'queuingDelay': '0.029', 'bandwidth': '83.46', 'delay': '0.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.029', 'bandwidth': '83.46', 'delay': '0.7'}, {'queuingDelay': '0.062', 'bandwidth': '9.84', 'delay': '0.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.077', 'bandwidth': '2.09', 'delay': '14.4'}, {'queuingDelay': '0.053', 'bandwidth': '72.94', 'delay': '0.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.053', 'bandwidth': '72.94', 'delay': '0.4'}, {'queuingDelay': '0.077', 'bandwidth': '2.09', 'delay': '14.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.071', 'bandwidth': '8.64', 'delay': '13.6'}, {'queuingDelay': '0.014', 'bandwidth': '75.93', 'delay': '1.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.014', 'bandwidth': '75.93', 'delay': '1.7'}, {'queuingDelay': '0.071', 'bandwidth': '8.64', 'delay': '13.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.098', 'bandwidth': '7.65', 'delay': '23.5'}, {'queuingDelay': '0.023', 'bandwidth': '83.33', 'delay': '0.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.023', 'bandwidth': '83.33', 'delay': '0.2'}, {'queuingDelay': '0.098', 'bandwidth': '7.65', 'delay': '23.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.096', 'bandwidth': '8.13', 'delay': '20.2'}, {'queuingDelay': '0.003', 'bandwidth': '81.72', 'delay': '10.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.003', 'bandwidth': '81.72', 'delay': '10.6'}, {'queuingDelay': '0.096', 'bandwidth': '8.13', 'delay': '20.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.099', 'bandwidth': '13.87', 'delay': '24.6'}, {'queuingDelay': '0.033', 'bandwidth': '92.98', 'delay': '21.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.033', 'bandwidth': '92.98', 'delay': '21.3'}, {'queuingDelay': '0.099', 'bandwidth': '13.87', 'delay': '24.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.100', 'bandwidth': '54.09', 'delay': '20.8'}, {'queuingDelay': '0.053', 'bandwidth': '96.60', 'delay': '6.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.053', 'bandwidth': '96.60', 'delay': '6.6'}, {'queuingDelay': '0.100', 'bandwidth': '54.09', 'delay': '20.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.081', 'bandwidth': '93.44', 'delay': '21.7'}, {'queuingDelay': '0.007', 'bandwidth': '97.94', 'delay': '7.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.007', 'bandwidth': '97.94', 'delay': '7.0'}, {'queuingDelay': '0.081', 'bandwidth': '93.44', 'delay': '21.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.099', 'bandwidth': '47.41', 'delay': '5.2'}, {'queuingDelay': '0.009', 'bandwidth': '39.47', 'delay': '1.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.009', 'bandwidth': '39.47', 'delay': '1.3'}, {'queuingDelay': '0.099', 'bandwidth': '47.41', 'delay': '5.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.047', 'bandwidth': '80.36', 'delay': '5.5'}, {'queuingDelay': '0.062', 'bandwidth': '9.81', 'delay': '0.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.062', 'bandwidth': '9.81', 'delay': '0.3'}, {'queuingDelay': '0.047', 'bandwidth': '80.36', 'delay': '5.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.049', 'bandwidth': '99.25', 'delay': '0.9'}, {'queuingDelay': '0.080', 'bandwidth': '2.48', 'delay': '11.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.080', 'bandwidth': '2.48', 'delay': '11.6'}, {'queuingDelay': '0.049', 'bandwidth': '99.25', 'delay': '0.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.047', 'bandwidth': '62.67', 'delay': '0.3'}, {'queuingDelay': '0.094', 'bandwidth': '34.34', 'delay': '23.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.094', 'bandwidth': '34.34', 'delay': '23.3'}, {'queuingDelay': '0.047', 'bandwidth': '62.67', 'delay': '0.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.099', 'bandwidth': '52.52', 'delay': '7.0'}, {'queuingDelay': '0.100', 'bandwidth': '17.04', 'delay': '17.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.100', 'bandwidth': '17.04', 'delay': '17.3'}, {'queuingDelay': '0.099', 'bandwidth': '52.52', 'delay': '7.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.081', 'bandwidth': '38.10', 'delay': '16.5'}, {'queuingDelay': '0.084', 'bandwidth': '39.29', 'delay': '22.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.084', 'bandwidth': '39.29', 'delay': '22.6'}, {'queuingDelay': '0.081', 'bandwidth': '38.10', 'delay': '16.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.091', 'bandwidth': '69.77', 'delay': '15.4'}, {'queuingDelay': '0.065', 'bandwidth': '1.36', 'delay': '24.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.065', 'bandwidth': '1.36', 'delay': '24.6'}, {'queuingDelay': '0.091', 'bandwidth': '69.77', 'delay': '15.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.080', 'bandwidth': '14.79', 'delay': '24.7'}, {'queuingDelay': '0.080', 'bandwidth': '4.87', 'delay': '24.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.080', 'bandwidth': '4.87', 'delay': '24.2'}, {'queuingDelay': '0.080', 'bandwidth': '14.79', 'delay': '24.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.062', 'bandwidth': '44.00', 'delay': '18.9'}, {'queuingDelay': '0.006', 'bandwidth': '60.02', 'delay': '24.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.006', 'bandwidth': '60.02', 'delay': '24.5'}, {'queuingDelay': '0.062', 'bandwidth': '44.00', 'delay': '18.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.083', 'bandwidth': '1.70', 'delay': '11.6'}, {'queuingDelay': '0.006', 'bandwidth': '78.44', 'delay': '24.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.006', 'bandwidth': '78.44', 'delay': '24.5'}, {'queuingDelay': '0.083', 'bandwidth': '1.70', 'delay': '11.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.075', 'bandwidth': '0.89', 'delay': '4.8'}, {'queuingDelay': '0.002', 'bandwidth': '57.26', 'delay': '16.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.002', 'bandwidth': '57.26', 'delay': '16.2'}, {'queuingDelay': '0.075', 'bandwidth': '0.89', 'delay': '4.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.006', 'bandwidth': '22.23', 'delay': '4.0'}, {'queuingDelay': '0.002', 'bandwidth': '34.59', 'delay': '18.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.002', 'bandwidth': '34.59', 'delay': '18.3'}, {'queuingDelay': '0.006', 'bandwidth': '22.23', 'delay': '4.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.050', 'bandwidth': '42.93', 'delay': '4.7'}, {'queuingDelay': '0.000', 'bandwidth': '2.53', 'delay': '11.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.000', 'bandwidth': '2.53', 'delay': '11.0'}, {'queuingDelay': '0.050', 'bandwidth': '42.93', 'delay': '4.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.093', 'bandwidth': '48.05', 'delay': '0.3'}, {'queuingDelay': '0.016', 'bandwidth': '12.12', 'delay': '4.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.016', 'bandwidth': '12.12', 'delay': '4.1'}, {'queuingDelay': '0.093', 'bandwidth': '48.05', 'delay': '0.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.097', 'bandwidth': '28.31', 'delay': '17.5'}, {'queuingDelay': '0.017', 'bandwidth': '17.72', 'delay': '3.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.017', 'bandwidth': '17.72', 'delay': '3.2'}, {'queuingDelay': '0.097', 'bandwidth': '28.31', 'delay': '17.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.097', 'bandwidth': '91.70', 'delay': '25.0'}, {'queuingDelay': '0.019', 'bandwidth': '19.01', 'delay': '2.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.019', 'bandwidth': '19.01', 'delay': '2.6'}, {'queuingDelay': '0.097', 'bandwidth': '91.70', 'delay': '25.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.098', 'bandwidth': '76.19', 'delay': '8.7'}, {'queuingDelay': '0.009', 'bandwidth': '2.17', 'delay': '0.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.009', 'bandwidth': '2.17', 'delay': '0.4'}, {'queuingDelay': '0.098', 'bandwidth': '76.19', 'delay': '8.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.056', 'bandwidth': '89.87', 'delay': '2.5'}, {'queuingDelay': '0.024', 'bandwidth': '12.00', 'delay': '10.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.024', 'bandwidth': '12.00', 'delay': '10.0'}, {'queuingDelay': '0.056', 'bandwidth': '89.87', 'delay': '2.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.023', 'bandwidth': '97.05', 'delay': '9.0'}, {'queuingDelay': '0.009', 'bandwidth': '1.23', 'delay': '6.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.009', 'bandwidth': '1.23', 'delay': '6.0'}, {'queuingDelay': '0.023', 'bandwidth': '97.05', 'delay': '9.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.010', 'bandwidth': '69.47', 'delay': '0.7'}, {'queuingDelay': '0.000', 'bandwidth': '11.15', 'delay': '21.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.000', 'bandwidth': '11.15', 'delay': '21.5'}, {'queuingDelay': '0.010', 'bandwidth': '69.47', 'delay': '0.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.002', 'bandwidth': '51.98', 'delay': '0.4'}, {'queuingDelay': '0.051', 'bandwidth': '3.09', 'delay': '17.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.051', 'bandwidth': '3.09', 'delay': '17.0'}, {'queuingDelay': '0.002', 'bandwidth': '51.98', 'delay': '0.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.031', 'bandwidth': '13.56', 'delay': '11.5'}, {'queuingDelay': '0.021', 'bandwidth': '13.81', 'delay': '24.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.021', 'bandwidth': '13.81', 'delay': '24.6'}, {'queuingDelay': '0.031', 'bandwidth': '13.56', 'delay': '11.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.013', 'bandwidth': '61.83', 'delay': '23.5'}, {'queuingDelay': '0.007', 'bandwidth': '45.38', 'delay': '23.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.007', 'bandwidth': '45.38', 'delay': '23.1'}, {'queuingDelay': '0.013', 'bandwidth': '61.83', 'delay': '23.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.022', 'bandwidth': '87.65', 'delay': '24.3'}, {'queuingDelay': '0.026', 'bandwidth': '5.48', 'delay': '23.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.026', 'bandwidth': '5.48', 'delay': '23.4'}, {'queuingDelay': '0.022', 'bandwidth': '87.65', 'delay': '24.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.010', 'bandwidth': '96.66', 'delay': '4.1'}, {'queuingDelay': '0.072', 'bandwidth': '1.00', 'delay': '19.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.072', 'bandwidth': '1.00', 'delay': '19.5'}, {'queuingDelay': '0.010', 'bandwidth': '96.66', 'delay': '4.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.013', 'bandwidth': '86.66', 'delay': '0.3'}, {'queuingDelay': '0.064', 'bandwidth': '90.23', 'delay': '11.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.064', 'bandwidth': '90.23', 'delay': '11.5'}, {'queuingDelay': '0.013', 'bandwidth': '86.66', 'delay': '0.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.037', 'bandwidth': '97.08', 'delay': '0.4'}, {'queuingDelay': '0.038', 'bandwidth': '99.73', 'delay': '0.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.038', 'bandwidth': '99.73', 'delay': '0.5'}, {'queuingDelay': '0.037', 'bandwidth': '97.08', 'delay': '0.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.014', 'bandwidth': '99.34', 'delay': '20.2'}, {'queuingDelay': '0.076', 'bandwidth': '94.80', 'delay': '0.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.076', 'bandwidth': '94.80', 'delay': '0.3'}, {'queuingDelay': '0.014', 'bandwidth': '99.34', 'delay': '20.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.043', 'bandwidth': '95.86', 'delay': '14.2'}, {'queuingDelay': '0.100', 'bandwidth': '97.73', 'delay': '13.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.100', 'bandwidth': '97.73', 'delay': '13.2'}, {'queuingDelay': '0.043', 'bandwidth': '95.86', 'delay': '14.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.092', 'bandwidth': '95.12', 'delay': '21.4'}, {'queuingDelay': '0.089', 'bandwidth': '77.31', 'delay': '12.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.089', 'bandwidth': '77.31', 'delay': '12.0'}, {'queuingDelay': '0.092', 'bandwidth': '95.12', 'delay': '21.4'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.098', 'bandwidth': '98.79', 'delay': '1.6'}, {'queuingDelay': '0.034', 'bandwidth': '90.75', 'delay': '17.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.034', 'bandwidth': '90.75', 'delay': '17.8'}, {'queuingDelay': '0.098', 'bandwidth': '98.79', 'delay': '1.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.074', 'bandwidth': '65.09', 'delay': '1.0'}, {'queuingDelay': '0.099', 'bandwidth': '94.21', 'delay': '23.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.099', 'bandwidth': '94.21', 'delay': '23.5'}, {'queuingDelay': '0.074', 'bandwidth': '65.09', 'delay': '1.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.092', 'bandwidth': '13.43', 'delay': '3.6'}, {'queuingDelay': '0.087', 'bandwidth': '99.15', 'delay': '24.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.087', 'bandwidth': '99.15', 'delay': '24.3'}, {'queuingDelay': '0.092', 'bandwidth': '13.43', 'delay': '3.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.092', 'bandwidth': '62.86', 'delay': '7.3'}, {'queuingDelay': '0.094', 'bandwidth': '24.70', 'delay': '23.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.094', 'bandwidth': '24.70', 'delay': '23.7'}, {'queuingDelay': '0.092', 'bandwidth': '62.86', 'delay': '7.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.022', 'bandwidth': '0.89', 'delay': '1.5'}, {'queuingDelay': '0.094', 'bandwidth': '10.25', 'delay': '11.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.094', 'bandwidth': '10.25', 'delay': '11.1'}, {'queuingDelay': '0.022', 'bandwidth': '0.89', 'delay': '1.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.068', 'bandwidth': '11.55', 'delay': '0.7'}, {'queuingDelay': '0.089', 'bandwidth': '0.96', 'delay': '2.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.089', 'bandwidth': '0.96', 'delay': '2.2'}, {'queuingDelay': '0.068', 'bandwidth': '11.55', 'delay': '0.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.012', 'bandwidth': '2.83', 'delay': '7.7'}, {'queuingDelay': '0.019', 'bandwidth': '3.64', 'delay': '1.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.019', 'bandwidth': '3.64', 'delay': '1.6'}, {'queuingDelay': '0.012', 'bandwidth': '2.83', 'delay': '7.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.007', 'bandwidth': '17.10', 'delay': '1.9'}, {'queuingDelay': '0.011', 'bandwidth': '78.52', 'delay': '2.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.011', 'bandwidth': '78.52', 'delay': '2.7'}, {'queuingDelay': '0.007', 'bandwidth': '17.10', 'delay': '1.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.079', 'bandwidth': '88.42', 'delay': '3.5'}, {'queuingDelay': '0.005', 'bandwidth': '79.24', 'delay': '2.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.005', 'bandwidth': '79.24', 'delay': '2.1'}, {'queuingDelay': '0.079', 'bandwidth': '88.42', 'delay': '3.5'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.091', 'bandwidth': '97.19', 'delay': '1.3'}, {'queuingDelay': '0.096', 'bandwidth': '39.16', 'delay': '1.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.096', 'bandwidth': '39.16', 'delay': '1.3'}, {'queuingDelay': '0.091', 'bandwidth': '97.19', 'delay': '1.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.088', 'bandwidth': '95.13', 'delay': '1.6'}, {'queuingDelay': '0.026', 'bandwidth': '7.86', 'delay': '24.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.026', 'bandwidth': '7.86', 'delay': '24.9'}, {'queuingDelay': '0.088', 'bandwidth': '95.13', 'delay': '1.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.015', 'bandwidth': '92.06', 'delay': '7.8'}, {'queuingDelay': '0.025', 'bandwidth': '96.06', 'delay': '24.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.025', 'bandwidth': '96.06', 'delay': '24.8'}, {'queuingDelay': '0.015', 'bandwidth': '92.06', 'delay': '7.8'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.002', 'bandwidth': '90.57', 'delay': '11.3'}, {'queuingDelay': '0.069', 'bandwidth': '99.72', 'delay': '21.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.069', 'bandwidth': '99.72', 'delay': '21.1'}, {'queuingDelay': '0.002', 'bandwidth': '90.57', 'delay': '11.3'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.008', 'bandwidth': '59.93', 'delay': '24.1'}, {'queuingDelay': '0.089', 'bandwidth': '75.47', 'delay': '8.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.089', 'bandwidth': '75.47', 'delay': '8.9'}, {'queuingDelay': '0.008', 'bandwidth': '59.93', 'delay': '24.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.007', 'bandwidth': '25.73', 'delay': '23.0'}, {'queuingDelay': '0.093', 'bandwidth': '12.85', 'delay': '24.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.093', 'bandwidth': '12.85', 'delay': '24.9'}, {'queuingDelay': '0.007', 'bandwidth': '25.73', 'delay': '23.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.005', 'bandwidth': '0.86', 'delay': '23.1'}, {'queuingDelay': '0.095', 'bandwidth': '68.30', 'delay': '24.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.095', 'bandwidth': '68.30', 'delay': '24.0'}, {'queuingDelay': '0.005', 'bandwidth': '0.86', 'delay': '23.1'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.003', 'bandwidth': '25.53', 'delay': '24.2'}, {'queuingDelay': '0.085', 'bandwidth': '86.49', 'delay': '18.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.085', 'bandwidth': '86.49', 'delay': '18.7'}, {'queuingDelay': '0.003', 'bandwidth': '25.53', 'delay': '24.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.053', 'bandwidth': '6.04', 'delay': '24.9'}, {'queuingDelay': '0.051', 'bandwidth': '95.21', 'delay': '24.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.051', 'bandwidth': '95.21', 'delay': '24.7'}, {'queuingDelay': '0.053', 'bandwidth': '6.04', 'delay': '24.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.005', 'bandwidth': '0.57', 'delay': '25.0'}, {'queuingDelay': '0.022', 'bandwidth': '88.00', 'delay': '0.7'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.022', 'bandwidth': '88.00', 'delay': '0.7'}, {'queuingDelay': '0.005', 'bandwidth': '0.57', 'delay': '25.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.008', 'bandwidth': '37.37', 'delay': '5.6'}, {'queuingDelay': '0.053', 'bandwidth': '3.30', 'delay': '1.0'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.053', 'bandwidth': '3.30', 'delay': '1.0'}, {'queuingDelay': '0.008', 'bandwidth': '37.37', 'delay': '5.6'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.012', 'bandwidth': '1.07', 'delay': '2.2'}, {'queuingDelay': '0.099', 'bandwidth': '1.71', 'delay': '6.9'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}, {'paths': [{'queuingDelay': '0.099', 'bandwidth': '1.71', 'delay': '6.9'}, {'queuingDelay': '0.012', 'bandwidth': '1.07', 'delay': '2.2'}], 'netem': [(0, 0, 'loss 0.00%'), (1, 0, 'loss 0.00%')]}]
+    mptcpTopos = core.TopoDesignFile(DESIGN_PATH)
 
+    journal = core.CampaignJournal(JOURNAL_PATH)
+    resultCache = core.ResultCache(RESULT_CACHE_PATH)
+    timeoutModel = core.TimeoutModel(RUNTIMES_PATH, maxTimeout=core.THREAD_TIMEOUT)
+    resultStore = core.ResultStore(RESULT_STORE_PATH)
+    # If adaptiveReplication, a configuration is not repeated anymore once its completion time converged, and the
+    # campaign stops before times rounds if all did
+    replication = core.AdaptiveReplication(REPLICATION_PATH) if adaptiveReplication else None
     for i in range(times):
-        quicTests(mptcpTopos)
+        quicTests(mptcpTopos, journal=journal, resultCache=resultCache, timeoutModel=timeoutModel, resultStore=resultStore,
+                  replication=replication)
+        if replication is not None and replication.done():
+            break
+    journal.close()
+    resultCache.close()
+    timeoutModel.close()
+    resultStore.close()
+    if replication is not None:
+        for line in replication.report():
+            print(line)
+        replication.close()
 
 launchTests(times=3)
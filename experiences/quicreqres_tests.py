@@ -12,6 +12,17 @@ import os
 REMOTE_SERVER_RUNNER_HOSTNAME = ["mininet@localhost"]
 REMOTE_SERVER_RUNNER_PORT = ["8022"]
 
+# Remove this file to run the campaign again instead of resuming it; the jobs already run with the same
+# specification, kernel and Minitopo are still linked from RESULT_CACHE_PATH unless it is removed too
+JOURNAL_PATH = os.path.splitext(os.path.basename(__file__))[0] + ".journal"
+# Shared by all the campaign scripts, so that identical experiences (same specification, kernel and Minitopo of the
+# hosts) are only run once
+RESULT_CACHE_PATH = "results.cache"
+# Parsed results of all the campaigns, for the analyses (see core.ResultStore)
+RESULT_STORE_PATH = "results.store"
+# Runtimes of the experiences, from which the timeout of each job is predicted
+RUNTIMES_PATH = "runtimes.model"
+
 
 def getPostProcessingList(**kwargs):
     toReturn = []
@@ -34,32 +45,30 @@ def getPostProcessingList(**kwargs):
     return toReturn
 
 
-def quicSiriTests(topos, protocol="mptcp", tmpfs="/mnt/tmpfs"):
-    experienceLauncher = core.ExperienceLauncher(REMOTE_SERVER_RUNNER_HOSTNAME, REMOTE_SERVER_RUNNER_PORT)
-
-    def testsMultipath(**kwargs):
-        def test(**kwargs):
-            xpDict = {
-                XP_TYPE: QUICREQRES,
-                SCHEDULER_CLIENT: "default",
-                SCHEDULER_SERVER: "default",
-                CC: "olia" if kwargs["multipath"] == 1 else "cubic",
-                CLIENT_PCAP: "yes",
-                SERVER_PCAP: "yes",
-                QUIC_MULTIPATH: kwargs["multipath"],
-                QUICREQRES_RUN_TIME: 30,
-                RMEM: (10240, 87380, 16777216),
-            }
-            if int(kwargs["multipath"]) == 0:
-                kwargs["protocol"] = "tcp"
-
-            kwargs["postProcessing"] = getPostProcessingList(**kwargs)
-            core.experiment(experienceLauncher, xpDict, **kwargs)
-
-        core.experimentFor("multipath", [0, 1], test, **kwargs)
-        # core.experimentFor("multipath", [1], test, **kwargs)
-
-    core.experimentTopos(topos, "siri_quicreqres", protocol, tmpfs, testsMultipath)
+def quicSiriTests(topos, protocol="mptcp", tmpfs="/mnt/tmpfs", journal=None, resultCache=None, timeoutModel=None, resultStore=None):
+    experienceLauncher = core.ExperienceLauncher(REMOTE_SERVER_RUNNER_HOSTNAME, REMOTE_SERVER_RUNNER_PORT, journal=journal,
+                                                 resultCache=resultCache, timeoutModel=timeoutModel, resultStore=resultStore)
+
+    def test(**kwargs):
+        xpDict = {
+            XP_TYPE: QUICREQRES,
+            SCHEDULER_CLIENT: "default",
+            SCHEDULER_SERVER: "default",
+            CC: "olia" if kwargs["multipath"] == 1 else "cubic",
+            CLIENT_PCAP: "yes",
+            SERVER_PCAP: "yes",
+            QUIC_MULTIPATH: kwargs["multipath"],
+            QUICREQRES_RUN_TIME: 30,
+            RMEM: (10240, 87380, 16777216),
+        }
+        if int(kwargs["multipath"]) == 0:
+            kwargs["protocol"] = "tcp"
+
+        kwargs["postProcessing"] = getPostProcessingList(**kwargs)
+        core.experiment(experienceLauncher, xpDict, **kwargs)
+
+    sweep = core.Sweep(("multipath", [0, 1]))
+    core.experimentTopos(topos, "siri_quicreqres", protocol, tmpfs, sweep.expand(test))
     experienceLauncher.finish()
 
 
@@ -73,7 +82,15 @@ def launchTests(times=5):
         {PATHS: [{DELAY: 7.5, BANDWIDTH: 10}, {DELAY: 12.5, BANDWIDTH: 10}], NETEM: [(0, 0, "loss 0%"), (1, 0, "loss 0%"), (0, 7, "loss 100%")]},
     ]
 
+    journal = core.CampaignJournal(JOURNAL_PATH)
+    resultCache = core.ResultCache(RESULT_CACHE_PATH)
+    timeoutModel = core.TimeoutModel(RUNTIMES_PATH, maxTimeout=core.THREAD_TIMEOUT)
+    resultStore = core.ResultStore(RESULT_STORE_PATH)
     for i in range(times):
-        quicSiriTests(topos)
+        quicSiriTests(topos, journal=journal, resultCache=resultCache, timeoutModel=timeoutModel, resultStore=resultStore)
+    journal.close()
+    resultCache.close()
+    timeoutModel.close()
+    resultStore.close()
 
 launchTests(times=5)
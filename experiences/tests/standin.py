@@ -0,0 +1,83 @@
+import os
+
+from kernel_state import MPTCP_ENABLED_PATH
+from transport import LocalTransport
+
+""" Stand-in emulation hosts for the tests of the launchers, as in benchmark_orchestration.py: each host is a directory of
+    this machine reached through LocalTransport, with stand-ins of sudo, mn and mpPerf.py that do nothing but create the
+    files Minitopo would
+"""
+
+""" Relative, so that each stand-in host has its own tmpfs in its directory """
+STANDIN_TMPFS = "tmpfs"
+POST_PROCESSING = [("ping.log", "ping.log"), ("https_client.log", "https_client.log")]
+
+STANDIN_SUDO = """#!/bin/sh
+# Kernel parameters are written with "sudo tee"; don't touch the real ones
+if [ "$1" = "tee" ]; then exec cat > /dev/null; fi
+exec "$@"
+"""
+STANDIN_MN = """#!/bin/sh
+exit 0
+"""
+STANDIN_MPPERF = """#!/bin/sh
+# Named after its directory, so that the readiness probe of a stand-in host only sees its own experience
+exec sh -c 'sleep %s
+for f in """ + " ".join([remoteFilename for remoteFilename, _ in POST_PROCESSING]) + """; do echo $f > $f; done' "mpPerf.py $PWD"
+"""
+""" The pattern of the readiness probe matching Minitopo experiences """
+MPPERF_PATTERN = "'[m]pPerf.py'"
+
+
+def writeStandIn(binDir, name, content):
+    path = os.path.join(binDir, name)
+    standIn = open(path, "w")
+    standIn.write(content)
+    standIn.close()
+    os.chmod(path, 0o755)
+
+
+def standInBin(rootDir, runtime=0):
+    """ Write the stand-ins in rootDir/bin, with experiences lasting runtime seconds, and return the path of mpPerf.py """
+    binDir = os.path.join(rootDir, "bin")
+    os.mkdir(binDir)
+    writeStandIn(binDir, "sudo", STANDIN_SUDO)
+    writeStandIn(binDir, "mn", STANDIN_MN)
+    writeStandIn(binDir, "mpPerf.py", STANDIN_MPPERF % runtime)
+    return os.path.join(binDir, "mpPerf.py")
+
+
+class StandInTransport(LocalTransport):
+    """ Each host is the directory rootDir/host_<num>: its commands start there, with it as HOME, and find the stand-ins
+        of rootDir/bin first in their PATH
+    """
+    def __init__(self, remoteHostnames, remotePorts, rootDir):
+        LocalTransport.__init__(self, remoteHostnames, remotePorts)
+        self.homes = []
+        for num in range(len(remoteHostnames)):
+            home = os.path.join(rootDir, "host_" + str(num))
+            # Like the tmpfs mounted on the real hosts, it exists before the first job
+            os.makedirs(os.path.join(home, STANDIN_TMPFS))
+            open(os.path.join(home, "mptcp_enabled"), "w").close()
+            self.homes.append(home)
+        self.binDir = os.path.join(rootDir, "bin")
+
+    def shellCmd(self, num, remoteCmd):
+        # The readiness probe only looks at the experiences of the host and at its stand-in of the MPTCP sysctl
+        remoteCmd = remoteCmd.replace(MPPERF_PATTERN, "'[m]pPerf.py " + self.homes[num] + "/'")
+        remoteCmd = remoteCmd.replace(MPTCP_ENABLED_PATH, os.path.join(self.homes[num], "mptcp_enabled"))
+        return LocalTransport.shellCmd(self, num, "cd " + self.homes[num] + " && HOME=" + self.homes[num] + " PATH=" +
+                                       self.binDir + ":$PATH && " + remoteCmd)
+
+    def putCmd(self, num, filename, path):
+        return LocalTransport.putCmd(self, num, filename, os.path.join(self.homes[num], path))
+
+    def getCmd(self, num, remoteFilename, newFilename):
+        return LocalTransport.getCmd(self, num, os.path.join(self.homes[num], remoteFilename), newFilename)
+
+
+def standInTransport(rootDir):
+    """ Return the transport to give to the launcher for stand-in hosts in rootDir """
+    def transport(remoteHostnames, remotePorts):
+        return StandInTransport(remoteHostnames, remotePorts, rootDir)
+    return transport
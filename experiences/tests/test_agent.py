@@ -0,0 +1,198 @@
+import io
+import json
+import os
+import shutil
+import sys
+import tarfile
+import tempfile
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+from agent import ChunkedWriter, archiveArtifacts
+from agent_launcher import MAX_KERNEL_FAILURES, AgentChannel, AgentExperienceLauncher
+from events import PhaseEvents
+from kernel_state import KernelStateCache
+from slots import Slot
+from transport import LocalTransport
+
+
+def agentJob(tmpfs, **kwargs):
+    job = {
+        "id": "job",
+        "tmpfs": tmpfs,
+        "files": {},
+        "kernelCmd": None,
+        "cleanCmd": "true",
+        "fallbackCleanCmd": None,
+        "readyCmd": "true",
+        "readyTimeout": 5,
+        "cmd": "cd " + tmpfs + " && echo result > result.log && echo out",
+        "timeout": 10,
+        "killCmd": "true",
+        "artifacts": [os.path.join(tmpfs, "result.log"), os.path.join(tmpfs, "minitopo.out"),
+                      os.path.join(tmpfs, "missing.log")],
+        "compress": False,
+    }
+    job.update(kwargs)
+    return job
+
+
+def archiveContents(archive, compress=False):
+    tar = tarfile.open(fileobj=io.BytesIO(archive), mode="r:gz" if compress else "r:")
+    contents = dict((member.name, tar.extractfile(member).read()) for member in tar)
+    tar.close()
+    return contents
+
+
+class AgentProtocolTest(unittest.TestCase):
+    """ The agent runs here, through LocalTransport, as it would on a host """
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.hostDir = tempfile.mkdtemp()
+        # The agent is copied in the directory the transport runs the commands in
+        os.chdir(self.hostDir)
+        self.tmpfs = os.path.join(self.hostDir, "tmpfs", "job_1")
+        self.channel = AgentChannel(LocalTransport(["host"], ["22"]), 0, python=sys.executable)
+
+    def tearDown(self):
+        self.channel.close()
+        os.chdir(self.cwd)
+        shutil.rmtree(self.hostDir)
+
+    def test_job(self):
+        files = {"xp": "eHBUeXBlOmh0dHBz"}
+        reply, archive = self.channel.request(agentJob(self.tmpfs, files=files, cmd="cat " + self.tmpfs + "/xp > " +
+                                                       self.tmpfs + "/result.log && echo out"), 30)
+        self.assertEqual(reply["id"], "job")
+        self.assertEqual((reply["returnCode"], reply["timedOut"], reply["hostReady"]), (0, False, True))
+        self.assertEqual([phase["phase"] for phase in reply["phases"]], ["upload", "clean", "run", "collect"])
+        self.assertTrue(all(phase["ok"] for phase in reply["phases"]))
+        # The artifacts are named by their index, the missing ones are skipped
+        self.assertEqual(archiveContents(archive), {"0": b"xpType:https", "1": b"out\n"})
+        self.assertFalse(os.path.exists(self.tmpfs))
+
+    def test_jobs_share_the_agent(self):
+        for compress in (False, True):
+            reply, archive = self.channel.request(agentJob(self.tmpfs, compress=compress), 30)
+            self.assertEqual(archiveContents(archive, compress=compress)["0"], b"result\n")
+        self.assertEqual(self.channel.starts, 1)
+
+    def test_kernel_failure(self):
+        reply, archive = self.channel.request(agentJob(self.tmpfs, kernelCmd="echo boot; false"), 30)
+        self.assertEqual(reply["kernel"], {"returnCode": 1, "out": "boot\n"})
+        self.assertEqual([(phase["phase"], phase["ok"]) for phase in reply["phases"]],
+                         [("upload", True), ("kernel", False)])
+        self.assertEqual(archive, b"")
+
+    def test_timeout(self):
+        reply, archive = self.channel.request(agentJob(self.tmpfs, cmd="sleep 30", timeout=0.5), 30)
+        self.assertEqual((reply["timedOut"], reply["hostReady"]), (True, True))
+        self.assertEqual(archive, b"")
+
+    def test_error(self):
+        # The tmpfs directory cannot be created
+        reply, _ = self.channel.request(agentJob("/proc/none/job_1"), 30)
+        self.assertTrue("error" in reply)
+
+
+class ArchiveStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.artifacts = [os.path.join(self.directory, "result.log"), os.path.join(self.directory, "missing.log"),
+                          os.path.join(self.directory, "big.log")]
+        self.content = os.urandom(100000)
+        for path, content in [(self.artifacts[0], b"result\n"), (self.artifacts[2], self.content)]:
+            artifact = open(path, "wb")
+            artifact.write(content)
+            artifact.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_chunks(self):
+        for compress in (False, True):
+            stream = io.BytesIO()
+            writer = ChunkedWriter(stream)
+            archiveArtifacts(self.artifacts, compress, writer)
+            writer.close()
+            stream.write(b"{}\n")
+            stream.seek(0)
+            channel = AgentChannel(None, 0)
+            archive = channel.readChunks(stream)
+            # The reply follows the archive
+            self.assertEqual(stream.read(), b"{}\n")
+            contents = archiveContents(archive, compress=compress)
+            self.assertEqual(sorted(contents), ["0", "2"])
+            self.assertEqual(contents["2"], self.content)
+
+            # Written as it is built (a tar record at a time), not at once
+            stream.seek(0)
+            sizes = []
+            while not sizes or sizes[-1] > 0:
+                sizes.append(int(stream.readline(), 16))
+                channel.read(stream, sizes[-1])
+            self.assertTrue(len(sizes) > 2 and max(sizes) < len(self.content))
+
+    def test_interrupted_stream(self):
+        stream = io.BytesIO(b"a\n" + b"x" * 5)
+        self.assertRaises(Exception, AgentChannel(None, 0).readChunks, stream)
+
+
+class FailingKernelAgent(object):
+    """ Reply to every job as an agent whose kernel parameter write failed """
+    def request(self, job, timeout):
+        phases = [{"phase": "kernel", "start": 0.0, "duration": 0.0, "ok": False}]
+        return {"id": job["id"], "phases": phases, "hostReady": True, "kernel": {"returnCode": 1, "out": ""}}, b""
+
+
+class StubAgentLauncher(AgentExperienceLauncher):
+    def __init__(self):
+        transport = LocalTransport(["host"], ["22"])
+        self.finished = True
+        self.slots = [Slot(0, 0, 1)]
+        self.remoteHostnames = transport.remoteHostnames
+        self.remotePorts = transport.remotePorts
+        self.pcapSummary = None
+        self.compressPull = False
+        self.events = PhaseEvents()
+        self.kernelState = KernelStateCache(transport)
+        self.agents = [FailingKernelAgent()]
+        self.kernelFailures = [0]
+        self.recoveries = 0
+
+    def agentJob(self, num, kernelCmd, wanted, **kwargs):
+        return {"id": "job", "timeout": 10, "kernelCmd": kernelCmd, "artifacts": sorted(wanted)}
+
+    def recoverHost(self, num, **kwargs):
+        self.recoveries += 1
+        return True
+
+
+class AgentLauncherKernelFailureTest(unittest.TestCase):
+    def setUp(self):
+        self.workingDir = tempfile.mkdtemp()
+        self.launcher = StubAgentLauncher()
+        self.job = {"workingDir": self.workingDir, "tmpfs": "/tmp/job", "xpAbsPath": "xp", "protocol": "mptcp",
+                    "postProcessing": [("result.log", "result.log")]}
+
+    def tearDown(self):
+        self.launcher.events.close()
+        shutil.rmtree(self.workingDir)
+
+    def test_recover_only_repeated_failures(self):
+        for _ in range(MAX_KERNEL_FAILURES - 1):
+            self.assertEqual(self.launcher.launchAgentXp(0, **self.job), (False, True, None))
+            self.assertEqual(self.launcher.recoveries, 0)
+
+        self.assertEqual(self.launcher.launchAgentXp(0, **self.job), (False, True, None))
+        self.assertEqual(self.launcher.recoveries, 1)
+        events = open(os.path.join(self.workingDir, "events.jsonl"))
+        phases = [json.loads(line)["phase"] for line in events]
+        events.close()
+        self.assertEqual(phases, ["lease", "kernel"] * MAX_KERNEL_FAILURES)
+
+
+if __name__ == '__main__':
+    unittest.main()
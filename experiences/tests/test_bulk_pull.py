@@ -0,0 +1,78 @@
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+from core import bulkPullCmd, bulkPullWanted, checkBulkPull, extractBulkPull
+
+
+def readFile(path):
+    pathFile = open(path, "rb")
+    content = pathFile.read()
+    pathFile.close()
+    return content
+
+
+class BulkPullTest(unittest.TestCase):
+    def setUp(self):
+        self.remoteDir = tempfile.mkdtemp()
+        self.localDir = tempfile.mkdtemp()
+        for filename in ["ping.log", "https_client.log"]:
+            remoteFile = open(os.path.join(self.remoteDir, filename), "wb")
+            remoteFile.write(filename.encode() * 100)
+            remoteFile.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.remoteDir)
+        shutil.rmtree(self.localDir)
+
+    def local(self, filename):
+        return os.path.join(self.localDir, filename)
+
+    def pull(self, files, compress):
+        """ Run the remote command here and extract its output as the launcher does """
+        wanted = bulkPullWanted(files)
+        devnull = open(os.devnull, "w")
+        archive = tempfile.TemporaryFile()
+        subprocess.call(["sh", "-c", bulkPullCmd(wanted, compress)], stdout=archive, stderr=devnull)
+        devnull.close()
+        archive.seek(0)
+        pulled = extractBulkPull(archive, wanted, compress)
+        archive.close()
+        return wanted, pulled
+
+    def test_wanted(self):
+        wanted = bulkPullWanted([("ping.log", "/tmp/job/", "a"), ("ping.log", "/tmp/job", "b"), ("x.log", "/tmp/job", "c")])
+        self.assertEqual(wanted, {"/tmp/job/ping.log": ["a", "b"], "/tmp/job/x.log": ["c"]})
+
+    def test_extract(self):
+        for compress in (False, True):
+            files = [("ping.log", self.remoteDir, self.local("ping.log")),
+                     ("ping.log", self.remoteDir, self.local("ping_copy.log")),
+                     ("https_client.log", self.remoteDir, self.local("client.log"))]
+            wanted, pulled = self.pull(files, compress)
+            checkBulkPull(wanted, pulled)
+            for remoteFilename, remotePath, newFilename in files:
+                self.assertEqual(readFile(newFilename), readFile(os.path.join(remotePath, remoteFilename)))
+
+    def test_missing_file(self):
+        files = [("ping.log", self.remoteDir, self.local("ping.log")),
+                 ("missing.log", self.remoteDir, self.local("missing.log"))]
+        wanted, pulled = self.pull(files, False)
+        self.assertEqual(pulled, set([os.path.join(self.remoteDir, "ping.log")]))
+        self.assertRaises(Exception, checkBulkPull, wanted, pulled)
+        self.assertFalse(os.path.exists(self.local("missing.log")))
+
+    def test_interrupted_stream(self):
+        wanted = bulkPullWanted([("ping.log", self.remoteDir, self.local("ping.log"))])
+        self.assertEqual(extractBulkPull(io.BytesIO(b"not a tar archive"), wanted, False), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
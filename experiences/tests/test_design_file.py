@@ -0,0 +1,119 @@
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from design_file import COLUMNS_EXTENSION, SCHEMA_EXTENSION, TopoDesignFile, writeDesignFile
+from generate_topo import BANDWIDTH, DELAY, NETEM, PATHS, QUEUING_DELAY
+
+DESIGNS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "designs")
+
+
+def readFile(path):
+    pathFile = open(path)
+    content = pathFile.read()
+    pathFile.close()
+    return content
+
+
+def twins(paths, losses):
+    """ Return the topology of paths with the losses, followed by its twin with the paths in reverse order """
+    topo = {PATHS: paths, NETEM: [(nbPath, 0, "loss " + loss + "%") for nbPath, loss in enumerate(losses)]}
+    twin = {PATHS: paths[::-1], NETEM: [(nbPath, 0, "loss " + loss + "%") for nbPath, loss in enumerate(losses[::-1])]}
+    return [topo, twin]
+
+
+TOPOS = twins([{BANDWIDTH: "51.83", DELAY: "10.5", QUEUING_DELAY: "0.048"},
+               {BANDWIDTH: "45.38", DELAY: "13.3", QUEUING_DELAY: "0.063"}], ["1.56", "1.19"]) + \
+    twins([{BANDWIDTH: "49.44", DELAY: "20.6", QUEUING_DELAY: "0.029"},
+           {BANDWIDTH: "34.80", DELAY: "22.1", QUEUING_DELAY: "0.062"}], ["0.00", "0.00"])
+
+
+class DesignFileTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "design")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        writeDesignFile(self.path, TOPOS)
+        design = TopoDesignFile(self.path)
+        self.assertEqual(len(design), 4)
+        self.assertEqual(list(design), TOPOS)
+        # As many times as needed
+        self.assertEqual(list(design), TOPOS)
+
+        self.assertEqual(readFile(self.path + COLUMNS_EXTENSION).splitlines(), [
+            "bandwidth0,delay0,queuingDelay0,loss0,bandwidth1,delay1,queuingDelay1,loss1",
+            "51.83,10.5,0.048,1.56,45.38,13.3,0.063,1.19",
+            "49.44,20.6,0.029,0.00,34.80,22.1,0.062,0.00",
+        ])
+        self.assertEqual(design.schema, {"rows": 2, "paths": 2, "pathParameters": [BANDWIDTH, DELAY, QUEUING_DELAY],
+                                         "netemTemplates": {"loss": "loss {0}%"}, "netemAt": 0, "withReversed": True})
+
+    def test_without_twins_and_netem(self):
+        topos = [{PATHS: [{BANDWIDTH: "10", DELAY: "5"}], NETEM: []}, {PATHS: [{BANDWIDTH: "20", DELAY: "5"}], NETEM: []}]
+        writeDesignFile(self.path, topos, withReversed=False, netemTemplates={})
+        self.assertEqual(list(TopoDesignFile(self.path)), topos)
+
+    def test_other_netem_templates(self):
+        topos = [{PATHS: [{BANDWIDTH: "10", DELAY: "5"}], NETEM: [(0, 2, "delay 5ms 2ms")]}]
+        writeDesignFile(self.path, topos, withReversed=False, netemTemplates={"jitter": "delay 5ms {0}ms"}, netemAt=2)
+        self.assertEqual(list(TopoDesignFile(self.path)), topos)
+
+    def test_lazy_loading(self):
+        writeDesignFile(self.path, TOPOS)
+        # Only the schema is read when the design is opened
+        os.rename(self.path + COLUMNS_EXTENSION, self.path + ".moved")
+        design = TopoDesignFile(self.path)
+        self.assertEqual(len(design), 4)
+        topos = iter(design)
+        self.assertRaises(IOError, next, topos)
+
+        os.rename(self.path + ".moved", self.path + COLUMNS_EXTENSION)
+        topos = iter(design)
+        self.assertEqual(next(topos), TOPOS[0])
+        self.assertEqual(next(topos), TOPOS[1])
+
+    def test_unsupported_topos(self):
+        # The second topology is not the twin of the first one
+        self.assertRaises(Exception, writeDesignFile, self.path, TOPOS[:1] + TOPOS[2:3])
+        topos = [{PATHS: [{BANDWIDTH: "10", DELAY: "5"}], NETEM: [(0, 0, "delay 5ms 2ms")]}]
+        self.assertRaises(Exception, writeDesignFile, self.path, topos, withReversed=False)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_generated_design(self):
+        from topo_design import LATIN_HYPERCUBE, designTopos
+
+        topos = designTopos(16, method=LATIN_HYPERCUBE, seed=1)
+        writeDesignFile(self.path, topos)
+        self.assertEqual(list(TopoDesignFile(self.path)), topos)
+
+    def test_shipped_designs(self):
+        """ Writing the topologies of a shipped design gives back the same files """
+        paths = [path[:-len(SCHEMA_EXTENSION)] for path in sorted(glob.glob(os.path.join(DESIGNS_DIR, "*" + SCHEMA_EXTENSION)))]
+        self.assertTrue(len(paths) > 0)
+        for path in paths:
+            design = TopoDesignFile(path)
+            topos = list(design)
+            self.assertEqual(len(topos), len(design))
+            writeDesignFile(self.path, topos, withReversed=design.schema["withReversed"],
+                            netemTemplates=design.schema["netemTemplates"], netemAt=design.schema["netemAt"])
+            for extension in [COLUMNS_EXTENSION, SCHEMA_EXTENSION]:
+                self.assertEqual(readFile(self.path + extension), readFile(path + extension))
+
+
+if __name__ == '__main__':
+    unittest.main()
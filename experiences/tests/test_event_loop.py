@@ -0,0 +1,180 @@
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+from async_launcher import AsyncExperienceLauncher
+from core import experiment, experimentTopos
+from event_loop import Command, EventLoop, Sleep, Worker
+from generate_topo import BANDWIDTH, DELAY, PATHS
+from generate_xp import CLIENT_PCAP, HTTPS, XP_TYPE
+from standin import POST_PROCESSING, STANDIN_TMPFS, standInBin, standInTransport
+
+
+def processRunning(pid):
+    """ A killed process whose parent is gone may stay a zombie until init reaps it """
+    try:
+        statFile = open("/proc/" + str(pid) + "/stat")
+    except IOError:
+        return False
+    state = statFile.read().rsplit(")", 1)[1].split()[0]
+    statFile.close()
+    return state != "Z"
+
+
+class EventLoopTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.loop = EventLoop(pollInterval=0.01)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_commands_run_concurrently(self):
+        results = []
+
+        def commandTask(cmd):
+            result = yield Command(["sh", "-c", cmd], capture=True)
+            results.append((result.returnCode, result.out))
+
+        start = time.time()
+        for cmd in ["sleep 0.3; echo first", "sleep 0.3; exit 3"]:
+            self.loop.spawn(commandTask(cmd))
+        self.loop.run()
+        self.assertTrue(time.time() - start < 0.55)
+        self.assertEqual(sorted(results), [(0, b"first\n"), (3, b"")])
+
+    def test_timed_out_command_is_killed(self):
+        pidPath = os.path.join(self.directory, "pid")
+        results = []
+
+        def commandTask():
+            # The shell starts a child of its own, which must be killed with it
+            result = yield Command(["sh", "-c", "sleep 30 & echo $! > " + pidPath + "; wait"], timeout=0.2)
+            results.append(result)
+
+        start = time.time()
+        self.loop.spawn(commandTask())
+        self.loop.run()
+        self.assertTrue(time.time() - start < 5)
+        self.assertTrue(results[0].timedOut)
+        self.assertNotEqual(results[0].returnCode, 0)
+        pidFile = open(pidPath)
+        pid = int(pidFile.read())
+        pidFile.close()
+        self.assertFalse(processRunning(pid))
+
+    def test_missing_command(self):
+        results = []
+
+        def commandTask():
+            result = yield Command([os.path.join(self.directory, "missing")])
+            results.append((result.returnCode, result.timedOut))
+
+        self.loop.spawn(commandTask())
+        self.loop.run()
+        self.assertEqual(results, [(-1, False)])
+
+
+class WorkerTest(unittest.TestCase):
+    def setUp(self):
+        self.worker = Worker()
+        self.loop = EventLoop(pollInterval=0.01)
+
+    def tearDown(self):
+        self.worker.close()
+
+    def test_call_does_not_block_the_loop(self):
+        events = []
+        started = threading.Event()
+
+        def blocking():
+            started.set()
+            time.sleep(0.3)
+            return threading.current_thread().name
+
+        def callTask():
+            name = yield self.worker.call(blocking)
+            events.append(("called", name))
+
+        def tickTask():
+            while not started.is_set():
+                yield Sleep(0.01)
+            yield Sleep(0.05)
+            events.append(("tick", None))
+
+        self.loop.spawn(callTask())
+        self.loop.spawn(tickTask())
+        self.loop.run()
+        self.assertEqual([event for event, _ in events], ["tick", "called"])
+        self.assertNotEqual(events[1][1], threading.current_thread().name)
+
+    def test_call_raises_the_exception(self):
+        caught = []
+
+        def failing():
+            raise ValueError("broken")
+
+        def callTask():
+            try:
+                yield self.worker.call(failing)
+            except ValueError as e:
+                caught.append(str(e))
+
+        self.loop.spawn(callTask())
+        self.loop.run()
+        self.assertEqual(caught, ["broken"])
+
+
+class AsyncExperienceLauncherTest(unittest.TestCase):
+    def setUp(self):
+        self.rootDir = tempfile.mkdtemp()
+        self.minitopoPath = standInBin(self.rootDir)
+        self.stdout = sys.stdout
+        sys.stdout = open(os.devnull, "w")
+
+    def tearDown(self):
+        sys.stdout.close()
+        sys.stdout = self.stdout
+        shutil.rmtree(self.rootDir)
+
+    def test_campaign(self):
+        launcher = AsyncExperienceLauncher(["standin"] * 2, ["0", "1"], transport=standInTransport(self.rootDir),
+                                           minitopoPath=self.minitopoPath)
+        phases = []
+        launcher.events.subscribe(lambda event: phases.append(event["phase"]))
+        topos = [{PATHS: [{BANDWIDTH: 10 + job, DELAY: 10}]} for job in range(4)]
+        workingDirs = []
+
+        def test(**kwargs):
+            kwargs["postProcessing"] = POST_PROCESSING
+            workingDirs.append(kwargs["workingDir"])
+            experiment(launcher, {XP_TYPE: HTTPS, CLIENT_PCAP: "no"}, **kwargs)
+
+        experimentTopos(topos, "test", "mptcp", STANDIN_TMPFS, test, baseDir=self.rootDir)
+        launcher.finish()
+
+        # The loop opened the connections itself
+        self.assertTrue(launcher.transport.managedMasters)
+        self.assertEqual(len(workingDirs), 4)
+        for workingDir in workingDirs:
+            for remoteFilename, localFilename in POST_PROCESSING:
+                artifact = open(os.path.join(workingDir, localFilename))
+                self.assertEqual(artifact.read(), remoteFilename + "\n")
+                artifact.close()
+        for phase in ["upload", "run", "collect"]:
+            self.assertEqual(phases.count(phase), 4)
+        # Each job removed its tmpfs subdirectory once collected
+        for home in launcher.transport.homes:
+            self.assertEqual([name for name in os.listdir(os.path.join(home, STANDIN_TMPFS)) if name.startswith("job_")],
+                             [])
+
+
+if __name__ == '__main__':
+    unittest.main()
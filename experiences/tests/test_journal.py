@@ -0,0 +1,118 @@
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+from core import ExperienceLauncher, experiment, experimentTopos
+from generate_topo import BANDWIDTH, DELAY, PATHS
+from generate_xp import HTTPS, XP_TYPE
+from journal import DONE, PENDING, CampaignJournal
+from scheduler import JobScheduler
+from timeout_model import TimeoutModel
+
+TOPOS = [{PATHS: [{DELAY: 10, BANDWIDTH: 10}]}, {PATHS: [{DELAY: 20, BANDWIDTH: 5}]}]
+POST_PROCESSING = [("https_client.log", "https_client.log"), ("ping.log", "ping.log")]
+
+
+class StubLauncher(ExperienceLauncher):
+    """ Only plans the jobs: the ones to run stay in its workQueue """
+    def __init__(self, journal):
+        self.finished = True
+        self.journal = journal
+        self.resultCache = None
+        self.resultStore = None
+        self.replication = None
+        self.pcapSummary = None
+        self.timeoutModel = TimeoutModel()
+        self.workQueue = JobScheduler(1, lpt=False)
+        self.outstanding = 0
+        self.outstandingCondition = threading.Condition()
+
+    def queued(self):
+        jobs = []
+        while True:
+            job = self.workQueue.get_nowait()
+            if job is None:
+                return jobs
+            jobs.append(job)
+
+
+class CampaignJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.baseDir = tempfile.mkdtemp()
+        self.path = os.path.join(self.baseDir, "journal.sqlite")
+
+    def tearDown(self):
+        shutil.rmtree(self.baseDir)
+
+    def campaign(self, run, repetitions=1):
+        """ Plan the jobs of a campaign with a new journal object, as a restarted script would, and return them """
+        journal = CampaignJournal(self.path)
+        launcher = StubLauncher(journal)
+
+        def test(**kwargs):
+            kwargs["postProcessing"] = POST_PROCESSING
+            for _ in range(repetitions):
+                experiment(launcher, {XP_TYPE: HTTPS}, **kwargs)
+
+        campaignDir = experimentTopos(TOPOS, "test", "mptcp", "/tmp", test, baseDir=os.path.join(self.baseDir, run))
+        launcher.workQueue.close()
+        return journal, launcher, campaignDir, launcher.queued()
+
+    def complete(self, launcher, job):
+        """ Write the artifacts of the job and record it as done """
+        for _, localFilename in POST_PROCESSING:
+            artifact = open(os.path.join(job["workingDir"], localFilename), "w")
+            artifact.write(job["workingDir"] + "\n")
+            artifact.close()
+        launcher.xpCollected(None, [os.path.join(job["workingDir"], localFilename) for _, localFilename in POST_PROCESSING],
+                             **job)
+
+    def test_occurrences(self):
+        journal, _, _, jobs = self.campaign("first", repetitions=2)
+        # The repetitions of a specification are numbered, the topologies are different specifications
+        self.assertEqual(sorted(job["jobId"].rsplit("-", 1)[1] for job in jobs), ["1", "1", "2", "2"])
+        self.assertEqual(len(set(job["jobId"] for job in jobs)), 4)
+        self.assertEqual(journal.count(PENDING), 4)
+        journal.close()
+
+    def test_done_jobs_are_linked(self):
+        journal, launcher, _, jobs = self.campaign("first", repetitions=2)
+        # Only the first repetition of the first topology completed before the controller died
+        done = [job for job in jobs if job["jobId"].endswith("-1")][0]
+        self.complete(launcher, done)
+        self.assertEqual((journal.count(DONE), journal.count(PENDING)), (1, 3))
+        journal.close()
+
+        journal, _, campaignDir, jobs = self.campaign("resumed", repetitions=2)
+        self.assertEqual(len(jobs), 3)
+        self.assertFalse(done["jobId"] in [job["jobId"] for job in jobs])
+        # Same topology directory, in the new campaign directory
+        workingDir = os.path.join(campaignDir, os.path.basename(done["workingDir"]))
+        for _, localFilename in POST_PROCESSING:
+            self.assertEqual(os.stat(os.path.join(workingDir, localFilename)).st_ino,
+                             os.stat(os.path.join(done["workingDir"], localFilename)).st_ino)
+        row = journal.connection.execute("SELECT state, workingDir FROM jobs WHERE specHash || '-' || occurrence = ?",
+                                         (done["jobId"],)).fetchone()
+        self.assertEqual(tuple(row), (DONE, workingDir))
+        journal.close()
+
+    def test_missing_artifacts_are_run_again(self):
+        journal, launcher, _, jobs = self.campaign("first")
+        self.complete(launcher, jobs[0])
+        journal.close()
+        os.remove(os.path.join(jobs[0]["workingDir"], "ping.log"))
+
+        journal, _, _, resumedJobs = self.campaign("resumed")
+        self.assertEqual(sorted(job["jobId"] for job in resumedJobs), sorted(job["jobId"] for job in jobs))
+        self.assertEqual((journal.count(DONE), journal.count(PENDING)), (0, 2))
+        journal.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
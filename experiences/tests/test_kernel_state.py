@@ -0,0 +1,98 @@
+import os
+import sys
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+from kernel_state import KernelStateCache
+from transport import LocalTransport
+
+MPTCP_ON = [("/proc/sys/net/mptcp/mptcp_enabled", "1")]
+MPTCP_OFF = [("/proc/sys/net/mptcp/mptcp_enabled", "0")]
+OPEN_BUP_ON = [("/sys/module/mptcp_fullmesh/parameters/open_bup", "1")]
+
+
+class KernelStateCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.transport = LocalTransport(["host"], ["22"])
+        self.cache = KernelStateCache(self.transport)
+
+    def test_first_write_is_complete(self):
+        remoteCmd, changed = self.cache.prepare(0, MPTCP_ON + OPEN_BUP_ON)
+        self.assertEqual(changed, MPTCP_ON + OPEN_BUP_ON)
+        self.assertTrue(remoteCmd.startswith("echo 1 | sudo tee /proc/sys/net/mptcp/mptcp_enabled > /dev/null && "))
+        self.assertTrue(remoteCmd.endswith(" && cat /proc/sys/kernel/random/boot_id"))
+        self.cache.commit(0, MPTCP_ON + OPEN_BUP_ON, changed, 0, b"boot1\n")
+        self.assertEqual(self.cache.writes[0], 2)
+
+    def test_only_changed_parameters_are_written(self):
+        self.cache.commit(0, MPTCP_ON + OPEN_BUP_ON, MPTCP_ON + OPEN_BUP_ON, 0, b"boot1\n")
+        self.assertEqual(self.cache.prepare(0, MPTCP_ON + OPEN_BUP_ON), None)
+
+        remoteCmd, changed = self.cache.prepare(0, MPTCP_OFF + OPEN_BUP_ON)
+        self.assertEqual(changed, MPTCP_OFF)
+        # The changed parameter only, unless the host rebooted in between
+        self.assertTrue(remoteCmd.startswith('B=$(cat /proc/sys/kernel/random/boot_id); if [ "$B" = "boot1" ]; then '
+                                             'echo 0 | sudo tee /proc/sys/net/mptcp/mptcp_enabled > /dev/null; else '))
+        self.assertTrue(remoteCmd.endswith("; fi && echo $B"))
+        self.cache.commit(0, MPTCP_OFF + OPEN_BUP_ON, changed, 0, b"boot1\n")
+        self.assertEqual((self.cache.writes[0], self.cache.skipped[0]), (3, 3))
+
+    def test_reboot_invalidates_the_state(self):
+        self.cache.commit(0, MPTCP_ON + OPEN_BUP_ON, MPTCP_ON + OPEN_BUP_ON, 0, b"boot1\n")
+        remoteCmd, changed = self.cache.prepare(0, MPTCP_OFF + OPEN_BUP_ON)
+        # The host answers with another boot_id: it wrote all the parameters, and the cache only knows these ones
+        self.cache.commit(0, MPTCP_OFF + OPEN_BUP_ON, changed, 0, b"boot2\n")
+        self.assertEqual(self.cache.bootIds[0], "boot2")
+        self.assertEqual(self.cache.writes[0], 4)
+        self.assertEqual(self.cache.prepare(0, MPTCP_OFF + OPEN_BUP_ON), None)
+
+    def test_reconnection_invalidates_the_state(self):
+        self.cache.commit(0, MPTCP_ON, MPTCP_ON, 0, b"boot1\n")
+        self.transport.handshakes[0] += 1
+        remoteCmd, changed = self.cache.prepare(0, MPTCP_ON)
+        self.assertEqual(changed, [])
+        self.assertTrue(" then true; else " in remoteCmd)
+
+    def test_failed_write_forgets_the_state(self):
+        self.cache.commit(0, MPTCP_ON, MPTCP_ON, 0, b"boot1\n")
+        self.assertRaises(Exception, self.cache.commit, 0, MPTCP_OFF, MPTCP_OFF, 1, b"")
+        self.assertEqual(self.cache.bootIds[0], None)
+        self.assertEqual(self.cache.prepare(0, MPTCP_ON)[1], MPTCP_ON)
+
+
+class KernelStateLeaseTest(unittest.TestCase):
+    def setUp(self):
+        # Three slots of the same machine
+        self.cache = KernelStateCache(LocalTransport(["host"] * 3, ["22"] * 3), hosts=[0, 0, 0])
+
+    def test_same_parameters_share_the_lease(self):
+        self.assertTrue(self.cache.tryAcquire(0, MPTCP_ON))
+        self.assertTrue(self.cache.tryAcquire(1, MPTCP_ON))
+        self.assertEqual(self.cache.tryAcquire(2, MPTCP_OFF), None)
+        self.cache.release(0)
+        self.cache.release(1)
+        self.assertTrue(self.cache.tryAcquire(2, MPTCP_OFF))
+
+    def test_waiters_are_served_in_order(self):
+        self.assertTrue(self.cache.tryAcquire(0, MPTCP_ON))
+        self.assertEqual(self.cache.tryAcquire(1, MPTCP_OFF), None)
+        # Slot 2 could join the lease of slot 0, but slot 1 asked first
+        self.assertEqual(self.cache.tryAcquire(2, MPTCP_ON), None)
+        self.cache.release(0)
+        self.assertEqual(self.cache.tryAcquire(2, MPTCP_ON), None)
+        self.assertTrue(self.cache.tryAcquire(1, MPTCP_OFF))
+        self.cache.release(1)
+        self.assertTrue(self.cache.tryAcquire(2, MPTCP_ON))
+
+    def test_other_slots_are_invalidated_on_change(self):
+        self.assertTrue(self.cache.tryAcquire(0, MPTCP_ON))
+        self.cache.release(0)
+        self.cache.bootIds = ["boot"] * 3
+        self.assertTrue(self.cache.tryAcquire(1, MPTCP_OFF))
+        self.assertEqual(self.cache.bootIds, [None, "boot", None])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+import core
+
+
+class RecoveredMinitopoCommand(core.MinitopoCommand):
+    """ Do not touch the host running the tests """
+    def recover(self):
+        self.recovered = True
+        return True
+
+
+@unittest.skipUnless(os.name == "posix", "process groups")
+class MinitopoCommandTimeoutTest(unittest.TestCase):
+    def setUp(self):
+        self.workingDir = tempfile.mkdtemp()
+        self.transport = core.LocalTransport(["localhost"], [22])
+        self.drainTimeout = core.DRAIN_TIMEOUT
+
+    def tearDown(self):
+        core.DRAIN_TIMEOUT = self.drainTimeout
+        shutil.rmtree(self.workingDir)
+
+    def runCommand(self, cmd, timeout, timestamps):
+        testOkList = [None]
+        minitopoCommand = RecoveredMinitopoCommand(0, self.transport, ["sh", "-c", cmd], self.workingDir, testOkList,
+                                                   timestamps=timestamps)
+        minitopoCommand.recovered = False
+        start = time.time()
+        hostReady = minitopoCommand.run(timeout)
+        return minitopoCommand, testOkList[0], hostReady, time.time() - start
+
+    def test_success(self):
+        minitopoCommand, testOk, hostReady, _ = self.runCommand("echo hello", 10, timestamps=True)
+        self.assertTrue(testOk)
+        self.assertTrue(hostReady)
+        self.assertFalse(minitopoCommand.recovered)
+        minitopoOut = open(os.path.join(self.workingDir, "minitopo.out"))
+        self.assertTrue(minitopoOut.read().strip().endswith(" hello"))
+        minitopoOut.close()
+
+    def test_timeout_kills_children(self):
+        for timestamps in (False, True):
+            # The background sleep keeps the pipes open unless the whole process group is killed
+            minitopoCommand, testOk, hostReady, elapsed = self.runCommand("sleep 30 & echo started; sleep 30", 0.5,
+                                                                          timestamps=timestamps)
+            self.assertFalse(testOk)
+            self.assertTrue(hostReady)
+            self.assertTrue(minitopoCommand.recovered)
+            self.assertLess(elapsed, 0.5 + core.DRAIN_TIMEOUT)
+
+    def test_timeout_does_not_wait_for_escaped_processes(self):
+        # setsid moves the sleep out of the process group of the command: it keeps the pipes open until it ends
+        core.DRAIN_TIMEOUT = 0.5
+        minitopoCommand, testOk, _, elapsed = self.runCommand("setsid sleep 5 & sleep 30", 0.5, timestamps=True)
+        self.assertFalse(testOk)
+        self.assertTrue(minitopoCommand.recovered)
+        self.assertLess(elapsed, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
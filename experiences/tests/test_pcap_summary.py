@@ -0,0 +1,99 @@
+import os
+import shutil
+import socket
+import struct
+import sys
+import tempfile
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+from pcap_summary import PCAPNG_MAGIC, TCP_ACK, TCP_SYN, summarizePcap
+
+CLIENT = ("10.0.0.1", 40000)
+SERVER = ("10.1.0.1", 443)
+
+
+def tcpPacket(source, destination, seq, ack, flags, payloadLength=0):
+    """ IPv4 packet of a TCP segment, with a 20 bytes TCP header """
+    length = 40 + payloadLength
+    ip = struct.pack(">BBHHHBBH4s4s", 0x45, 0, length, 0, 0, 64, 6, 0, socket.inet_aton(source[0]),
+                     socket.inet_aton(destination[0]))
+    tcp = struct.pack(">HHIIBBHHH", source[1], destination[1], seq, ack, 5 << 4, flags, 65535, 0, 0)
+    return ip + tcp + b"\0" * payloadLength
+
+
+def writePcap(filename, packets):
+    """ Write the (timestamp, packet) as a raw IP capture """
+    pcapFile = open(filename, "wb")
+    pcapFile.write(struct.pack("<IHHiIII", 0xa1b2c3d4, 2, 4, 0, 0, 65535, 101))
+    for timestamp, packet in packets:
+        pcapFile.write(struct.pack("<IIII", int(timestamp), int(round((timestamp % 1) * 1e6)), len(packet), len(packet)))
+        pcapFile.write(packet)
+    pcapFile.close()
+
+
+def exchange(handshakeRtt, handshakeAckDelay):
+    """ A handshake, then 100 bytes each way; the client data is acknowledged after 0.1 s, the server data after 1 ms """
+    return [
+        (0.0, tcpPacket(CLIENT, SERVER, 1000, 0, TCP_SYN)),
+        (handshakeRtt, tcpPacket(SERVER, CLIENT, 5000, 1001, TCP_SYN | TCP_ACK)),
+        (handshakeRtt + handshakeAckDelay, tcpPacket(CLIENT, SERVER, 1001, 5001, TCP_ACK)),
+        (1.0, tcpPacket(CLIENT, SERVER, 1001, 5001, TCP_ACK, 100)),
+        (1.1, tcpPacket(SERVER, CLIENT, 5001, 1101, TCP_ACK)),
+        (2.0, tcpPacket(SERVER, CLIENT, 5001, 1101, TCP_ACK, 100)),
+        (2.001, tcpPacket(CLIENT, SERVER, 1101, 5101, TCP_ACK)),
+    ]
+
+
+class PcapSummaryTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, "client.pcap")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def directions(self, packets):
+        writePcap(self.filename, packets)
+        summary = summarizePcap(self.filename)
+        self.assertEqual(len(summary["subflows"]), 1)
+        return dict((direction["source"], direction) for direction in summary["subflows"][0]["directions"])
+
+    def test_rtt_of_the_capturing_side(self):
+        # Captured on the client: the SYN/ACK comes one RTT after the SYN
+        directions = self.directions(exchange(0.1, 0.0001))
+        client, server = directions["10.0.0.1:40000"], directions["10.1.0.1:443"]
+        self.assertEqual((client["local"], server["local"]), (True, False))
+        self.assertAlmostEqual(client["rtt"]["avg"], 0.1, places=5)
+        self.assertFalse("ackDelay" in client)
+        # The data of the server is seen once it crossed the network, only the ACK delay of the client is left
+        self.assertAlmostEqual(server["ackDelay"]["avg"], 0.001, places=5)
+        self.assertFalse("rtt" in server)
+
+    def test_server_side_capture(self):
+        directions = self.directions(exchange(0.0001, 0.1))
+        self.assertEqual((directions["10.0.0.1:40000"]["local"], directions["10.1.0.1:443"]["local"]), (False, True))
+        self.assertTrue("ackDelay" in directions["10.0.0.1:40000"])
+        self.assertTrue("rtt" in directions["10.1.0.1:443"])
+
+    def test_handshake_not_captured(self):
+        directions = self.directions(exchange(0.1, 0.0001)[3:])
+        for direction in directions.values():
+            self.assertEqual(direction["local"], None)
+            self.assertTrue("rtt" in direction)
+
+    def test_pcapng_rejected(self):
+        pcapFile = open(self.filename, "wb")
+        pcapFile.write(PCAPNG_MAGIC + b"\0" * 28)
+        pcapFile.close()
+        try:
+            summarizePcap(self.filename)
+            self.fail("pcapng file accepted")
+        except Exception as e:
+            self.assertTrue("pcapng" in str(e))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+from core import ExperienceLauncher, experiment, experimentTopos
+from generate_topo import BANDWIDTH, DELAY, PATHS
+from generate_xp import CLIENT_PCAP, HTTPS, XP_TYPE
+from standin import POST_PROCESSING, STANDIN_TMPFS, standInBin, standInTransport
+
+
+class PipelineTest(unittest.TestCase):
+    """ The three stages (upload, run, collect) of each host of ExperienceLauncher, on stand-in hosts """
+    def setUp(self):
+        self.rootDir = tempfile.mkdtemp()
+        self.minitopoPath = standInBin(self.rootDir)
+        self.stdout = sys.stdout
+        sys.stdout = open(os.devnull, "w")
+
+    def tearDown(self):
+        sys.stdout.close()
+        sys.stdout = self.stdout
+        shutil.rmtree(self.rootDir)
+
+    def campaign(self, jobs, callback=None):
+        """ Run jobs experiences on two stand-in hosts and return the launcher, the workingDirs and the events """
+        launcher = ExperienceLauncher(["standin"] * 2, ["0", "1"], pipeline=True, transport=standInTransport(self.rootDir),
+                                      minitopoPath=self.minitopoPath)
+        events = []
+        launcher.events.subscribe(events.append)
+        if callback is not None:
+            launcher.events.subscribe(lambda event: callback(launcher, event))
+        topos = [{PATHS: [{BANDWIDTH: 10 + job, DELAY: 10}]} for job in range(jobs)]
+        workingDirs = []
+
+        def test(**kwargs):
+            kwargs["postProcessing"] = POST_PROCESSING
+            workingDirs.append(kwargs["workingDir"])
+            experiment(launcher, {XP_TYPE: HTTPS, CLIENT_PCAP: "no"}, **kwargs)
+
+        experimentTopos(topos, "test", "mptcp", STANDIN_TMPFS, test, baseDir=self.rootDir)
+        launcher.finish()
+        return launcher, workingDirs, events
+
+    def assertCollected(self, launcher, workingDirs):
+        for workingDir in workingDirs:
+            for remoteFilename, localFilename in POST_PROCESSING:
+                artifact = open(os.path.join(workingDir, localFilename))
+                self.assertEqual(artifact.read(), remoteFilename + "\n")
+                artifact.close()
+        # The collect stage removed the tmpfs subdirectory of every job
+        for home in launcher.transport.homes:
+            self.assertEqual([name for name in os.listdir(os.path.join(home, STANDIN_TMPFS)) if name.startswith("job_")],
+                             [])
+
+    def test_campaign(self):
+        launcher, workingDirs, events = self.campaign(4)
+        self.assertCollected(launcher, workingDirs)
+        for phase in ["upload", "run", "collect"]:
+            self.assertEqual(len([event for event in events if event["phase"] == phase and event["ok"]]), 4)
+
+    def test_quarantined_host_requeues_its_uploaded_job(self):
+        def quarantine(launcher, event):
+            # The job uploaded to the first host reaches its run stage once the host is quarantined
+            if event["phase"] == "upload" and event["host"] == launcher.slotName(0):
+                launcher.quarantined[0] = True
+
+        launcher, workingDirs, events = self.campaign(3, quarantine)
+        self.assertCollected(launcher, workingDirs)
+        self.assertEqual(len([event for event in events if event["phase"] == "upload" and event["host"] == "standin:0"]), 1)
+        runs = [event for event in events if event["phase"] == "run"]
+        self.assertEqual(len(runs), 3)
+        # The requeued job did not lose an attempt
+        self.assertEqual(set((event["host"], event["attempt"]) for event in runs), set([("standin:1", 1)]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+from replication import AdaptiveReplication, parseDuration
+
+
+class ParseDurationTest(unittest.TestCase):
+    def test_durations(self):
+        self.assertEqual(parseDuration("1m2.5s"), 62.5)
+        self.assertEqual(parseDuration("850ms"), 0.85)
+        self.assertEqual(parseDuration(" 12.345s\n"), 12.345)
+        self.assertEqual(parseDuration("Completed in 1s"), None)
+
+
+class AdaptiveReplicationTest(unittest.TestCase):
+    def setUp(self):
+        self.baseDir = tempfile.mkdtemp()
+        self.path = os.path.join(self.baseDir, "replication")
+
+    def tearDown(self):
+        shutil.rmtree(self.baseDir)
+
+    def job(self, campaign, completionTime, jobId=None):
+        """ Return (artifacts, kwargs) of a completed job of the configuration topo/https """
+        campaignDir = os.path.join(self.baseDir, campaign)
+        workingDir = os.path.join(campaignDir, "topo", "https")
+        if not os.path.isdir(workingDir):
+            os.makedirs(workingDir)
+        clientLog = os.path.join(workingDir, "https_client.log")
+        clientLogFile = open(clientLog, "w")
+        clientLogFile.write("GET /random\n" + completionTime + "\n")
+        clientLogFile.close()
+        kwargs = {"campaignDir": campaignDir, "workingDir": workingDir}
+        if jobId is not None:
+            kwargs["jobId"] = jobId
+        return [os.path.join(workingDir, "ping.log"), clientLog], kwargs
+
+    def test_converged(self):
+        replication = AdaptiveReplication(self.path)
+        for index, completionTime in enumerate(["10s", "10.1s"]):
+            artifacts, kwargs = self.job("round" + str(index), completionTime)
+            self.assertTrue(replication.ingest(artifacts, **kwargs))
+            self.assertFalse(replication.converged(**kwargs))
+        artifacts, kwargs = self.job("round2", "10.05s")
+        replication.ingest(artifacts, **kwargs)
+        self.assertTrue(replication.converged(**kwargs))
+        self.assertTrue(replication.done())
+        replication.close()
+
+    def test_not_converged(self):
+        replication = AdaptiveReplication(self.path)
+        for index, completionTime in enumerate(["10s", "20s", "15s"]):
+            artifacts, kwargs = self.job("round" + str(index), completionTime)
+            replication.ingest(artifacts, **kwargs)
+        self.assertFalse(replication.converged(**kwargs))
+        self.assertEqual(replication.pending(), 1)
+        replication.close()
+
+    def test_job_counted_once(self):
+        replication = AdaptiveReplication(self.path)
+        artifacts, kwargs = self.job("round0", "10s", jobId="spec:0")
+        self.assertTrue(replication.ingest(artifacts, **kwargs))
+        replication.close()
+
+        # The resumed campaign links the job from its journal in a new campaign directory
+        replication = AdaptiveReplication(self.path)
+        self.assertEqual(replication.samples, {os.path.join("topo", "https"): [10.0]})
+        artifacts, kwargs = self.job("resumed", "10s", jobId="spec:0")
+        self.assertFalse(replication.ingest(artifacts, **kwargs))
+        self.assertEqual(replication.samples, {os.path.join("topo", "https"): [10.0]})
+        replication.close()
+
+    def test_no_completion_time(self):
+        replication = AdaptiveReplication()
+        artifacts, kwargs = self.job("round0", "connection refused")
+        self.assertFalse(replication.ingest(artifacts, **kwargs))
+        self.assertFalse(replication.done())
+        replication.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
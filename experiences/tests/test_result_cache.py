@@ -0,0 +1,156 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+import result_cache
+from generate_topo import BANDWIDTH, DELAY, PATHS, generateTopoFile
+from generate_xp import HTTPS, XP_TYPE, generateXpFile
+from result_cache import ResultCache, linkArtifact
+
+VERSIONS = "4.14.0-mptcp 0123456789abcdef0123456789abcdef01234567"
+FILES = [("https_client.log", "https_client.log"), ("/tmp/server.log", "server.log")]
+
+
+def readFile(path):
+    pathFile = open(path)
+    content = pathFile.read()
+    pathFile.close()
+    return content
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.baseDir = tempfile.mkdtemp()
+        self.cache = ResultCache(os.path.join(self.baseDir, "cache.sqlite"))
+        self.jobs = 0
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.baseDir)
+
+    def job(self, bandwidth=10, protocol="mptcp"):
+        """ Return the kwargs of a new job in its own directory """
+        self.jobs += 1
+        workingDir = os.path.join(self.baseDir, "job_" + str(self.jobs))
+        os.mkdir(workingDir)
+        kwargs = {"workingDir": workingDir, "protocol": protocol, "topoAbsPath": os.path.join(workingDir, "topo"),
+                  "xpAbsPath": os.path.join(workingDir, "httpsTest")}
+        generateTopoFile(kwargs["topoAbsPath"], {PATHS: [{DELAY: 10, BANDWIDTH: bandwidth}]})
+        generateXpFile(kwargs["xpAbsPath"], {XP_TYPE: HTTPS})
+        return kwargs
+
+    def files(self, kwargs):
+        return [(remoteKey, os.path.join(kwargs["workingDir"], localFilename)) for remoteKey, localFilename in FILES]
+
+    def runJob(self, key, kwargs):
+        """ The job was run after a miss: write its artifacts and store them """
+        for _, filename in self.files(kwargs):
+            artifact = open(filename, "w")
+            artifact.write(key + "\n")
+            artifact.close()
+        self.cache.store(key, self.files(kwargs))
+
+    def test_hit_and_miss(self):
+        kwargs = self.job()
+        key = self.cache.nextKey(softwareVersions=VERSIONS, **kwargs)
+        self.assertEqual(self.cache.link(key, self.files(kwargs)), None)
+        self.runJob(key, kwargs)
+
+        # The same specification, generated by another campaign script
+        otherCache = ResultCache(self.cache.path)
+        otherKwargs = self.job()
+        otherKey = otherCache.nextKey(softwareVersions=VERSIONS, **otherKwargs)
+        self.assertEqual(otherKey, key)
+        linked = otherCache.link(otherKey, self.files(otherKwargs))
+        self.assertEqual(linked, [filename for _, filename in self.files(otherKwargs)])
+        for (_, filename), (_, otherFilename) in zip(self.files(kwargs), self.files(otherKwargs)):
+            self.assertEqual(os.stat(filename).st_ino, os.stat(otherFilename).st_ino)
+        self.assertEqual((self.cache.misses, otherCache.hits), (1, 1))
+        otherCache.close()
+
+    def test_other_specification_misses(self):
+        kwargs = self.job()
+        key = self.cache.nextKey(softwareVersions=VERSIONS, **kwargs)
+        self.runJob(key, kwargs)
+        for otherKwargs in [self.job(bandwidth=20), self.job(protocol="tcp")]:
+            otherKey = self.cache.nextKey(softwareVersions=VERSIONS, **otherKwargs)
+            self.assertNotEqual(otherKey, key)
+            self.assertEqual(self.cache.link(otherKey, self.files(otherKwargs)), None)
+
+    def test_replicas_stay_distinct(self):
+        keys = [self.cache.nextKey(softwareVersions=VERSIONS, **self.job()) for _ in range(3)]
+        self.assertEqual([key.rsplit("-", 1)[1] for key in keys], ["1", "2", "3"])
+        self.assertEqual(len(set(key.rsplit("-", 1)[0] for key in keys)), 1)
+
+        kwargs = self.job()
+        self.runJob(keys[0], kwargs)
+        # Replica 2 was never run, it does not reuse replica 1
+        self.assertEqual(self.cache.link(keys[1], self.files(self.job())), None)
+
+        # With replications, the fourth job reuses the first replica
+        cache = ResultCache(self.cache.path, replications=3)
+        keys = [cache.nextKey(softwareVersions=VERSIONS, **self.job()) for _ in range(4)]
+        self.assertEqual([key.rsplit("-", 1)[1] for key in keys], ["1", "2", "3", "1"])
+        otherKwargs = self.job()
+        cache.link(keys[3], self.files(otherKwargs))
+        self.assertEqual(readFile(self.files(otherKwargs)[0][1]), keys[0] + "\n")
+        cache.close()
+
+    def test_version_change_misses(self):
+        kwargs = self.job()
+        key = self.cache.nextKey(softwareVersions=VERSIONS, **kwargs)
+        self.runJob(key, kwargs)
+
+        upgraded = ResultCache(self.cache.path)
+        otherKwargs = self.job()
+        otherKey = upgraded.nextKey(softwareVersions="4.19.0-mptcp " + VERSIONS.split()[1], **otherKwargs)
+        self.assertNotEqual(otherKey, key)
+        self.assertEqual(upgraded.link(otherKey, self.files(otherKwargs)), None)
+        upgraded.close()
+
+    def test_removed_artifact_misses(self):
+        kwargs = self.job()
+        key = self.cache.nextKey(softwareVersions=VERSIONS, **kwargs)
+        self.runJob(key, kwargs)
+        os.remove(self.files(kwargs)[1][1])
+        self.assertEqual(self.cache.link(key, self.files(self.job())), None)
+
+
+class LinkArtifactTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.source = os.path.join(self.directory, "source")
+        sourceFile = open(self.source, "w")
+        sourceFile.write("artifact\n")
+        sourceFile.close()
+        self.destination = os.path.join(self.directory, "destination")
+        self.link = os.link
+
+    def tearDown(self):
+        result_cache.os.link = self.link
+        shutil.rmtree(self.directory)
+
+    def test_hard_link_replaces_destination(self):
+        destinationFile = open(self.destination, "w")
+        destinationFile.write("stale\n")
+        destinationFile.close()
+        linkArtifact(self.source, self.destination)
+        self.assertEqual(os.stat(self.source).st_ino, os.stat(self.destination).st_ino)
+
+    def test_copy_across_file_systems(self):
+        def crossDeviceLink(source, destination):
+            raise OSError(18, "Invalid cross-device link")
+
+        result_cache.os.link = crossDeviceLink
+        linkArtifact(self.source, self.destination)
+        self.assertNotEqual(os.stat(self.source).st_ino, os.stat(self.destination).st_ino)
+        self.assertEqual(readFile(self.destination), "artifact\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
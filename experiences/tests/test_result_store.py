@@ -0,0 +1,250 @@
+import json
+import math
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+from generate_topo import BANDWIDTH, DELAY, NETEM, PATHS, QUEUE_SIZE, generateTopoFile
+from generate_xp import HTTPS, XP_TYPE, generateXpFile
+from result_cache import linkArtifact
+from result_store import COLUMN_FORMATS, FLOAT, INDEX_FILENAME, INT, SCHEMA_FILENAME, STRING, ResultStore, parseJob, \
+    parseNetstat, parsePingLog
+
+TOPO = {PATHS: [{DELAY: 15, QUEUE_SIZE: 10, BANDWIDTH: 10}, {DELAY: 30, QUEUE_SIZE: 20, BANDWIDTH: 5}],
+        NETEM: [(1, 2, "loss 1%")]}
+PING_LOG = """PING 10.1.0.1 (10.1.0.1) 56(84) bytes of data.
+5 packets transmitted, 5 received, 0% packet loss, time 4005ms
+rtt min/avg/max/mdev = 30.1/30.5/31.0/0.3 ms
+PING 10.1.1.1 (10.1.1.1) 56(84) bytes of data.
+5 packets transmitted, 4 received, 20% packet loss, time 4004ms
+rtt min/avg/max/mdev = 60.2/61.0/62.5/0.9 ms
+"""
+NETSTAT_BEFORE = """Ip:
+    120 total packets received
+Tcp:
+    1000 segments received
+    900 segments send out
+    5 segments retransmitted
+TcpExt:
+    3 fast retransmits
+    TCPLossProbes: 1
+"""
+NETSTAT_AFTER = """Ip:
+    620 total packets received
+Tcp:
+    1500 segments received
+    1300 segments send out
+    12 segments retransmitted
+TcpExt:
+    7 fast retransmits
+    TCPLossProbes: 4
+"""
+
+
+def writeFile(filename, content):
+    newFile = open(filename, "w")
+    newFile.write(content)
+    newFile.close()
+
+
+class ParserTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_ping_log(self):
+        filename = os.path.join(self.directory, "ping.log")
+        writeFile(filename, PING_LOG)
+        self.assertEqual(parsePingLog(filename), [
+            {"loss": 0.0, "min": 30.1, "avg": 30.5, "max": 31.0, "mdev": 0.3},
+            {"loss": 20.0, "min": 60.2, "avg": 61.0, "max": 62.5, "mdev": 0.9},
+        ])
+
+    def test_netstat(self):
+        filename = os.path.join(self.directory, "netstat")
+        writeFile(filename, NETSTAT_AFTER)
+        counters = parseNetstat(filename)
+        self.assertEqual(counters[("Ip", "total packets received")], 620)
+        self.assertEqual(counters[("Tcp", "segments send out")], 1300)
+        self.assertEqual(counters[("TcpExt", "fast retransmits")], 7)
+        # The "label: value" lines
+        self.assertEqual(counters[("TcpExt", "TCPLossProbes")], 4)
+
+
+class ResultStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.baseDir = tempfile.mkdtemp()
+        self.path = os.path.join(self.baseDir, "store")
+
+    def tearDown(self):
+        shutil.rmtree(self.baseDir)
+
+    def job(self, campaign, completionTime="10.5s", linkedFrom=None):
+        """ Return (artifacts, kwargs) of a job of the topology TOPO, its artifacts linked from those of linkedFrom if given """
+        campaignDir = os.path.join(self.baseDir, campaign)
+        topoDir = os.path.join(campaignDir, "topo")
+        workingDir = os.path.join(topoDir, "https")
+        os.makedirs(workingDir)
+        kwargs = {"campaignDir": campaignDir, "workingDir": workingDir, "protocol": "mptcp",
+                  "topoAbsPath": os.path.join(topoDir, "topo"), "xpAbsPath": os.path.join(workingDir, "httpsTest")}
+        generateTopoFile(kwargs["topoAbsPath"], TOPO)
+        generateXpFile(kwargs["xpAbsPath"], {XP_TYPE: HTTPS})
+
+        contents = [("https_client.log", "GET /random\n" + completionTime + "\n"), ("ping.log", PING_LOG),
+                    ("netstat_client_before", NETSTAT_BEFORE), ("netstat_client_after", NETSTAT_AFTER)]
+        artifacts = []
+        for name, content in contents:
+            artifacts.append(os.path.join(workingDir, name))
+            if linkedFrom is None:
+                writeFile(artifacts[-1], content)
+            else:
+                linkArtifact(os.path.join(linkedFrom, name), artifacts[-1])
+        return artifacts, kwargs
+
+    def rawColumn(self, store, name):
+        """ The values of the column as written in its file, without numpy """
+        columnFile = open(store.columnPath(name), "rb")
+        data = columnFile.read()
+        columnFile.close()
+        valueFormat = COLUMN_FORMATS[store.types[name]]
+        return list(struct.unpack("<" + valueFormat * (len(data) // struct.calcsize("<" + valueFormat)), data))
+
+    def test_parse_job(self):
+        artifacts, kwargs = self.job("campaign")
+        # Artifacts that were not pulled are ignored
+        row = parseJob(artifacts + [os.path.join(kwargs["workingDir"], "netstat_server_before")], **kwargs)
+        self.assertEqual((row["valid"], row["campaign"], row["configuration"], row["protocol"]),
+                         (1, "campaign", os.path.join("topo", "https"), "mptcp"))
+        self.assertEqual([row["path0." + key] for key in ("delay", "queueSize", "bandwidth", "loss")], [15.0, 10.0, 10.0, 0.0])
+        # The loss set by netem
+        self.assertEqual([row["path1." + key] for key in ("delay", "queueSize", "bandwidth", "loss")], [30.0, 20.0, 5.0, 1.0])
+        self.assertEqual((row["xp.xpType"], row["xp.file_size"]), ("https", "1024"))
+        self.assertEqual(row["completionTime"], 10.5)
+        self.assertEqual((row["ping0.loss"], row["ping0.avg"], row["ping1.loss"], row["ping1.max"]), (0.0, 30.5, 20.0, 62.5))
+        self.assertEqual((row["client.segmentsReceived"], row["client.segmentsSent"], row["client.segmentsRetransmitted"],
+                          row["client.fastRetransmits"]), (500, 400, 7, 4))
+        self.assertFalse(any(name.startswith("server.") for name in row))
+
+    def test_unchanged_job_is_skipped(self):
+        store = ResultStore(self.path)
+        artifacts, kwargs = self.job("campaign")
+        self.assertTrue(store.ingest(artifacts, **kwargs))
+        # Same size and modification time
+        self.assertFalse(store.ingest(artifacts, **kwargs))
+        # Touched, but with the same SHA-1
+        os.utime(artifacts[0], (0, 0))
+        self.assertFalse(store.ingest(artifacts, **kwargs))
+        self.assertEqual((store.rows, store.ingested, store.skipped), (1, 1, 2))
+        store.close()
+
+    def test_changed_job_invalidates_its_row(self):
+        store = ResultStore(self.path)
+        artifacts, kwargs = self.job("campaign")
+        self.assertTrue(store.ingest(artifacts, **kwargs))
+        writeFile(artifacts[0], "GET /random\n12.5s\n")
+        self.assertTrue(store.ingest(artifacts, **kwargs))
+        self.assertEqual(self.rawColumn(store, "valid"), [0, 1])
+        self.assertEqual(self.rawColumn(store, "completionTime"), [10.5, 12.5])
+        store.close()
+
+    def test_read_only(self):
+        store = ResultStore(self.path)
+        store.append({"completionTime": 10.5, "protocol": "mptcp"})
+        reader = ResultStore(self.path, readOnly=True)
+        store.append({"completionTime": 11.5, "protocol": "quic"})
+        # Only the rows present when it was opened
+        self.assertEqual(reader.rows, 1)
+        self.assertEqual(reader.dictionaries["protocol"], ["mptcp"])
+        self.assertEqual((reader.types["completionTime"], reader.types["protocol"]), (FLOAT, STRING))
+        reader.close()
+        store.close()
+
+        # A writer interrupted in the middle of a row
+        columnFile = open(os.path.join(self.path, "completionTime.col"), "ab")
+        columnFile.write(struct.pack("<d", 12.5))
+        columnFile.close()
+        writeFile(os.path.join(self.path, "protocol.dict"), '"mptcp"\n"quic"\n"tcp"\n')
+        reader = ResultStore(self.path, readOnly=True)
+        self.assertEqual((reader.rows, reader.dictionaries["protocol"]), (2, ["mptcp", "quic"]))
+        reader.close()
+        store = ResultStore(self.path)
+        self.assertEqual(self.rawColumn(store, "completionTime"), [10.5, 11.5])
+        store.append({"completionTime": 13.5, "protocol": "tcp"})
+        self.assertEqual(self.rawColumn(store, "protocol"), [0, 1, 2])
+        store.close()
+
+    def test_read_only_does_not_write(self):
+        store = ResultStore(self.path)
+        store.append({"completionTime": 10.5})
+        store.close()
+        os.remove(os.path.join(self.path, INDEX_FILENAME))
+        ResultStore(self.path, readOnly=True).close()
+        self.assertFalse(os.path.exists(os.path.join(self.path, INDEX_FILENAME)))
+
+    def test_float_widens_int_column(self):
+        store = ResultStore(self.path)
+        store.append({"completionTime": 10})
+        store.append({"other": 1})
+        store.append({"completionTime": 10.5})
+        self.assertEqual(store.types["completionTime"], FLOAT)
+        values = self.rawColumn(store, "completionTime")
+        self.assertEqual((values[0], values[2]), (10.0, 10.5))
+        self.assertTrue(math.isnan(values[1]))
+        store.close()
+
+        schemaFile = open(os.path.join(self.path, SCHEMA_FILENAME))
+        self.assertTrue(["completionTime", FLOAT] in json.load(schemaFile)["columns"])
+        schemaFile.close()
+        store = ResultStore(self.path)
+        store.append({"completionTime": 11})
+        self.assertEqual(self.rawColumn(store, "completionTime")[3], 11.0)
+        store.close()
+
+    def test_int_stays_in_float_column(self):
+        store = ResultStore(self.path)
+        store.append({"completionTime": 10.5, "valid": 1})
+        store.append({"completionTime": 10, "valid": 1})
+        self.assertEqual((store.types["completionTime"], store.types["valid"]), (FLOAT, INT))
+        self.assertEqual(self.rawColumn(store, "completionTime"), [10.5, 10.0])
+        store.close()
+
+    def test_failed_row_keeps_columns_aligned(self):
+        store = ResultStore(self.path)
+        store.append({"completionTime": 10.5, "protocol": "mptcp", "retransmissions": 2})
+        self.assertRaises(ValueError, store.append, {"completionTime": 11.5, "protocol": "quic", "retransmissions": "many"})
+        store.append({"completionTime": 12.5, "protocol": "tcp", "retransmissions": 3})
+        self.assertEqual(store.rows, 2)
+        self.assertEqual(self.rawColumn(store, "completionTime"), [10.5, 12.5])
+        self.assertEqual(self.rawColumn(store, "retransmissions"), [2, 3])
+        # The value of the failed row never entered the dictionary
+        self.assertEqual(store.dictionaries["protocol"], ["mptcp", "tcp"])
+        self.assertEqual(self.rawColumn(store, "protocol"), [0, 1])
+        store.close()
+
+    def test_linked_job_is_not_ingested_again(self):
+        store = ResultStore(self.path)
+        artifacts, kwargs = self.job("campaign")
+        self.assertTrue(store.ingest(artifacts, **kwargs))
+        # The journal of the resumed campaign, or the result cache, links the artifacts in a new campaign directory
+        linkedArtifacts, linkedKwargs = self.job("resumed", linkedFrom=kwargs["workingDir"])
+        self.assertFalse(store.ingest(linkedArtifacts, **linkedKwargs))
+        self.assertFalse(store.ingest(linkedArtifacts, **linkedKwargs))
+        self.assertEqual((store.rows, store.ingested, store.reused, store.skipped), (1, 1, 1, 1))
+
+        # Another replica of the same specification is another measurement
+        otherArtifacts, otherKwargs = self.job("replica", completionTime="11.5s")
+        self.assertTrue(store.ingest(otherArtifacts, **otherKwargs))
+        self.assertEqual(store.rows, 2)
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import sys
+import threading
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+from Queue import Empty
+from scheduler import JobScheduler, listScheduleMakespan
+
+
+def drain(scheduler):
+    jobs = []
+    while True:
+        job = scheduler.get_nowait()
+        if job is None:
+            return jobs
+        jobs.append(job)
+
+
+class JobSchedulerTest(unittest.TestCase):
+    def test_lpt_order(self):
+        scheduler = JobScheduler(2)
+        for job, cost in [("a", 1), ("b", 5), ("c", 3), ("d", 5)]:
+            scheduler.put(job, cost)
+        scheduler.close()
+        # Ties keep the order the jobs were added in
+        self.assertEqual(drain(scheduler), ["b", "d", "c", "a"])
+
+    def test_fifo_order(self):
+        scheduler = JobScheduler(2, lpt=False)
+        for job, cost in [("a", 1), ("b", 5), ("c", 3)]:
+            scheduler.put(job, cost)
+        scheduler.close()
+        self.assertEqual(drain(scheduler), ["a", "b", "c"])
+
+    def test_lookahead_window(self):
+        scheduler = JobScheduler(1, lookahead=2)
+        for job, cost in [("a", 1), ("b", 2), ("c", 9), ("d", 3)]:
+            scheduler.put(job, cost)
+        scheduler.close()
+        # c is only seen once b left the window
+        self.assertEqual(drain(scheduler), ["b", "c", "d", "a"])
+
+    def test_dispatch_before_close(self):
+        scheduler = JobScheduler(1)
+        self.assertRaises(Empty, scheduler.get_nowait)
+        scheduler.put("a", 1)
+        self.assertEqual(scheduler.get_nowait(), "a")
+        self.assertRaises(Empty, scheduler.get_nowait)
+
+        got = []
+        getter = threading.Thread(target=lambda: got.append(scheduler.get()))
+        getter.start()
+        scheduler.put("b", 1)
+        getter.join(5)
+        self.assertEqual(got, ["b"])
+        scheduler.close()
+        self.assertEqual(scheduler.get(), None)
+
+    def test_makespan(self):
+        self.assertEqual(listScheduleMakespan([2, 1, 1], 2), 2)
+        self.assertEqual(listScheduleMakespan([1, 1, 2], 2), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
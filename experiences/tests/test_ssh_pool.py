@@ -0,0 +1,75 @@
+import os
+import sys
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+from ssh_pool import SshConnectionPool
+
+
+class OfflineConnectionPool(SshConnectionPool):
+    """ Count the checks of the master connections instead of running ssh """
+    def __init__(self, remoteHostnames, remotePorts, **kwargs):
+        SshConnectionPool.__init__(self, remoteHostnames, remotePorts, **kwargs)
+        self.alive = set()
+        self.checks = 0
+        self.opened = 0
+
+    def isAlive(self, num):
+        self.checks += 1
+        return self.masters[num] in self.alive
+
+    def openMasterCmd(self, num):
+        self.opened += 1
+        self.alive.add(self.masters[num])
+        return ["true"]
+
+    def closeMaster(self, num):
+        pass
+
+
+class SshConnectionPoolTest(unittest.TestCase):
+    def setUp(self):
+        # Two slots on host1, one on host2
+        self.pool = OfflineConnectionPool(["host1", "host1", "host2"], ["22", "22", "22"])
+
+    def tearDown(self):
+        self.pool.closeAll()
+
+    def test_one_master_per_host(self):
+        self.assertEqual(self.pool.controlPath(0), self.pool.controlPath(1))
+        self.assertNotEqual(self.pool.controlPath(0), self.pool.controlPath(2))
+        self.assertTrue("ControlPath=" + self.pool.controlPath(1) in self.pool.shellCmd(1, "true"))
+        self.pool.shellCmd(0, "true")
+        self.pool.putCmd(2, "topo", "/tmp")
+        self.assertEqual(self.pool.report(), ["host1:22 2 remote operations with 1 handshakes (1 saved)",
+                                              "host2:22 1 remote operations with 1 handshakes (0 saved)"])
+
+    def test_slots_see_the_reconnection(self):
+        self.pool.shellCmd(0, "true")
+        self.assertEqual(self.pool.handshakes, [1, 1, 0])
+
+    def test_checks_are_spaced(self):
+        for _ in range(5):
+            self.pool.shellCmd(0, "true")
+            self.pool.shellCmd(1, "true")
+        # The first operation finds the master down and opens it, the others trust it
+        self.assertEqual((self.pool.checks, self.pool.opened), (1, 1))
+
+        self.pool.masterLost(1)
+        self.pool.shellCmd(0, "true")
+        self.assertEqual((self.pool.checks, self.pool.opened), (2, 1))
+
+        self.pool.checkInterval = 0
+        self.pool.getCmd(0, "/tmp/log", "log")
+        self.assertEqual((self.pool.checks, self.pool.opened), (3, 1))
+
+    def test_managed_masters_are_not_checked(self):
+        self.pool.manageMasters()
+        self.pool.shellCmd(0, "true")
+        self.assertEqual((self.pool.checks, self.pool.opened, self.pool.operations[0]), (0, 0, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
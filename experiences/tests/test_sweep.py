@@ -0,0 +1,94 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+from core import Sweep, experimentFor
+
+
+def jobKeys(jobs, *keywords):
+    return [tuple(job[keyword] for keyword in keywords) for job in jobs]
+
+
+class SweepTest(unittest.TestCase):
+    def test_cartesian_product(self):
+        sweep = Sweep(("xp", ["https", "quic"]), ("multipath", [0, 1]))
+        self.assertEqual(jobKeys(sweep.jobs(protocol="mptcp"), "protocol", "xp", "multipath"),
+                         [("mptcp", "https", 0), ("mptcp", "https", 1), ("mptcp", "quic", 0), ("mptcp", "quic", 1)])
+
+    def test_no_dimension(self):
+        self.assertEqual(list(Sweep().jobs(xp="https")), [{"xp": "https"}])
+
+    def test_dimension_skip_if(self):
+        # As in experimentFor, skipIf gets the element and the bindings of the previous dimensions
+        def skipQuicMultipath(multipath, **kwargs):
+            return kwargs["xp"] == "quic" and multipath == 1
+
+        sweep = Sweep(("xp", ["https", "quic"]), ("multipath", [0, 1], skipQuicMultipath))
+        self.assertEqual(jobKeys(sweep.jobs(), "xp", "multipath"), [("https", 0), ("https", 1), ("quic", 0)])
+
+    def test_elems_from_bindings(self):
+        sweep = Sweep(("xp", ["https", "quic"]), ("size", lambda **kwargs: [1, 2] if kwargs["xp"] == "https" else [3]))
+        self.assertEqual(jobKeys(sweep.jobs(), "xp", "size"), [("https", 1), ("https", 2), ("quic", 3)])
+
+    def test_predicates(self):
+        seen = []
+
+        def skipQuic(**kwargs):
+            seen.append(kwargs["multipath"])
+            return kwargs["xp"] == "quic"
+
+        sweep = Sweep(("xp", ["https", "quic"]), ("multipath", [0, 1])).skipIf(skipQuic)
+        sweep.skipIf(lambda **kwargs: kwargs["multipath"] == 1)
+        self.assertEqual(jobKeys(sweep.jobs(), "xp", "multipath"), [("https", 0)])
+        # Predicates get the complete jobs
+        self.assertEqual(seen, [0, 1, 0, 1])
+
+    def test_directories_of_generated_jobs_only(self):
+        workingDir = tempfile.mkdtemp()
+        try:
+            sweep = Sweep(("xp", ["https", "quic"]), ("paths", [("a", "b"), ("c",)]))
+            sweep.skipIf(lambda **kwargs: kwargs["xp"] == "quic")
+            jobs = list(sweep.jobs(workingDir=workingDir))
+            self.assertEqual([job["workingDir"] for job in jobs],
+                             [os.path.join(workingDir, "https", "a_b"), os.path.join(workingDir, "https", "c")])
+            self.assertTrue(all(os.path.isdir(job["workingDir"]) for job in jobs))
+            self.assertEqual(os.listdir(workingDir), ["https"])
+        finally:
+            shutil.rmtree(workingDir)
+
+    def test_expand(self):
+        jobs = []
+        Sweep(("xp", ["https", "quic"])).expand(lambda **kwargs: jobs.append(kwargs))(protocol="mptcp")
+        self.assertEqual(jobs, [{"protocol": "mptcp", "xp": "https"}, {"protocol": "mptcp", "xp": "quic"}])
+
+
+class ExperimentForTest(unittest.TestCase):
+    def setUp(self):
+        self.workingDir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.workingDir)
+
+    def test_skip_if_sees_the_parent_kwargs(self):
+        seen = []
+        jobs = []
+
+        def skipQuic(elem, **kwargs):
+            seen.append((elem, kwargs["workingDir"], kwargs.get("xp")))
+            return elem == "quic"
+
+        experimentFor("xp", ["https", "quic", "tcp"], lambda **kwargs: jobs.append(kwargs), workingDir=self.workingDir,
+                      skipIf=skipQuic)
+        self.assertEqual(seen, [(elem, self.workingDir, None) for elem in ["https", "quic", "tcp"]])
+        self.assertEqual([(job["xp"], job["workingDir"]) for job in jobs],
+                         [("https", os.path.join(self.workingDir, "https")), ("tcp", os.path.join(self.workingDir, "tcp"))])
+        self.assertEqual(sorted(os.listdir(self.workingDir)), ["https", "tcp"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+from generate_topo import BANDWIDTH, DELAY, LOSS, NETEM, PATHS, QUEUE_SIZE, generateTopoFile
+from generate_xp import HTTPS, HTTPS_RANDOM_SIZE, QUICREQRES, QUICREQRES_RUN_TIME, XP_TYPE, generateXpFile
+from timeout_model import DEFAULT_OVERHEAD, MIN_TIMEOUT, SAFETY_FACTOR, SAMPLES_TO_LEARN, UNTRAINED_SAFETY_FACTOR, \
+    PathParameters, TimeoutModel, expectedTransferTime
+
+""" 10 ms, 10 packets of 1500 bytes at 8 Mbps: RTT of 20 + 15 ms with a full queue, 1 MB/s """
+FAST_PATH = {DELAY: 10, QUEUE_SIZE: 10, BANDWIDTH: 8}
+FAST_PATH_RTT = 0.035
+FAST_PATH_RATE = 1000000.0
+""" The default file size, 1024 KB """
+FILE_SIZE = 1024 * 1024.0
+
+
+class ExpectedTransferTimeTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.jobs = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def job(self, topo, xpDict=None, protocol="mptcp"):
+        self.jobs += 1
+        kwargs = {"protocol": protocol, "topoAbsPath": os.path.join(self.directory, "topo" + str(self.jobs)),
+                  "xpAbsPath": os.path.join(self.directory, "xp" + str(self.jobs))}
+        generateTopoFile(kwargs["topoAbsPath"], topo)
+        generateXpFile(kwargs["xpAbsPath"], {XP_TYPE: HTTPS} if xpDict is None else xpDict)
+        return kwargs
+
+    def test_path(self):
+        path = PathParameters(10.0, 10.0, 8.0, 0.0)
+        self.assertAlmostEqual(path.rtt(), FAST_PATH_RTT)
+        self.assertAlmostEqual(path.rate(), FAST_PATH_RATE)
+        # Mathis: MSS / RTT * 1.22 / sqrt(p), below the 12.5 MB/s of the link
+        lossy = PathParameters(10.0, 10.0, 100.0, 1.0)
+        self.assertAlmostEqual(lossy.rate(), 1460 / 0.0212 * 1.22 / 0.1, places=3)
+        self.assertEqual(PathParameters(10.0, 10.0, 8.0, 100.0).rate(), 0.0)
+
+    def test_single_and_multipath(self):
+        topo = {PATHS: [FAST_PATH, {DELAY: 30, QUEUE_SIZE: 10, BANDWIDTH: 8}]}
+        self.assertAlmostEqual(expectedTransferTime(**self.job(topo, protocol="tcp")),
+                               4 * FAST_PATH_RTT + FILE_SIZE / FAST_PATH_RATE)
+        # Both paths, the slowest handshake
+        self.assertAlmostEqual(expectedTransferTime(**self.job(topo)), 4 * 0.075 + FILE_SIZE / (2 * FAST_PATH_RATE))
+        self.assertAlmostEqual(expectedTransferTime(**self.job(topo, {XP_TYPE: HTTPS, HTTPS_RANDOM_SIZE: "2048"},
+                                                               protocol="tcp")),
+                               4 * FAST_PATH_RTT + 2 * FILE_SIZE / FAST_PATH_RATE)
+
+    def test_netem_loss(self):
+        topo = {PATHS: [{DELAY: 10, QUEUE_SIZE: 10, BANDWIDTH: 100}], NETEM: [(0, 5, "loss 1%")]}
+        self.assertAlmostEqual(expectedTransferTime(**self.job(topo)), 4 * 0.0212 + FILE_SIZE / (1460 / 0.0212 * 12.2))
+        self.assertEqual(expectedTransferTime(**self.job({PATHS: [dict(FAST_PATH, **{LOSS: 100})]})), None)
+
+    def test_request_response(self):
+        kwargs = self.job({PATHS: [FAST_PATH]}, {XP_TYPE: QUICREQRES, QUICREQRES_RUN_TIME: "45"})
+        self.assertEqual(expectedTransferTime(**kwargs), 45.0)
+
+
+class TimeoutModelTest(ExpectedTransferTimeTest):
+    def setUp(self):
+        ExpectedTransferTimeTest.setUp(self)
+        self.model = TimeoutModel()
+
+    def tearDown(self):
+        self.model.close()
+        ExpectedTransferTimeTest.tearDown(self)
+
+    def train(self, model, overhead, scale, bandwidths=(1, 2, 4, 8, 16)):
+        """ Record runtimes following overhead + scale * expected for topologies of the given bandwidths """
+        jobs = []
+        for bandwidth in bandwidths:
+            kwargs = self.job({PATHS: [{DELAY: 10, QUEUE_SIZE: 10, BANDWIDTH: bandwidth}]})
+            model.observe(overhead + scale * expectedTransferTime(**kwargs), **kwargs)
+            jobs.append(kwargs)
+        return jobs
+
+    def test_untrained(self):
+        kwargs = self.job({PATHS: [FAST_PATH]})
+        expected = expectedTransferTime(**kwargs)
+        self.assertAlmostEqual(self.model.expectedRuntime(**kwargs), DEFAULT_OVERHEAD + expected)
+        self.assertEqual(self.model.timeout(**kwargs), int((DEFAULT_OVERHEAD + expected) * UNTRAINED_SAFETY_FACTOR))
+
+    def test_fit(self):
+        self.train(self.model, 5.0, 2.0, bandwidths=(1, 2, 4, 8))
+        with self.model.lock:
+            self.assertEqual(self.model.fit(HTTPS), (DEFAULT_OVERHEAD, 1.0, UNTRAINED_SAFETY_FACTOR))
+        self.train(self.model, 5.0, 2.0, bandwidths=(16,))
+        self.assertEqual(len(self.model.samples[HTTPS]), SAMPLES_TO_LEARN)
+        with self.model.lock:
+            overhead, scale, safetyFactor = self.model.fit(HTTPS)
+        self.assertAlmostEqual(overhead, 5.0)
+        self.assertAlmostEqual(scale, 2.0)
+        # Every runtime matches its prediction
+        self.assertEqual(safetyFactor, SAFETY_FACTOR)
+
+    def test_worst_ratio(self):
+        jobs = self.train(self.model, 5.0, 2.0, bandwidths=(1, 2, 4, 8, 16, 32))
+        # A much slower run than its prediction
+        self.model.observe(100.0, **jobs[-1])
+        with self.model.lock:
+            overhead, scale, safetyFactor = self.model.fit(HTTPS)
+        worstRatio = max(runtime / (overhead + scale * expected) for expected, runtime in self.model.samples[HTTPS])
+        self.assertAlmostEqual(safetyFactor, worstRatio * 1.1)
+        self.assertTrue(safetyFactor > SAFETY_FACTOR)
+        # The timeout of that job covers the runtime it had
+        self.assertTrue(self.model.timeout(**jobs[-1]) >= 100.0)
+
+    def test_timeout_bounds(self):
+        self.train(self.model, 5.0, 2.0)
+        fast = self.job({PATHS: [dict(FAST_PATH, **{BANDWIDTH: 100})]})
+        self.assertEqual(self.model.timeout(**fast), MIN_TIMEOUT)
+
+        model = TimeoutModel(maxTimeout=200)
+        slow = self.job({PATHS: [dict(FAST_PATH, **{BANDWIDTH: 0.5})]})
+        prediction = DEFAULT_OVERHEAD + expectedTransferTime(**slow)
+        self.assertEqual(model.timeout(**slow), int(prediction * UNTRAINED_SAFETY_FACTOR))
+        # Doubled at each attempt, up to the maximum
+        self.assertEqual(model.timeout(attempts=2, **slow), 200)
+        lossy = self.job({PATHS: [dict(FAST_PATH, **{LOSS: 100})]})
+        self.assertEqual(model.timeout(**lossy), 200)
+        self.assertEqual(model.expectedRuntime(**lossy), 200)
+        model.close()
+
+    def test_persistence(self):
+        path = os.path.join(self.directory, "runtimes.sqlite")
+        model = TimeoutModel(path)
+        self.train(model, 5.0, 2.0)
+        model.close()
+        model = TimeoutModel(path)
+        with model.lock:
+            overhead, scale, _ = model.fit(HTTPS)
+        self.assertAlmostEqual(overhead, 5.0)
+        self.assertAlmostEqual(scale, 2.0)
+        model.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import sys
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from generate_topo import BANDWIDTH, DELAY, NETEM, PATHS, QUEUING_DELAY
+
+if np is not None:
+    from topo_design import DESIGNS, HALTON, LATIN_HYPERCUBE, SOBOL, SOBOL_BITS, UNIFORM, designPathValues, designTopos, \
+        unitDesign
+
+""" The first 8 points of the 3 first dimensions of the Sobol sequence of Joe and Kuo, in the order of their index """
+SOBOL_POINTS = [
+    (0.0, 0.0, 0.0),
+    (0.5, 0.5, 0.5),
+    (0.25, 0.75, 0.75),
+    (0.75, 0.25, 0.25),
+    (0.125, 0.625, 0.375),
+    (0.625, 0.125, 0.875),
+    (0.375, 0.375, 0.625),
+    (0.875, 0.875, 0.125),
+]
+""" The first 4 points of the Halton sequence in bases 2 and 3, starting at index 1 """
+HALTON_POINTS = [(1 / 2.0, 1 / 3.0), (1 / 4.0, 2 / 3.0), (3 / 4.0, 1 / 9.0), (1 / 8.0, 4 / 9.0)]
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class UnitDesignTest(unittest.TestCase):
+    def test_shapes_and_bounds(self):
+        for method in DESIGNS:
+            points = unitDesign(method, 16, 8, seed=1)
+            self.assertEqual(points.shape, (16, 8))
+            self.assertTrue(np.all(points >= 0.0) and np.all(points < 1.0))
+
+    def test_seeded_designs_are_reproducible(self):
+        for method in DESIGNS:
+            self.assertTrue(np.array_equal(unitDesign(method, 16, 8, seed=1), unitDesign(method, 16, 8, seed=1)))
+            self.assertFalse(np.array_equal(unitDesign(method, 16, 8, seed=1), unitDesign(method, 16, 8, seed=2)))
+
+    def test_latin_hypercube_strata(self):
+        points = unitDesign(LATIN_HYPERCUBE, 20, 4, seed=1)
+        for dimension in range(4):
+            self.assertEqual(sorted(np.floor(points[:, dimension] * 20).astype(int)), list(range(20)))
+
+    def test_sobol_points(self):
+        points = unitDesign(SOBOL, 8, 3, seed=1)
+        # Remove the digital shift, drawn first from the seeded state
+        shift = np.random.RandomState(1).randint(0, 1 << SOBOL_BITS, size=3).astype(np.int64)
+        unshifted = (np.round(points * (1 << SOBOL_BITS)).astype(np.int64) ^ shift) / float(1 << SOBOL_BITS)
+        self.assertTrue(np.array_equal(unshifted, np.array(SOBOL_POINTS)))
+        # A power of 2 of points is balanced: each half of each dimension holds half of them
+        points = unitDesign(SOBOL, 64, 16, seed=1)
+        self.assertTrue(np.all(np.sum(points < 0.5, axis=0) == 32))
+        self.assertRaises(Exception, unitDesign, SOBOL, 8, 17)
+
+    def test_halton_points(self):
+        points = unitDesign(HALTON, 4, 2, seed=1)
+        shift = np.random.RandomState(1).random_sample(2)
+        self.assertTrue(np.allclose((points - shift) % 1.0, np.array(HALTON_POINTS)))
+
+    def test_unknown_design(self):
+        self.assertRaises(Exception, unitDesign, "grid", 4, 2)
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class DesignToposTest(unittest.TestCase):
+    def test_path_values(self):
+        values = designPathValues(10, pathsPerTopo=3, bandwidth=(5, 50), rtt=(10, 20), method=UNIFORM, seed=1)
+        self.assertEqual(sorted(values), ["bandwidth", "loss", "queuingDelay", "rtt"])
+        for array in values.values():
+            self.assertEqual(array.shape, (10, 3))
+        self.assertTrue(np.all(values["bandwidth"] >= 5) and np.all(values["bandwidth"] < 50))
+        self.assertTrue(np.all(values["rtt"] >= 10) and np.all(values["rtt"] < 20))
+
+    def test_reversed_twins(self):
+        for method in DESIGNS:
+            topos = designTopos(8, pathsPerTopo=2, method=method, seed=1)
+            self.assertEqual(len(topos), 16)
+            for topo, twin in zip(topos[::2], topos[1::2]):
+                self.assertEqual(twin[PATHS], topo[PATHS][::-1])
+                self.assertEqual([loss for _, _, loss in twin[NETEM]], [loss for _, _, loss in topo[NETEM]][::-1])
+                self.assertEqual([nbPath for nbPath, _, _ in twin[NETEM]], [0, 1])
+
+        self.assertEqual(len(designTopos(8, method=SOBOL, seed=1, withReversed=False)), 8)
+
+    def test_topo_format_and_bounds(self):
+        topos = designTopos(16, bandwidth=(1, 10), rtt=(10, 50), queuingDelay=(0.05, 0.1), loss=(0.5, 1.5),
+                            method=LATIN_HYPERCUBE, seed=3)
+        for topo in topos:
+            for path, (nbPath, start, loss) in zip(topo[PATHS], topo[NETEM]):
+                self.assertTrue(1 <= float(path[BANDWIDTH]) <= 10)
+                # Half of the RTT rounded to the ms
+                self.assertTrue(5 <= float(path[DELAY]) <= 25)
+                self.assertEqual(float(path[DELAY]) * 2, round(float(path[DELAY]) * 2))
+                self.assertTrue(0.05 <= float(path[QUEUING_DELAY]) <= 0.1)
+                self.assertEqual(start, 0)
+                self.assertTrue(loss.startswith("loss ") and loss.endswith("%"))
+                self.assertTrue(0.5 <= float(loss[len("loss "):-1]) <= 1.5)
+
+    def test_determinism(self):
+        self.assertEqual(designTopos(8, method=HALTON, seed=7), designTopos(8, method=HALTON, seed=7))
+        self.assertNotEqual(designTopos(8, method=HALTON, seed=7), designTopos(8, method=HALTON, seed=8))
+
+
+if __name__ == '__main__':
+    unittest.main()
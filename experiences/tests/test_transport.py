@@ -0,0 +1,76 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+from transport import LocalTransport, Transport
+
+
+class IncompleteTransport(Transport):
+    """ Forgot getCmd() """
+    def shellCmd(self, num, remoteCmd):
+        return ["sh", "-c", remoteCmd]
+
+    def putCmd(self, num, filename, path):
+        return ["cp", filename, path]
+
+
+class TransportTest(unittest.TestCase):
+    def test_abstract(self):
+        self.assertRaises(TypeError, Transport, ["host"], ["22"])
+        self.assertRaises(TypeError, IncompleteTransport, ["host"], ["22"])
+
+    def test_different_lengths(self):
+        self.assertRaises(Exception, LocalTransport, ["host1", "host2"], ["22"])
+
+    def test_defaults(self):
+        transport = LocalTransport(["host"], ["22"])
+        self.assertTrue(transport.isAlive(0))
+        self.assertEqual(subprocess.call(transport.masterCheckCmd(0)), 0)
+        self.assertEqual(subprocess.call(transport.openMasterCmd(0)), 0)
+        self.assertFalse(transport.managedMasters)
+        transport.manageMasters()
+        self.assertTrue(transport.managedMasters)
+        transport.closeAll()
+
+
+class LocalTransportTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.transport = LocalTransport(["host1", "host2"], ["22", "2222"])
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_commands_run_here(self):
+        remoteDir = os.path.join(self.directory, "remote")
+        self.assertEqual(subprocess.call(self.transport.shellCmd(1, "mkdir " + remoteDir + " && test -d " + remoteDir)), 0)
+        self.assertNotEqual(subprocess.call(self.transport.shellCmd(1, "exit 3")), 0)
+
+        filename = os.path.join(self.directory, "topo")
+        localFile = open(filename, "w")
+        localFile.write("path_0:10,10,10,0\n")
+        localFile.close()
+        self.assertEqual(subprocess.call(self.transport.putCmd(1, filename, remoteDir)), 0)
+        newFilename = os.path.join(self.directory, "pulled")
+        self.assertEqual(subprocess.call(self.transport.getCmd(1, os.path.join(remoteDir, "topo"), newFilename)), 0)
+        pulledFile = open(newFilename)
+        self.assertEqual(pulledFile.read(), "path_0:10,10,10,0\n")
+        pulledFile.close()
+
+    def test_report(self):
+        self.transport.shellCmd(0, "true")
+        self.transport.putCmd(0, "a", "b")
+        self.transport.getCmd(1, "a", "b")
+        self.assertEqual(self.transport.operations, [2, 1])
+        self.assertEqual(self.transport.handshakes, [0, 0])
+        self.assertEqual(self.transport.report(), ["host1:22 2 local operations", "host2:2222 1 local operations"])
+
+
+if __name__ == '__main__':
+    unittest.main()
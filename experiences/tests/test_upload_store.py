@@ -0,0 +1,131 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+# The modules of core import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+from transport import LocalTransport
+from upload_store import UploadStore, fileHash
+
+
+def writeFile(path, content):
+    pathFile = open(path, "w")
+    pathFile.write(content)
+    pathFile.close()
+
+
+def readFile(path):
+    pathFile = open(path)
+    content = pathFile.read()
+    pathFile.close()
+    return content
+
+
+class UploadStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        # The home of the hosts, which all are this machine
+        self.home = os.path.join(self.directory, "home")
+        os.mkdir(self.home)
+        self.environHome = os.environ["HOME"]
+        os.environ["HOME"] = self.home
+        self.storePath = os.path.join(self.home, ".minitopo_store")
+        self.transport = LocalTransport(["host1", "host1", "host2"], ["22", "22", "22"])
+        self.topo = os.path.join(self.directory, "topo")
+        self.xp = os.path.join(self.directory, "httpsTest")
+        writeFile(self.topo, "leftSubnet 10.0.\n")
+        writeFile(self.xp, "xpType:https\n")
+        self.jobs = 0
+
+    def tearDown(self):
+        os.environ["HOME"] = self.environHome
+        shutil.rmtree(self.directory)
+
+    def upload(self, store, num, filenames=None):
+        """ Upload the files to the directory of a new job, check its content and return whether the store was used """
+        self.jobs += 1
+        path = os.path.join(self.directory, "tmpfs", "job_" + str(self.jobs))
+        filenames = [self.topo, self.xp] if filenames is None else filenames
+        if not store.upload(num, filenames, path):
+            return False
+
+        for filename in filenames:
+            self.assertEqual(readFile(os.path.join(path, os.path.basename(filename))), readFile(filename))
+        return True
+
+    def storeFile(self, name, content, age):
+        """ Put a file in the store as if it was last used age seconds ago """
+        if not os.path.isdir(self.storePath):
+            os.mkdir(self.storePath)
+        path = os.path.join(self.storePath, name)
+        writeFile(path, content)
+        modified = time.time() - age
+        os.utime(path, (modified, modified))
+        return path
+
+    def test_hit_and_miss(self):
+        store = UploadStore(self.transport)
+        self.assertTrue(self.upload(store, 0))
+        # In the home directory of the host, whatever the directory the commands run in
+        self.assertEqual(sorted(os.listdir(self.storePath)), sorted([fileHash(self.topo), fileHash(self.xp)]))
+        self.assertTrue(self.upload(store, 0))
+        self.assertEqual((store.sent[0], store.saved[0]), (2, 2))
+
+        writeFile(self.topo, "leftSubnet 10.1.\n")
+        self.assertTrue(self.upload(store, 0))
+        self.assertEqual((store.sent[0], store.saved[0]), (3, 3))
+        self.assertEqual(store.report()[0], "host1:22 3 files sent to the upload store (3 uploads saved)")
+
+    def test_slots_and_campaigns_share_the_store(self):
+        store = UploadStore(self.transport, hosts=[0, 0, 1])
+        self.assertTrue(self.upload(store, 0))
+        self.assertTrue(self.upload(store, 1))
+        self.assertEqual((store.sent, store.saved), ([2, 0, 0], [0, 2, 0]))
+
+        # The next campaign lists the store
+        store = UploadStore(self.transport, hosts=[0, 0, 1])
+        self.assertTrue(self.upload(store, 2))
+        self.assertEqual((store.sent, store.saved), ([0, 0, 0], [0, 0, 2]))
+
+    def test_removed_store(self):
+        store = UploadStore(self.transport)
+        self.assertTrue(self.upload(store, 0))
+        shutil.rmtree(self.storePath)
+        # The caller uploads the files without the store, which is listed again at the next upload
+        self.assertFalse(self.upload(store, 0))
+        self.assertFalse(store.isListed(0))
+        self.assertTrue(self.upload(store, 0))
+        self.assertEqual((store.sent[0], store.saved[0]), (4, 0))
+
+    def test_old_files_are_removed(self):
+        old = self.storeFile("0" * 40, "old\n", 40 * 24 * 3600)
+        part = self.storeFile("1" * 40 + ".part0", "interrupted\n", 40 * 24 * 3600)
+        recent = self.storeFile("2" * 40, "recent\n", 24 * 3600)
+        store = UploadStore(self.transport, maxAge=30)
+        self.assertTrue(self.upload(store, 0))
+        self.assertEqual([os.path.exists(path) for path in [old, part, recent]], [False, False, True])
+
+        # The files used by a job are touched
+        usedPath = os.path.join(self.storePath, fileHash(self.topo))
+        modified = time.time() - 40 * 24 * 3600
+        os.utime(usedPath, (modified, modified))
+        self.assertTrue(self.upload(store, 0))
+        self.assertTrue(os.path.getmtime(usedPath) > time.time() - 3600)
+
+    def test_size_limit(self):
+        oldest = self.storeFile("0" * 40, "x" * 60, 3 * 3600)
+        older = self.storeFile("1" * 40, "x" * 60, 2 * 3600)
+        newer = self.storeFile("2" * 40, "x" * 60, 3600)
+        store = UploadStore(self.transport, maxSize=100)
+        self.assertTrue(self.upload(store, 0))
+        # The least recently used files beyond the limit, not the files of the job
+        self.assertEqual([os.path.exists(path) for path in [oldest, older, newer]], [False, False, True])
+        self.assertEqual(store.sent[0], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()